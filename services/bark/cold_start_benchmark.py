@@ -0,0 +1,19 @@
+"""Cold-start benchmark for the Bark model.
+
+Run with ``python -m services.bark.cold_start_benchmark [--runs N] [--no-snapshot]``.
+"""
+
+import sys
+
+from services.bark.app import _audio_config
+from services.bark.synthesis import BarkSynthesizer
+from services.common.cold_start import main
+from services.common.model_loader import BackgroundModelLoader
+
+
+def _create_model_loader() -> BackgroundModelLoader:
+    return BarkSynthesizer(_audio_config)._model_loader
+
+
+if __name__ == "__main__":
+    sys.exit(main("services.bark.cold_start_benchmark", _create_model_loader))
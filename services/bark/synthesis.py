@@ -8,6 +8,7 @@ This module provides the core text-to-speech functionality including:
 
 from __future__ import annotations
 
+import dataclasses
 import io
 import os
 import time
@@ -16,27 +17,31 @@ from contextlib import contextmanager
 from typing import Any
 
 import numpy as np
-import torch
-
-# Import Bark with strict fail-fast
-try:
-    from bark import SAMPLE_RATE, generate_audio, preload_models
-except ImportError as exc:
-    raise ImportError(
-        f"Required TTS library not available: {exc}. "
-        "Bark service requires bark library. Use python-ml base image or "
-        "explicitly install bark."
-    ) from exc
-from scipy.io.wavfile import write as write_wav
-
-from services.common.model_loader import BackgroundModelLoader
+
+from services.common.model_loader import BackgroundModelLoader, load_phase
+from services.common.model_snapshot import (
+    ModelSnapshot,
+    SnapshotContents,
+    build_module,
+)
 from services.common.model_utils import force_download_bark
 from services.common.structured_logging import get_logger
 from services.common.permissions import check_directory_permissions
 from services.common.gpu_utils import get_full_device_info, log_device_info
+from services.common.lazy_imports import lazy_import
 
 logger = get_logger(__name__)
 
+# Bark, torch and scipy load with the models (in the loader thread), so the
+# service answers /health/live without waiting for them
+_BARK_HINT = (
+    "Bark service requires bark library. Use python-ml base image or "
+    "explicitly install bark."
+)
+bark = lazy_import("bark", _BARK_HINT)
+torch = lazy_import("torch", _BARK_HINT)
+wavfile = lazy_import("scipy.io.wavfile", _BARK_HINT)
+
 
 @contextmanager
 def _bark_environment_context() -> Generator[None, None, None]:
@@ -225,12 +230,13 @@ def _preload_bark_models(logger: Any) -> float:
 
     # Use small models if configured to reduce memory footprint
     # Small models use ~50% less memory but with reduced quality
-    preload_models(
-        text_use_small=use_small_models,
-        coarse_use_small=use_small_models,
-        fine_use_small=use_small_models,
-        codec_use_gpu=torch.cuda.is_available(),  # Use GPU if available
-    )
+    with load_phase("preload"):
+        bark.preload_models(
+            text_use_small=use_small_models,
+            coarse_use_small=use_small_models,
+            fine_use_small=use_small_models,
+            codec_use_gpu=torch.cuda.is_available(),  # Use GPU if available
+        )
     preload_duration = time.time() - preload_start
 
     return preload_duration
@@ -494,6 +500,84 @@ def _compile_bark_models(logger: Any) -> tuple[list[str], str]:
         return [], compile_mode
 
 
+# Bark GPT models in a snapshot; the codec comes from Encodec's own cache
+_SNAPSHOT_COMPONENTS = ("text", "coarse", "fine")
+
+
+def _snapshot_module(bark_models: dict[str, Any], component: str) -> Any:
+    module = (
+        bark_models["text"]["model"] if component == "text" else bark_models[component]
+    )
+    # Compiled models wrap the original module; snapshot the weights only
+    return getattr(module, "_orig_mod", module)
+
+
+def _export_bark_snapshot(_loaded: Any) -> SnapshotContents:
+    """Snapshot the post-processed (device, FP16) Bark GPT weights."""
+    from bark.generation import models as bark_models
+
+    components: dict[str, dict[str, torch.Tensor]] = {}
+    metadata: dict[str, Any] = {}
+    for component in _SNAPSHOT_COMPONENTS:
+        module = _snapshot_module(bark_models, component)
+        components[component] = module.state_dict()
+        metadata[component] = dataclasses.asdict(module.config)
+    return SnapshotContents(components=components, metadata=metadata)
+
+
+def _restore_bark_snapshot(contents: SnapshotContents) -> bool:
+    """Rebuild Bark's module-level models from a snapshot."""
+    from bark.generation import load_codec_model, models as bark_models
+    from bark.model import GPT, GPTConfig
+    from bark.model_fine import FineGPT, FineGPTConfig
+    from transformers import BertTokenizer
+
+    with _bark_environment_context():
+        with load_phase("deserialize"):
+            text_config = GPTConfig(**contents.metadata["text"])
+            coarse_config = GPTConfig(**contents.metadata["coarse"])
+            fine_config = FineGPTConfig(**contents.metadata["fine"])
+            text_model = build_module(
+                lambda: GPT(text_config), contents.components["text"]
+            )
+            coarse_model = build_module(
+                lambda: GPT(coarse_config), contents.components["coarse"]
+            )
+            fine_model = build_module(
+                lambda: FineGPT(fine_config), contents.components["fine"]
+            )
+        with load_phase("tokenizer"):
+            tokenizer = BertTokenizer.from_pretrained("bert-base-multilingual-cased")
+
+        bark_models["text"] = {"model": text_model, "tokenizer": tokenizer}
+        bark_models["coarse"] = coarse_model
+        bark_models["fine"] = fine_model
+        with load_phase("codec"):
+            load_codec_model(use_gpu=torch.cuda.is_available())
+        with load_phase("compile"):
+            _compile_bark_models(logger)
+    return True
+
+
+def _snapshot_device() -> str:
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _create_bark_snapshot() -> ModelSnapshot:
+    return ModelSnapshot(
+        "bark_models",
+        export=_export_bark_snapshot,
+        restore=_restore_bark_snapshot,
+        fingerprint=lambda: {
+            "small_models": os.getenv("BARK_USE_SMALL_MODELS", "false").lower(),
+            "device": _snapshot_device(),
+            "torch": torch.__version__,
+            "bark": getattr(bark, "__version__", "unknown"),
+        },
+        device=_snapshot_device,
+    )
+
+
 class BarkSynthesizer:
     """Bark TTS synthesizer with Piper fallback."""
 
@@ -542,10 +626,12 @@ class BarkSynthesizer:
                     preload_duration = _preload_bark_models(self._logger)
 
                     # Stage 5: Migrate models to GPU (if available)
-                    _migrate_models_to_gpu(self._logger)
+                    with load_phase("gpu_migration"):
+                        _migrate_models_to_gpu(self._logger)
 
                     # Stage 6: Compile models with torch.compile() if enabled
-                    _compile_bark_models(self._logger)
+                    with load_phase("compile"):
+                        _compile_bark_models(self._logger)
 
                     total_duration = time.time() - load_start
 
@@ -599,6 +685,7 @@ class BarkSynthesizer:
             logger=self._logger,
             loader_name="bark_models",
             is_side_effect=True,  # preload_models() doesn't return model
+            snapshot=_create_bark_snapshot(),
         )
 
         # Initialize result cache if enabled
@@ -838,12 +925,12 @@ class BarkSynthesizer:
                 # Try to pass silent=True if supported (reduces overhead from progress bars)
                 # Bark's generate_audio may not support all parameters, so we use try/except
                 try:
-                    audio_array = generate_audio(
+                    audio_array = bark.generate_audio(
                         text, history_prompt=voice, silent=True
                     )
                 except TypeError:
                     # silent parameter not supported, use default call
-                    audio_array = generate_audio(text, history_prompt=voice)
+                    audio_array = bark.generate_audio(text, history_prompt=voice)
 
             # Synchronize CUDA operations for accurate timing
             if torch.cuda.is_available():
@@ -921,7 +1008,7 @@ class BarkSynthesizer:
 
             # Convert to WAV bytes
             conversion_start = time.time()
-            audio_bytes = self._audio_to_bytes(audio_array, SAMPLE_RATE)
+            audio_bytes = self._audio_to_bytes(audio_array, bark.SAMPLE_RATE)
             conversion_time = (time.time() - conversion_start) * 1000
             stage_timings["audio_conversion_ms"] = conversion_time
 
@@ -974,7 +1061,7 @@ class BarkSynthesizer:
 
         # Write to bytes buffer
         output_buffer = io.BytesIO()
-        write_wav(output_buffer, sample_rate, audio_int16)
+        wavfile.write(output_buffer, sample_rate, audio_int16)
 
         return output_buffer.getvalue()
 
@@ -10,8 +10,9 @@ from collections.abc import Awaitable, Callable
 
 from fastapi import FastAPI
 
+from services.common.config.loader import get_env_with_default
 from services.common.health import HealthManager
-from services.common.middleware import ObservabilityMiddleware
+from services.common.middleware import HttpRouteMetrics, ObservabilityMiddleware
 from services.common.structured_logging import get_logger
 from services.common.tracing import setup_service_observability
 
@@ -38,6 +39,19 @@ warnings.filterwarnings(
 logger = get_logger(__name__)
 
 
+def _background_probing_enabled() -> bool:
+    """Whether HEALTH_BACKGROUND_PROBING allows the dependency prober (default on)."""
+    return bool(get_env_with_default("HEALTH_BACKGROUND_PROBING", True, bool))
+
+
+def _probe_interval_from_env() -> float | None:
+    """Get HEALTH_PROBE_INTERVAL_SECONDS, or None for the adaptive interval."""
+    interval = get_env_with_default("HEALTH_PROBE_INTERVAL_SECONDS", None, float)
+    if interval is None:
+        return None
+    return max(0.1, interval)
+
+
 def create_service_app(
     service_name: str,
     service_version: str = "1.0.0",
@@ -73,8 +87,9 @@ def create_service_app(
                            Can be sync or async.
         health_manager: Optional HealthManager instance for tracking startup failures.
                         If provided, startup callback exceptions will be recorded
-                        in the HealthManager. Services should create HealthManager at
-                        module level and pass it here.
+                        in the HealthManager and its background dependency prober
+                        runs for the app's lifetime. Services should create
+                        HealthManager at module level and pass it here.
 
     Returns:
         Configured FastAPI app with observability middleware and instrumentation
@@ -109,7 +124,7 @@ def create_service_app(
     observability_manager = setup_service_observability(service_name, service_version)
 
     @asynccontextmanager
-    async def lifespan(_app: FastAPI) -> Any:  # noqa: ARG001
+    async def lifespan(_app: FastAPI) -> Any:
         """Standardized lifespan handler with service-specific startup/shutdown.
 
         IMPORTANT: FastAPI routes (including health endpoints) are registered immediately
@@ -121,6 +136,8 @@ def create_service_app(
         5. Services should mark_startup_complete() early (after initiating background loading)
         """
         # Startup
+        # Every route is registered by now; fix the HTTP metric label sets
+        _app.state.http_route_metrics = HttpRouteMetrics.from_app(_app)
         try:
             # Call service-specific startup (services can access observability_manager
             # via get_observability_manager(service_name) if needed)
@@ -143,8 +160,18 @@ def create_service_app(
                 )
             # Continue without crashing - HealthManager now controls readiness
 
+        # Refresh dependency health in the background so readiness probes
+        # read a snapshot instead of checking dependencies on request
+        if health_manager is not None and _background_probing_enabled():
+            health_manager.start_background_probing(
+                interval_seconds=_probe_interval_from_env()
+            )
+
         yield
 
+        if health_manager is not None:
+            await health_manager.stop_background_probing()
+
         # Shutdown
         if shutdown_callback:
             try:
@@ -9,22 +9,31 @@ REQUIRES: Services using this module must use python-ml base image or explicitly
 install librosa and soundfile dependencies.
 """
 
-import audioop
 import io
 import wave
 from dataclasses import dataclass
 from typing import Any, ClassVar
 
-try:
-    import librosa
-    import numpy as np
-    import soundfile as sf
-except ImportError as exc:
-    raise ImportError(
-        f"Required audio processing libraries not available: {exc}. "
-        "Services using audio processing must use python-ml base image or "
-        "explicitly install librosa and soundfile."
-    ) from exc
+import numpy as np
+
+from services.common.audio_kernels import (
+    convert_width,
+    expand_channels,
+    mix_to_mono,
+    pcm_bytes,
+    pcm_samples,
+    rms,
+)
+from services.common.lazy_imports import lazy_import
+
+
+# librosa and soundfile load on first use; most callers only touch PCM helpers
+_AUDIO_LIBS_HINT = (
+    "Services using audio processing must use python-ml base image or "
+    "explicitly install librosa and soundfile."
+)
+librosa = lazy_import("librosa", _AUDIO_LIBS_HINT)
+sf = lazy_import("soundfile", _AUDIO_LIBS_HINT)
 
 
 @dataclass(slots=True)
@@ -843,15 +852,17 @@ class AudioProcessor:
         if from_channels == to_channels:
             return pcm_data
 
-        if from_channels == 1 and to_channels == 2:
-            # Mono to stereo - duplicate channel
-            return audioop.tomono(pcm_data, sample_width, 1, 1)
-        elif from_channels == 2 and to_channels == 1:
-            # Stereo to mono - mix channels
-            return audioop.tomono(pcm_data, sample_width, 1, 1)
-        else:
-            # Unsupported conversion
+        if sample_width not in (1, 2, 3, 4):
             return pcm_data
+        samples = pcm_samples(pcm_data, sample_width)
+        if from_channels == 1:
+            # Mono to N channels - duplicate the channel
+            return pcm_bytes(expand_channels(samples, to_channels), sample_width)
+        if to_channels == 1:
+            # N channels to mono - average the channels
+            return pcm_bytes(mix_to_mono(samples, from_channels), sample_width)
+        # Unsupported conversion
+        return pcm_data
 
     def _convert_sample_width(
         self, pcm_data: bytes, from_width: int, to_width: int
@@ -860,17 +871,11 @@ class AudioProcessor:
         if from_width == to_width:
             return pcm_data
 
-        if from_width == 1 and to_width == 2:
-            return audioop.lin2lin(pcm_data, 1, 2)
-        elif from_width == 2 and to_width == 1:
-            return audioop.lin2lin(pcm_data, 2, 1)
-        elif from_width == 2 and to_width == 4:
-            return audioop.lin2lin(pcm_data, 2, 4)
-        elif from_width == 4 and to_width == 2:
-            return audioop.lin2lin(pcm_data, 4, 2)
-        else:
+        if from_width not in (1, 2, 3, 4) or to_width not in (1, 2, 3, 4):
             # Unsupported conversion
             return pcm_data
+        samples = pcm_samples(pcm_data, from_width)
+        return pcm_bytes(convert_width(samples, from_width, to_width), to_width)
 
     def calculate_rms(self, pcm_data: bytes, sample_width: int = 2) -> float:
         """Calculate RMS (Root Mean Square) of PCM audio data using librosa."""
@@ -897,8 +902,8 @@ class AudioProcessor:
                 audio_float = audio_float / 2147483648.0
 
             # Use librosa's RMS calculation
-            rms = librosa.feature.rms(y=audio_float)[0]
-            return float(np.mean(rms).item())
+            frame_rms = librosa.feature.rms(y=audio_float)[0]
+            return float(np.mean(frame_rms).item())
         except Exception:
             return 0.0
 
@@ -1045,40 +1050,8 @@ def calculate_rms_int16(pcm_data: bytes, sample_width: int = 2) -> float:
         if not pcm_data:
             return 0.0
 
-        # Use audioop.rms() as primary method (fast, standard library)
-        try:
-            rms = audioop.rms(pcm_data, sample_width)
-            return float(rms)
-        except (audioop.error, OSError) as exc:
-            # Fallback to numpy if audioop fails
-            # Log fallback for debugging
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.debug(
-                "audioop.rms failed, using numpy fallback",
-                extra={
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                    "pcm_length": len(pcm_data),
-                    "sample_width": sample_width,
-                },
-            )
-
-            if sample_width == 2:
-                array = np.frombuffer(pcm_data, dtype=np.int16)
-            elif sample_width == 4:
-                array = np.frombuffer(pcm_data, dtype=np.int32)
-            else:
-                # This should not happen due to validation above, but keep for safety
-                return 0.0
-
-            if array.size == 0:
-                return 0.0
-
-            # Calculate RMS directly in int domain
-            rms = np.sqrt(np.mean(array.astype(np.float64) ** 2))
-            return float(rms)
+        # Vectorized RMS over a zero-copy view of the PCM bytes
+        return rms(pcm_samples(pcm_data, sample_width))
 
     except (ValueError, TypeError, MemoryError) as exc:
         # Log specific error types with context
@@ -6,33 +6,267 @@ This module provides audio enhancement functionality including:
 - Audio quality improvement
 - Performance optimization
 
+Segments enhanced through ``enhance_audio_bytes`` never run on the event loop:
+decoding and filtering go to a worker thread, and concurrent segments are
+micro-batched into padded MetricGAN+ ``enhance_batch`` calls on a single
+dedicated inference thread (see ``EnhancementBatcher``). With ``chunk_seconds``
+set, long segments are split into fixed-size overlapping windows that are
+enhanced independently and recombined with raised-cosine crossfades, so model
+memory per forward pass no longer grows with segment length.
+
 REQUIRES: Services using this module must use python-ml base image or explicitly
 install scipy dependency.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import functools
+import io
 import os
 import time
 from typing import Any
+import wave
 
 import numpy as np
 
-try:
-    from scipy import signal
-except ImportError as exc:
-    raise ImportError(
-        f"Required audio enhancement library not available: {exc}. "
-        "Services using audio enhancement must use python-ml base image or "
-        "explicitly install scipy."
-    ) from exc
-
+from services.common.lazy_imports import lazy_import
 from services.common.model_loader import BackgroundModelLoader
 from services.common.model_utils import force_download_speechbrain
 from services.common.structured_logging import get_logger
 
+
+# scipy.signal takes over a second to import; it is only needed for filtering
+signal = lazy_import(
+    "scipy.signal",
+    "Services using audio enhancement must use python-ml base image or "
+    "explicitly install scipy.",
+)
+
 logger = get_logger(__name__)
 
+# Sample rate assumed for headerless PCM input to enhance_audio_bytes
+DEFAULT_SAMPLE_RATE = 16000
+
+
+@functools.lru_cache(maxsize=32)
+def high_pass_sos(
+    sample_rate: int, cutoff_freq: float, order: int = 4
+) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """Butterworth high-pass filter as second-order sections.
+
+    Designed once per (sample rate, cutoff, order). The returned array is
+    shared by every caller and must not be modified (it is not flagged
+    read-only because scipy's sosfilt kernels require a writable buffer).
+    """
+    sos: np.ndarray[Any, np.dtype[np.float64]] = signal.butter(
+        order, cutoff_freq / (sample_rate / 2), btype="high", output="sos"
+    )
+    return sos
+
+
+def decode_audio_bytes(
+    audio_data: bytes,
+) -> tuple[np.ndarray[Any, np.dtype[np.float32]], int, bool]:
+    """Decode 16-bit mono WAV or headerless 16 kHz PCM to float32 in [-1, 1].
+
+    Returns:
+        (audio, sample_rate, is_wav)
+    """
+    if audio_data[:4] == b"RIFF":
+        with wave.open(io.BytesIO(audio_data), "rb") as wav_file:
+            if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+                raise ValueError(
+                    "Only 16-bit mono WAV is supported, got "
+                    f"{wav_file.getsampwidth() * 8}-bit "
+                    f"{wav_file.getnchannels()}-channel"
+                )
+            sample_rate = wav_file.getframerate()
+            pcm = wav_file.readframes(wav_file.getnframes())
+        is_wav = True
+    else:
+        sample_rate, pcm, is_wav = DEFAULT_SAMPLE_RATE, audio_data, False
+    # astype allocates the writable float32 buffer; scale it in place
+    audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio, sample_rate, is_wav
+
+
+def encode_audio_bytes(
+    audio: np.ndarray[Any, np.dtype[np.float32]], sample_rate: int, as_wav: bool
+) -> bytes:
+    """Encode float audio as 16-bit PCM, wrapped in a WAV header if requested."""
+    # Clamp after multiplication to prevent overflow when converting back
+    scaled = np.multiply(audio, 32768.0, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    pcm = scaled.astype(np.int16)
+    if not as_wav:
+        return pcm.tobytes()
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def chunk_spans(
+    length: int, chunk_samples: int, overlap_samples: int
+) -> list[tuple[int, int]]:
+    """Fixed-size, overlapping (start, end) windows covering ``length`` samples.
+
+    Consecutive windows overlap by at least ``overlap_samples``; the last one
+    is aligned to the end of the signal so every window has the same size
+    (and batches of windows need no padding). A signal no longer than one
+    window is a single span.
+    """
+    if not 0 <= overlap_samples < chunk_samples:
+        raise ValueError(
+            f"overlap ({overlap_samples}) must be in [0, chunk ({chunk_samples}))"
+        )
+    if length <= chunk_samples:
+        return [(0, length)]
+    hop = chunk_samples - overlap_samples
+    starts = [*range(0, length - chunk_samples, hop), length - chunk_samples]
+    return [(start, start + chunk_samples) for start in starts]
+
+
+def overlap_add(
+    chunks: list[np.ndarray[Any, np.dtype[np.float32]]],
+    spans: list[tuple[int, int]],
+    length: int,
+    overlap_samples: int,
+) -> np.ndarray[Any, np.dtype[np.float32]]:
+    """Recombine processed windows with raised-cosine crossfades.
+
+    Each window fades in over its first ``overlap_samples`` and out over its
+    last (except at the ends of the signal). The weighted sum is normalized
+    by the summed weights, so the crossfade is transparent wherever the
+    windows agree, including the larger overlap of an end-aligned last window.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    # sin^2 ramp sampled at half-sample offsets: never exactly 0, and a
+    # fade-in plus the mirrored fade-out sums to 1
+    phase = (np.arange(overlap_samples, dtype=np.float32) + 0.5) / max(
+        overlap_samples, 1
+    )
+    ramp = np.sin(0.5 * np.pi * phase) ** 2
+    output = np.zeros(length, dtype=np.float32)
+    weights = np.zeros(length, dtype=np.float32)
+    last = len(chunks) - 1
+    for index, (chunk, (start, end)) in enumerate(zip(chunks, spans, strict=True)):
+        weight = np.ones(end - start, dtype=np.float32)
+        if overlap_samples:
+            if index > 0:
+                weight[:overlap_samples] = ramp
+            if index < last:
+                np.minimum(
+                    weight[-overlap_samples:],
+                    ramp[::-1],
+                    out=weight[-overlap_samples:],
+                )
+        output[start:end] += weight * chunk
+        weights[start:end] += weight
+    output /= weights
+    return output
+
+
+class EnhancementBatcher:
+    """Micro-batch concurrent enhancement requests into single model calls."""
+
+    def __init__(
+        self,
+        enhance_batch: Callable[
+            [list[np.ndarray[Any, np.dtype[np.float32]]]],
+            list[np.ndarray[Any, np.dtype[np.float32]]],
+        ],
+        max_batch_size: int = 4,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            enhance_batch: Callable taking a list of float32 signals and
+                returning one enhanced signal per input, in order
+            max_batch_size: Maximum segments per forward pass
+            max_wait_ms: How long to wait for more segments after the first
+                arrives
+        """
+        self.enhance_batch = enhance_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self._queue: asyncio.Queue[
+            tuple[np.ndarray[Any, np.dtype[np.float32]], asyncio.Future[Any]]
+        ] = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="audio-enhancement"
+        )
+        self._worker: asyncio.Task[None] | None = None
+
+    async def enhance(
+        self, audio: np.ndarray[Any, np.dtype[np.float32]]
+    ) -> np.ndarray[Any, np.dtype[np.float32]]:
+        """Enhance one signal, sharing a forward pass with concurrent callers."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((audio, future))
+        result: np.ndarray[Any, np.dtype[np.float32]] = await future
+        return result
+
+    async def _run(self) -> None:
+        """Collect queued signals into batches and run them on the worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except TimeoutError:
+                    break
+
+            audios = [audio for audio, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.enhance_batch, audios
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            logger.debug(
+                "audio_enhancer.batch_completed",
+                batch_size=len(batch),
+                samples=sum(len(audio) for audio in audios),
+                duration_ms=round((time.perf_counter() - start) * 1000, 2),
+            )
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the batching task and the worker thread."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
 
 class AudioEnhancer:
     """Audio enhancement using MetricGAN+ and preprocessing techniques."""
@@ -44,6 +278,10 @@ class AudioEnhancer:
         model_source: str = "speechbrain/metricgan-plus-voicebank",
         model_savedir: str = "pretrained_models/metricgan-plus",
         enhancement_class: Any | None = None,  # Dependency injection for testing
+        batch_size: int = 4,
+        batch_wait_ms: float = 10.0,
+        chunk_seconds: float | None = None,
+        chunk_overlap_seconds: float = 0.1,
     ) -> None:
         """Initialize audio enhancer.
 
@@ -53,6 +291,11 @@ class AudioEnhancer:
             model_source: Source for MetricGAN+ model
             model_savedir: Directory to save model
             enhancement_class: Optional enhancement class for dependency injection (testing)
+            batch_size: Maximum concurrent segments per MetricGAN+ forward pass
+            batch_wait_ms: How long a segment waits for others to batch with
+            chunk_seconds: Enhance segments longer than this in overlapping
+                windows of this length (None: whole segment at once)
+            chunk_overlap_seconds: Crossfade length between windows
         """
         self.enable_metricgan = enable_metricgan
         self.device = device
@@ -60,7 +303,20 @@ class AudioEnhancer:
         self.model_savedir = model_savedir
         self._enhancement_class = enhancement_class  # Store injected class
 
+        self.batch_size = batch_size
+        self.chunk_seconds = chunk_seconds
+        self.chunk_overlap_seconds = chunk_overlap_seconds
+        if chunk_seconds is not None and not 0 <= chunk_overlap_seconds < chunk_seconds:
+            raise ValueError(
+                f"chunk_overlap_seconds ({chunk_overlap_seconds}) must be in "
+                f"[0, chunk_seconds ({chunk_seconds}))"
+            )
+
         self._metricgan_model: Any | None = None
+        self._batcher = EnhancementBatcher(
+            self._enhance_batch, max_batch_size=batch_size, max_wait_ms=batch_wait_ms
+        )
+        self._load_task: asyncio.Task[bool] | None = None
 
         # Initialize model loader (truly lazy - only loads when used)
         # Create loader functions that capture instance variables
@@ -253,17 +509,15 @@ class AudioEnhancer:
             Filtered audio array
         """
         try:
-            # Design high-pass Butterworth filter
-            nyquist = sample_rate / 2
-            normalized_cutoff = cutoff_freq / nyquist
-
             # Ensure cutoff is valid
-            if normalized_cutoff >= 1.0:
+            if cutoff_freq / (sample_rate / 2) >= 1.0:
                 logger.warning("audio_enhancer.invalid_cutoff", cutoff=cutoff_freq)
                 return audio
 
-            b, a = signal.butter(4, normalized_cutoff, btype="high", analog=False)
-            filtered_audio = signal.filtfilt(b, a, audio)
+            # Zero-phase filtering with the cached second-order sections
+            filtered_audio = signal.sosfiltfilt(
+                high_pass_sos(sample_rate, cutoff_freq), audio
+            )
 
             logger.debug("audio_enhancer.high_pass_applied", cutoff=cutoff_freq)
             return np.asarray(filtered_audio, dtype=np.float32)
@@ -272,6 +526,73 @@ class AudioEnhancer:
             logger.error("audio_enhancer.high_pass_failed", error=str(exc))
             return audio
 
+    def _get_metricgan_model(self) -> Any | None:
+        """Return the loaded MetricGAN+ model, or None if it is not usable yet."""
+        # Graceful handling: If model not loaded and not loading, return original audio
+        if not self.enable_metricgan:
+            return None
+
+        if not self._model_loader.is_loaded():
+            if self._model_loader.is_loading():
+                logger.debug("audio_enhancer.model_loading")
+            else:
+                logger.debug("audio_enhancer.model_not_loaded")
+            return None
+
+        # Get model from loader
+        self._metricgan_model = self._model_loader.get_model()
+        if self._metricgan_model is None:
+            logger.debug("audio_enhancer.enhancement_disabled")
+        return self._metricgan_model
+
+    def _chunk_spans(
+        self, length: int, sample_rate: int
+    ) -> tuple[list[tuple[int, int]], int]:
+        """Windows to enhance a segment in, and their overlap in samples."""
+        if self.chunk_seconds is None:
+            return [(0, length)], 0
+        chunk_samples = max(1, round(self.chunk_seconds * sample_rate))
+        overlap_samples = min(
+            round(self.chunk_overlap_seconds * sample_rate), chunk_samples - 1
+        )
+        return chunk_spans(length, chunk_samples, overlap_samples), overlap_samples
+
+    def _enhance_batch(
+        self, audios: list[np.ndarray[Any, np.dtype[np.float32]]]
+    ) -> list[np.ndarray[Any, np.dtype[np.float32]]]:
+        """Run one MetricGAN+ forward pass over a batch of signals.
+
+        Signals are zero-padded to the longest one and passed with their
+        relative lengths, so padding is masked out; each output is trimmed
+        back to its input length. Runs on the batcher's worker thread.
+        """
+        import torch
+
+        model = self._metricgan_model
+        if model is None:
+            return audios
+
+        lengths = [len(audio) for audio in audios]
+        max_length = max(lengths)
+        if len(audios) == 1:
+            # Shares memory with the input; no padding needed
+            batch = torch.from_numpy(np.ascontiguousarray(audios[0])).unsqueeze(0)
+        else:
+            batch = torch.zeros(len(audios), max_length, dtype=torch.float32)
+            for row, audio in zip(batch, audios, strict=True):
+                row[: len(audio)] = torch.from_numpy(audio)
+        relative_lengths = torch.tensor(
+            [length / max_length for length in lengths], dtype=torch.float32
+        )
+
+        with torch.no_grad():
+            enhanced = model.enhance_batch(batch, lengths=relative_lengths)
+        enhanced_array = enhanced.detach().cpu().numpy()
+        return [
+            np.asarray(enhanced_array[index, :length], dtype=np.float32)
+            for index, length in enumerate(lengths)
+        ]
+
     def enhance_audio(
         self,
         audio: np.ndarray[Any, np.dtype[np.float32]],
@@ -279,6 +600,9 @@ class AudioEnhancer:
     ) -> Any:
         """Apply MetricGAN+ enhancement to audio.
 
+        Runs synchronously as a batch of one; ``enhance_audio_bytes`` batches
+        concurrent requests instead.
+
         Args:
             audio: Input audio array (float32, shape: [samples])
             sample_rate: Sample rate of audio
@@ -286,47 +610,22 @@ class AudioEnhancer:
         Returns:
             Enhanced audio array
         """
-        # Graceful handling: If model not loaded and not loading, return original audio
-        if not self.enable_metricgan:
-            return audio
-
-        # Try to load model if not loaded (lazy loading)
-        # Note: This is sync because enhance_audio is sync, but loader is async
-        # We handle this gracefully by returning original audio if not available
-        if not self._model_loader.is_loaded():
-            # Check if loading (don't block)
-            if self._model_loader.is_loading():
-                logger.debug("audio_enhancer.model_loading")
-                return audio
-            # Try lazy load - but this is async, so we can't wait here
-            # For now, just return original audio if not loaded
-            logger.debug("audio_enhancer.model_not_loaded")
-            return audio
-
-        # Get model from loader
-        self._metricgan_model = self._model_loader.get_model()
-        if self._metricgan_model is None:
-            logger.debug("audio_enhancer.enhancement_disabled")
+        if self._get_metricgan_model() is None:
             return audio
 
         try:
-            import torch
-
-            # Convert to torch tensor
-            audio_tensor = (
-                torch.from_numpy(audio).float().unsqueeze(0)
-            )  # Add batch dimension
-
-            # Apply MetricGAN+ enhancement
-            enhanced_tensor = self._metricgan_model.enhance_batch(
-                audio_tensor, lengths=torch.tensor([len(audio) / sample_rate])
-            )
-
-            # Convert back to numpy
-            enhanced_audio = enhanced_tensor.squeeze(0).detach().cpu().numpy()
-
-            logger.debug("audio_enhancer.enhancement_applied")
-            return np.asarray(enhanced_audio, dtype=np.float32)
+            audio = np.asarray(audio, dtype=np.float32)
+            spans, overlap = self._chunk_spans(len(audio), sample_rate)
+            chunks = [audio[start:end] for start, end in spans]
+            # Windows go through the model batch_size at a time, bounding the
+            # memory of each forward pass regardless of segment length
+            enhanced_chunks = []
+            for first in range(0, len(chunks), self.batch_size):
+                enhanced_chunks.extend(
+                    self._enhance_batch(chunks[first : first + self.batch_size])
+                )
+            logger.debug("audio_enhancer.enhancement_applied", chunks=len(chunks))
+            return overlap_add(enhanced_chunks, spans, len(audio), overlap)
 
         except (ImportError, RuntimeError, OSError, MemoryError) as exc:
             logger.error("audio_enhancer.enhancement_failed", error=str(exc))
@@ -351,7 +650,8 @@ class AudioEnhancer:
         Returns:
             Enhanced audio array
         """
-        enhanced_audio = audio.copy()
+        # Neither stage modifies its input, so no defensive copy is needed
+        enhanced_audio = audio
 
         # Apply high-pass filter if requested
         if apply_high_pass:
@@ -369,11 +669,42 @@ class AudioEnhancer:
 
         return enhanced_audio
 
+    async def ensure_loaded(self) -> bool:
+        """Load MetricGAN+ now and wait for it (e.g. for prewarming)."""
+        if not self.enable_metricgan:
+            return False
+        return await self._model_loader.ensure_loaded()
+
+    def _start_background_load(self) -> None:
+        """Start loading MetricGAN+ without making the current request wait."""
+        if (
+            not self.enable_metricgan
+            or self._model_loader.is_loaded()
+            or self._model_loader.is_loading()
+            or (self._load_task is not None and not self._load_task.done())
+        ):
+            return
+        self._load_task = asyncio.create_task(self._model_loader.ensure_loaded())
+
+    def _prepare_segment(
+        self, audio_data: bytes
+    ) -> tuple[np.ndarray[Any, np.dtype[np.float32]], int, bool]:
+        audio, sample_rate, is_wav = decode_audio_bytes(audio_data)
+        filtered = self.apply_high_pass_filter(
+            audio, sample_rate=sample_rate, cutoff_freq=80.0
+        )
+        return filtered, sample_rate, is_wav
+
     async def enhance_audio_bytes(self, audio_data: bytes) -> bytes:
         """Enhance audio data (async wrapper for HTTP endpoint).
 
+        Accepts 16-bit mono WAV (returned as WAV at the same sample rate) or
+        headerless 16 kHz PCM (returned as PCM). Decoding and filtering run
+        in a worker thread and MetricGAN+ runs on the batcher's inference
+        thread, so the event loop is never blocked.
+
         Args:
-            audio_data: Raw audio data
+            audio_data: WAV or raw 16-bit PCM audio data
 
         Returns:
             Enhanced audio data
@@ -381,23 +712,28 @@ class AudioEnhancer:
         start_time = time.time()
 
         try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-            audio_array = audio_array / 32768.0  # Normalize to [-1, 1]
-
-            # Apply enhancement pipeline
-            enhanced_array = self.enhance_audio_pipeline(
-                audio_array,
-                sample_rate=16000,
-                apply_high_pass=True,
-                high_pass_cutoff=80.0,
+            self._start_background_load()
+            audio, sample_rate, is_wav = await asyncio.to_thread(
+                self._prepare_segment, audio_data
             )
 
-            # Convert back to int16 and bytes
-            # Clamp after multiplication to prevent overflow when converting back
-            enhanced_float = enhanced_array * 32768.0
-            enhanced_int16 = np.clip(enhanced_float, -32768.0, 32767.0).astype(np.int16)
-            enhanced_bytes = bytes(enhanced_int16.tobytes())
+            if len(audio) and self._get_metricgan_model() is not None:
+                # Windows of one segment are queued together, so they share
+                # forward passes with each other and with concurrent segments
+                spans, overlap = self._chunk_spans(len(audio), sample_rate)
+                chunks = await asyncio.gather(
+                    *(self._batcher.enhance(audio[start:end]) for start, end in spans)
+                )
+                if len(chunks) == 1:
+                    audio = chunks[0]
+                else:
+                    audio = await asyncio.to_thread(
+                        overlap_add, list(chunks), spans, len(audio), overlap
+                    )
+
+            enhanced_bytes = await asyncio.to_thread(
+                encode_audio_bytes, audio, sample_rate, is_wav
+            )
 
             processing_time = (time.time() - start_time) * 1000
 
@@ -420,6 +756,14 @@ class AudioEnhancer:
             # Return original data on failure
             return audio_data
 
+    async def close(self) -> None:
+        """Stop the batching worker and any pending background model load."""
+        if self._load_task is not None and not self._load_task.done():
+            self._load_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._load_task
+        await self._batcher.close()
+
     def get_enhancement_info(self) -> dict[str, Any]:
         """Get information about enhancement capabilities.
 
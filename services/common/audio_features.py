@@ -0,0 +1,249 @@
+"""Per-frame audio features computed once and shared by every consumer.
+
+``FrameFeatureStore`` keeps one row per frame in NumPy columns (a structure
+of arrays that grows by doubling, so appending does not allocate per frame):
+
+- ``samples``: number of samples in the frame
+- ``rms``: root mean square in the samples' own scale (int16 domain for
+  16-bit PCM, like ``audioop.rms``)
+- ``energy``: sum of squared samples
+- ``total``: sum of samples (the DC component, for SNR)
+- ``zero_crossings``: sign changes between consecutive samples
+- ``centroid_hz``, ``peak_hz`` and ``band_energy`` (one row of
+  ``len(band_edges_hz) - 1`` bands): spectral features, computed with one
+  real FFT per frame only when the store is created with ``spectral=True``
+
+Aggregates over a range of rows (``rms``, ``mean``, ``zcr``) combine the
+columns as if they were computed on the concatenated samples, so the RMS of
+a whole segment costs a sum over its frames instead of another pass over its
+PCM.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import pairwise
+import math
+from typing import Any
+
+import numpy as np
+
+
+SampleArray = np.ndarray[Any, np.dtype[Any]]
+
+# Below voice, fundamentals, formants, sibilance (edges in Hz)
+DEFAULT_BAND_EDGES_HZ: tuple[float, ...] = (0.0, 300.0, 1000.0, 3000.0, 8000.0)
+
+_SCALAR_COLUMNS: dict[str, type[np.generic]] = {
+    "samples": np.int32,
+    "rms": np.float32,
+    "energy": np.float64,
+    "total": np.float64,
+    "zero_crossings": np.int32,
+}
+_SPECTRAL_COLUMNS: dict[str, type[np.generic]] = {
+    "centroid_hz": np.float32,
+    "peak_hz": np.float32,
+}
+# FFT layouts kept per store; frames almost always share one size and rate
+_MAX_LAYOUTS = 8
+
+
+class FrameFeatureStore:
+    """Columnar per-frame features for one stream of mono frames."""
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        *,
+        spectral: bool = False,
+        band_edges_hz: Sequence[float] = DEFAULT_BAND_EDGES_HZ,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Rows allocated up front (the store grows as needed)
+            spectral: Compute ``centroid_hz``, ``peak_hz`` and ``band_energy``
+                (one FFT per frame); off by default
+            band_edges_hz: Increasing band edges for ``band_energy``
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        edges = tuple(float(edge) for edge in band_edges_hz)
+        if len(edges) < 2 or any(low >= high for low, high in pairwise(edges)):
+            raise ValueError(
+                f"band_edges_hz must be at least two increasing edges, got {edges}"
+            )
+        self.spectral = spectral
+        self.band_edges_hz = edges
+        self._length = 0
+        self._columns: dict[str, SampleArray] = {
+            name: np.zeros(capacity, dtype=dtype)
+            for name, dtype in _SCALAR_COLUMNS.items()
+        }
+        if spectral:
+            for name, dtype in _SPECTRAL_COLUMNS.items():
+                self._columns[name] = np.zeros(capacity, dtype=dtype)
+            self._columns["band_energy"] = np.zeros(
+                (capacity, len(edges) - 1), dtype=np.float64
+            )
+        self._layouts: dict[
+            tuple[int, int], tuple[SampleArray, SampleArray, SampleArray]
+        ] = {}
+        # Per-frame scratch, sized to the largest frame seen
+        self._values: SampleArray = np.empty(0, dtype=np.float64)
+        self._signs: SampleArray = np.empty(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(
+        self, samples: SampleArray, sample_rate: int, rms: float | None = None
+    ) -> int:
+        """Compute the features of one frame and store them as the next row.
+
+        Args:
+            samples: Mono samples of the frame (e.g. ``PCMFrame.samples``)
+            sample_rate: Sample rate in Hz (used by the spectral features)
+            rms: The frame's RMS when the caller already has it (such as
+                ``PCMFrame.rms``); the energy is derived from it instead of
+                from another pass over the samples
+
+        Returns:
+            Index of the new row
+        """
+        x = np.asarray(samples)
+        row = self._length
+        if row == len(self._columns["samples"]):
+            self._grow()
+        columns = self._columns
+        count = len(x)
+
+        if count == 0:
+            energy = total = 0.0
+            crossings = 0
+            rms = 0.0
+        else:
+            if len(self._values) < count:
+                self._values = np.empty(count, dtype=np.float64)
+                self._signs = np.empty(2 * count, dtype=bool)
+            # Widen once into scratch space; reducing int16 directly would
+            # allocate a cast buffer per frame
+            values = self._values[:count]
+            np.copyto(values, x)
+            if rms is None:
+                energy = float(np.dot(values, values))
+                rms = math.sqrt(energy / count)
+            else:
+                energy = rms * rms * count
+            total = float(values.sum())
+            signs = self._signs[:count]
+            changes = self._signs[count : 2 * count - 1]
+            np.less(values, 0, out=signs)
+            np.not_equal(signs[1:], signs[:-1], out=changes)
+            crossings = int(np.count_nonzero(changes))
+
+        columns["samples"][row] = count
+        columns["rms"][row] = rms
+        columns["energy"][row] = energy
+        columns["total"][row] = total
+        columns["zero_crossings"][row] = crossings
+        if self.spectral:
+            self._append_spectral(row, self._values[:count], sample_rate, energy)
+        self._length = row + 1
+        return row
+
+    def clear(self) -> None:
+        """Drop every row (the allocated columns are kept for reuse)."""
+        self._length = 0
+
+    def column(self, name: str) -> SampleArray:
+        """Read-only view of a column's rows, oldest first."""
+        data = self._columns.get(name)
+        if data is None:
+            if name in _SPECTRAL_COLUMNS or name == "band_energy":
+                raise KeyError(f"{name!r} needs a store created with spectral=True")
+            raise KeyError(f"Unknown feature column {name!r}")
+        view = data[: self._length]
+        view.flags.writeable = False
+        return view
+
+    def sample_count(self, start: int = 0, stop: int | None = None) -> int:
+        """Total samples in rows ``[start:stop]``."""
+        return int(self.column("samples")[start:stop].sum())
+
+    def rms(self, start: int = 0, stop: int | None = None) -> float:
+        """RMS of rows ``[start:stop]`` taken together."""
+        count = self.sample_count(start, stop)
+        if count == 0:
+            return 0.0
+        return math.sqrt(float(self.column("energy")[start:stop].sum()) / count)
+
+    def mean(self, start: int = 0, stop: int | None = None) -> float:
+        """Mean sample value (DC offset) of rows ``[start:stop]``."""
+        count = self.sample_count(start, stop)
+        if count == 0:
+            return 0.0
+        return float(self.column("total")[start:stop].sum()) / count
+
+    def zcr(self, start: int = 0, stop: int | None = None) -> float:
+        """Zero crossings per sample pair within the frames of rows ``[start:stop]``."""
+        samples = self.column("samples")[start:stop]
+        pairs = int(np.maximum(samples - 1, 0).sum())
+        if pairs == 0:
+            return 0.0
+        return int(self.column("zero_crossings")[start:stop].sum()) / pairs
+
+    def _append_spectral(
+        self, row: int, x: SampleArray, sample_rate: int, energy: float
+    ) -> None:
+        columns = self._columns
+        if energy == 0.0 or sample_rate <= 0:
+            # Silence has no spectrum worth an FFT
+            columns["centroid_hz"][row] = 0.0
+            columns["peak_hz"][row] = 0.0
+            columns["band_energy"][row] = 0.0
+            return
+        freqs, weights, bands = self._layout(len(x), sample_rate)
+        magnitude = np.abs(np.fft.rfft(x))
+        columns["centroid_hz"][row] = np.dot(freqs, magnitude) / magnitude.sum()
+        columns["peak_hz"][row] = freqs[np.argmax(magnitude)]
+        band_count = len(self.band_edges_hz) - 1
+        # Bins outside the edges land in an extra band that is dropped
+        columns["band_energy"][row] = np.bincount(
+            bands, weights=magnitude**2 * weights, minlength=band_count + 1
+        )[:band_count]
+
+    def _layout(
+        self, count: int, sample_rate: int
+    ) -> tuple[SampleArray, SampleArray, SampleArray]:
+        """Bin frequencies, Parseval weights and band index for an FFT size."""
+        key = (count, sample_rate)
+        layout = self._layouts.get(key)
+        if layout is None:
+            freqs = np.fft.rfftfreq(count, 1 / sample_rate)
+            # One-sided spectrum: bins other than DC and Nyquist stand for two,
+            # so the bands add up to the frame's energy
+            weights = np.full(len(freqs), 2.0 / count)
+            weights[0] = 1.0 / count
+            if count % 2 == 0:
+                weights[-1] = 1.0 / count
+            edges = np.asarray(self.band_edges_hz)
+            band_count = len(edges) - 1
+            bands = np.searchsorted(edges, freqs, side="right") - 1
+            bands[freqs == edges[-1]] = band_count - 1
+            bands[(bands < 0) | (bands >= band_count)] = band_count
+            if len(self._layouts) >= _MAX_LAYOUTS:
+                self._layouts.clear()
+            layout = (freqs, weights, bands)
+            self._layouts[key] = layout
+        return layout
+
+    def _grow(self) -> None:
+        for name, data in self._columns.items():
+            grown = np.zeros((2 * len(data), *data.shape[1:]), dtype=data.dtype)
+            grown[: self._length] = data[: self._length]
+            self._columns[name] = grown
+
+
+__all__ = ["DEFAULT_BAND_EDGES_HZ", "FrameFeatureStore"]
@@ -0,0 +1,410 @@
+"""Vectorized PCM kernels shared by the audio contract, gateway and helpers.
+
+NumPy replacements for the ``audioop`` operations the services use (``audioop``
+is deprecated and removed in Python 3.13):
+
+- ``pcm_samples`` / ``pcm_bytes``: zero-copy views between PCM bytes and
+  integer sample arrays (8-, 16-, 24- and 32-bit, signed like ``audioop``)
+- ``convert_width``: ``audioop.lin2lin``
+- ``mix_to_mono`` / ``expand_channels``: ``audioop.tomono`` / ``tostereo``,
+  channel-aware for any channel count
+- ``Resampler``: ``audioop.ratecv`` (linear interpolation) that keeps its
+  phase and last input frame between calls, so a stream resampled frame by
+  frame is identical to the same audio resampled in one piece
+- ``rms``: ``audioop.rms``
+- ``TimeStretcher``: pitch-preserving WSOLA duration changes for clock drift
+  correction
+
+Kernels take sample arrays (or views of bytes) and accept an optional ``out``
+array so hot paths can reuse buffers instead of allocating per frame.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+
+SampleArray = np.ndarray[Any, np.dtype[Any]]
+
+# Little-endian container dtype per sample width; 24-bit samples use int32
+_DTYPES: dict[int, np.dtype[Any]] = {
+    1: np.dtype("i1"),
+    2: np.dtype("<i2"),
+    3: np.dtype("<i4"),
+    4: np.dtype("<i4"),
+}
+
+
+def _check_width(width: int) -> None:
+    if width not in _DTYPES:
+        raise ValueError(f"Unsupported sample width: {width} (expected 1, 2, 3 or 4)")
+
+
+def sample_dtype(width: int) -> np.dtype[Any]:
+    """NumPy dtype holding samples of ``width`` bytes."""
+    _check_width(width)
+    return _DTYPES[width]
+
+
+def sample_limits(width: int) -> tuple[int, int]:
+    """(min, max) sample value for ``width`` bytes."""
+    _check_width(width)
+    bits = 8 * width
+    return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+
+def pcm_samples(data: bytes | bytearray | memoryview, width: int) -> SampleArray:
+    """Little-endian signed PCM as a sample array.
+
+    A read-only view of ``data`` (no copy) except for 24-bit audio, which is
+    unpacked into a new int32 array.
+    """
+    _check_width(width)
+    if len(data) % width:
+        raise ValueError(
+            f"PCM length ({len(data)} bytes) is not a multiple of width {width}"
+        )
+    if width != 3:
+        return np.frombuffer(data, dtype=_DTYPES[width])
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+    padded = np.zeros((len(raw), 4), dtype=np.uint8)
+    padded[:, 1:] = raw
+    # Sample in the top three bytes; the arithmetic shift restores the sign
+    return padded.view("<i4").reshape(-1) >> 8
+
+
+def pcm_bytes(samples: SampleArray, width: int) -> bytes:
+    """Encode a sample array of ``width``-byte samples as little-endian PCM."""
+    _check_width(width)
+    if width != 3:
+        return np.asarray(samples, dtype=_DTYPES[width]).tobytes()
+    packed = np.asarray(samples, dtype="<i4").reshape(-1, 1).view(np.uint8)
+    return packed[:, :3].tobytes()
+
+
+def convert_width(
+    samples: SampleArray,
+    from_width: int,
+    to_width: int,
+    out: SampleArray | None = None,
+) -> SampleArray:
+    """Change sample width by shifting, as ``audioop.lin2lin`` does.
+
+    Widening shifts left (8 -> 16 bit multiplies by 256); narrowing keeps the
+    most significant bytes (an arithmetic shift, rounding toward -inf).
+    """
+    _check_width(from_width)
+    dtype = sample_dtype(to_width)
+    if out is None:
+        out = np.empty(len(samples), dtype=dtype)
+    shift = 8 * (to_width - from_width)
+    if shift >= 0:
+        np.left_shift(samples, shift, out=out, dtype=dtype, casting="unsafe")
+    else:
+        # Shift in the source dtype; casting first would truncate the samples
+        out[...] = np.right_shift(samples, -shift)
+    return out
+
+
+def mix_to_mono(
+    samples: SampleArray,
+    channels: int,
+    weights: SampleArray | list[float] | None = None,
+    out: SampleArray | None = None,
+) -> SampleArray:
+    """Mix interleaved channels into one, clipping like ``audioop.tomono``.
+
+    Args:
+        samples: Interleaved samples (frames * channels)
+        channels: Number of interleaved channels
+        weights: Per-channel gains (default: the average of all channels)
+        out: Optional output array of one sample per frame (same dtype)
+    """
+    if channels < 1 or len(samples) % channels:
+        raise ValueError(
+            f"{len(samples)} samples do not form whole frames of {channels} channels"
+        )
+    frames = np.asarray(samples).reshape(-1, channels)
+    if out is None:
+        out = np.empty(len(frames), dtype=frames.dtype)
+    if weights is None and np.issubdtype(frames.dtype, np.integer):
+        # Integer average: floor((a + b + ...) / channels), as tomono rounds
+        wide = np.int64 if frames.dtype.itemsize > 2 else np.int32
+        if channels == 1:
+            out[...] = frames[:, 0]
+            return out
+        total = np.add(frames[:, 0], frames[:, 1], dtype=wide)
+        for channel in range(2, channels):
+            total += frames[:, channel]
+        if channels & (channels - 1) == 0:
+            np.right_shift(total, channels.bit_length() - 1, out=total)
+        else:
+            np.floor_divide(total, channels, out=total)
+        out[...] = total
+        return out
+    if weights is None:
+        weights = np.full(channels, 1.0 / channels)
+    mixed = frames @ np.asarray(weights, dtype=np.float64)
+    if np.issubdtype(out.dtype, np.integer):
+        info = np.iinfo(out.dtype)
+        np.floor(mixed, out=mixed)
+        np.clip(mixed, info.min, info.max, out=mixed)
+    out[...] = mixed
+    return out
+
+
+def expand_channels(
+    samples: SampleArray, channels: int, out: SampleArray | None = None
+) -> SampleArray:
+    """Duplicate mono samples into ``channels`` interleaved channels."""
+    if out is None:
+        out = np.empty(len(samples) * channels, dtype=np.asarray(samples).dtype)
+    out.reshape(-1, channels)[...] = np.asarray(samples)[:, None]
+    return out
+
+
+def rms(samples: SampleArray) -> float:
+    """Root mean square in the samples' own scale (``audioop.rms``, unrounded)."""
+    if len(samples) == 0:
+        return 0.0
+    values = np.asarray(samples, dtype=np.float64)
+    return float(np.sqrt(np.dot(values, values) / len(values)))
+
+
+class Resampler:
+    """Stateful linear-interpolation resampler for streams of PCM frames.
+
+    Output sample ``k`` of the stream is read at input position
+    ``k * from_rate / to_rate`` (exact integer arithmetic, so there is no
+    drift over long streams). The last input frame and the output count carry
+    over between ``process`` calls; splitting a stream into frames therefore
+    does not change the result, unlike ``audioop.ratecv(..., state=None)``
+    which restarts its phase on every call.
+
+    Like ``audioop.ratecv`` there is no anti-aliasing filter. Use
+    ``services.common.audio.resample_audio`` (librosa) where quality matters
+    more than per-frame cost.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int, channels: int = 1) -> None:
+        if from_rate <= 0 or to_rate <= 0:
+            raise ValueError(f"Sample rates must be positive: {from_rate} -> {to_rate}")
+        if channels < 1:
+            raise ValueError(f"channels must be positive, got {channels}")
+        divisor = math.gcd(from_rate, to_rate)
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.channels = channels
+        self._down = from_rate // divisor
+        self._up = to_rate // divisor
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream position (start a new stream)."""
+        self._frames_in = 0
+        self._frames_out = 0
+        self._previous: SampleArray | None = None
+
+    def max_output_frames(self, input_frames: int) -> int:
+        """Upper bound on the frames one ``process`` call returns."""
+        return (input_frames * self._up) // self._down + 2
+
+    def process(
+        self, samples: SampleArray, out: SampleArray | None = None
+    ) -> SampleArray:
+        """Resample the next interleaved chunk of the stream.
+
+        Args:
+            samples: Interleaved samples (frames * channels) of any dtype
+            out: Optional output of at least ``max_output_frames`` frames
+                (times channels); the returned array is a view of it
+
+        Returns:
+            Resampled interleaved samples, same dtype as the input (or ``out``)
+        """
+        frames = np.asarray(samples).reshape(-1, self.channels)
+        dtype = out.dtype if out is not None else frames.dtype
+        if self.from_rate == self.to_rate:
+            result = frames.reshape(-1)
+            if out is None:
+                return result
+            out[: len(result)] = result
+            return out[: len(result)]
+        if len(frames) == 0:
+            return out[:0] if out is not None else np.empty(0, dtype=dtype)
+
+        # Input frame positions available: [first, last]; position `first`
+        # is the previous call's last frame when there is one
+        first = self._frames_in - (1 if self._previous is not None else 0)
+        last = self._frames_in + len(frames) - 1
+        # Outputs whose read position k * down / up lies in [.., last]
+        end = (last * self._up) // self._down + 1
+        positions = np.arange(self._frames_out, end, dtype=np.int64) * self._down
+        index = positions // self._up - first
+        source = (
+            frames
+            if self._previous is None
+            else np.concatenate((self._previous, frames))
+        )
+
+        count = len(index) * self.channels
+        if out is None:
+            out = np.empty(count, dtype=dtype)
+        result = out[:count].reshape(-1, self.channels)
+        if self._up == 1:
+            # Integer decimation (e.g. 48 kHz -> 16 kHz) reads whole frames
+            result[...] = source[index]
+        else:
+            frac = (positions % self._up).astype(np.float64) / self._up
+            left = source[index].astype(np.float64)
+            # The last read position may be exactly the last frame (frac 0)
+            right = source[np.minimum(index + 1, len(source) - 1)]
+            interpolated = left + (right - left) * frac[:, None]
+            if np.issubdtype(dtype, np.integer):
+                info = np.iinfo(dtype)
+                np.rint(interpolated, out=interpolated)
+                np.clip(interpolated, info.min, info.max, out=interpolated)
+            result[...] = interpolated
+
+        self._frames_in += len(frames)
+        self._frames_out = end
+        self._previous = frames[-1:].copy()
+        return result.reshape(-1)
+
+
+class TimeStretcher:
+    """WSOLA-style time-scale modification for small duration changes.
+
+    Shortens or lengthens a stream by whole pitch periods: the lag ``L`` that
+    best aligns ``x[a:a+L]`` with ``x[a+L:a+2L]`` (normalized cross-correlation
+    over a sliding window) is found, and the two periods are crossfaded into
+    one (speed up) or a crossfaded copy is inserted (slow down). Pitch is
+    preserved, every output sample is a whole sample, and frame edges are left
+    untouched, so consecutive frames stay continuous.
+
+    The requested change is accumulated per stream in ``pending`` samples and
+    applied once it covers the best-aligned period, so a 1% correction on 20 ms
+    frames becomes one period removed every few frames rather than a clipped
+    frame.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        min_period_ms: float = 2.5,
+        max_period_ms: float = 15.0,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.min_lag = max(2, int(sample_rate * min_period_ms / 1000))
+        self.max_lag = max(self.min_lag, int(sample_rate * max_period_ms / 1000))
+        self.pending = 0.0  # Samples still to remove (> 0) or insert (< 0)
+        self._fades: dict[int, SampleArray] = {}
+
+    def process(self, samples: SampleArray, speed: float = 1.0) -> SampleArray:
+        """Time-stretch the next chunk of mono samples.
+
+        Args:
+            samples: Mono samples of any dtype
+            speed: Playback speed; 1.05 makes the stream ~5% shorter and
+                0.95 ~5% longer (applied as whole periods become available)
+
+        Returns:
+            Stretched samples, same dtype as the input
+        """
+        x = np.asarray(samples)
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        self.pending += len(x) * (1.0 - 1.0 / speed)
+        if abs(self.pending) < self.min_lag or len(x) < 2 * self.min_lag:
+            return x
+
+        signal = x.astype(np.float64)
+        parts: list[SampleArray] = []
+        copied = 0  # Input consumed into ``parts`` so far
+        position = 0
+        while abs(self.pending) >= self.min_lag:
+            max_lag = min(self.max_lag, (len(x) - position) // 2)
+            if max_lag < self.min_lag:
+                break
+            lag = self._best_lag(signal, position, max_lag)
+            if lag > abs(self.pending):
+                # Only whole periods keep the pitch; wait for more correction
+                break
+            first = signal[position : position + lag]
+            second = signal[position + lag : position + 2 * lag]
+            fade_in = self._fade_in(lag)
+            if self.pending > 0:
+                # Replace two periods with one that fades from the first to the second
+                parts.append(x[copied:position])
+                parts.append(first + (second - first) * fade_in)
+                copied = position + 2 * lag
+                self.pending -= lag
+            else:
+                # Insert a period that fades from the second back to the first
+                # between them: ... first, second->first, second ...
+                parts.append(x[copied : position + lag])
+                parts.append(second + (first - second) * fade_in)
+                copied = position + lag
+                self.pending += lag
+            position += 2 * lag
+        parts.append(x[copied:])
+
+        if np.issubdtype(x.dtype, np.integer):
+            info = np.iinfo(x.dtype)
+            parts = [
+                np.clip(np.rint(part), info.min, info.max)
+                if part.dtype != x.dtype
+                else part
+                for part in parts
+            ]
+        return np.concatenate(parts).astype(x.dtype, copy=False)
+
+    def reset(self) -> None:
+        """Forget any pending correction."""
+        self.pending = 0.0
+
+    def _best_lag(self, signal: SampleArray, position: int, max_lag: int) -> int:
+        """Lag in [min_lag, max_lag] best aligning the signal with itself."""
+        window = self.min_lag
+        reference = signal[position : position + window]
+        candidates = np.lib.stride_tricks.sliding_window_view(
+            signal[position + self.min_lag : position + max_lag + window], window
+        )
+        energy = np.einsum("ij,ij->i", candidates, candidates)
+        score = (candidates @ reference) / np.sqrt(
+            energy * float(reference @ reference) + 1e-9
+        )
+        return self.min_lag + int(np.argmax(score))
+
+    def _fade_in(self, length: int) -> SampleArray:
+        """Raised-cosine ramp from 0 to 1 at half-sample offsets (cached)."""
+        fade = self._fades.get(length)
+        if fade is None:
+            fade = 0.5 - 0.5 * np.cos(np.pi * (np.arange(length) + 0.5) / length)
+            self._fades[length] = fade
+        return fade
+
+
+def resample(
+    samples: SampleArray, from_rate: int, to_rate: int, channels: int = 1
+) -> SampleArray:
+    """Resample a complete buffer (a one-shot ``Resampler``)."""
+    return Resampler(from_rate, to_rate, channels).process(samples)
+
+
+__all__ = [
+    "Resampler",
+    "TimeStretcher",
+    "convert_width",
+    "expand_channels",
+    "mix_to_mono",
+    "pcm_bytes",
+    "pcm_samples",
+    "resample",
+    "rms",
+    "sample_dtype",
+    "sample_limits",
+]
@@ -3,7 +3,7 @@
 from enum import Enum
 from pathlib import Path
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
 from opentelemetry.metrics import Observation
 
@@ -156,12 +156,101 @@ def create_audio_metrics(observability_manager: ObservabilityManager) -> dict[st
             unit="s",
             description="Voice input to response latency",
         ),
+        "voice_stage_duration": meter.create_histogram(
+            "voice_stage_duration_seconds",
+            unit="s",
+            description="Voice-to-voice latency breakdown by pipeline stage",
+        ),
         "active_sessions": meter.create_up_down_counter(
             "active_sessions", unit="1", description="Number of active voice sessions"
         ),
     }
 
 
+def create_jitter_buffer_metrics(
+    observability_manager: ObservabilityManager,
+    get_stats: Callable[[], Mapping[str, dict[str, float]]],
+) -> dict[str, Any]:
+    """Register observable jitter buffer metrics.
+
+    Instruments can only be registered once per name, so register once per
+    process and report every live buffer from ``get_stats``.
+
+    Args:
+        observability_manager: ObservabilityManager instance for the service
+        get_stats: Returns ``JitterBuffer.stats()`` keyed by surface ID; each
+            surface is reported with a ``surface`` attribute
+
+    Returns:
+        Dictionary (may be empty - callbacks are registered at creation time)
+    """
+    meter = observability_manager.get_meter()
+    if not meter:
+        return {}
+    service_name = observability_manager.service_name
+
+    def stat_callback(key: str) -> Callable[[Any], list[Observation]]:
+        def callback(_callback_options: Any) -> list[Observation]:
+            return [
+                Observation(stats[key], {"service": service_name, "surface": surface})
+                for surface, stats in get_stats().items()
+            ]
+
+        return callback
+
+    def dropped_callback(_callback_options: Any) -> list[Observation]:
+        return [
+            Observation(
+                stats[f"{reason}_drops"],
+                {"reason": reason, "service": service_name, "surface": surface},
+            )
+            for surface, stats in get_stats().items()
+            for reason in ("late", "duplicate", "overflow")
+        ]
+
+    try:
+        meter.create_observable_gauge(
+            "jitter_buffer_occupancy_frames",
+            unit="1",
+            description="Frames waiting in the jitter buffer",
+            callbacks=[stat_callback("occupancy_frames")],
+        )
+        meter.create_observable_gauge(
+            "jitter_buffer_target_latency_ms",
+            unit="ms",
+            description="Current jitter buffer playout delay",
+            callbacks=[stat_callback("target_latency_ms")],
+        )
+        meter.create_observable_gauge(
+            "jitter_buffer_jitter_ms",
+            unit="ms",
+            description="Estimated inter-arrival jitter (RFC 3550)",
+            callbacks=[stat_callback("jitter_ms")],
+        )
+        meter.create_observable_counter(
+            "jitter_buffer_dropped_frames_total",
+            unit="1",
+            description="Frames dropped as late, duplicate or ring overflow",
+            callbacks=[dropped_callback],
+        )
+        meter.create_observable_counter(
+            "jitter_buffer_concealed_frames_total",
+            unit="1",
+            description="Missing frames replaced by loss concealment",
+            callbacks=[stat_callback("concealed_frames")],
+        )
+    except Exception as exc:
+        from .structured_logging import get_logger
+
+        get_logger(__name__).warning(
+            "jitter_buffer_metrics.creation_failed",
+            service=service_name,
+            error=str(exc),
+            error_type=type(exc).__name__,
+        )
+    return {}
+
+
 def create_stt_metrics(observability_manager: ObservabilityManager) -> dict[str, Any]:
     """Create STT-specific metrics (replaces Discord Prometheus metrics)."""
     meter = observability_manager.get_meter()
@@ -208,6 +297,21 @@ def create_llm_metrics(observability_manager: ObservabilityManager) -> dict[str,
             unit="1",
             description="Total LLM tokens processed by type (prompt/completion)",
         ),
+        "llm_prompt_tokens": meter.create_histogram(
+            "llm_prompt_tokens",
+            unit="1",
+            description="Estimated prompt tokens per LLM request (system, history and input)",
+        ),
+        "llm_fast_path_requests": meter.create_counter(
+            "llm_fast_path_requests_total",
+            unit="1",
+            description="Fast-path intent router decisions by result (hit/miss) and intent",
+        ),
+        "llm_fast_path_saved": meter.create_histogram(
+            "llm_fast_path_latency_saved_seconds",
+            unit="s",
+            description="Estimated agent latency avoided by fast-path answers",
+        ),
     }
 
 
@@ -254,6 +358,26 @@ def create_http_metrics(observability_manager: ObservabilityManager) -> dict[str
                 unit="s",
                 description="HTTP request duration",
             ),
+            "http_request_logging_duration": meter.create_histogram(
+                "http_request_logging_duration_seconds",
+                unit="s",
+                description="Time spent emitting log events while serving a request",
+            ),
+            "http_client_hedged_requests": meter.create_counter(
+                "http_client_hedged_requests_total",
+                unit="1",
+                description="Hedged outbound requests by upstream and winning copy",
+            ),
+            "http_client_retry_budget_exhausted": meter.create_counter(
+                "http_client_retry_budget_exhausted_total",
+                unit="1",
+                description="Outbound retries or hedges refused by the retry budget",
+            ),
+            "http_client_replica_ejections": meter.create_counter(
+                "http_client_replica_ejections_total",
+                unit="1",
+                description="Upstream replicas ejected after their circuit opened",
+            ),
         }
         logger.debug(
             "http_metrics.created",
@@ -295,6 +419,16 @@ def create_guardrails_metrics(
             unit="1",
             description="Total toxicity checks performed",
         ),
+        "toxicity_cache_lookups": meter.create_counter(
+            "guardrails_toxicity_cache_lookups_total",
+            unit="1",
+            description="Sentence-level toxicity cache lookups by result (hit/miss)",
+        ),
+        "toxicity_batch_size": meter.create_histogram(
+            "guardrails_toxicity_batch_size",
+            unit="1",
+            description="Sentences scored per toxicity forward pass",
+        ),
         "pii_detections": meter.create_counter(
             "guardrails_pii_detections_total",
             unit="1",
@@ -354,10 +488,62 @@ def _read_cgroup_memory_limit() -> int | None:
     return None
 
 
+def _create_logging_metrics(meter: Any, service_name: str) -> None:
+    """Register observable instruments for the process log pipeline."""
+    from .structured_logging import get_log_pipeline_stats, get_logger
+
+    def events_callback(_callback_options: Any) -> list[Observation]:
+        stats = get_log_pipeline_stats()
+        return [
+            Observation(
+                count, {"event": event, "level": level, "service": service_name}
+            )
+            for (event, level), count in stats["events"].items()
+        ]
+
+    def dropped_callback(_callback_options: Any) -> list[Observation]:
+        stats = get_log_pipeline_stats()
+        return [
+            Observation(count, {"level": level, "service": service_name})
+            for level, count in stats["dropped"].items()
+        ]
+
+    def queue_depth_callback(_callback_options: Any) -> list[Observation]:
+        stats = get_log_pipeline_stats()
+        return [Observation(stats["queue_depth"], {"service": service_name})]
+
+    try:
+        meter.create_observable_counter(
+            "log_events_total",
+            unit="1",
+            description="Log events written, by event name and level",
+            callbacks=[events_callback],
+        )
+        meter.create_observable_counter(
+            "log_events_dropped_total",
+            unit="1",
+            description="Log events dropped because the log queue was full",
+            callbacks=[dropped_callback],
+        )
+        meter.create_observable_gauge(
+            "log_queue_depth",
+            unit="1",
+            description="Log records waiting for the render thread",
+            callbacks=[queue_depth_callback],
+        )
+    except Exception as exc:
+        get_logger(__name__).warning(
+            "logging_metrics.creation_failed",
+            service=service_name,
+            error=str(exc),
+            error_type=type(exc).__name__,
+        )
+
+
 def create_system_metrics(
     observability_manager: ObservabilityManager,
 ) -> dict[str, Any]:
-    """Create system-level metrics (memory usage, limits).
+    """Create system-level metrics (memory usage, limits, log pipeline).
 
     Uses ObservableGauge for callback-based metric collection.
     Metrics are automatically collected every 15 seconds via PeriodicExportingMetricReader.
@@ -372,6 +558,8 @@ def create_system_metrics(
     if not meter:
         return {}
 
+    _create_logging_metrics(meter, observability_manager.service_name)
+
     try:
         import psutil
     except ImportError:
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Any
 
 from services.common.audio import AudioProcessor as CommonAudioProcessor
+from services.common.audio_features import FrameFeatureStore
 from services.common.audio_quality import AudioQualityMetrics
 from services.common.audio_vad import VADProcessor
 from services.common.structured_logging import get_logger
@@ -118,6 +119,20 @@ class AudioProcessingCore:
         """
         return await self._quality_metrics.calculate_metrics(audio_data)
 
+    def calculate_feature_metrics(
+        self, features: FrameFeatureStore, sample_rate: int
+    ) -> dict[str, Any]:
+        """Calculate audio quality metrics from already-extracted frame features.
+
+        Args:
+            features: Per-frame features of the audio to analyze
+            sample_rate: Sample rate of the frames in Hz
+
+        Returns:
+            Quality metrics dictionary
+        """
+        return self._quality_metrics.metrics_from_features(features, sample_rate)
+
     async def _normalize_frame(self, frame: PCMFrame) -> PCMFrame:
         """Apply basic normalization to frame.
 
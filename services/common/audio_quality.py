@@ -10,6 +10,8 @@ from typing import Any
 
 import numpy as np
 
+from services.common.audio_features import FrameFeatureStore
+from services.common.audio_kernels import pcm_samples
 from services.common.surfaces.types import AudioSegment, PCMFrame
 
 
@@ -61,86 +63,12 @@ class AudioQualityMetrics:
             )
 
         try:
-            # Convert to numpy array for analysis
-            if isinstance(audio_data, PCMFrame):
-                audio_array = np.frombuffer(audio_data.pcm, dtype=np.int16).astype(
-                    np.float32
-                )
-                sample_rate = audio_data.sample_rate
-            else:
-                audio_array = np.frombuffer(audio_data.pcm, dtype=np.int16).astype(
-                    np.float32
-                )
-                sample_rate = audio_data.sample_rate
-
-            # Normalize to [-1, 1]
-            audio_array = audio_array / 32768.0
-
-            # Calculate RMS (volume level)
-            rms = np.sqrt(np.mean(audio_array**2))
-
-            # Early return for silent/empty audio to avoid -Infinity in SNR calculation
-            if rms < 1e-6 or len(audio_array) == 0:
-                from services.common.structured_logging import get_logger
-
-                logger = get_logger(__name__)
-                logger.debug(
-                    "audio_quality.silent_audio_detected",
-                    rms=float(rms),
-                    array_length=len(audio_array),
-                    sample_rate=sample_rate,
-                )
-                return {
-                    "rms": 0.0,  # Normalized RMS (0-1)
-                    "rms_int16": 0.0,  # Int16 domain RMS (0-32767)
-                    "snr_db": float(-np.inf),  # Explicit silent audio handling
-                    "clarity_score": 0.0,
-                    "dominant_frequency_hz": 0.0,
-                    "sample_rate": sample_rate,
-                    "duration_ms": len(audio_array) / sample_rate * 1000
-                    if sample_rate > 0
-                    else 0.0,
-                }
-
-            # Calculate SNR (signal-to-noise ratio)
-            signal_power = np.mean(audio_array**2)
-            noise_power = np.var(audio_array - np.mean(audio_array))
-
-            # Guard against silent audio (signal_power = 0) producing -Infinity
-            if signal_power < 1e-10:
-                snr = -np.inf
-            else:
-                snr = 10 * np.log10(signal_power / (noise_power + 1e-10))
-
-            # Calculate clarity score with -Infinity handling
-            if snr == -np.inf or np.isinf(snr):
-                clarity_score = 0.0
-            else:
-                clarity_score = min(1.0, max(0.0, (snr + 20) / 40))  # Normalize to 0-1
-
-            # Calculate frequency content
-            fft = np.fft.fft(audio_array)
-            freqs = np.fft.fftfreq(len(audio_array), 1 / sample_rate)
-            dominant_freq = freqs[np.argmax(np.abs(fft))]
-
-            # Calculate int16 domain RMS for threshold comparisons
-            from services.common.audio import normalized_to_int16
-
-            rms_int16 = normalized_to_int16(rms)
-
-            metrics = {
-                "rms": float(rms),  # Normalized RMS (0-1) for SNR calculations
-                "rms_int16": float(
-                    rms_int16
-                ),  # Int16 domain RMS (0-32767) for threshold comparisons
-                "snr_db": float(snr),
-                "clarity_score": float(clarity_score),
-                "dominant_frequency_hz": float(abs(dominant_freq)),
-                "sample_rate": sample_rate,
-                "duration_ms": len(audio_array) / sample_rate * 1000,
-            }
-
-            return metrics
+            # The whole buffer as one row; dominant frequency needs the spectrum
+            features = FrameFeatureStore(capacity=1, spectral=True)
+            features.append(pcm_samples(audio_data.pcm, 2), audio_data.sample_rate)
+            return AudioQualityMetrics.metrics_from_features(
+                features, audio_data.sample_rate
+            )
 
         except (ValueError, IndexError, ZeroDivisionError) as exc:
             # Return default metrics on error (invalid audio data, empty array, etc.)
@@ -165,6 +93,144 @@ class AudioQualityMetrics:
                 "duration_ms": 0.0,
             }
 
+    @staticmethod
+    def metrics_from_features(
+        features: FrameFeatureStore,
+        sample_rate: int,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> dict[str, Any]:
+        """Quality metrics of rows ``[start:stop]`` of a feature store.
+
+        Reads only the per-frame columns, so the metrics of an accumulated
+        segment cost a sum over its frames rather than a pass over its PCM.
+        Same keys as ``calculate_metrics``; ``dominant_frequency_hz`` (the
+        peak of the loudest frame) is only present when the store computes
+        spectral features.
+
+        Args:
+            features: Features of 16-bit PCM frames
+            sample_rate: Sample rate of the frames in Hz
+            start: First row to include
+            stop: Row to stop before (default: all rows)
+        """
+        count = features.sample_count(start, stop)
+        rms_int16 = features.rms(start, stop)
+        # Normalize to [-1, 1]
+        rms = rms_int16 / 32768.0
+        duration_ms = count / sample_rate * 1000 if sample_rate > 0 else 0.0
+
+        # Early return for silent/empty audio to avoid -Infinity in SNR calculation
+        if rms < 1e-6 or count == 0:
+            from services.common.structured_logging import get_logger
+
+            logger = get_logger(__name__)
+            logger.debug(
+                "audio_quality.silent_audio_detected",
+                rms=float(rms),
+                array_length=count,
+                sample_rate=sample_rate,
+            )
+            metrics: dict[str, Any] = {
+                "rms": 0.0,  # Normalized RMS (0-1)
+                "rms_int16": 0.0,  # Int16 domain RMS (0-32767)
+                "snr_db": float(-np.inf),  # Explicit silent audio handling
+                "clarity_score": 0.0,
+                "sample_rate": sample_rate,
+                "duration_ms": duration_ms,
+            }
+            if features.spectral:
+                metrics["dominant_frequency_hz"] = 0.0
+            return metrics
+
+        # Calculate SNR (signal-to-noise ratio): power against variance
+        signal_power = rms * rms
+        mean = features.mean(start, stop) / 32768.0
+        noise_power = max(signal_power - mean * mean, 0.0)
+
+        # Guard against silent audio (signal_power = 0) producing -Infinity
+        if signal_power < 1e-10:
+            snr = -np.inf
+        else:
+            snr = 10 * np.log10(signal_power / (noise_power + 1e-10))
+
+        # Calculate clarity score with -Infinity handling
+        if np.isinf(snr):
+            clarity_score = 0.0
+        else:
+            clarity_score = min(1.0, max(0.0, (snr + 20) / 40))  # Normalize to 0-1
+
+        metrics = {
+            "rms": float(rms),  # Normalized RMS (0-1) for SNR calculations
+            "rms_int16": float(
+                rms_int16
+            ),  # Int16 domain RMS (0-32767) for threshold comparisons
+            "snr_db": float(snr),
+            "clarity_score": float(clarity_score),
+            "sample_rate": sample_rate,
+            "duration_ms": duration_ms,
+        }
+        if features.spectral:
+            energy = features.column("energy")[start:stop]
+            peaks = features.column("peak_hz")[start:stop]
+            metrics["dominant_frequency_hz"] = float(peaks[np.argmax(energy)])
+        return metrics
+
+    @staticmethod
+    def calculate_reference_snr(
+        reference: np.ndarray[Any, np.dtype[Any]],
+        estimate: np.ndarray[Any, np.dtype[Any]],
+    ) -> float:
+        """SNR of an estimate against a reference signal of the same length.
+
+        Unlike ``snr_db`` from ``calculate_metrics``, this measures how far
+        ``estimate`` deviates from ``reference`` (e.g. enhanced vs clean audio).
+
+        Returns:
+            SNR in dB (inf if the signals are identical)
+        """
+        reference = np.asarray(reference, dtype=np.float64)
+        error_power = float(np.sum((reference - estimate) ** 2))
+        if error_power == 0.0:
+            return float(np.inf)
+        return float(10 * np.log10((np.sum(reference**2) + 1e-20) / error_power))
+
+    @staticmethod
+    def calculate_segmental_snr(
+        reference: np.ndarray[Any, np.dtype[Any]],
+        estimate: np.ndarray[Any, np.dtype[Any]],
+        sample_rate: int,
+        frame_ms: float = 20.0,
+        min_db: float = -10.0,
+        max_db: float = 35.0,
+    ) -> float:
+        """Mean per-frame SNR of an estimate against a reference signal.
+
+        Frame SNRs are clamped to [min_db, max_db] before averaging, the usual
+        segmental SNR that tracks perceived quality more closely than a
+        whole-signal SNR: a short burst of error (such as a discontinuity at
+        a chunk boundary) lowers it even when the total error energy is small.
+        Frames where the reference is silent are skipped.
+
+        Returns:
+            Segmental SNR in dB (max_db if there are no non-silent frames)
+        """
+        frame = max(1, int(sample_rate * frame_ms / 1000))
+        count = min(len(reference), len(estimate)) // frame
+        if count == 0:
+            return max_db
+        reference = np.asarray(reference[: count * frame], dtype=np.float64)
+        estimate = np.asarray(estimate[: count * frame], dtype=np.float64)
+        signal_power = np.sum(reference.reshape(count, frame) ** 2, axis=1)
+        error_power = np.sum((reference - estimate).reshape(count, frame) ** 2, axis=1)
+        voiced = signal_power > 1e-10 * frame
+        if not np.any(voiced):
+            return max_db
+        frame_snr = 10 * np.log10(
+            signal_power[voiced] / np.maximum(error_power[voiced], 1e-20)
+        )
+        return float(np.mean(np.clip(frame_snr, min_db, max_db)))
+
     @staticmethod
     def validate_quality_thresholds(
         metrics: dict[str, Any],
@@ -52,8 +52,6 @@ class VADProcessor:
             self._vad_call_count += 1
 
             if self._vad_call_count <= 10 or self._vad_call_count % 100 == 0:
-                frame_rms = np.frombuffer(frame.pcm, dtype=np.int16)
-                frame_rms = np.sqrt(np.mean(frame_rms.astype(np.float32) ** 2))
                 self._logger.debug(
                     "audio_vad.detection_result",
                     is_speech=is_speech,
@@ -61,7 +59,7 @@ class VADProcessor:
                     input_samples=len(frame.pcm) // 2,
                     vad_sample_rate=sample_rate,
                     vad_samples=len(frame_bytes) // 2,
-                    frame_rms=float(frame_rms),
+                    frame_rms=frame.rms,
                     aggressiveness=self._aggressiveness,
                 )
 
@@ -110,6 +108,10 @@ class VADProcessor:
     def _prepare_frame_for_vad(self, frame: PCMFrame) -> tuple[bytes, int]:
         """Prepare frame for VAD by converting to 16kHz if needed.
 
+        Resampling and trimming work on views of ``frame.samples``, so the only
+        copy is the final one to bytes; a 20ms frame already at 16kHz is passed
+        to VAD as is.
+
         Args:
             frame: PCM frame to prepare
 
@@ -117,42 +119,27 @@ class VADProcessor:
             Tuple of (frame bytes, sample rate)
         """
         target_sample_rate = 16000
+        # Ensure frame is correct length for VAD (10ms, 20ms, or 30ms)
+        # Use 20ms frames for better compatibility with 40ms Discord frames
+        frame_duration_ms = 20  # Use 20ms frames (320 samples at 16kHz)
+        frame_length = int(target_sample_rate * frame_duration_ms / 1000)
 
-        # If already at 16kHz, use directly
-        if frame.sample_rate == target_sample_rate:
-            # Ensure frame is correct length for VAD (10ms, 20ms, or 30ms)
-            frame_duration_ms = 20  # Use 20ms frames (320 samples at 16kHz)
-            frame_length = int(target_sample_rate * frame_duration_ms / 1000)
-
-            frame_data = np.frombuffer(frame.pcm, dtype=np.int16)
-            if len(frame_data) > frame_length:
-                # Take first 20ms for VAD (discard remainder)
-                frame_data = frame_data[:frame_length]
-            elif len(frame_data) < frame_length:
-                # Pad with zeros if too short
-                frame_data = np.pad(
-                    frame_data, (0, frame_length - len(frame_data)), mode="constant"
-                )
-
-            return frame_data.astype(np.int16).tobytes(), target_sample_rate
+        if (
+            frame.sample_rate == target_sample_rate
+            and len(frame.pcm) == 2 * frame_length
+        ):
+            return frame.pcm, target_sample_rate
 
-        # Convert to 16kHz for VAD
-        frame_data = np.frombuffer(frame.pcm, dtype=np.int16)
+        frame_data = frame.samples
         if frame.sample_rate > target_sample_rate:
             # Downsample
             ratio = frame.sample_rate // target_sample_rate
             frame_data = frame_data[::ratio]
-        else:
+        elif frame.sample_rate < target_sample_rate:
             # Upsample (simple repeat)
             ratio = target_sample_rate // frame.sample_rate
             frame_data = np.repeat(frame_data, ratio)
 
-        # Ensure frame is correct length for VAD (10ms, 20ms, or 30ms)
-        # Use 20ms frames for better compatibility with 40ms Discord frames
-        # (split 40ms into two 20ms chunks would be ideal, but for now use 20ms)
-        frame_duration_ms = 20  # Use 20ms frames (320 samples at 16kHz)
-        frame_length = int(target_sample_rate * frame_duration_ms / 1000)
-
         if len(frame_data) > frame_length:
             # Take first 20ms for VAD (discard remainder)
             frame_data = frame_data[:frame_length]
@@ -162,5 +149,4 @@ class VADProcessor:
                 frame_data, (0, frame_length - len(frame_data)), mode="constant"
             )
 
-        frame_bytes = frame_data.astype(np.int16).tobytes()
-        return frame_bytes, target_sample_rate
+        return frame_data.tobytes(), target_sample_rate
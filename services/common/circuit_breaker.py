@@ -92,6 +92,22 @@ class CircuitBreaker:
         # HALF_OPEN state
         return self._state == CircuitState.HALF_OPEN
 
+    def peek_available(self) -> bool:
+        """Check if ``is_available`` would allow a request, without side effects.
+
+        An OPEN circuit whose timeout has passed reports True but stays OPEN
+        (and nothing is logged) until ``is_available`` is called.
+        """
+        if self._state != CircuitState.OPEN:
+            return True
+        if self._last_failure_time is None:
+            return False
+        timeout = min(
+            self._config.timeout_seconds * (2**self._failure_count),
+            self._config.max_timeout_seconds,
+        )
+        return time.time() - self._last_failure_time >= timeout
+
     async def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute function with circuit breaker protection."""
         if not self.is_available():
@@ -128,6 +144,14 @@ class CircuitBreaker:
             self._on_failure()
             raise
 
+    def record_success(self) -> None:
+        """Record a successful outcome observed outside ``call``."""
+        self._on_success()
+
+    def record_failure(self) -> None:
+        """Record a failed outcome observed outside ``call``."""
+        self._on_failure()
+
     def _on_success(self) -> None:
         """Handle successful operation."""
         if self._state == CircuitState.HALF_OPEN:
@@ -0,0 +1,129 @@
+"""Cold-start benchmark harness for model-serving services.
+
+Every run loads the service's model in a fresh interpreter, the way a newly
+scheduled pod would, and reports the time to a loaded model together with the
+loader's stage breakdown. The first run after a model change populates the
+snapshot; later runs show the snapshot restore.
+
+Services expose it from a small module::
+
+    from services.common.cold_start import main
+
+    if __name__ == "__main__":
+        sys.exit(main("services.flan.cold_start_benchmark", _create_loader))
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .model_loader import BackgroundModelLoader
+
+
+_RESULT_PREFIX = "COLD_START_RESULT "
+
+
+async def _load_once(create_loader: Callable[[], BackgroundModelLoader]) -> None:
+    start = time.perf_counter()
+    loader = create_loader()
+    await loader.initialize()
+    await loader.ensure_loaded()
+    ready_ms = (time.perf_counter() - start) * 1000
+    # Let a first run finish writing the snapshot the next run will use
+    await loader.wait_for_snapshot()
+    status = loader.get_status()
+    await loader.cleanup()
+    print(_RESULT_PREFIX + json.dumps({"ready_ms": round(ready_ms, 2), **status}))
+
+
+def run_benchmark(
+    module: str, runs: int = 3, snapshots: bool = True
+) -> list[dict[str, Any]]:
+    """Measure ``runs`` cold starts of a service's model.
+
+    Args:
+        module: Benchmark module to run as ``python -m <module> --once``
+        runs: Number of fresh-process loads
+        snapshots: Whether the children may use model snapshots
+
+    Returns:
+        One result per run: process wall time, time to loaded model and the
+        loader's ``get_status()``
+    """
+    env = dict(os.environ, MODEL_SNAPSHOT_ENABLED="true" if snapshots else "false")
+    results: list[dict[str, Any]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-m", module, "--once"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        lines = [
+            line
+            for line in completed.stdout.splitlines()
+            if line.startswith(_RESULT_PREFIX)
+        ]
+        if not lines:
+            results.append(
+                {
+                    "wall_ms": round(wall_ms, 2),
+                    "error": completed.stderr.strip().splitlines()[-1:],
+                }
+            )
+            continue
+        result = json.loads(lines[-1][len(_RESULT_PREFIX) :])
+        results.append({"wall_ms": round(wall_ms, 2), **result})
+    return results
+
+
+def main(
+    module: str,
+    create_loader: Callable[[], BackgroundModelLoader],
+    argv: list[str] | None = None,
+) -> int:
+    """Command-line entry point shared by the per-service benchmarks."""
+    parser = argparse.ArgumentParser(description=f"Cold-start benchmark ({module})")
+    parser.add_argument("--runs", type=int, default=3, help="fresh-process loads")
+    parser.add_argument(
+        "--no-snapshot", action="store_true", help="load without model snapshots"
+    )
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.once:
+        asyncio.run(_load_once(create_loader))
+        return 0
+
+    results = run_benchmark(module, runs=args.runs, snapshots=not args.no_snapshot)
+    print(f"\n=== Cold Start: {module} ===")
+    for index, result in enumerate(results, start=1):
+        if "error" in result:
+            print(
+                f"run {index}: failed after {result['wall_ms']:.0f}ms {result['error']}"
+            )
+            continue
+        breakdown = ", ".join(
+            f"{phase} {ms:.0f}ms"
+            for phase, ms in result.get("breakdown_ms", {}).items()
+        )
+        print(
+            f"run {index}: {result.get('method', '?'):>8}  "
+            f"process {result['wall_ms']:.0f}ms  model {result['ready_ms']:.0f}ms  "
+            f"[{breakdown}]"
+        )
+    return 0 if all("error" not in result for result in results) else 1
+
+
+__all__ = ["main", "run_benchmark"]
@@ -8,9 +8,33 @@ in the voice pipeline, ensuring proper hierarchical organization and traceabilit
 import re
 import time
 import uuid
+from contextvars import ContextVar
 from typing import Any
 
 
+# Correlation ID of the request being handled (set by ObservabilityMiddleware).
+# Kept here rather than in the middleware so that logging and HTTP clients can
+# read it without importing FastAPI.
+_correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+
+
+def get_correlation_id() -> str | None:
+    """Get correlation ID from async context."""
+    return _correlation_id.get()
+
+
+def set_correlation_id(correlation_id: str) -> None:
+    """Set correlation ID in async context.
+
+    This allows endpoints to set correlation_id from request body when
+    middleware didn't extract it from headers.
+
+    Args:
+        correlation_id: Correlation ID to set
+    """
+    _correlation_id.set(correlation_id)
+
+
 def _generate_unique_suffix() -> str:
     """Generate a short unique suffix to prevent collisions."""
     return str(uuid.uuid4())[:8]
@@ -328,8 +352,10 @@ __all__ = [
     "generate_orchestrator_correlation_id",
     "generate_stt_correlation_id",
     "generate_tts_correlation_id",
+    "get_correlation_id",
     "get_service_from_correlation_id",
     "is_valid_correlation_id",
     "parse_correlation_id",
+    "set_correlation_id",
     "validate_correlation_id",
 ]
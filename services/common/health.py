@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import random
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, cast
+from typing import Any
 
 from .structured_logging import get_logger
 
@@ -62,6 +64,18 @@ class HealthManager:
         # Startup failure tracking
         self._startup_failure: dict[str, Any] | None = None
 
+        # Background prober state. The snapshot is replaced, never mutated, so
+        # readers always see a consistent view without locking.
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        self._ready_event = asyncio.Event()
+        self._prober_task: asyncio.Task[None] | None = None
+        self._probe_interval: float | None = None
+        self._probe_jitter = 0.1
+        self._probe_max_backoff = 30.0
+        self._probe_timeout = 2.0
+        self._next_probe_at: dict[str, float] = {}
+        self._probe_errors: dict[str, int] = {}
+
     def set_observability_manager(self, observability_manager: Any) -> None:
         """Set the observability manager for metrics."""
         self._observability_manager = observability_manager
@@ -107,6 +121,230 @@ class HealthManager:
         else:
             return self._dep_cache_ttl  # Steady state: configured value
 
+    @property
+    def probing(self) -> bool:
+        """Whether the background prober is running."""
+        return self._prober_task is not None and not self._prober_task.done()
+
+    def start_background_probing(
+        self,
+        interval_seconds: float | None = None,
+        jitter: float = 0.1,
+        max_backoff_seconds: float = 30.0,
+        timeout_seconds: float = 2.0,
+    ) -> None:
+        """Refresh dependency status in the background instead of on request.
+
+        Each dependency is re-checked on its own schedule; failures that raise
+        or time out back off exponentially so a struggling dependency is not
+        hammered. Readiness reads the published snapshot without any I/O.
+        Calling this again while the prober runs is a no-op.
+
+        Args:
+            interval_seconds: Refresh interval; defaults to the adaptive
+                startup-aware cache TTL
+            jitter: Fractional jitter applied to each refresh interval
+            max_backoff_seconds: Upper bound for the backed-off interval
+            timeout_seconds: Per-check timeout
+        """
+        if self.probing:
+            return
+        self._probe_interval = interval_seconds
+        self._probe_jitter = max(0.0, jitter)
+        self._probe_max_backoff = max_backoff_seconds
+        self._probe_timeout = timeout_seconds
+        self._prober_task = asyncio.create_task(self._probe_loop())
+        self._logger.debug(
+            "health.background_probing_started",
+            dependencies=list(self._dependencies),
+        )
+
+    async def stop_background_probing(self) -> None:
+        """Stop the background prober; readiness falls back to on-request checks."""
+        task, self._prober_task = self._prober_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def get_dependency_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the latest probed status of each dependency."""
+        return self._snapshot
+
+    async def wait_until_ready(
+        self, timeout: float, poll_interval: float = 2.0
+    ) -> bool:
+        """Wait until the service is ready.
+
+        With the background prober running this wakes as soon as a probe
+        reports every dependency available; otherwise it polls ``check_ready``.
+
+        Returns:
+            True if ready within ``timeout``, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if await self.check_ready():
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._ready_event.wait(), timeout=min(remaining, poll_interval)
+                )
+
+    async def _probe_loop(self) -> None:
+        """Probe due dependencies concurrently, then sleep until the next is due."""
+        while True:
+            now = time.monotonic()
+            due = [
+                (name, check)
+                for name, check in list(self._dependencies.items())
+                if self._next_probe_at.get(name, 0.0) <= now
+            ]
+            if due:
+                await asyncio.gather(
+                    *(self._probe_dependency(name, check) for name, check in due)
+                )
+            next_due = min(
+                (self._next_probe_at.get(name, 0.0) for name in self._dependencies),
+                default=time.monotonic() + self._get_effective_cache_ttl(),
+            )
+            await asyncio.sleep(max(0.05, next_due - time.monotonic()))
+
+    async def _probe_dependency(self, name: str, check: Callable[[], Any]) -> None:
+        """Run one background probe and schedule the next."""
+        elapsed_since_startup = time.time() - self._startup_time
+        status = await self._run_check(
+            name, check, elapsed_since_startup, self._probe_timeout
+        )
+        interval = self._probe_interval or self._get_effective_cache_ttl()
+        # Only errors and timeouts back off; a dependency that is merely not
+        # ready yet (e.g. models loading) keeps the normal interval
+        errors = self._probe_errors.get(name, 0) + 1 if "error" in status else 0
+        self._probe_errors[name] = errors
+        if errors:
+            interval = min(self._probe_max_backoff, interval * 2**errors)
+        interval *= 1 + random.uniform(-self._probe_jitter, self._probe_jitter)
+        self._next_probe_at[name] = time.monotonic() + interval
+
+    def _publish(self, name: str, status: dict[str, Any]) -> None:
+        """Publish a dependency status into the snapshot."""
+        self._snapshot = {**self._snapshot, name: status}
+        self._update_ready_event()
+
+    def _snapshot_ready(self) -> bool:
+        """Whether the snapshot shows every registered dependency available."""
+        snapshot = self._snapshot
+        return all(
+            bool(snapshot.get(name, {}).get("available")) for name in self._dependencies
+        )
+
+    def _update_ready_event(self) -> None:
+        if self._startup_complete and self._snapshot_ready():
+            self._ready_event.set()
+        else:
+            self._ready_event.clear()
+
+    async def _run_check(
+        self,
+        name: str,
+        check: Callable[[], Any],
+        elapsed_since_startup: float,
+        timeout: float = 2.0,
+    ) -> dict[str, Any]:
+        """Run a dependency check, cache the result and publish it to the snapshot.
+
+        Returns dependency status dict with available, checked_at, cached, and optional error fields.
+        """
+        now_monotonic = time.monotonic()
+        try:
+            if asyncio.iscoroutinefunction(check):
+                is_healthy = await asyncio.wait_for(check(), timeout=timeout)
+            else:
+                # Offload sync work to thread if potentially blocking
+                loop = asyncio.get_running_loop()
+                is_healthy = await asyncio.wait_for(
+                    loop.run_in_executor(None, check), timeout=timeout
+                )
+            status: dict[str, Any] = {
+                "available": is_healthy,
+                "checked_at": time.time(),
+                "cached": False,
+            }
+        except TimeoutError:
+            # Timeout treated as failure
+            status = {
+                "available": False,
+                "error": "Timeout",
+                "error_type": "TimeoutError",
+                "checked_at": time.time(),
+                "cached": False,
+            }
+        except Exception as exc:
+            # Determine log level based on startup phase
+            is_startup_phase = elapsed_since_startup < 60.0
+            log_level = "debug" if is_startup_phase else "warning"
+            getattr(self._logger, log_level)(
+                "health.dependency_error",
+                dependency=name,
+                error=str(exc),
+                error_type=type(exc).__name__,
+                elapsed_since_startup_seconds=round(elapsed_since_startup, 1),
+                is_startup_phase=is_startup_phase,
+            )
+            status = {
+                "available": False,
+                "error": f"{type(exc).__name__}: {str(exc)}",
+                "error_type": type(exc).__name__,
+                "checked_at": time.time(),
+                "cached": False,
+            }
+
+        self._dep_cache[name] = {
+            "result": bool(status["available"]),
+            "ts": now_monotonic,
+        }
+        self._publish(name, status)
+        return status
+
+    async def _dependency_statuses(
+        self, elapsed_since_startup: float
+    ) -> dict[str, dict[str, Any] | BaseException]:
+        """Get the status of every registered dependency.
+
+        While the background prober runs, statuses come from its snapshot in
+        O(1); only dependencies it has not reached yet are checked inline.
+        Without the prober, every dependency is checked behind the TTL cache.
+        """
+        snapshot = self._snapshot if self.probing else {}
+        statuses: dict[str, dict[str, Any] | BaseException] = {}
+        unprobed: dict[str, Callable[[], Any]] = {}
+        for name, check in self._dependencies.items():
+            status = snapshot.get(name)
+            if status is None:
+                unprobed[name] = check
+            else:
+                statuses[name] = {**status, "cached": True}
+
+        if unprobed:
+            # Check remaining dependencies in parallel
+            effective_cache_ttl = self._get_effective_cache_ttl()
+            results = await asyncio.gather(
+                *(
+                    self._check_dependency(
+                        name, check, elapsed_since_startup, effective_cache_ttl
+                    )
+                    for name, check in unprobed.items()
+                ),
+                return_exceptions=True,
+            )
+            statuses.update(zip(unprobed, results, strict=True))
+        return statuses
+
     async def _check_dependency(
         self,
         name: str,
@@ -152,58 +390,7 @@ class HealthManager:
                 }
 
             # Perform actual dependency check with timeout
-            try:
-                if asyncio.iscoroutinefunction(check):
-                    is_healthy = await asyncio.wait_for(check(), timeout=2.0)
-                else:
-                    # Offload sync work to thread if potentially blocking
-                    loop = asyncio.get_running_loop()
-                    is_healthy = await asyncio.wait_for(
-                        loop.run_in_executor(None, check), timeout=2.0
-                    )
-
-                # Cache the result
-                self._dep_cache[name] = {
-                    "result": bool(is_healthy),
-                    "ts": now_monotonic,
-                }
-
-                return {
-                    "available": is_healthy,
-                    "checked_at": time.time(),
-                    "cached": False,
-                }
-            except TimeoutError:
-                # Timeout treated as failure
-                self._dep_cache[name] = {"result": False, "ts": now_monotonic}
-                return {
-                    "available": False,
-                    "error": "Timeout",
-                    "error_type": "TimeoutError",
-                    "checked_at": time.time(),
-                    "cached": False,
-                }
-            except Exception as exc:
-                # Cache failure result
-                self._dep_cache[name] = {"result": False, "ts": now_monotonic}
-                # Determine log level based on startup phase
-                is_startup_phase = elapsed_since_startup < 60.0
-                log_level = "debug" if is_startup_phase else "warning"
-                getattr(self._logger, log_level)(
-                    "health.dependency_error",
-                    dependency=name,
-                    error=str(exc),
-                    error_type=type(exc).__name__,
-                    elapsed_since_startup_seconds=round(elapsed_since_startup, 1),
-                    is_startup_phase=is_startup_phase,
-                )
-                return {
-                    "available": False,
-                    "error": f"{type(exc).__name__}: {str(exc)}",
-                    "error_type": type(exc).__name__,
-                    "checked_at": time.time(),
-                    "cached": False,
-                }
+            return await self._run_check(name, check, elapsed_since_startup)
 
     async def check_ready(self) -> bool:
         """Check if service is ready (all critical deps available).
@@ -214,7 +401,8 @@ class HealthManager:
 
         This allows services to return 503 during model downloads and cache warmup.
 
-        Checks all dependencies in parallel for better performance.
+        With the background prober running this reads its snapshot without I/O;
+        otherwise all dependencies are checked in parallel.
         """
         if not self._startup_complete:
             return False
@@ -222,30 +410,20 @@ class HealthManager:
         if not self._dependencies:
             return True
 
-        # Check all dependencies in parallel
-        effective_cache_ttl = self._get_effective_cache_ttl()
-        elapsed_since_startup = time.time() - self._startup_time
-        tasks = [
-            self._check_dependency(
-                name, check, elapsed_since_startup, effective_cache_ttl
-            )
-            for name, check in self._dependencies.items()
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if self.probing and self._snapshot_ready():
+            return True
+
+        statuses = await self._dependency_statuses(time.time() - self._startup_time)
 
         # Return False if any dependency is unhealthy
-        dependency_names = list(self._dependencies.keys())
-        for i, result in enumerate(results):
-            name = dependency_names[i]
-            if isinstance(result, Exception):
+        for name, result in statuses.items():
+            if isinstance(result, BaseException):
                 self._logger.warning(
                     "health.dependency_check_failed", dependency=name, error=str(result)
                 )
                 return False
 
-            # Type narrowing: result is dict[str, Any] here (Exception was handled above)
-            dep_status: dict[str, Any] = cast(dict[str, Any], result)
-            if not dep_status.get("available", False):
+            if not result.get("available", False):
                 self._logger.debug("health.dependency_unhealthy", dependency=name)
                 return False
 
@@ -337,6 +515,7 @@ class HealthManager:
             return  # Don't mark complete if critical failure occurred
 
         self._startup_complete = True
+        self._update_ready_event()
         self._logger.info("health.startup_complete", service=self._service_name)
         # Update startup metric using OpenTelemetry
         if self._health_status_gauge:
@@ -391,21 +570,11 @@ class HealthManager:
             dependency_status: dict[str, dict[str, Any]] = {}
             failing_dependencies: list[str] = []
 
-            # Check all dependencies in parallel
-            effective_cache_ttl = self._get_effective_cache_ttl()
-            tasks = [
-                self._check_dependency(
-                    name, check, elapsed_since_startup, effective_cache_ttl
-                )
-                for name, check in self._dependencies.items()
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            statuses = await self._dependency_statuses(elapsed_since_startup)
 
             # Process results
-            dependency_names = list(self._dependencies.keys())
-            for i, result in enumerate(results):
-                name = dependency_names[i]
-                if isinstance(result, Exception):
+            for name, result in statuses.items():
+                if isinstance(result, BaseException):
                     # Exception occurred during check
                     dependency_status[name] = {
                         "available": False,
@@ -416,8 +585,7 @@ class HealthManager:
                     failing_dependencies.append(name)
                     ready = False
                 else:
-                    # Type narrowing: result is dict[str, Any] here (Exception was handled above)
-                    dep_status: dict[str, Any] = cast(dict[str, Any], result)
+                    dep_status = result
                     dependency_status[name] = dep_status
 
                     # Update dependency metric using OpenTelemetry
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping, MutableMapping
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping, MutableMapping
 from typing import Any
 
 import httpx
@@ -16,44 +18,152 @@ from .structured_logging import get_logger
 DEFAULT_BACKOFF_SECONDS = 0.5
 
 
-async def post_with_retries(
-    client: httpx.AsyncClient,
-    url: str,
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's deadline passes before a request could be sent."""
+
+
+def timeout_within_deadline(
+    timeout: float | httpx.Timeout | None, deadline: float | None
+) -> float | httpx.Timeout | None:
+    """Shrink a request timeout so the request ends by ``deadline``.
+
+    Args:
+        timeout: Requested timeout
+        deadline: Absolute ``time.monotonic()`` deadline, or None
+
+    Returns:
+        The timeout, capped at the time remaining before the deadline
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Deadline exceeded before request was sent")
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, httpx.Timeout):
+        return httpx.Timeout(
+            connect=_cap(timeout.connect, remaining),
+            read=_cap(timeout.read, remaining),
+            write=_cap(timeout.write, remaining),
+            pool=_cap(timeout.pool, remaining),
+        )
+    return min(float(timeout), remaining)
+
+
+def _cap(value: float | None, limit: float) -> float:
+    return limit if value is None else min(value, limit)
+
+
+class RetryBudget:
+    """Limit retries to a fraction of recent request volume.
+
+    Every request earns ``ratio`` retries and a floor of
+    ``min_retries_per_second`` keeps low-traffic clients able to retry. When
+    an upstream degrades, retries stop at roughly ``ratio`` extra load instead
+    of multiplying it by ``max_retries``.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 0.5,
+        window_seconds: float = 10.0,
+        on_exhausted: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request over the window
+            min_retries_per_second: Retries always allowed regardless of volume
+            window_seconds: Sliding window for counting requests and retries
+            on_exhausted: Called each time a retry is refused
+        """
+        self.ratio = ratio
+        self.window_seconds = window_seconds
+        self._reserve = min_retries_per_second * window_seconds
+        self._on_exhausted = on_exhausted
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self.exhausted = 0
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request."""
+        now = time.monotonic()
+        # Prune here too, or a client that never retries keeps every timestamp
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            True if the retry may be sent, False if the budget is exhausted
+        """
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) < self._reserve + self.ratio * len(self._requests):
+            self._retries.append(now)
+            return True
+        self.exhausted += 1
+        if self._on_exhausted is not None:
+            self._on_exhausted()
+        return False
+
+
+async def send_with_retries(
+    send_attempt: Callable[[float | httpx.Timeout | None], Awaitable[httpx.Response]],
     *,
-    files: Mapping[str, tuple[str, bytes, str]] | None = None,
-    data: Mapping[str, Any] | None = None,
-    json: Any | None = None,
-    content: bytes | None = None,
-    headers: Mapping[str, str] | None = None,
-    params: Mapping[str, Any] | None = None,
+    url: str,
     max_retries: int = 3,
     log_fields: MutableMapping[str, Any] | None = None,
     logger: BoundLogger | None = None,
     timeout: float | httpx.Timeout | None = None,
+    deadline: float | None = None,
+    retry_budget: RetryBudget | None = None,
+    record_request: bool = True,
+    payload_size: int = 0,
 ) -> httpx.Response:
-    """POST helper that retries with exponential backoff and structured logs."""
+    """Retry loop behind ``post_with_retries``, with exponential backoff.
+
+    ``send_attempt`` sends one attempt with the given (deadline-capped)
+    timeout; error statuses are raised here, so each attempt's outcome is
+    visible to whoever sends it, and a caller may route each attempt
+    differently (e.g. to another replica).
+
+    Args:
+        send_attempt: Sends one attempt and returns its response
+        url: URL (or endpoint) for the structured logs
+        max_retries: Maximum attempts, including the first
+        log_fields: Extra fields for every log event
+        logger: Logger to use (defaults to this module's)
+        timeout: Timeout per attempt
+        deadline: Absolute ``time.monotonic()`` deadline for the whole call
+        retry_budget: Budget retries are taken from
+        record_request: Record the call in ``retry_budget``; pass False when
+            the caller already counted it (e.g. for a hedged copy)
+        payload_size: Request body size for the first attempt's log
+    """
 
     attempt = 0
     log = logger or get_logger(__name__)
     extra = dict(log_fields or {})
-    # Auto-inject correlation ID from context using shared utility
-    request_headers = inject_correlation_id(headers)
-
-    # Calculate payload size for logging
-    payload_size = 0
-    if files:
-        payload_size = sum(
-            len(f[1]) if isinstance(f[1], bytes) else 0 for f in files.values()
-        )
-    elif content:
-        payload_size = len(content)
-    elif json:
-        import json as json_module
 
-        payload_size = len(json_module.dumps(json).encode())
+    if retry_budget is not None and record_request:
+        retry_budget.record_request()
 
     while True:
         attempt += 1
+        attempt_timeout = timeout_within_deadline(timeout, deadline)
         # Log first attempt with decision context
         if attempt == 1:
             log.info(
@@ -68,16 +178,7 @@ async def post_with_retries(
             )
 
         try:
-            response = await client.post(
-                url,
-                files=files,
-                data=data,
-                json=json,
-                content=content,
-                headers=request_headers,
-                params=params,
-                timeout=timeout,
-            )
+            response = await send_attempt(attempt_timeout)
             response.raise_for_status()
             log.info(
                 "http.post_success",
@@ -89,7 +190,16 @@ async def post_with_retries(
             )
             return response
         except Exception as exc:
+            backoff = min(DEFAULT_BACKOFF_SECONDS * (2 ** (attempt - 1)), 10.0)
             if attempt >= max_retries:
+                decision = "max_retries_exceeded"
+            elif deadline is not None and time.monotonic() + backoff >= deadline:
+                decision = "deadline_exhausted"
+            elif retry_budget is not None and not retry_budget.try_acquire():
+                decision = "retry_budget_exhausted"
+            else:
+                decision = None
+            if decision is not None:
                 log.error(
                     "http.post_failed",
                     url=url,
@@ -97,11 +207,10 @@ async def post_with_retries(
                     max_retries=max_retries,
                     error=str(exc),
                     error_type=type(exc).__name__,
-                    decision="max_retries_exceeded",
+                    decision=decision,
                     **extra,
                 )
                 raise
-            backoff = min(DEFAULT_BACKOFF_SECONDS * (2 ** (attempt - 1)), 10.0)
             log.warning(
                 "http.post_retry",
                 url=url,
@@ -116,4 +225,85 @@ async def post_with_retries(
             await asyncio.sleep(backoff)
 
 
-__all__ = ["post_with_retries"]
+def payload_size_of(
+    files: Mapping[str, tuple[str, bytes, str]] | None = None,
+    content: bytes | None = None,
+    json: Any | None = None,
+) -> int:
+    """Size in bytes of a request body, for logging."""
+    if files:
+        return sum(len(f[1]) if isinstance(f[1], bytes) else 0 for f in files.values())
+    if content:
+        return len(content)
+    if json:
+        import json as json_module
+
+        return len(json_module.dumps(json).encode())
+    return 0
+
+
+async def post_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    files: Mapping[str, tuple[str, bytes, str]] | None = None,
+    data: Mapping[str, Any] | None = None,
+    json: Any | None = None,
+    content: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    params: Mapping[str, Any] | None = None,
+    max_retries: int = 3,
+    log_fields: MutableMapping[str, Any] | None = None,
+    logger: BoundLogger | None = None,
+    timeout: float | httpx.Timeout | None = None,
+    deadline: float | None = None,
+    retry_budget: RetryBudget | None = None,
+    record_request: bool = True,
+) -> httpx.Response:
+    """POST helper that retries with exponential backoff and structured logs.
+
+    With a ``deadline`` (absolute ``time.monotonic()``), each attempt's timeout
+    is capped at the remaining time and no retry starts that could not finish
+    in time. With a ``retry_budget``, retries stop once the budget is spent;
+    pass ``record_request=False`` when the caller already counted the request
+    in the budget (e.g. for a hedged copy of it).
+    """
+    # Auto-inject correlation ID from context using shared utility
+    request_headers = inject_correlation_id(headers)
+
+    async def send_attempt(
+        attempt_timeout: float | httpx.Timeout | None,
+    ) -> httpx.Response:
+        return await client.post(
+            url,
+            files=files,
+            data=data,
+            json=json,
+            content=content,
+            headers=request_headers,
+            params=params,
+            timeout=attempt_timeout,
+        )
+
+    return await send_with_retries(
+        send_attempt,
+        url=url,
+        max_retries=max_retries,
+        log_fields=log_fields,
+        logger=logger,
+        timeout=timeout,
+        deadline=deadline,
+        retry_budget=retry_budget,
+        record_request=record_request,
+        payload_size=payload_size_of(files, content, json),
+    )
+
+
+__all__ = [
+    "DeadlineExceededError",
+    "RetryBudget",
+    "payload_size_of",
+    "post_with_retries",
+    "send_with_retries",
+    "timeout_within_deadline",
+]
@@ -25,14 +25,17 @@ def create_resilient_client(
         service_name: Name of the service (used for circuit breaker naming and defaults)
         base_url: Base URL for the service. If not provided, will try to load from
                  environment variable `{PREFIX}_BASE_URL`, or default to
-                 `http://{service_name.lower()}`
+                 `http://{service_name.lower()}`. A comma-separated list
+                 load-balances across replicas.
         env_prefix: Prefix for environment variables (e.g., "ORCHESTRATOR").
                    If not provided, defaults to `service_name.upper()`.
         **kwargs: Additional keyword arguments to override any ResilientHTTPClient
                  parameter. These take precedence over environment variables.
                  Valid parameters: timeout, health_check_interval,
                  health_check_startup_grace_seconds, health_check_timeout,
-                 max_connections, max_keepalive_connections, circuit_config.
+                 max_connections, max_keepalive_connections, circuit_config,
+                 retry_budget_ratio, hedge_idempotent, load_balancing,
+                 pin_by_correlation_id, metrics.
 
     Returns:
         Configured ResilientHTTPClient instance
@@ -121,6 +124,26 @@ def create_resilient_client(
             5,
             int,
         ),
+        "retry_budget_ratio": get_env_with_default(
+            f"{prefix}_RETRY_BUDGET_RATIO",
+            0.1,
+            float,
+        ),
+        "hedge_idempotent": get_env_with_default(
+            f"{prefix}_HEDGE_REQUESTS",
+            False,
+            bool,
+        ),
+        "load_balancing": get_env_with_default(
+            f"{prefix}_LOAD_BALANCING",
+            "least_loaded",
+            str,
+        ),
+        "pin_by_correlation_id": get_env_with_default(
+            f"{prefix}_PIN_BY_CORRELATION_ID",
+            False,
+            bool,
+        ),
     }
 
     # Apply kwargs overrides (kwargs take precedence over env vars)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
+from services.common.correlation import get_correlation_id
+
 
 def inject_correlation_id(headers: Mapping[str, str] | None = None) -> dict[str, str]:
     """Inject correlation ID from context into headers if not present.
@@ -23,16 +25,10 @@ def inject_correlation_id(headers: Mapping[str, str] | None = None) -> dict[str,
     if "X-Correlation-ID" in result:
         return result
 
-    # Try to get correlation ID from async context
-    try:
-        from services.common.middleware import get_correlation_id
-
-        correlation_id = get_correlation_id()
-        if correlation_id:
-            result["X-Correlation-ID"] = correlation_id
-    except ImportError:
-        # Middleware not available, skip injection
-        pass
+    # Get correlation ID from async context
+    correlation_id = get_correlation_id()
+    if correlation_id:
+        result["X-Correlation-ID"] = correlation_id
 
     return result
 
@@ -43,12 +39,7 @@ def get_correlation_id_from_context() -> str | None:
     Returns:
         Correlation ID if available, None otherwise
     """
-    try:
-        from services.common.middleware import get_correlation_id
-
-        return get_correlation_id()
-    except ImportError:
-        return None
+    return get_correlation_id()
 
 
 __all__ = ["inject_correlation_id", "get_correlation_id_from_context"]
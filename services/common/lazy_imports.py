@@ -0,0 +1,73 @@
+"""Deferred imports for heavy dependencies.
+
+torch, transformers, librosa and scipy each take hundreds of milliseconds to
+several seconds to import. Modules that only need them once a model loads or a
+request arrives bind them with ``lazy_import`` so that the service answers
+``/health/live`` first::
+
+    torch = lazy_import("torch", "FLAN service requires torch")
+
+    def _load() -> None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"  # imports here
+
+Whether the package is installed is still checked at import time, so a missing
+dependency keeps failing fast at startup with the given hint.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str, hint: str | None = None) -> Any:
+    """Return a proxy for module ``name`` that imports it on first use.
+
+    Args:
+        name: Absolute module name, e.g. ``"torch"`` or ``"scipy.signal"``
+        hint: Appended to the ImportError raised when the package is missing
+
+    Raises:
+        ImportError: If the module cannot be found
+    """
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError) as exc:
+        spec = None
+        reason = str(exc)
+    else:
+        reason = f"No module named '{name}'"
+    if spec is None:
+        message = f"Required library not available: {reason}."
+        raise ImportError(f"{message} {hint}" if hint else message, name=name)
+    return LazyModule(name)
+
+
+__all__ = ["LazyModule", "lazy_import"]
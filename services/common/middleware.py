@@ -4,231 +4,328 @@ from __future__ import annotations
 
 import time
 import uuid
-from collections.abc import Awaitable, Callable
-from contextvars import ContextVar
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+from opentelemetry.trace import SpanContext
 
-from services.common.structured_logging import get_logger
+from starlette.datastructures import MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-logger = get_logger(__name__)
-
-# Context variable for storing correlation ID in async context
-_correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+from services.common.correlation import get_correlation_id, set_correlation_id
+from services.common.structured_logging import (
+    LoggingTimer,
+    get_logger,
+    track_logging_time,
+)
 
+logger = get_logger(__name__)
 
-def get_correlation_id() -> str | None:
-    """Get correlation ID from async context."""
-    return _correlation_id.get()
-
+# Route label for requests that matched no registered route (404s), used a
+# method the route does not accept, or hit a route beyond MAX_ROUTES
+ROUTE_FALLBACK = "__unmatched__"
+HTTP_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"})
+# Routes given their own series; later ones share the fallback bucket
+MAX_ROUTES = 256
+_STATUSES = ("success", "error")
 
-def set_correlation_id(correlation_id: str) -> None:
-    """Set correlation ID in async context.
 
-    This allows endpoints to set correlation_id from request body when
-    middleware didn't extract it from headers.
+class HttpRouteMetrics:
+    """HTTP server instruments with attribute sets precomputed per route template.
 
-    Args:
-        correlation_id: Correlation ID to set
+    The ``route`` label is the template of the matched route (``/items/{id}``),
+    never the raw path, so series count is bounded by the routes registered
+    at startup: at most ``MAX_ROUTES`` templates plus ``ROUTE_FALLBACK``, each
+    with a fixed set of methods and two statuses.
     """
-    _correlation_id.set(correlation_id)
+
+    def __init__(
+        self,
+        http_metrics: dict[str, Any],
+        service_name: str | None,
+        routes: Iterable[tuple[str, Iterable[str] | None]],
+        max_routes: int = MAX_ROUTES,
+    ) -> None:
+        self.requests = http_metrics.get("http_requests")
+        self.duration = http_metrics.get("http_request_duration")
+        self.logging_duration = http_metrics.get("http_request_logging_duration")
+
+        self._request_attributes: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._duration_attributes: dict[tuple[str, str], dict[str, Any]] = {}
+        self._logging_attributes: dict[str, dict[str, Any]] = {}
+
+        self._add_route(ROUTE_FALLBACK, (*HTTP_METHODS, "OTHER"), service_name)
+        for template, methods in routes:
+            if template in self._logging_attributes:
+                continue
+            if len(self._logging_attributes) > max_routes:
+                break
+            self._add_route(template, methods or HTTP_METHODS, service_name)
+
+    @classmethod
+    def from_app(cls, app: Any) -> HttpRouteMetrics | None:
+        """Build from ``app.state.http_metrics`` and the app's registered routes."""
+        state = getattr(app, "state", None)
+        http_metrics = getattr(state, "http_metrics", None)
+        if not http_metrics or not isinstance(http_metrics, dict):
+            return None
+        routes = [
+            (route.path, getattr(route, "methods", None))
+            for route in getattr(app, "routes", ())
+            if isinstance(getattr(route, "path", None), str)
+        ]
+        return cls(http_metrics, getattr(state, "service_name", None), routes)
+
+    def _add_route(
+        self, template: str, methods: Iterable[str], service_name: str | None
+    ) -> None:
+        base: dict[str, Any] = {"route": template}
+        if service_name:
+            base["service"] = service_name
+        self._logging_attributes[template] = base
+        for method in methods:
+            self._duration_attributes[template, method] = {**base, "method": method}
+            for status in _STATUSES:
+                self._request_attributes[template, method, status] = {
+                    **base,
+                    "method": method,
+                    "status": status,
+                }
+
+    def route_for(self, scope: Scope) -> str:
+        """Template of the route the router matched, or ``ROUTE_FALLBACK``."""
+        route = scope.get("route")
+        template = getattr(route, "path", None)
+        if template in self._logging_attributes:
+            return template
+        return ROUTE_FALLBACK
+
+    def record_request(
+        self,
+        route: str,
+        method: str,
+        status: str,
+        duration_seconds: float,
+        span_context: SpanContext | None = None,
+    ) -> None:
+        """Record the request count and duration.
+
+        The duration is recorded under ``span_context`` when it is valid, so an
+        SDK with exemplars enabled links the latency bucket to the request's
+        trace, which carries its correlation ID.
+        """
+        if (route, method) not in self._duration_attributes:
+            route = ROUTE_FALLBACK
+            if method not in HTTP_METHODS:
+                method = "OTHER"
+        if self.requests is not None:
+            self.requests.add(
+                1, attributes=self._request_attributes[route, method, status]
+            )
+        if self.duration is None:
+            return
+        attributes = self._duration_attributes[route, method]
+        if span_context is None or not span_context.is_valid:
+            self.duration.record(duration_seconds, attributes=attributes)
+            return
+        token = otel_context.attach(
+            trace.set_span_in_context(trace.NonRecordingSpan(span_context))
+        )
+        try:
+            self.duration.record(duration_seconds, attributes=attributes)
+        finally:
+            otel_context.detach(token)
+
+    def record_logging_time(self, route: str, seconds: float) -> None:
+        """Record time spent logging while serving a request to ``route``."""
+        if self.logging_duration is not None:
+            self.logging_duration.record(
+                seconds, attributes=self._logging_attributes[route]
+            )
 
 
-class ObservabilityMiddleware(BaseHTTPMiddleware):
+class ObservabilityMiddleware:
     """Unified middleware for correlation IDs, request/response logging, and timing.
 
     This middleware combines:
     - Correlation ID extraction/generation and propagation
     - Request/response logging with timing
     - Automatic correlation_id binding to logger context
+    - HTTP metrics labelled by route template (see ``HttpRouteMetrics``)
+
+    It is a plain ASGI middleware rather than a ``BaseHTTPMiddleware``: the
+    endpoint runs in the caller's task and response messages are forwarded as
+    they are sent, so streaming bodies are not buffered through an extra
+    stream and WebSocket and lifespan scopes pass through untouched.
     """
 
     CORRELATION_HEADER = "X-Correlation-ID"
     # Paths to exclude from verbose logging
     EXCLUDED_PATHS: ClassVar[set[str]] = {"/health/live", "/health/ready", "/metrics"}
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        # 1. Extract or generate correlation ID
-        correlation_id = (
-            request.headers.get(self.CORRELATION_HEADER)
-            or request.query_params.get("correlation_id")
-            or str(uuid.uuid4())
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._header_name = self.CORRELATION_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_logging_time() as log_timer:
+            try:
+                await self._handle(scope, receive, send)
+            finally:
+                self._record_logging_time(scope, log_timer)
+
+    def _correlation_id(self, scope: Scope) -> str:
+        """Correlation ID from the request header or query string, else a new one."""
+        for name, value in scope["headers"]:
+            if name == self._header_name and value:
+                return value.decode("latin-1")
+        if scope["query_string"]:
+            correlation_id = QueryParams(scope["query_string"]).get("correlation_id")
+            if correlation_id:
+                return correlation_id
+        return str(uuid.uuid4())
+
+    @staticmethod
+    def _route_metrics(scope: Scope) -> HttpRouteMetrics | None:
+        """The app's route metrics, built here if the lifespan did not build them."""
+        app = scope.get("app")
+        state = getattr(app, "state", None)
+        if state is None:
+            return None
+        route_metrics: HttpRouteMetrics | None = getattr(
+            state, "http_route_metrics", None
         )
+        if route_metrics is None:
+            route_metrics = HttpRouteMetrics.from_app(app)
+            if route_metrics is not None:
+                state.http_route_metrics = route_metrics
+        return route_metrics
+
+    def _record_logging_time(self, scope: Scope, log_timer: LoggingTimer) -> None:
+        """Record time spent logging while serving the request."""
+        if scope["path"] in self.EXCLUDED_PATHS:
+            return
+        route_metrics = self._route_metrics(scope)
+        if route_metrics is not None:
+            route_metrics.record_logging_time(
+                route_metrics.route_for(scope), log_timer.seconds
+            )
+
+    async def _handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        path = scope["path"]
 
-        # 2. Store in context variable for this request
-        _correlation_id.set(correlation_id)
+        # 1. Extract or generate correlation ID
+        correlation_id = self._correlation_id(scope)
+
+        # 2. Store in context variable; the endpoint runs in this task and sees it
+        set_correlation_id(correlation_id)
 
         # 3. Determine if we should log (exclude health checks and metrics)
-        should_log = request.url.path not in self.EXCLUDED_PATHS
-        start_time = time.perf_counter() if should_log else None
+        should_log = path not in self.EXCLUDED_PATHS
+        start_time = time.perf_counter()
 
         # 4. Get HTTP metrics from app state (if available)
-        http_metrics: dict[str, Any] | None = None
-        service_name: str | None = None
-        if hasattr(request.app, "state"):
-            http_metrics = getattr(request.app.state, "http_metrics", None)
-            service_name = getattr(request.app.state, "service_name", None)
-            if should_log and not http_metrics:
-                logger.debug(
-                    "metrics.not_available",
-                    has_state=hasattr(request.app, "state"),
-                    service=service_name,
-                    path=request.url.path,
-                )
+        route_metrics = self._route_metrics(scope) if should_log else None
 
         # 5. Log request start (if not excluded)
         if should_log:
             logger.info(
                 "http.request.start",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 correlation_id=correlation_id,
-                query_params=dict(request.query_params)
-                if request.query_params
+                query_params=dict(QueryParams(scope["query_string"]))
+                if scope["query_string"]
                 else None,
             )
 
-        try:
-            # 6. Process request
-            response = await call_next(request)
-
-            # 7. Record HTTP metrics
-            if http_metrics and start_time:
-                duration_seconds = time.perf_counter() - start_time
-                status = "success" if 200 <= response.status_code < 400 else "error"
-                method = request.method
-                route = request.url.path
-
-                try:
-                    # Record request count
-                    if "http_requests" in http_metrics:
-                        attributes: dict[str, Any] = {
-                            "method": method,
-                            "route": route,
-                            "status": status,
-                        }
-                        if service_name:
-                            attributes["service"] = service_name
-                        http_metrics["http_requests"].add(1, attributes=attributes)
-                        logger.debug(
-                            "metric.recorded",
-                            metric="http_requests_total",
-                            value=1,
-                            attributes=attributes,
-                            service=service_name,
-                        )
-                    else:
-                        logger.warning(
-                            "metric.missing_key",
-                            key="http_requests",
-                            available_keys=list(http_metrics.keys())
-                            if http_metrics
-                            else [],
-                            service=service_name,
-                        )
-
-                    # Record request duration
-                    if "http_request_duration" in http_metrics:
-                        attributes = {
-                            "method": method,
-                            "route": route,
-                        }
-                        if service_name:
-                            attributes["service"] = service_name
-                        http_metrics["http_request_duration"].record(
-                            duration_seconds, attributes=attributes
-                        )
-                        logger.debug(
-                            "metric.recorded",
-                            metric="http_request_duration_seconds",
-                            value=duration_seconds,
-                            attributes=attributes,
-                            service=service_name,
-                        )
-                    else:
-                        logger.warning(
-                            "metric.missing_key",
-                            key="http_request_duration",
-                            available_keys=list(http_metrics.keys())
-                            if http_metrics
-                            else [],
-                            service=service_name,
-                        )
-                except Exception as metric_exc:
-                    logger.exception(
-                        "metric.recording_failed",
-                        error=str(metric_exc),
-                        error_type=type(metric_exc).__name__,
-                        service=service_name,
-                        method=method,
-                        route=route,
-                    )
-
-            # 8. Log response with timing (if not excluded)
-            if should_log and start_time:
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                logger.info(
-                    "http.request.complete",
-                    method=request.method,
-                    path=request.url.path,
-                    status_code=response.status_code,
-                    duration_ms=round(duration_ms, 2),
-                    correlation_id=correlation_id,
-                )
+        status_code = 500
+        span_context: SpanContext | None = None
 
-            # 9. Include correlation ID in response headers
-            response.headers[self.CORRELATION_HEADER] = correlation_id
-            return response
+        async def send_with_correlation(message: Message) -> None:
+            nonlocal status_code, span_context
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # The request's trace, for exemplars on the duration histogram
+                span_context = trace.get_current_span().get_span_context()
+                # 6. Include correlation ID in response headers
+                MutableHeaders(scope=message)[self.CORRELATION_HEADER] = correlation_id
+            await send(message)
 
+        try:
+            # 7. Process request; body chunks are forwarded as the app sends them
+            await self.app(scope, receive, send_with_correlation)
         except Exception as exc:
-            # 10. Record error metrics
-            if http_metrics and start_time:
-                duration_seconds = (
-                    (time.perf_counter() - start_time) if start_time else 0
+            duration_seconds = time.perf_counter() - start_time
+
+            # 8. Record error metrics
+            if route_metrics is not None:
+                route_metrics.record_request(
+                    route_metrics.route_for(scope),
+                    method,
+                    "error",
+                    duration_seconds,
+                    span_context,
                 )
-                method = request.method
-                route = request.url.path
-
-                # Record request count (error)
-                if "http_requests" in http_metrics:
-                    attributes = {
-                        "method": method,
-                        "route": route,
-                        "status": "error",
-                    }
-                    if service_name:
-                        attributes["service"] = service_name
-                    http_metrics["http_requests"].add(1, attributes=attributes)
-
-                # Record request duration (error)
-                if "http_request_duration" in http_metrics:
-                    attributes = {
-                        "method": method,
-                        "route": route,
-                    }
-                    if service_name:
-                        attributes["service"] = service_name
-                    http_metrics["http_request_duration"].record(
-                        duration_seconds, attributes=attributes
-                    )
-
-            # 11. Log errors with timing (if not excluded)
-            if should_log and start_time:
-                duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # 9. Log errors with timing (if not excluded)
+            if should_log:
                 logger.error(
                     "http.request.error",
-                    method=request.method,
-                    path=request.url.path,
+                    method=method,
+                    path=path,
                     error=str(exc),
                     error_type=type(exc).__name__,
-                    duration_ms=round(duration_ms, 2),
+                    duration_ms=round(duration_seconds * 1000, 2),
                     correlation_id=correlation_id,
                 )
             raise
 
+        if not should_log:
+            return
+        duration_seconds = time.perf_counter() - start_time
+
+        # 10. Record HTTP metrics
+        if route_metrics is not None:
+            status = "success" if 200 <= status_code < 400 else "error"
+            route = route_metrics.route_for(scope)
+            try:
+                route_metrics.record_request(
+                    route, method, status, duration_seconds, span_context
+                )
+            except Exception as metric_exc:
+                logger.exception(
+                    "metric.recording_failed",
+                    error=str(metric_exc),
+                    error_type=type(metric_exc).__name__,
+                    method=method,
+                    route=route,
+                )
+
+        # 11. Log response with timing
+        logger.info(
+            "http.request.complete",
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=round(duration_seconds * 1000, 2),
+            correlation_id=correlation_id,
+        )
+
 
-__all__ = ["ObservabilityMiddleware", "get_correlation_id", "set_correlation_id"]
+__all__ = [
+    "HTTP_METHODS",
+    "MAX_ROUTES",
+    "ROUTE_FALLBACK",
+    "HttpRouteMetrics",
+    "ObservabilityMiddleware",
+    "get_correlation_id",
+    "set_correlation_id",
+]
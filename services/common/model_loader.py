@@ -5,16 +5,49 @@ This module provides a standardized pattern for model loading across all service
 - Download fallback: If cache miss, download from source
 - Background loading: Non-blocking startup
 - Graceful API handling: Services can check state and respond appropriately
+- Snapshots: Optionally restore post-processed weights from a model snapshot
+  before either, and write one after a regular load
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import os
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from .model_snapshot import snapshots_enabled
+
+
+if TYPE_CHECKING:
+    from .model_snapshot import ModelSnapshot
+
+
+# Loader whose load is running in the current context (propagates into the
+# worker threads that run loader functions)
+_current_loader: ContextVar[BackgroundModelLoader | None] = ContextVar(
+    "current_model_loader", default=None
+)
+
+
+@contextlib.contextmanager
+def load_phase(phase: str) -> Iterator[None]:
+    """Time a step of the running model load for the ``get_status()`` breakdown.
+
+    Loader functions wrap their expensive steps (deserialization, GPU
+    migration, compilation) in this; it is a no-op outside a load.
+    """
+    loader = _current_loader.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if loader is not None:
+            loader._record_phase(phase, time.perf_counter() - start)
 
 
 def _get_force_download_from_env(loader_name: str, explicit_value: bool | None) -> bool:
@@ -67,6 +100,7 @@ class BackgroundModelLoader:
         return_model_key: str | None = None,  # For dict returns, key to extract model
         is_side_effect: bool = False,  # For functions that don't return model
         force_download: bool | None = None,  # Force download, None = check env vars
+        snapshot: ModelSnapshot | None = None,
     ) -> None:
         """Initialize model loader with cache-first + download fallback.
 
@@ -82,6 +116,8 @@ class BackgroundModelLoader:
             return_model_key: If loader returns dict, key to extract model from
             is_side_effect: If True, loader function doesn't return model (e.g., Bark)
             force_download: Force download flag. If None, checks environment variables.
+            snapshot: Model snapshot restored before the cache/download load and
+                      written after one (ignored when MODEL_SNAPSHOT_ENABLED=false)
             heartbeat_interval: Seconds between heartbeat logs during downloads (default 10.0)
         """
         self._cache_loader_func = cache_loader_func
@@ -110,6 +146,11 @@ class BackgroundModelLoader:
             10.0  # Log heartbeat every N seconds during downloads
         )
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._snapshot = snapshot if snapshots_enabled() else None
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._snapshot_state: str | None = None  # restored/saving/saved/failed
+        # Seconds per load stage, e.g. cache_load, deserialize, compile
+        self._phase_durations: dict[str, float] = {}
 
         self._logger.debug(
             "model_loader.initialized",
@@ -153,9 +194,13 @@ class BackgroundModelLoader:
     async def _background_load(self) -> None:
         """Background loading task (cache-first + download fallback)."""
         self._load_start_time = time.time()
+        self._phase_durations = {}
         heartbeat_started = False
 
         try:
+            if await self._load_snapshot():
+                return
+
             # Skip cache if force_download is enabled
             if self._force_download:
                 self._logger.info(
@@ -174,7 +219,9 @@ class BackgroundModelLoader:
                     loader_name=self._loader_name,
                     phase="cache_check",
                 )
-                cache_result = await self._execute_loader(self._cache_loader_func)
+                cache_result = await self._execute_loader(
+                    self._cache_loader_func, phase="cache_load"
+                )
                 cache_duration = time.time() - cache_start
 
                 if cache_result is not None:
@@ -196,6 +243,7 @@ class BackgroundModelLoader:
                         total_duration_ms=round(self._load_duration * 1000, 2),
                         phase="cache_load_complete",
                     )
+                    self._schedule_snapshot_save()
                     return
 
                 self._logger.info(
@@ -265,7 +313,9 @@ class BackgroundModelLoader:
             if not heartbeat_started:
                 self._heartbeat_task = asyncio.create_task(self._heartbeat_logger())
 
-            download_result = await self._execute_loader(self._download_loader_func)
+            download_result = await self._execute_loader(
+                self._download_loader_func, phase="download"
+            )
             download_duration = time.time() - download_start
 
             # Cancel heartbeat now that download is complete
@@ -293,6 +343,7 @@ class BackgroundModelLoader:
                 phase="download_complete",
                 is_side_effect=self._is_side_effect,
             )
+            self._schedule_snapshot_save()
 
         except Exception as exc:
             # Cancel heartbeat on error
@@ -345,13 +396,85 @@ class BackgroundModelLoader:
                 break
 
     async def _execute_loader(
-        self, loader_func: Callable[[], Any] | Callable[[], Awaitable[Any]]
+        self,
+        loader_func: Callable[[], Any] | Callable[[], Awaitable[Any]],
+        phase: str | None = None,
     ) -> Any:
-        """Execute loader function (sync or async)."""
-        if asyncio.iscoroutinefunction(loader_func):
-            return await loader_func()
-        else:
-            return await asyncio.to_thread(loader_func)
+        """Execute loader function (sync or async), timing it as ``phase``."""
+        token = _current_loader.set(self)
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(loader_func):
+                return await loader_func()
+            else:
+                return await asyncio.to_thread(loader_func)
+        finally:
+            _current_loader.reset(token)
+            if phase is not None:
+                self._record_phase(phase, time.perf_counter() - start)
+
+    def _record_phase(self, phase: str, seconds: float) -> None:
+        self._phase_durations[phase] = self._phase_durations.get(phase, 0.0) + seconds
+
+    async def _load_snapshot(self) -> bool:
+        """Try restoring the model from its snapshot; True on a hit."""
+        if self._snapshot is None or self._force_download:
+            return False
+
+        snapshot = self._snapshot
+        result = await self._execute_loader(snapshot.load, phase="snapshot_load")
+        if result is None:
+            self._logger.info(
+                "model_loader.snapshot_miss",
+                loader_name=self._loader_name,
+                snapshot_path=str(snapshot.path),
+                phase="snapshot_miss",
+            )
+            return False
+
+        self._model = result
+        self._load_method = "snapshot"
+        self._snapshot_state = "restored"
+        self._load_duration = time.time() - (self._load_start_time or time.time())
+        self._is_loading = False
+        self._loading_event.set()
+        self._logger.info(
+            "model_loader.snapshot_load_success",
+            loader_name=self._loader_name,
+            snapshot_path=str(snapshot.path),
+            total_duration_ms=round(self._load_duration * 1000, 2),
+            phase="snapshot_load_complete",
+        )
+        return True
+
+    def _schedule_snapshot_save(self) -> None:
+        """Write a snapshot of the freshly loaded model without delaying readiness."""
+        if self._snapshot is None or self._model is None:
+            return
+        self._snapshot_state = "saving"
+        self._snapshot_task = asyncio.create_task(self._save_snapshot(self._snapshot))
+
+    async def _save_snapshot(self, snapshot: ModelSnapshot) -> None:
+        try:
+            await self._execute_loader(
+                functools.partial(snapshot.save, self._model), phase="snapshot_save"
+            )
+            self._snapshot_state = "saved"
+        except Exception as exc:
+            self._snapshot_state = "failed"
+            self._logger.warning(
+                "model_loader.snapshot_save_failed",
+                loader_name=self._loader_name,
+                snapshot_path=str(snapshot.path),
+                error=str(exc),
+                error_type=type(exc).__name__,
+                phase="snapshot_save_failed",
+            )
+
+    async def wait_for_snapshot(self) -> None:
+        """Wait for a pending snapshot write to finish."""
+        if self._snapshot_task is not None:
+            await self._snapshot_task
 
     def is_loaded(self) -> bool:
         """Check if models are currently loaded."""
@@ -376,7 +499,8 @@ class BackgroundModelLoader:
     def get_status(self) -> dict[str, Any]:
         """Get detailed loading status for API responses.
 
-        Returns dict with: loaded, loading, error, method, duration_ms, phase fields.
+        Returns dict with: loaded, loading, error, method, duration_ms, phase fields,
+        plus ``breakdown_ms`` (time per load stage) and ``snapshot`` state when known.
         """
         status: dict[str, Any] = {
             "loaded": self.is_loaded(),
@@ -402,6 +526,13 @@ class BackgroundModelLoader:
             status["method"] = self._load_method
         if self._load_duration:
             status["duration_ms"] = round(self._load_duration * 1000, 2)
+        if self._phase_durations:
+            status["breakdown_ms"] = {
+                phase: round(seconds * 1000, 2)
+                for phase, seconds in self._phase_durations.items()
+            }
+        if self._snapshot_state:
+            status["snapshot"] = self._snapshot_state
         if self._load_start_time and self._is_loading:
             elapsed = time.time() - self._load_start_time
             status["elapsed_ms"] = round(elapsed * 1000, 2)
@@ -484,9 +615,13 @@ class BackgroundModelLoader:
             self._is_loading = True
             self._loading_event.clear()
             self._load_start_time = time.time()
+            self._phase_durations = {}
             heartbeat_started = False
 
             try:
+                if await self._load_snapshot():
+                    return True
+
                 # Skip cache if force_download is enabled
                 if self._force_download:
                     self._logger.info(
@@ -505,7 +640,9 @@ class BackgroundModelLoader:
                         loader_name=self._loader_name,
                         phase="lazy_cache_check",
                     )
-                    cache_result = await self._execute_loader(self._cache_loader_func)
+                    cache_result = await self._execute_loader(
+                        self._cache_loader_func, phase="cache_load"
+                    )
                     cache_duration = time.time() - cache_start
 
                     if cache_result is not None:
@@ -527,6 +664,7 @@ class BackgroundModelLoader:
                             total_duration_ms=round(self._load_duration * 1000, 2),
                             phase="lazy_cache_complete",
                         )
+                        self._schedule_snapshot_save()
                         return True
 
                 # Cache miss, no cache function, or force_download - try download
@@ -541,7 +679,9 @@ class BackgroundModelLoader:
                 if not heartbeat_started:
                     self._heartbeat_task = asyncio.create_task(self._heartbeat_logger())
 
-                download_result = await self._execute_loader(self._download_loader_func)
+                download_result = await self._execute_loader(
+                    self._download_loader_func, phase="download"
+                )
                 download_duration = time.time() - download_start
 
                 # Cancel heartbeat now that download is complete
@@ -568,6 +708,7 @@ class BackgroundModelLoader:
                     phase="lazy_download_complete",
                     is_side_effect=self._is_side_effect,
                 )
+                self._schedule_snapshot_save()
                 return True
 
             except Exception as exc:
@@ -615,6 +756,12 @@ class BackgroundModelLoader:
                     await self._loading_task
             self._loading_task = None
 
+        if self._snapshot_task is not None:
+            # A partial write would be discarded anyway; let it finish
+            with contextlib.suppress(Exception):
+                await self._snapshot_task
+            self._snapshot_task = None
+
         self._is_loading = False
         self._loading_event.set()
         self._logger.debug(
@@ -622,4 +769,4 @@ class BackgroundModelLoader:
         )
 
 
-__all__ = ["BackgroundModelLoader"]
+__all__ = ["BackgroundModelLoader", "load_phase"]
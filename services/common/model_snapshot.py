@@ -0,0 +1,301 @@
+"""Model snapshots for fast cold starts.
+
+After a model is loaded and post-processed (moved to its device, cast to half
+precision, quantized), its weights are persisted as safetensors next to a JSON
+manifest. The next start memory-maps those files straight into freshly built
+modules instead of deserializing checkpoints and redoing the post-processing.
+
+Snapshots are keyed by a fingerprint (model name, device, dtype, library
+versions); a snapshot whose fingerprint no longer matches is ignored and
+rewritten after the next regular load. ``torch.compile`` output cannot be
+stored as weights, so compilation still runs after a restore.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import shutil
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .structured_logging import get_logger
+
+
+if TYPE_CHECKING:
+    import torch
+
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FORMAT = 1
+_MANIFEST = "manifest.json"
+
+
+def snapshots_enabled() -> bool:
+    """Whether model snapshots are enabled (``MODEL_SNAPSHOT_ENABLED``)."""
+    return os.getenv("MODEL_SNAPSHOT_ENABLED", "true").lower() in ("true", "1", "yes")
+
+
+def snapshot_root() -> Path:
+    """Directory holding model snapshots (``MODEL_SNAPSHOT_DIR``)."""
+    return Path(os.getenv("MODEL_SNAPSHOT_DIR", "/app/models/snapshots"))
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be restored into a model."""
+
+
+@dataclass
+class SnapshotContents:
+    """Weights and metadata of a snapshot.
+
+    ``components`` maps a component name (e.g. ``"model"``, ``"coarse"``) to
+    its state dict; ``metadata`` holds JSON-serializable data needed to
+    rebuild the modules (configs, dtype).
+    """
+
+    components: dict[str, dict[str, torch.Tensor]]
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def build_module(
+    factory: Callable[[], torch.nn.Module], state_dict: Mapping[str, torch.Tensor]
+) -> torch.nn.Module:
+    """Build a module on the meta device and assign snapshot tensors to it.
+
+    Assigning keeps the memory-mapped tensors instead of copying them into
+    randomly initialized weights.
+
+    Raises:
+        SnapshotError: If the state dict leaves any parameter or buffer unset
+    """
+    import torch
+
+    with torch.device("meta"):
+        module = factory()
+    module.load_state_dict(state_dict, strict=True, assign=True)
+    tensors = itertools.chain(module.parameters(), module.buffers())
+    if any(tensor.is_meta for tensor in tensors):
+        raise SnapshotError(
+            f"{type(module).__name__} has tensors missing from snapshot"
+        )
+    return module.eval()
+
+
+def _deduplicate(
+    state_dict: Mapping[str, torch.Tensor],
+) -> tuple[dict[str, torch.Tensor], dict[str, str]]:
+    """Split tied tensors into stored tensors and aliases.
+
+    safetensors refuses tensors sharing memory, so a tensor identical to one
+    already stored (tied embeddings) is recorded as an alias instead.
+    """
+    tensors: dict[str, torch.Tensor] = {}
+    aliases: dict[str, str] = {}
+    seen: dict[tuple[Any, ...], str] = {}
+    storages: set[int] = set()
+    for name, value in state_dict.items():
+        tensor = value.detach()
+        storage = tensor.untyped_storage().data_ptr()
+        key = (
+            storage,
+            tensor.storage_offset(),
+            tuple(tensor.shape),
+            tuple(tensor.stride()),
+            tensor.dtype,
+        )
+        if key in seen:
+            aliases[name] = seen[key]
+            continue
+        if storage in storages or not tensor.is_contiguous():
+            # Overlapping views of one storage must be stored separately
+            tensor = tensor.contiguous().clone()
+        storages.add(storage)
+        seen[key] = name
+        tensors[name] = tensor
+    return tensors, aliases
+
+
+class ModelSnapshot:
+    """Persist and restore a post-processed model as mmap-able safetensors."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        export: Callable[[Any], SnapshotContents],
+        restore: Callable[[SnapshotContents], Any],
+        fingerprint: Mapping[str, Any] | Callable[[], Mapping[str, Any]],
+        root: str | Path | None = None,
+        device: str | Callable[[], str] = "cpu",
+    ) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            name: Snapshot directory name (usually the loader name)
+            export: Turns the loaded model into ``SnapshotContents``
+            restore: Rebuilds the model from ``SnapshotContents``; may raise
+                to reject the snapshot
+            fingerprint: Everything the weights depend on; a mismatch
+                invalidates the snapshot. May be a callable, evaluated on the
+                first load or save, so that e.g. torch is not imported early.
+            root: Snapshot directory (defaults to ``MODEL_SNAPSHOT_DIR``)
+            device: Device the tensors are loaded onto (or a callable)
+        """
+        self.name = name
+        self._export = export
+        self._restore = restore
+        self._fingerprint_source = fingerprint
+        self._fingerprint: dict[str, str] | None = None
+        self._root = Path(root) if root is not None else snapshot_root()
+        self._device = device
+
+    @property
+    def fingerprint(self) -> dict[str, str]:
+        if self._fingerprint is None:
+            source = self._fingerprint_source
+            values = source() if callable(source) else source
+            self._fingerprint = {k: str(v) for k, v in values.items()}
+        return self._fingerprint
+
+    @property
+    def device(self) -> str:
+        return self._device() if callable(self._device) else self._device
+
+    @property
+    def path(self) -> Path:
+        return self._root / self.name
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        try:
+            manifest: dict[str, Any] = json.loads(
+                (self.path / _MANIFEST).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return None
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            return None
+        if manifest.get("fingerprint") != self.fingerprint:
+            logger.info(
+                "model_snapshot.stale",
+                snapshot=self.name,
+                path=str(self.path),
+                phase="snapshot_check",
+            )
+            return None
+        return manifest
+
+    def exists(self) -> bool:
+        """Whether a snapshot matching the current fingerprint exists."""
+        return self._read_manifest() is not None
+
+    def load(self) -> Any | None:
+        """Restore the model from the snapshot.
+
+        Returns:
+            The restored model, or None if there is no usable snapshot
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            return None
+
+        start = time.perf_counter()
+        try:
+            from safetensors.torch import load_file
+
+            components: dict[str, dict[str, torch.Tensor]] = {}
+            for component, entry in manifest["components"].items():
+                # CPU loads are memory-mapped; tensors page in on first use
+                tensors = load_file(str(self.path / entry["file"]), device=self.device)
+                for alias, target in entry.get("aliases", {}).items():
+                    tensors[alias] = tensors[target]
+                components[component] = tensors
+            model = self._restore(
+                SnapshotContents(components, manifest.get("metadata", {}))
+            )
+        except Exception as exc:
+            logger.warning(
+                "model_snapshot.restore_failed",
+                snapshot=self.name,
+                path=str(self.path),
+                error=str(exc),
+                error_type=type(exc).__name__,
+                phase="snapshot_load_failed",
+            )
+            return None
+
+        logger.info(
+            "model_snapshot.restored",
+            snapshot=self.name,
+            path=str(self.path),
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+            phase="snapshot_load_complete",
+        )
+        return model
+
+    def save(self, model: Any) -> Path:
+        """Persist the model, replacing any previous snapshot atomically.
+
+        Returns:
+            Snapshot directory
+        """
+        from safetensors.torch import save_file
+
+        start = time.perf_counter()
+        contents = self._export(model)
+        self._root.mkdir(parents=True, exist_ok=True)
+        staging = self._root / f".{self.name}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+
+        try:
+            entries: dict[str, Any] = {}
+            for component, state_dict in contents.components.items():
+                tensors, aliases = _deduplicate(state_dict)
+                filename = f"{component}.safetensors"
+                save_file(tensors, str(staging / filename))
+                entries[component] = {"file": filename, "aliases": aliases}
+
+            manifest = {
+                "format": SNAPSHOT_FORMAT,
+                "fingerprint": self.fingerprint,
+                "components": entries,
+                "metadata": contents.metadata,
+                "created_at": time.time(),
+            }
+            (staging / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+            # Swap directories so readers never see a partial snapshot
+            previous = self._root / f".{self.name}.old-{os.getpid()}"
+            if self.path.exists():
+                self.path.replace(previous)
+            staging.replace(self.path)
+            shutil.rmtree(previous, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        logger.info(
+            "model_snapshot.saved",
+            snapshot=self.name,
+            path=str(self.path),
+            components=list(contents.components),
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+            phase="snapshot_save_complete",
+        )
+        return self.path
+
+
+__all__ = [
+    "ModelSnapshot",
+    "SnapshotContents",
+    "SnapshotError",
+    "build_module",
+    "snapshot_root",
+    "snapshots_enabled",
+]
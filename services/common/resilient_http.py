@@ -1,15 +1,42 @@
-"""Resilient HTTP client with circuit breaker and health checks."""
+"""Resilient HTTP client with circuit breaker and health checks.
+
+Upstream health is inferred passively from real request outcomes: status
+codes and timeouts feed the circuit breaker and response latency feeds an
+EWMA estimate. The request path only probes ``/health/ready`` actively while
+the circuit is recovering, so steady-state requests make no extra calls.
+
+Calls may carry an absolute deadline that caps every attempt's timeout.
+Retries and hedged copies of idempotent requests draw from one retry budget,
+bounding the extra load a degraded upstream sees.
+
+An upstream may be served by several replicas (``base_url`` accepts a list or
+a comma-separated string). Each replica has its own connection pool, circuit
+breaker and latency EWMA. Requests go to the less loaded of two randomly
+picked replicas, or are pinned to one replica by an affinity key such as a
+user ID; a replica whose circuit opens is ejected until it recovers.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
+import random
 import time
-from typing import Any
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Literal
 
 import httpx
 
-from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
-from .http_client import post_with_retries
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from .http_client import (
+    DeadlineExceededError,
+    RetryBudget,
+    payload_size_of,
+    send_with_retries,
+    timeout_within_deadline,
+)
 from .http_headers import inject_correlation_id
 from .structured_logging import get_logger
 
@@ -18,13 +45,89 @@ class ServiceUnavailableError(Exception):
     """Raised when service is unavailable."""
 
 
+LoadBalancing = Literal["least_loaded", "round_robin"]
+
+
+class UpstreamReplica:
+    """One replica of an upstream with its own pool, circuit and latency."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        circuit_config: CircuitBreakerConfig,
+        latency_ewma_alpha: float,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.circuit = CircuitBreaker(name, circuit_config)
+        self.client: httpx.AsyncClient | None = None
+        self.in_flight = 0
+        # A replica recovering from an open circuit takes one trial at a time
+        self.trial_in_flight = False
+        self.latency_ewma: float | None = None
+        self._latency_ewma_alpha = latency_ewma_alpha
+
+    @property
+    def load(self) -> float:
+        """Expected wait for a new request: in-flight requests times latency."""
+        return (self.in_flight + 1) * (self.latency_ewma or 0.0)
+
+    def record_latency(self, elapsed: float) -> None:
+        """Fold one response latency into the replica's EWMA."""
+        if self.latency_ewma is None:
+            self.latency_ewma = elapsed
+        else:
+            self.latency_ewma += self._latency_ewma_alpha * (
+                elapsed - self.latency_ewma
+            )
+
+    def admits_request(self) -> bool:
+        """Whether selection may route a request here (no circuit side effects).
+
+        A closed circuit admits every request. An open circuit past its
+        timeout, or a half-open one, admits a single trial until it finishes.
+        """
+        if self.circuit.get_state() == CircuitState.CLOSED:
+            return True
+        return not self.trial_in_flight and self.circuit.peek_available()
+
+    def affinity_weight(self, key: str) -> int:
+        """Rendezvous hash weight of ``key`` on this replica."""
+        digest = hashlib.blake2b(
+            f"{key}|{self.base_url}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the replica's routing state."""
+        return {
+            "url": self.base_url,
+            "circuit_state": self.circuit.get_state().value,
+            "in_flight": self.in_flight,
+            "latency_ewma_ms": (
+                round(self.latency_ewma * 1000, 2)
+                if self.latency_ewma is not None
+                else None
+            ),
+        }
+
+
+def split_base_urls(base_url: str | Sequence[str]) -> list[str]:
+    """Split a comma-separated base URL setting into replica URLs."""
+    urls = base_url.split(",") if isinstance(base_url, str) else base_url
+    replicas = [url.strip().rstrip("/") for url in urls if url.strip()]
+    if not replicas:
+        raise ValueError("at least one base URL is required")
+    return replicas
+
+
 class ResilientHTTPClient:
     """HTTP client with circuit breaker and health checks."""
 
     def __init__(
         self,
         service_name: str,
-        base_url: str,
+        base_url: str | Sequence[str],
         circuit_config: CircuitBreakerConfig | None = None,
         timeout: float = 30.0,
         health_check_interval: float = 10.0,
@@ -32,13 +135,34 @@ class ResilientHTTPClient:
         health_check_timeout: float = 10.0,
         max_connections: int = 10,
         max_keepalive_connections: int = 5,
+        latency_ewma_alpha: float = 0.2,
+        slow_request_seconds: float | None = None,
+        retry_budget_ratio: float = 0.1,
+        hedge_idempotent: bool = False,
+        hedge_min_samples: int = 20,
+        metrics: dict[str, Any] | None = None,
+        load_balancing: LoadBalancing = "least_loaded",
+        pin_by_correlation_id: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self._service_name = service_name
-        self._base_url = base_url.rstrip("/")
-        self._circuit = CircuitBreaker(
-            service_name, circuit_config or CircuitBreakerConfig()
-        )
-        self._client: httpx.AsyncClient | None = None
+        urls = split_base_urls(base_url)
+        config = circuit_config or CircuitBreakerConfig()
+        # Circuits keep the service name when there is a single replica
+        self._replicas = [
+            UpstreamReplica(
+                service_name if len(urls) == 1 else f"{service_name}@{url}",
+                url,
+                config,
+                latency_ewma_alpha,
+            )
+            for url in urls
+        ]
+        self._base_url = self._replicas[0].base_url
+        self._load_balancing = load_balancing
+        self._round_robin = itertools.count()
+        self._pin_by_correlation_id = pin_by_correlation_id
+        self._transport = transport
         self._timeout = timeout
         self._logger = get_logger(__name__)
         # Initialize to current time to prevent stampede on first check
@@ -56,19 +180,129 @@ class ResilientHTTPClient:
             0  # Track consecutive failures for exponential backoff
         )
         self._max_backoff_interval: float = 120.0  # Max interval of 2 minutes
+        # Passive health: EWMA of upstream response latency (seconds) and an
+        # optional threshold above which a response counts as a failure
+        self._latency_ewma_alpha = latency_ewma_alpha
+        self._latency_ewma: float | None = None
+        self._slow_request_seconds = slow_request_seconds
+        # Recent response latencies for the hedging delay (observed p95)
+        self._latency_samples: deque[float] = deque(maxlen=256)
+        self._hedge_idempotent = hedge_idempotent
+        self._hedge_min_samples = hedge_min_samples
+        self._metrics = metrics or {}
+        # Retries and hedges share one budget of extra load on the upstream
+        self._retry_budget = RetryBudget(
+            ratio=retry_budget_ratio, on_exhausted=self._record_budget_exhausted
+        )
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
+    async def _get_client(self, replica: UpstreamReplica) -> httpx.AsyncClient:
+        """Get or create the replica's HTTP client (one pool per replica)."""
+        if replica.client is None:
             limits = httpx.Limits(
                 max_connections=self._max_connections,
                 max_keepalive_connections=self._max_keepalive_connections,
             )
-            self._client = httpx.AsyncClient(
+            replica.client = httpx.AsyncClient(
                 timeout=self._timeout,
                 limits=limits,
+                transport=self._transport,
             )
-        return self._client
+        return replica.client
+
+    def _circuit_state(self) -> CircuitState:
+        """Best circuit state across replicas."""
+        states = {replica.circuit.get_state() for replica in self._replicas}
+        for state in (CircuitState.CLOSED, CircuitState.HALF_OPEN):
+            if state in states:
+                return state
+        return CircuitState.OPEN
+
+    def _select_replica(
+        self,
+        affinity_key: str | None = None,
+        exclude: Sequence[UpstreamReplica] = (),
+    ) -> tuple[UpstreamReplica | None, bool]:
+        """Pick the replica for a request; None when every circuit is open.
+
+        With an affinity key the replica is chosen by rendezvous hashing, so a
+        key stays on its replica and only moves while that replica is ejected.
+        Otherwise the less loaded of two random replicas wins. A replica whose
+        circuit is not closed is offered one trial request at a time.
+
+        Returns:
+            The replica and whether this call took its trial slot; only then
+            does the caller clear ``trial_in_flight`` once the request ends
+        """
+        candidates = [
+            replica
+            for replica in self._replicas
+            if replica not in exclude and replica.admits_request()
+        ]
+        if len(candidates) <= 1:
+            chosen = candidates[0] if candidates else None
+        elif affinity_key is not None:
+            chosen = max(candidates, key=lambda r: r.affinity_weight(affinity_key))
+        elif self._load_balancing == "round_robin":
+            chosen = candidates[next(self._round_robin) % len(candidates)]
+        else:
+            first, second = random.sample(candidates, 2)
+            if (second.load, second.in_flight) < (first.load, first.in_flight):
+                chosen = second
+            else:
+                chosen = first
+        if chosen is None or chosen.circuit.get_state() == CircuitState.CLOSED:
+            return chosen, False
+        # Only the chosen replica moves to half-open
+        chosen.circuit.is_available()
+        chosen.trial_in_flight = True
+        return chosen, True
+
+    def _retry_replica(
+        self, affinity_key: str | None, failed: UpstreamReplica
+    ) -> tuple[UpstreamReplica, bool]:
+        """Pick the replica for a retry, moving off ``failed`` when possible.
+
+        Returns:
+            The replica and whether this call took its trial slot
+
+        Raises:
+            ServiceUnavailableError: If no replica's circuit allows requests
+        """
+        replica, trial = self._select_replica(affinity_key, exclude=(failed,))
+        if replica is None:
+            replica, trial = self._select_replica(affinity_key)
+        if replica is None:
+            raise ServiceUnavailableError(f"{self._service_name} circuit is open")
+        return replica, trial
+
+    def _affinity_key(
+        self, affinity_key: str | None, headers: dict[str, str]
+    ) -> str | None:
+        if affinity_key is None and self._pin_by_correlation_id:
+            return headers.get("X-Correlation-ID")
+        return affinity_key
+
+    async def _probe_replicas(self) -> httpx.Response:
+        """Probe every replica's /health/ready concurrently.
+
+        Returns a ready response when any replica is ready, otherwise the
+        first response; raises the first error when no replica answered.
+        """
+
+        async def probe(replica: UpstreamReplica) -> httpx.Response:
+            client = await self._get_client(replica)
+            return await client.get(
+                f"{replica.base_url}/health/ready",
+                timeout=self._health_check_timeout,
+            )
+
+        results = await asyncio.gather(
+            *(probe(replica) for replica in self._replicas), return_exceptions=True
+        )
+        responses = [r for r in results if isinstance(r, httpx.Response)]
+        if not responses:
+            raise next(r for r in results if isinstance(r, BaseException))
+        return next((r for r in responses if r.status_code == 200), responses[0])
 
     def _get_effective_check_interval(self) -> float:
         """Get effective check interval based on startup phase.
@@ -127,10 +361,7 @@ class ResilientHTTPClient:
                 return True
 
             try:
-                client = await self._get_client()
-                response = await client.get(
-                    f"{self._base_url}/health/ready", timeout=self._health_check_timeout
-                )
+                response = await self._probe_replicas()
 
                 is_healthy: bool = response.status_code == 200
                 self._is_healthy = is_healthy
@@ -166,7 +397,7 @@ class ResilientHTTPClient:
                         "resilient_http.health_check_failed",
                         service=self._service_name,
                         status_code=response.status_code,
-                        url=f"{self._base_url}/health/ready",
+                        url=str(response.url),
                         elapsed_since_startup_seconds=round(elapsed_since_startup, 1),
                         is_expected_during_startup=is_expected_during_startup,
                         consecutive_failures=self._consecutive_failures,
@@ -226,7 +457,10 @@ class ResilientHTTPClient:
                     getattr(self._logger, log_level)(
                         "resilient_http.health_check_error",
                         service=self._service_name,
-                        url=f"{self._base_url}/health/ready",
+                        url=",".join(
+                            f"{replica.base_url}/health/ready"
+                            for replica in self._replicas
+                        ),
                         error=str(exc),
                         error_type=error_type,
                         is_timeout=is_timeout,
@@ -242,6 +476,198 @@ class ResilientHTTPClient:
 
                 return False
 
+    @property
+    def latency_ewma(self) -> float | None:
+        """EWMA of upstream response latency in seconds, None before any response."""
+        return self._latency_ewma
+
+    @property
+    def latency_p95(self) -> float | None:
+        """p95 of recent upstream response latency in seconds.
+
+        None until ``hedge_min_samples`` responses have been observed.
+        """
+        samples = self._latency_samples
+        if len(samples) < max(1, self._hedge_min_samples):
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def get_upstream_stats(self) -> dict[str, Any]:
+        """Get passively observed upstream health."""
+        p95 = self.latency_p95
+        return {
+            "service": self._service_name,
+            "healthy": self._is_healthy,
+            "latency_ewma_ms": (
+                round(self._latency_ewma * 1000, 2)
+                if self._latency_ewma is not None
+                else None
+            ),
+            "latency_p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+            "circuit_state": self._circuit_state().value,
+            "retry_budget_exhausted": self._retry_budget.exhausted,
+            "replicas": [replica.get_stats() for replica in self._replicas],
+        }
+
+    def _record_budget_exhausted(self) -> None:
+        counter = self._metrics.get("http_client_retry_budget_exhausted")
+        if counter is not None:
+            counter.add(1, attributes={"service": self._service_name})
+
+    async def _hedged(
+        self,
+        send: Callable[[UpstreamReplica], Awaitable[httpx.Response]],
+        replica: UpstreamReplica,
+        trial: bool = False,
+    ) -> httpx.Response:
+        """Send a request, hedging with a second copy after the observed p95.
+
+        Only for idempotent requests. The hedge goes to another replica when
+        one is available. Whichever copy succeeds first wins and the other is
+        cancelled; the hedge is paid for from the retry budget. ``trial`` says
+        whether ``replica`` is on its half-open trial for this request.
+        """
+        delay = self.latency_p95
+        if delay is None:
+            return await send(replica)
+
+        primary = asyncio.ensure_future(send(replica))
+        hedge_replica: UpstreamReplica | None = None
+        hedge_trial = False
+        tasks: set[asyncio.Future[httpx.Response]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._retry_budget.try_acquire():
+                return await primary
+
+            hedge_replica, hedge_trial = self._select_replica(exclude=(replica,))
+            if hedge_replica is None and trial:
+                # A recovering replica gets its one trial, not a second copy
+                return await primary
+            hedge = asyncio.ensure_future(send(hedge_replica or replica))
+            tasks.add(hedge)
+            pending: set[asyncio.Future[httpx.Response]] = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer a successful copy; fall back to the last one to finish
+                winner = next((t for t in done if t.exception() is None), None)
+                if winner is None and not pending:
+                    winner = primary if primary in done else hedge
+                if winner is not None:
+                    break
+
+            counter = self._metrics.get("http_client_hedged_requests")
+            if counter is not None:
+                counter.add(
+                    1,
+                    attributes={
+                        "service": self._service_name,
+                        "winner": "hedge" if winner is hedge else "primary",
+                    },
+                )
+            return winner.result()
+        finally:
+            if hedge_trial and hedge_replica is not None:
+                hedge_replica.trial_in_flight = False
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark losing failures as retrieved
+                    task.exception()
+
+    async def _send(
+        self,
+        replica: UpstreamReplica,
+        func: Callable[..., Awaitable[httpx.Response]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request to a replica and learn its health from the outcome."""
+        replica.in_flight += 1
+        start = time.perf_counter()
+        try:
+            response = await func(*args, **kwargs)
+        except DeadlineExceededError:
+            # The caller ran out of time before sending; not the replica's fault
+            raise
+        except httpx.HTTPStatusError as exc:
+            self._record_outcome(
+                replica, time.perf_counter() - start, exc.response.status_code
+            )
+            raise
+        except Exception:
+            # Timeouts and transport errors
+            self._record_outcome(replica, time.perf_counter() - start, None)
+            raise
+        finally:
+            replica.in_flight -= 1
+        self._record_outcome(replica, time.perf_counter() - start, response.status_code)
+        return response
+
+    def _record_outcome(
+        self, replica: UpstreamReplica, elapsed: float, status_code: int | None
+    ) -> None:
+        """Feed one request outcome into the replica's circuit and health state.
+
+        Any response below 500 shows the replica is serving, so it counts as a
+        success unless it exceeded ``slow_request_seconds``.
+        """
+        succeeded = status_code is not None and status_code < 500
+        if succeeded:
+            self._latency_samples.append(elapsed)
+            replica.record_latency(elapsed)
+            if self._latency_ewma is None:
+                self._latency_ewma = elapsed
+            else:
+                self._latency_ewma += self._latency_ewma_alpha * (
+                    elapsed - self._latency_ewma
+                )
+            if (
+                self._slow_request_seconds is not None
+                and elapsed > self._slow_request_seconds
+            ):
+                succeeded = False
+
+        now = time.time()
+        if succeeded:
+            replica.circuit.record_success()
+            # A served request is as good as a health check
+            self._is_healthy = True
+            self._last_health_check = now
+            self._consecutive_failures = 0
+            return
+
+        was_closed = replica.circuit.get_state() == CircuitState.CLOSED
+        replica.circuit.record_failure()
+        if was_closed and replica.circuit.get_state() == CircuitState.OPEN:
+            self._on_replica_ejected(replica)
+        if self._circuit_state() != CircuitState.CLOSED:
+            # Make the next check_health probe for real
+            self._is_healthy = False
+            self._last_health_check = 0.0
+
+    def _on_replica_ejected(self, replica: UpstreamReplica) -> None:
+        if len(self._replicas) == 1:
+            return
+        self._logger.warning(
+            "resilient_http.replica_ejected",
+            service=self._service_name,
+            replica=replica.base_url,
+            available_replicas=sum(
+                r.circuit.get_state() != CircuitState.OPEN for r in self._replicas
+            ),
+        )
+        counter = self._metrics.get("http_client_replica_ejections")
+        if counter is not None:
+            counter.add(
+                1,
+                attributes={"service": self._service_name, "replica": replica.base_url},
+            )
+
     async def post_with_retry(
         self,
         endpoint: str,
@@ -256,14 +682,79 @@ class ResilientHTTPClient:
         log_fields: dict[str, Any] | None = None,
         logger: Any | None = None,
         timeout: float | httpx.Timeout | None = None,
+        deadline: float | None = None,
+        hedge: bool = False,
+        affinity_key: str | None = None,
     ) -> httpx.Response:
-        """POST with circuit breaker protection."""
+        """POST with circuit breaker protection.
+
+        Args:
+            deadline: Absolute ``time.monotonic()`` deadline for the whole
+                call; attempt timeouts shrink to fit and retries that cannot
+                finish in time are skipped
+            hedge: Hedge the request after the upstream's observed p95; only
+                for idempotent endpoints
+            affinity_key: Pin the request to one replica (e.g. a user ID) for
+                cache locality
+        """
         request_logger = logger or self._logger
 
-        # Check circuit breaker availability
-        circuit_available = self._circuit.is_available()
-        circuit_state = self._circuit.get_state().value
-        if not circuit_available:
+        # Auto-inject correlation ID from context
+        request_headers = inject_correlation_id(headers)
+
+        routing_key = self._affinity_key(affinity_key, request_headers)
+
+        async def send(target: UpstreamReplica) -> httpx.Response:
+            previous: UpstreamReplica | None = None
+
+            async def send_attempt(
+                attempt_timeout: float | httpx.Timeout | None,
+            ) -> httpx.Response:
+                nonlocal previous
+                # The first attempt goes to target; a retry moves off the
+                # replica that just failed
+                replica, trial = (
+                    (target, False)
+                    if previous is None
+                    else self._retry_replica(routing_key, previous)
+                )
+                previous = replica
+                try:
+                    client = await self._get_client(replica)
+                    # Each attempt is one outcome (and latency) for the replica
+                    return await self._send(
+                        replica,
+                        client.post,
+                        f"{replica.base_url}{endpoint}",
+                        files=files,
+                        data=data,
+                        json=json,
+                        content=content,
+                        headers=request_headers,
+                        params=params,
+                        timeout=attempt_timeout,
+                    )
+                finally:
+                    if trial:
+                        replica.trial_in_flight = False
+
+            return await send_with_retries(
+                send_attempt,
+                url=f"{target.base_url}{endpoint}",
+                max_retries=max_retries,
+                log_fields=log_fields,
+                logger=logger,
+                timeout=timeout,
+                deadline=deadline,
+                retry_budget=self._retry_budget,
+                record_request=False,
+                payload_size=payload_size_of(files, content, json),
+            )
+
+        # Pick a replica whose circuit allows requests
+        replica, trial = self._select_replica(routing_key)
+        circuit_state = self._circuit_state().value
+        if replica is None:
             request_logger.warning(
                 "resilient_http.decision",
                 service=self._service_name,
@@ -274,50 +765,86 @@ class ResilientHTTPClient:
             )
             raise ServiceUnavailableError(f"{self._service_name} circuit is open")
 
-        # Check health before attempting request
-        health_status = await self.check_health()
-        if not health_status:
-            request_logger.warning(
+        try:
+            # Steady state relies on passive health from real traffic; only probe
+            # actively while no replica's circuit is closed
+            health_status = True
+            if self._circuit_state() != CircuitState.CLOSED:
+                health_status = await self.check_health()
+            if not health_status:
+                request_logger.warning(
+                    "resilient_http.decision",
+                    service=self._service_name,
+                    endpoint=endpoint,
+                    circuit_state=circuit_state,
+                    decision="request_blocked",
+                    reason="service_not_healthy",
+                )
+                raise ServiceUnavailableError(f"{self._service_name} is not healthy")
+
+            request_logger.debug(
                 "resilient_http.decision",
                 service=self._service_name,
                 endpoint=endpoint,
+                replica=replica.base_url,
                 circuit_state=circuit_state,
-                decision="request_blocked",
-                reason="service_not_healthy",
+                health_status=health_status,
+                decision="proceeding_with_request",
             )
-            raise ServiceUnavailableError(f"{self._service_name} is not healthy")
-
-        request_logger.debug(
-            "resilient_http.decision",
-            service=self._service_name,
-            endpoint=endpoint,
-            circuit_state=circuit_state,
-            health_status=health_status,
-            decision="proceeding_with_request",
-        )
 
+            # One logical call earns budget once, however many copies are sent
+            self._retry_budget.record_request()
+            if hedge:
+                return await self._hedged(send, replica, trial)
+            return await send(replica)
+        finally:
+            if trial:
+                # Free the trial slot this call took on a recovering replica
+                replica.trial_in_flight = False
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: dict[str, str] | None,
+        timeout: float | httpx.Timeout | None,
+        deadline: float | None,
+        hedge: bool | None,
+        affinity_key: str | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a single idempotent request with circuit breaker protection."""
         # Auto-inject correlation ID from context
         request_headers = inject_correlation_id(headers)
 
-        client = await self._get_client()
-        url = f"{self._base_url}{endpoint}"
+        async def send(target: UpstreamReplica) -> httpx.Response:
+            client = await self._get_client(target)
+            return await self._send(
+                target,
+                client.request,
+                method,
+                f"{target.base_url}{endpoint}",
+                headers=request_headers,
+                # Capped per copy so a late hedge gets only the time left
+                timeout=timeout_within_deadline(timeout, deadline),
+                **kwargs,
+            )
 
-        # Use the circuit breaker to protect the request
-        return await self._circuit.call(
-            post_with_retries,
-            client,
-            url,
-            files=files,
-            data=data,
-            json=json,
-            content=content,
-            headers=request_headers,
-            params=params,
-            max_retries=max_retries,
-            log_fields=log_fields,
-            logger=logger,
-            timeout=timeout,
+        replica, trial = self._select_replica(
+            self._affinity_key(affinity_key, request_headers)
         )
+        if replica is None:
+            raise ServiceUnavailableError(f"{self._service_name} circuit is open")
+
+        self._retry_budget.record_request()
+        try:
+            if self._hedge_idempotent if hedge is None else hedge:
+                return await self._hedged(send, replica, trial)
+            return await send(replica)
+        finally:
+            if trial:
+                replica.trial_in_flight = False
 
     async def get(
         self,
@@ -326,23 +853,25 @@ class ResilientHTTPClient:
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | httpx.Timeout | None = None,
+        deadline: float | None = None,
+        hedge: bool | None = None,
+        affinity_key: str | None = None,
     ) -> httpx.Response:
-        """GET request with circuit breaker protection."""
-        if not self._circuit.is_available():
-            raise ServiceUnavailableError(f"{self._service_name} circuit is open")
-
-        # Auto-inject correlation ID from context
-        request_headers = inject_correlation_id(headers)
-
-        client = await self._get_client()
-        url = f"{self._base_url}{endpoint}"
+        """GET request with circuit breaker protection.
 
-        return await self._circuit.call(
-            client.get,
-            url,
-            headers=request_headers,
+        ``deadline`` caps the request timeout; ``hedge`` overrides the
+        client's ``hedge_idempotent`` default; ``affinity_key`` pins the
+        request to one replica.
+        """
+        return await self._request(
+            "GET",
+            endpoint,
+            headers=headers,
             params=params,
             timeout=timeout,
+            deadline=deadline,
+            hedge=hedge,
+            affinity_key=affinity_key,
         )
 
     async def put(
@@ -354,25 +883,27 @@ class ResilientHTTPClient:
         json: Any | None = None,
         content: bytes | None = None,
         timeout: float | httpx.Timeout | None = None,
+        deadline: float | None = None,
+        hedge: bool | None = None,
+        affinity_key: str | None = None,
     ) -> httpx.Response:
-        """PUT request with circuit breaker protection."""
-        if not self._circuit.is_available():
-            raise ServiceUnavailableError(f"{self._service_name} circuit is open")
+        """PUT request with circuit breaker protection.
 
-        # Auto-inject correlation ID from context
-        request_headers = inject_correlation_id(headers)
-
-        client = await self._get_client()
-        url = f"{self._base_url}{endpoint}"
-
-        return await self._circuit.call(
-            client.put,
-            url,
-            headers=request_headers,
+        ``deadline`` caps the request timeout; ``hedge`` overrides the
+        client's ``hedge_idempotent`` default; ``affinity_key`` pins the
+        request to one replica.
+        """
+        return await self._request(
+            "PUT",
+            endpoint,
+            headers=headers,
             params=params,
             json=json,
             content=content,
             timeout=timeout,
+            deadline=deadline,
+            hedge=hedge,
+            affinity_key=affinity_key,
         )
 
     async def delete(
@@ -382,34 +913,47 @@ class ResilientHTTPClient:
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | httpx.Timeout | None = None,
+        deadline: float | None = None,
+        hedge: bool | None = None,
+        affinity_key: str | None = None,
     ) -> httpx.Response:
-        """DELETE request with circuit breaker protection."""
-        if not self._circuit.is_available():
-            raise ServiceUnavailableError(f"{self._service_name} circuit is open")
-
-        # Auto-inject correlation ID from context
-        request_headers = inject_correlation_id(headers)
-
-        client = await self._get_client()
-        url = f"{self._base_url}{endpoint}"
+        """DELETE request with circuit breaker protection.
 
-        return await self._circuit.call(
-            client.delete,
-            url,
-            headers=request_headers,
+        ``deadline`` caps the request timeout; ``hedge`` overrides the
+        client's ``hedge_idempotent`` default; ``affinity_key`` pins the
+        request to one replica.
+        """
+        return await self._request(
+            "DELETE",
+            endpoint,
+            headers=headers,
             params=params,
             timeout=timeout,
+            deadline=deadline,
+            hedge=hedge,
+            affinity_key=affinity_key,
         )
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Close the replicas' HTTP clients."""
+        for replica in self._replicas:
+            if replica.client:
+                await replica.client.aclose()
+                replica.client = None
 
     def get_circuit_stats(self) -> dict[str, Any]:
-        """Get circuit breaker statistics."""
-        return self._circuit.get_stats()
+        """Get circuit breaker statistics (per replica when there are several)."""
+        if len(self._replicas) == 1:
+            return self._replicas[0].circuit.get_stats()
+        replicas = [replica.circuit.get_stats() for replica in self._replicas]
+        return {
+            "name": self._service_name,
+            "state": self._circuit_state().value,
+            "failure_count": sum(stats["failure_count"] for stats in replicas),
+            "success_count": sum(stats["success_count"] for stats in replicas),
+            "is_available": any(stats["is_available"] for stats in replicas),
+            "replicas": replicas,
+        }
 
     async def __aenter__(self) -> ResilientHTTPClient:
         """Async context manager entry."""
@@ -422,4 +966,11 @@ class ResilientHTTPClient:
         await self.close()
 
 
-__all__ = ["ResilientHTTPClient", "ServiceUnavailableError"]
+__all__ = [
+    "DeadlineExceededError",
+    "LoadBalancing",
+    "ResilientHTTPClient",
+    "ServiceUnavailableError",
+    "UpstreamReplica",
+    "split_base_urls",
+]
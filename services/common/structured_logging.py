@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
 import time
 import warnings
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import IO, Any
 
 import structlog
@@ -31,6 +36,260 @@ def _numeric_level(level: str) -> int:
 
 Processor = Callable[[Any, str, dict[str, Any]], dict[str, Any]]
 
+# Level configured by the last configure_logging() call; NOTSET logs everything,
+# matching structlog's behaviour before configuration
+_configured_level = logging.NOTSET
+
+_DEFAULT_QUEUE_SIZE = 10000
+# Cap on distinct event names tracked for metrics; the rest count as "other"
+_MAX_TRACKED_EVENTS = 512
+# Caller-side start time of the event being emitted on this thread
+_emit_start = threading.local()
+
+
+def log_enabled(level: int) -> bool:
+    """Return True if events at ``level`` pass the configured level filter.
+
+    Filtered structlog calls are already no-ops, but their keyword arguments are
+    still evaluated by the caller. Guard per-frame events whose arguments are
+    costly to build::
+
+        if log_enabled(logging.DEBUG):
+            logger.debug("voice.frame", stats=expensive_stats())
+    """
+    return level >= _configured_level
+
+
+class LoggingTimer:
+    """Time spent on the calling thread emitting log events."""
+
+    __slots__ = ("elapsed_ns",)
+
+    def __init__(self) -> None:
+        self.elapsed_ns = 0
+
+    @property
+    def seconds(self) -> float:
+        """Accumulated logging time in seconds."""
+        return self.elapsed_ns / 1e9
+
+
+_logging_timer: ContextVar[LoggingTimer | None] = ContextVar(
+    "logging_timer", default=None
+)
+
+
+@contextmanager
+def track_logging_time() -> Generator[LoggingTimer, None, None]:
+    """Accumulate caller-side logging time for the current context.
+
+    Tasks spawned inside the block share the timer, so this covers everything
+    logged while serving a request.
+
+    Yields:
+        Timer whose ``seconds`` grows as events are emitted
+    """
+    timer = LoggingTimer()
+    token = _logging_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _logging_timer.reset(token)
+
+
+def _stamp_start(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    _emit_start.ns = time.perf_counter_ns()
+    return event_dict
+
+
+def _pop_start() -> int | None:
+    start_ns: int | None = getattr(_emit_start, "ns", None)
+    _emit_start.ns = None
+    return start_ns
+
+
+def _charge_logging_time(start_ns: int | None) -> None:
+    if start_ns is None:
+        return
+    timer = _logging_timer.get()
+    if timer is not None:
+        timer.elapsed_ns += time.perf_counter_ns() - start_ns
+
+
+class _CallsiteFreeLogger(logging.Logger):
+    """Private stdlib logger that skips the caller frame walk for every record.
+
+    Parented to the shared logger of the same name, so records propagate to
+    its handlers and it follows that logger's level and ``disabled`` flag.
+    It is not registered with the logging manager, so ``logging.getLogger``
+    never returns it and stdlib callers keep pathname/lineno.
+    """
+
+    def findCaller(  # noqa: N802
+        self, stack_info: bool = False, stacklevel: int = 1
+    ) -> tuple[str, int, str, str | None]:
+        if stack_info:
+            return super().findCaller(stack_info, stacklevel)
+        return "(unknown file)", 0, "(unknown function)", None
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        # The manager clears level caches only for loggers it knows, so
+        # this one must not cache
+        if self.manager.disable >= level or (self.parent and self.parent.disabled):
+            return False
+        return level >= self.getEffectiveLevel()
+
+
+class _CallsiteFreeLoggerFactory(structlog.stdlib.LoggerFactory):
+    """structlog logger factory whose stdlib loggers skip the caller frame walk.
+
+    No renderer here uses pathname/lineno/funcName, and structlog's stack walk
+    to fill them in was the largest single cost of emitting an event. Each
+    name gets a private ``_CallsiteFreeLogger`` under the shared logger, so
+    no shared logger or the process-wide logger class is changed (unlike
+    ``LoggerFactory``, which calls ``logging.setLoggerClass``).
+    ``stack_info=True`` still walks.
+    """
+
+    def __init__(self) -> None:
+        # LoggerFactory.__init__ would install its logger class process-wide
+        self._ignore = None
+        self._loggers: dict[str, _CallsiteFreeLogger] = {}
+
+    def __call__(self, *args: Any) -> logging.Logger:
+        shared = super().__call__(*args)
+        logger = self._loggers.get(shared.name)
+        if logger is None:
+            logger = _CallsiteFreeLogger(shared.name)
+            logger.parent = shared
+            self._loggers[shared.name] = logger
+        return logger
+
+
+class _PipelineStats:
+    """Emission and drop counters for the log pipeline."""
+
+    def __init__(self) -> None:
+        self.events: dict[tuple[str, str], int] = {}
+        self.dropped: dict[str, int] = {}
+        self._drop_lock = threading.Lock()
+
+    def count_event(self, record: logging.LogRecord) -> None:
+        """Count an emitted record by event name and level.
+
+        Called under the output handler's lock, so updates are serialized.
+        """
+        msg = record.msg
+        event = msg.get("event") if isinstance(msg, dict) else record.name
+        key = (str(event), record.levelname.lower())
+        if key not in self.events and len(self.events) >= _MAX_TRACKED_EVENTS:
+            key = ("other", key[1])
+        self.events[key] = self.events.get(key, 0) + 1
+
+    def count_drop(self, record: logging.LogRecord) -> None:
+        """Count a record dropped because the queue was full."""
+        level = record.levelname.lower()
+        with self._drop_lock:
+            self.dropped[level] = self.dropped.get(level, 0) + 1
+
+
+_stats = _PipelineStats()
+_queue: queue.Queue[logging.LogRecord] | None = None
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _CountingStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream handler that counts events and charges synchronous logging time."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # On the render thread (async mode) there is no caller stamp to pop
+        start_ns = _pop_start()
+        _stats.count_event(record)
+        super().emit(record)
+        _charge_logging_time(start_ns)
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records for the render thread without formatting them.
+
+    ``prepare`` only snapshots what rendering needs from the calling thread;
+    JSON/console rendering happens on the listener. A full queue drops the
+    record and counts it rather than blocking the caller.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot the record's event and context on the calling thread.
+
+        structlog events get a shallow copy of their event dict, so changes
+        made after the call do not reach the rendered line. stdlib records
+        have their message interpolated and the caller's contextvars captured
+        here, because the listener thread does not share them.
+        """
+        record = copy.copy(record)
+        if isinstance(record.msg, dict):
+            record.msg = record.msg.copy()
+        else:
+            record.msg = record.getMessage()
+            record.args = None
+            record.log_context = structlog.contextvars.get_contextvars()
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        start_ns = _pop_start()
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            _stats.count_drop(record)
+        except Exception:
+            self.handleError(record)
+        _charge_logging_time(start_ns)
+
+
+def _stop_listener() -> None:
+    """Stop the render thread after draining queued records."""
+    global _listener, _queue
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        _queue = None
+
+
+atexit.register(_stop_listener)
+
+
+def flush_logs() -> None:
+    """Block until every queued log record has been written."""
+    if _queue is not None and _listener is not None:
+        _queue.join()
+
+
+def get_log_pipeline_stats() -> dict[str, Any]:
+    """Get log pipeline counters.
+
+    Returns:
+        Dictionary with ``events`` keyed by (event, level), ``dropped`` keyed
+        by level, current ``queue_depth`` and whether the pipeline is ``async``
+    """
+    return {
+        "events": dict(_stats.events),
+        "dropped": dict(_stats.dropped),
+        "queue_depth": _queue.qsize() if _queue is not None else 0,
+        "async": _listener is not None,
+    }
+
+
+def _merge_contextvars(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """``merge_contextvars`` that prefers the context captured at enqueue time."""
+    record = event_dict.get("_record")
+    context = getattr(record, "log_context", None)
+    if context is None:
+        return structlog.contextvars.merge_contextvars(logger, method_name, event_dict)
+    for key, value in context.items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
 
 def _add_service(service_name: str | None) -> Processor:
     def processor(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
@@ -48,6 +307,8 @@ def configure_logging(
     service_name: str | None = None,
     stream: IO[str] | None = None,
     full_tracebacks: bool | None = None,
+    async_logs: bool | None = None,
+    queue_size: int | None = None,
 ) -> None:
     """Configure structlog + stdlib logging for the process.
 
@@ -61,6 +322,13 @@ def configure_logging(
                         summary format (format_exc_info). If None, defaults to
                         full tracebacks for DEBUG level, summary for INFO+.
                         Can also be set via LOG_FULL_TRACEBACKS environment variable.
+        async_logs: Whether to render and write logs on a background thread.
+                    If None, uses LOG_ASYNC; when that is unset, defaults to
+                    async for the process stdout and synchronous when an
+                    explicit stream is given, so captured output is readable
+                    immediately.
+        queue_size: Maximum queued records in async mode before new records
+                    are dropped and counted (defaults to LOG_QUEUE_SIZE or 10000).
 
     Example:
         # Production usage
@@ -72,9 +340,25 @@ def configure_logging(
         configure_logging(level="INFO", json_logs=True, stream=output)
     """
 
+    global _configured_level, _listener, _queue
+
     numeric_level = _numeric_level(level)
     output_stream = stream if stream is not None else sys.stdout
 
+    if async_logs is None:
+        env_async = os.getenv("LOG_ASYNC", "").lower()
+        if env_async in ("true", "1", "yes"):
+            async_logs = True
+        elif env_async in ("false", "0", "no"):
+            async_logs = False
+        else:
+            async_logs = stream is None
+    if queue_size is None:
+        try:
+            queue_size = int(os.getenv("LOG_QUEUE_SIZE", str(_DEFAULT_QUEUE_SIZE)))
+        except ValueError:
+            queue_size = _DEFAULT_QUEUE_SIZE
+
     # Determine exception processor
     # Priority: explicit parameter > environment variable > log level inference
     if full_tracebacks is None:
@@ -95,7 +379,7 @@ def configure_logging(
     )
 
     shared_processors = [
-        structlog.contextvars.merge_contextvars,
+        _merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso", key="timestamp"),
         _add_service(service_name),
@@ -112,7 +396,7 @@ def configure_logging(
             structlog.dev.ConsoleRenderer(),
         ]
 
-    handler = logging.StreamHandler(output_stream)
+    handler = _CountingStreamHandler(output_stream)
     handler.setFormatter(
         structlog.stdlib.ProcessorFormatter(
             foreign_pre_chain=shared_processors,
@@ -120,9 +404,19 @@ def configure_logging(
         )
     )
 
+    # Drain and stop any pipeline from a previous configuration
+    _stop_listener()
+    root_handler: logging.Handler = handler
+    if async_logs:
+        _queue = queue.Queue(maxsize=max(1, queue_size))
+        _listener = logging.handlers.QueueListener(_queue, handler)
+        _listener.start()
+        root_handler = _BoundedQueueHandler(_queue)
+
     root = logging.getLogger()
-    root.handlers = [handler]
+    root.handlers = [root_handler]
     root.setLevel(numeric_level)
+    _configured_level = numeric_level
     logging.captureWarnings(True)
 
     # Suppress FutureWarnings from third-party libraries (known issues, will be resolved by dependency updates)
@@ -186,13 +480,16 @@ def configure_logging(
     # These warnings appear frequently during import and don't require action
     logging.getLogger("pkg_resources").setLevel(logging.ERROR)
 
+    logger_factory = _CallsiteFreeLoggerFactory()
+
     structlog.configure(
         processors=[
+            _stamp_start,
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -228,13 +525,9 @@ def get_logger(
 
     # Auto-bind correlation ID from context if not explicitly provided
     if correlation_id is None:
-        try:
-            from services.common.middleware import get_correlation_id
+        from services.common.correlation import get_correlation_id
 
-            correlation_id = get_correlation_id()
-        except ImportError:
-            # Middleware not available, skip auto-binding
-            pass
+        correlation_id = get_correlation_id()
 
     if correlation_id:
         logger = logger.bind(correlation_id=correlation_id)
@@ -314,12 +607,17 @@ def correlation_context(
 
 
 __all__ = [
+    "LoggingTimer",
     "bind_correlation_id",
     "configure_logging",
     "correlation_context",
+    "flush_logs",
+    "get_log_pipeline_stats",
     "get_logger",
+    "log_enabled",
     "should_rate_limit",
     "should_sample",
+    "track_logging_time",
 ]
 
 
@@ -7,12 +7,19 @@ across all surface adapters for consistent processing.
 
 from __future__ import annotations
 
-import audioop
 import io
 import wave
 from dataclasses import dataclass
 from typing import Any
 
+from services.common.audio_kernels import (
+    Resampler,
+    convert_width,
+    mix_to_mono,
+    pcm_bytes,
+    pcm_samples,
+    resample,
+)
 from services.common.structured_logging import get_logger
 
 
@@ -100,35 +107,50 @@ class AudioContract:
             return False
 
     def normalize_audio(
-        self, audio_data: bytes, metadata: dict[str, Any]
+        self,
+        audio_data: bytes,
+        metadata: dict[str, Any],
+        resampler: Resampler | None = None,
     ) -> tuple[bytes, dict[str, Any]]:
-        """Normalize audio data to canonical contract."""
+        """Normalize audio data to canonical contract.
+
+        Args:
+            audio_data: PCM audio in the format described by ``metadata``
+            metadata: Source ``sample_rate``, ``channels`` and ``sample_width``
+            resampler: Stream resampler to reuse across consecutive frames of
+                one stream (see ``create_resampler``); without one each call
+                is resampled on its own
+        """
         try:
             # Extract current metadata
             current_rate = metadata.get("sample_rate", self.spec.sample_rate)
             current_channels = metadata.get("channels", 1)
             current_width = metadata.get("sample_width", 2)
 
-            # Resample if needed
-            if current_rate != self.spec.sample_rate:
-                audio_data = self._resample_audio(
-                    audio_data, current_rate, self.spec.sample_rate, current_width
-                )
-                current_rate = self.spec.sample_rate
+            if (
+                current_rate != self.spec.sample_rate
+                or current_channels != self.spec.channels
+                or current_width != self.spec.sample_width
+            ):
+                samples = pcm_samples(audio_data, current_width)
 
-            # Convert to mono if needed
-            if current_channels != self.spec.channels:
-                audio_data = self._convert_to_mono(
-                    audio_data, current_channels, current_width
-                )
-                current_channels = self.spec.channels
+                # Downmix first so resampling touches one channel
+                if current_channels != self.spec.channels:
+                    samples = mix_to_mono(samples, current_channels)
 
-            # Convert to 16-bit if needed
-            if current_width != self.spec.sample_width:
-                audio_data = self._convert_sample_width(
-                    audio_data, current_width, self.spec.sample_width
-                )
-                current_width = self.spec.sample_width
+                # Convert to 16-bit if needed
+                if current_width != self.spec.sample_width:
+                    samples = convert_width(
+                        samples, current_width, self.spec.sample_width
+                    )
+
+                # Resample if needed
+                if current_rate != self.spec.sample_rate:
+                    if resampler is None:
+                        resampler = self.create_resampler(current_rate)
+                    samples = resampler.process(samples)
+
+                audio_data = pcm_bytes(samples, self.spec.sample_width)
 
             # Update metadata
             normalized_metadata = {
@@ -152,16 +174,19 @@ class AudioContract:
             self._logger.error("audio_contract.normalization_error", error=str(e))
             return audio_data, metadata
 
+    def create_resampler(self, from_rate: int) -> Resampler:
+        """Stateful resampler from ``from_rate`` to the canonical rate."""
+        return Resampler(from_rate, self.spec.sample_rate, self.spec.channels)
+
     def _resample_audio(
         self, audio_data: bytes, from_rate: int, to_rate: int, sample_width: int
     ) -> bytes:
-        """Resample audio using audioop."""
+        """Resample mono audio by linear interpolation."""
         try:
-            # Use audioop for simple resampling
-            resampled, _ = audioop.ratecv(
-                audio_data, sample_width, 1, from_rate, to_rate, None
+            resampled = resample(
+                pcm_samples(audio_data, sample_width), from_rate, to_rate
             )
-            return resampled
+            return pcm_bytes(resampled, sample_width)
         except (ValueError, TypeError, OSError) as e:
             self._logger.warning("audio_contract.resample_failed", error=str(e))
             return audio_data
@@ -169,17 +194,13 @@ class AudioContract:
     def _convert_to_mono(
         self, audio_data: bytes, channels: int, sample_width: int
     ) -> bytes:
-        """Convert stereo to mono."""
+        """Downmix interleaved channels to mono by averaging them."""
         if channels == 1:
             return audio_data
 
         try:
-            # Simple downmix: average left and right channels
-            if channels == 2:
-                return audioop.tomono(audio_data, sample_width, 0.5, 0.5)
-            else:
-                # For more than 2 channels, just take the first channel
-                return audioop.tomono(audio_data, sample_width, 1.0, 0.0)
+            mono = mix_to_mono(pcm_samples(audio_data, sample_width), channels)
+            return pcm_bytes(mono, sample_width)
         except (ValueError, TypeError, OSError) as e:
             self._logger.warning("audio_contract.mono_conversion_failed", error=str(e))
             return audio_data
@@ -192,15 +213,10 @@ class AudioContract:
             return audio_data
 
         try:
-            if from_width == 1 and to_width == 2:
-                # 8-bit to 16-bit
-                return audioop.lin2lin(audio_data, 1, 2)
-            elif from_width == 2 and to_width == 1:
-                # 16-bit to 8-bit
-                return audioop.lin2lin(audio_data, 2, 1)
-            else:
-                # Use audioop for other conversions
-                return audioop.lin2lin(audio_data, from_width, to_width)
+            converted = convert_width(
+                pcm_samples(audio_data, from_width), from_width, to_width
+            )
+            return pcm_bytes(converted, to_width)
         except (ValueError, TypeError, OSError) as e:
             self._logger.warning("audio_contract.width_conversion_failed", error=str(e))
             return audio_data
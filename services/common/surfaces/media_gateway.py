@@ -11,59 +11,252 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+from services.common.audio_kernels import (
+    Resampler,
+    TimeStretcher,
+    pcm_bytes,
+    pcm_samples,
+)
 from services.common.structured_logging import get_logger
 
 from .audio_contract import AudioContract, AudioContractSpec
 
 
-@dataclass
-class JitterBuffer:
-    """Jitter buffer for handling network timing variations."""
+# RTP sequence numbers are 16-bit and wrap
+_SEQUENCE_MOD = 1 << 16
+_SEQUENCE_HALF = 1 << 15
 
-    max_size: int = 10  # Maximum frames to buffer
-    target_latency_ms: float = 100.0  # Target latency in milliseconds
-    current_frames: list[tuple[bytes, float]] | None = None  # (audio_data, timestamp)
 
-    def __post_init__(self) -> None:
-        if self.current_frames is None:
-            self.current_frames = []
+@dataclass(slots=True)
+class _BufferedFrame:
+    """One frame held in the jitter buffer ring."""
 
-    def add_frame(self, audio_data: bytes, timestamp: float) -> None:
-        """Add frame to jitter buffer."""
-        if self.current_frames is None:
-            self.current_frames = []
-        self.current_frames.append((audio_data, timestamp))
+    sequence: int
+    audio_data: bytes
+    timestamp: float
 
-        # Remove old frames if buffer is too large
-        if len(self.current_frames) > self.max_size:
-            self.current_frames.pop(0)
 
-    def get_ready_frames(self, current_time: float) -> list[bytes]:
-        """Get frames that are ready to play based on target latency."""
-        if self.current_frames is None:
-            return []
-
-        ready_frames = []
-        ready_indices = []
-
-        for i, (audio_data, timestamp) in enumerate(self.current_frames):
-            age_ms = (current_time - timestamp) * 1000.0
-            if age_ms >= self.target_latency_ms:
-                ready_frames.append(audio_data)
-                ready_indices.append(i)
+@dataclass
+class JitterBuffer:
+    """Sequence-ordered adaptive jitter buffer.
+
+    Frames sit in a fixed ring indexed by ``sequence % max_size`` (O(1) insert
+    and release) and leave in sequence order on a playout schedule: frame
+    ``n`` plays ``target_latency_ms`` after the time it would have arrived
+    without jitter, anchored on the first frame after an underrun. Frames that
+    arrive after their turn are dropped as late; a gap whose turn has come
+    while later frames are waiting is concealed by repeating the previous
+    frame with decaying gain.
+
+    With ``adaptive`` the target latency follows the RFC 3550 inter-arrival
+    jitter estimate, moving at most ``adapt_step_ms`` per played frame so the
+    schedule never jumps. Timestamps are arrival times in seconds, on the same
+    clock as ``current_time`` in ``get_ready_frames``.
+
+    Transport sequence numbers are 16-bit RTP sequences that wrap; each is
+    unwrapped to the extended sequence closest to the highest one seen (RFC
+    3550 cycle counting) before it is compared or used as a ring index.
+    """
+
+    max_size: int = 10  # Ring capacity in frames
+    target_latency_ms: float = 100.0  # Current target (starting value if adaptive)
+    frame_duration_ms: float = 20.0
+    adaptive: bool = True
+    min_latency_ms: float = 20.0
+    max_latency_ms: float = 200.0
+    jitter_multiplier: float = 3.0  # Target = one frame + multiplier * jitter
+    adapt_step_ms: float = 1.0
+    max_concealed_frames: int = 3  # Consecutive repeats before silence
 
-        # Remove ready frames from buffer
-        for i in reversed(ready_indices):
-            if self.current_frames is not None:
-                self.current_frames.pop(i)
+    def __post_init__(self) -> None:
+        if self.max_size < 2:
+            raise ValueError(f"max_size must be at least 2, got {self.max_size}")
+        self._slots: list[_BufferedFrame | None] = [None] * self.max_size
+        self._count = 0
+        self._next_sequence: int | None = None
+        self._auto_sequence = 0
+        self._anchor_sequence = 0
+        self._anchor_time = 0.0
+        self._last_arrival: tuple[int, float] | None = None
+        self._last_frame = b""
+        self._concealed_run = 0
+        self.jitter_ms = 0.0
+        self.frames_received = 0
+        self.frames_released = 0
+        self.late_drops = 0
+        self.duplicate_drops = 0
+        self.overflow_drops = 0
+        self.concealed_frames = 0
+
+    @property
+    def current_frames(self) -> list[tuple[bytes, float]]:
+        """Buffered ``(audio_data, timestamp)`` pairs in sequence order."""
+        if self._next_sequence is None:
+            return []
+        frames = []
+        for offset in range(self.max_size):
+            frame = self._slots[(self._next_sequence + offset) % self.max_size]
+            if frame is not None:
+                frames.append((frame.audio_data, frame.timestamp))
+        return frames
+
+    @property
+    def occupancy(self) -> int:
+        """Frames currently buffered."""
+        return self._count
+
+    def add_frame(
+        self, audio_data: bytes, timestamp: float, sequence: int | None = None
+    ) -> bool:
+        """Insert a frame; returns False if it was dropped.
+
+        Args:
+            audio_data: Frame payload (canonical PCM)
+            timestamp: Arrival time in seconds
+            sequence: Transport (RTP) sequence number, wrapping at 2**16
+                (default: arrival order)
+        """
+        if sequence is None:
+            sequence = self._auto_sequence
+        elif self.frames_received:
+            sequence = self._extend_sequence(sequence)
+        self._auto_sequence = max(self._auto_sequence, sequence + 1)
+        self.frames_received += 1
+        self._update_jitter(sequence, timestamp)
+
+        if self._next_sequence is None or (
+            self._count == 0
+            and sequence >= self._next_sequence
+            and timestamp >= self._arrival_time(sequence)
+        ):
+            # First frame, or the stream resumed after an underrun: re-anchor
+            self._next_sequence = sequence
+            self._anchor_sequence = sequence
+            self._anchor_time = timestamp
+        elif sequence < self._next_sequence:
+            self.late_drops += 1
+            return False
+        elif sequence >= self._next_sequence + self.max_size:
+            self._skip(self._next_sequence, sequence - self.max_size + 1)
+
+        index = sequence % self.max_size
+        existing = self._slots[index]
+        if existing is not None and existing.sequence == sequence:
+            self.duplicate_drops += 1
+            return False
+        self._slots[index] = _BufferedFrame(sequence, audio_data, timestamp)
+        self._count += 1
+        return True
 
+    def get_ready_frames(self, current_time: float) -> list[bytes]:
+        """Release frames whose playout time has come, concealing gaps."""
+        ready_frames: list[bytes] = []
+        while self._count and self._next_sequence is not None:
+            if current_time < self._arrival_time(self._next_sequence) + (
+                self.target_latency_ms / 1000.0
+            ):
+                break
+            index = self._next_sequence % self.max_size
+            frame = self._slots[index]
+            if frame is not None and frame.sequence == self._next_sequence:
+                self._slots[index] = None
+                self._count -= 1
+                self._last_frame = frame.audio_data
+                self._concealed_run = 0
+                self.frames_released += 1
+                ready_frames.append(frame.audio_data)
+            else:
+                ready_frames.append(self._conceal())
+            self._next_sequence += 1
+            self._adapt_target()
         return ready_frames
 
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
-        if self.current_frames is None:
-            return True
-        return len(self.current_frames) == 0
+        return self._count == 0
+
+    def clear(self) -> None:
+        """Drop buffered frames and restart the schedule (counters are kept)."""
+        self._slots = [None] * self.max_size
+        self._count = 0
+        self._next_sequence = None
+        self._last_arrival = None
+        self._concealed_run = 0
+
+    def stats(self) -> dict[str, float]:
+        """Occupancy, latency and drop counters for metrics."""
+        return {
+            "occupancy_frames": self._count,
+            "target_latency_ms": self.target_latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "frames_received": self.frames_received,
+            "frames_released": self.frames_released,
+            "late_drops": self.late_drops,
+            "duplicate_drops": self.duplicate_drops,
+            "overflow_drops": self.overflow_drops,
+            "concealed_frames": self.concealed_frames,
+        }
+
+    def _extend_sequence(self, sequence: int) -> int:
+        """Unwrap a 16-bit sequence against the highest extended one seen."""
+        highest = self._auto_sequence - 1
+        distance = (sequence - highest + _SEQUENCE_HALF) % _SEQUENCE_MOD
+        return highest + distance - _SEQUENCE_HALF
+
+    def _arrival_time(self, sequence: int) -> float:
+        """Jitter-free arrival time of ``sequence`` on the current anchor."""
+        return (
+            self._anchor_time
+            + (sequence - self._anchor_sequence) * self.frame_duration_ms / 1000.0
+        )
+
+    def _update_jitter(self, sequence: int, timestamp: float) -> None:
+        """RFC 3550 interarrival jitter: J += (|D| - J) / 16."""
+        previous = self._last_arrival
+        if previous is None or sequence > previous[0]:
+            self._last_arrival = (sequence, timestamp)
+        if previous is None or sequence <= previous[0]:
+            return
+        transit_ms = (timestamp - previous[1]) * 1000.0 - (
+            sequence - previous[0]
+        ) * self.frame_duration_ms
+        self.jitter_ms += (abs(transit_ms) - self.jitter_ms) / 16.0
+
+    def _adapt_target(self) -> None:
+        """Step the target latency toward the jitter-derived target."""
+        if not self.adaptive:
+            return
+        ceiling = min(self.max_latency_ms, (self.max_size - 1) * self.frame_duration_ms)
+        desired = self.frame_duration_ms + self.jitter_multiplier * self.jitter_ms
+        desired = min(max(desired, self.min_latency_ms), ceiling)
+        step = max(
+            -self.adapt_step_ms,
+            min(self.adapt_step_ms, desired - self.target_latency_ms),
+        )
+        self.target_latency_ms += step
+
+    def _skip(self, start: int, sequence: int) -> None:
+        """Drop frames ``start..sequence - 1`` to make room in the ring."""
+        for skipped in range(start, min(sequence, start + self.max_size)):
+            index = skipped % self.max_size
+            frame = self._slots[index]
+            if frame is not None and frame.sequence == skipped:
+                self._slots[index] = None
+                self._count -= 1
+                self.overflow_drops += 1
+        self._next_sequence = sequence
+
+    def _conceal(self) -> bytes:
+        """Repeat the last frame at decaying gain, then fall back to silence."""
+        self.concealed_frames += 1
+        run = self._concealed_run
+        self._concealed_run += 1
+        if run >= self.max_concealed_frames or len(self._last_frame) % 2:
+            return bytes(len(self._last_frame))
+        samples = np.frombuffer(self._last_frame, dtype="<i2")
+        return (samples * 0.5**run).astype("<i2").tobytes()
 
 
 class MediaGateway:
@@ -79,6 +272,11 @@ class MediaGateway:
         self.jitter_buffer = JitterBuffer() if enable_jitter_buffer else None
         self._logger = get_logger(__name__)
 
+        # Resampler and time-stretch state per stream so frame boundaries
+        # stay continuous
+        self._resamplers: dict[str, Resampler] = {}
+        self._stretchers: dict[str | None, TimeStretcher] = {}
+
         # Performance tracking
         self._conversion_count = 0
         self._total_conversion_time = 0.0
@@ -88,8 +286,14 @@ class MediaGateway:
         audio_data: bytes,
         input_metadata: dict[str, Any],
         output_format: str = "pcm",
+        stream_id: str | None = None,
     ) -> tuple[bytes, dict[str, Any]]:
-        """Normalize audio to canonical contract format."""
+        """Normalize audio to canonical contract format.
+
+        Frames passed with the same ``stream_id`` share resampler state, so a
+        stream converted frame by frame matches the same audio converted in one
+        piece. Call ``end_stream`` when the stream finishes.
+        """
         start_time = time.time()
 
         try:
@@ -100,7 +304,9 @@ class MediaGateway:
 
             # Normalize to canonical format (handles non-canonical formats)
             normalized_data, normalized_metadata = self.contract.normalize_audio(
-                audio_data, input_metadata
+                audio_data,
+                input_metadata,
+                resampler=self._stream_resampler(stream_id, input_metadata),
             )
 
             # Convert to output format if needed
@@ -128,11 +334,30 @@ class MediaGateway:
             self._logger.error("media_gateway.normalization_failed", error=str(e))
             return audio_data, input_metadata
 
+    def _stream_resampler(
+        self, stream_id: str | None, metadata: dict[str, Any]
+    ) -> Resampler | None:
+        """Resampler carried across the frames of ``stream_id``, if any."""
+        from_rate = metadata.get("sample_rate", self.contract.spec.sample_rate)
+        if stream_id is None or from_rate == self.contract.spec.sample_rate:
+            return None
+        resampler = self._resamplers.get(stream_id)
+        if resampler is None or resampler.from_rate != from_rate:
+            resampler = self.contract.create_resampler(from_rate)
+            self._resamplers[stream_id] = resampler
+        return resampler
+
+    def end_stream(self, stream_id: str) -> None:
+        """Drop the resampler and time-stretch state kept for ``stream_id``."""
+        self._resamplers.pop(stream_id, None)
+        self._stretchers.pop(stream_id, None)
+
     async def convert_from_transport(
         self,
         transport_data: bytes,
         transport_codec: str,
         transport_metadata: dict[str, Any],
+        stream_id: str | None = None,
     ) -> tuple[bytes, dict[str, Any]]:
         """Convert from transport codec to canonical format."""
         try:
@@ -140,11 +365,11 @@ class MediaGateway:
                 # Opus to PCM conversion would go here
                 # For now, assume data is already PCM
                 return await self.normalize_audio(
-                    transport_data, transport_metadata, "pcm"
+                    transport_data, transport_metadata, "pcm", stream_id
                 )
             elif transport_codec == "pcm":
                 return await self.normalize_audio(
-                    transport_data, transport_metadata, "pcm"
+                    transport_data, transport_metadata, "pcm", stream_id
                 )
             else:
                 self._logger.warning(
@@ -193,22 +418,24 @@ class MediaGateway:
             )
             return canonical_data, canonical_metadata
 
-    def add_to_jitter_buffer(self, audio_data: bytes, timestamp: float) -> None:
+    def add_to_jitter_buffer(
+        self, audio_data: bytes, timestamp: float, sequence: int | None = None
+    ) -> None:
         """Add audio frame to jitter buffer."""
-        if self.jitter_buffer:
-            self.jitter_buffer.add_frame(audio_data, timestamp)
+        if self.jitter_buffer is not None:
+            self.jitter_buffer.add_frame(audio_data, timestamp, sequence)
 
     def get_from_jitter_buffer(self) -> list[bytes]:
         """Get ready frames from jitter buffer."""
-        if self.jitter_buffer:
+        if self.jitter_buffer is not None:
             current_time = time.time()
             return self.jitter_buffer.get_ready_frames(current_time)
         return []
 
     def clear_jitter_buffer(self) -> None:
         """Clear jitter buffer."""
-        if self.jitter_buffer and self.jitter_buffer.current_frames is not None:
-            self.jitter_buffer.current_frames.clear()
+        if self.jitter_buffer is not None:
+            self.jitter_buffer.clear()
 
     def get_performance_stats(self) -> dict[str, Any]:
         """Get performance statistics."""
@@ -224,9 +451,10 @@ class MediaGateway:
             "avg_conversion_time_ms": avg_conversion_time * 1000,
             "jitter_buffer_enabled": self.enable_jitter_buffer,
             "jitter_buffer_size": (
-                len(self.jitter_buffer.current_frames)
-                if self.jitter_buffer and self.jitter_buffer.current_frames is not None
-                else 0
+                self.jitter_buffer.occupancy if self.jitter_buffer is not None else 0
+            ),
+            "jitter_buffer": (
+                self.jitter_buffer.stats() if self.jitter_buffer is not None else {}
             ),
         }
 
@@ -235,8 +463,14 @@ class MediaGateway:
         audio_data: bytes,
         expected_timestamp: float,
         actual_timestamp: float,
+        stream_id: str | None = None,
     ) -> bytes:
-        """Handle clock drift correction."""
+        """Handle clock drift correction.
+
+        Canonical PCM is time-stretched (pitch-preserving, whole samples) by up
+        to 10% while drift exceeds 50 ms. Corrections smaller than a pitch
+        period carry over to the stream's next frames.
+        """
         try:
             drift_ms = (actual_timestamp - expected_timestamp) * 1000.0
 
@@ -249,15 +483,16 @@ class MediaGateway:
                     actual=actual_timestamp,
                 )
 
-                # Simple drift correction: adjust playback speed
-                if drift_ms > 0:
-                    # Audio is late, speed up slightly
-                    return self._speed_up_audio(audio_data, min(drift_ms / 1000.0, 0.1))
-                else:
-                    # Audio is early, slow down slightly
-                    return self._slow_down_audio(
-                        audio_data, min(abs(drift_ms) / 1000.0, 0.1)
-                    )
+                # Audio is late: speed up slightly; early: slow down slightly
+                change = min(abs(drift_ms) / 1000.0, 0.1)
+                speed = 1.0 / (1.0 - change) if drift_ms > 0 else 1.0 / (1.0 + change)
+                stretcher = self._stretchers.get(stream_id)
+                if stretcher is None:
+                    stretcher = TimeStretcher(self.contract.spec.sample_rate)
+                    self._stretchers[stream_id] = stretcher
+                width = self.contract.spec.sample_width
+                stretched = stretcher.process(pcm_samples(audio_data, width), speed)
+                return pcm_bytes(stretched, width)
 
             return audio_data
 
@@ -265,33 +500,12 @@ class MediaGateway:
             self._logger.warning("media_gateway.drift_correction_failed", error=str(e))
             return audio_data
 
-    def _speed_up_audio(self, audio_data: bytes, factor: float) -> bytes:
-        """Speed up audio by removing samples."""
-        try:
-            # Simple speed up by dropping samples
-            drop_ratio = int(len(audio_data) * factor)
-            if drop_ratio > 0:
-                return audio_data[drop_ratio:]
-            return audio_data
-        except Exception:
-            return audio_data
-
-    def _slow_down_audio(self, audio_data: bytes, factor: float) -> bytes:
-        """Slow down audio by duplicating samples."""
-        try:
-            # Simple slow down by duplicating samples
-            duplicate_ratio = int(len(audio_data) * factor)
-            if duplicate_ratio > 0:
-                return audio_data + audio_data[:duplicate_ratio]
-            return audio_data
-        except Exception:
-            return audio_data
-
     async def process_incoming_audio(
         self,
         audio_data: bytes,
         from_format: str,
         from_metadata: Any,
+        stream_id: str | None = None,
     ) -> Any:
         """Process incoming audio data from transport to canonical format."""
         try:
@@ -308,7 +522,7 @@ class MediaGateway:
 
             # Convert from transport codec if needed
             normalized_data, normalized_metadata = await self.convert_from_transport(
-                audio_data, from_format, metadata_dict
+                audio_data, from_format, metadata_dict, stream_id
             )
 
             return type(
@@ -7,8 +7,11 @@ surface adapters and their configurations.
 
 from __future__ import annotations
 
+import bisect
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
 from services.common.structured_logging import get_logger
@@ -47,8 +50,59 @@ class RegistryStats:
         }
 
 
+# Features understood by SurfaceConfig.supports_feature
+CAPABILITY_FEATURES = (
+    "audio_input",
+    "audio_output",
+    "stereo",
+    "wake_detection",
+    "vad",
+    "barge_in",
+    "playback_control",
+    "opus",
+    "pcm",
+    "webrtc",
+)
+_UNHEALTHY_STATUSES = frozenset({SurfaceStatus.UNAVAILABLE, SurfaceStatus.ERROR})
+
+
+class RegistryChangeType(Enum):
+    """Kind of change reported to registry subscribers."""
+
+    REGISTERED = "registered"
+    UNREGISTERED = "unregistered"
+    STATUS_CHANGED = "status_changed"
+    REINDEXED = "reindexed"
+    CLEARED = "cleared"
+
+
+@dataclass(slots=True)
+class RegistryChange:
+    """A change to the registry, delivered to subscribers after it is applied."""
+
+    change_type: RegistryChangeType
+    generation: int
+    surface_id: str | None = None
+    surface: SurfaceConfig | None = None
+    old_status: SurfaceStatus | None = None
+
+
+RegistrySubscriber = Callable[[RegistryChange], None]
+
+
 class SurfaceRegistry:
-    """Registry for managing surface adapters."""
+    """Registry for managing surface adapters.
+
+    Lookups by type, status, capability and priority read secondary indexes
+    that ``register_surface``, ``update_surface_status`` and
+    ``unregister_surface`` keep up to date, so they cost the size of the
+    answer rather than a scan of every surface. Each index keeps surfaces in
+    the order they entered it.
+
+    The indexes only see changes made through the registry. After mutating a
+    registered ``SurfaceConfig`` directly (status, priority, capabilities),
+    call ``reindex_surface``.
+    """
 
     def __init__(self) -> None:
         self._logger = get_logger(__name__)
@@ -57,6 +111,22 @@ class SurfaceRegistry:
         self._surfaces: dict[str, SurfaceConfig] = {}
         self._adapters: dict[str, SurfaceAdapter] = {}
 
+        # Secondary indexes (surface_id -> config, insertion ordered)
+        self._by_type: dict[SurfaceType, dict[str, SurfaceConfig]] = {}
+        self._by_status: dict[SurfaceStatus, dict[str, SurfaceConfig]] = {}
+        self._by_capability: dict[str, dict[str, SurfaceConfig]] = {}
+        self._healthy: dict[str, SurfaceConfig] = {}
+        # (-priority, sequence, surface_id), highest priority first
+        self._by_priority: list[tuple[int, int, str]] = []
+        # What each surface was indexed under, so stale entries can be removed
+        # even if the config was mutated in place
+        self._index_keys: dict[str, tuple[SurfaceStatus, tuple[int, int, str]]] = {}
+        self._sequence = 0
+
+        # Change notification
+        self._subscribers: list[RegistrySubscriber] = []
+        self._generation = 0
+
         # Statistics
         self._stats = RegistryStats()
 
@@ -87,10 +157,16 @@ class SurfaceRegistry:
 
             # Register surface
             self._surfaces[surface_config.surface_id] = surface_config
+            self._index_surface(surface_config)
             self._stats.total_surfaces += 1
 
             # Update availability stats
             self._update_availability_stats()
+            self._notify(
+                RegistryChangeType.REGISTERED,
+                surface_config.surface_id,
+                surface_config,
+            )
 
             self._logger.info(
                 "surface_registry.surface_registered",
@@ -121,6 +197,7 @@ class SurfaceRegistry:
 
             # Remove surface
             surface_config = self._surfaces.pop(surface_id)
+            self._unindex_surface(surface_config)
             self._stats.total_surfaces -= 1
 
             # Remove adapter if exists
@@ -129,6 +206,7 @@ class SurfaceRegistry:
 
             # Update availability stats
             self._update_availability_stats()
+            self._notify(RegistryChangeType.UNREGISTERED, surface_id, surface_config)
 
             self._logger.info(
                 "surface_registry.surface_unregistered",
@@ -152,38 +230,66 @@ class SurfaceRegistry:
 
     def get_surfaces_by_type(self, surface_type: SurfaceType) -> list[SurfaceConfig]:
         """Get surfaces by type."""
-        return [
-            surface
-            for surface in self._surfaces.values()
-            if surface.surface_type == surface_type
-        ]
+        return list(self._by_type.get(surface_type, {}).values())
+
+    def get_surfaces_by_status(self, status: SurfaceStatus) -> list[SurfaceConfig]:
+        """Get surfaces currently in ``status``."""
+        return list(self._by_status.get(status, {}).values())
 
     def get_available_surfaces(self) -> list[SurfaceConfig]:
         """Get all available surfaces."""
-        return [
-            surface for surface in self._surfaces.values() if surface.is_available()
-        ]
+        return self.get_surfaces_by_status(SurfaceStatus.AVAILABLE)
 
     def get_healthy_surfaces(self) -> list[SurfaceConfig]:
         """Get all healthy surfaces."""
-        return [surface for surface in self._surfaces.values() if surface.is_healthy()]
+        return list(self._healthy.values())
 
     def get_surfaces_by_capability(self, capability: str) -> list[SurfaceConfig]:
         """Get surfaces that support a specific capability."""
-        return [
-            surface
-            for surface in self._surfaces.values()
-            if surface.supports_feature(capability)
-        ]
+        return list(self._by_capability.get(capability, {}).values())
 
     def get_surfaces_by_priority(self, min_priority: int = 0) -> list[SurfaceConfig]:
-        """Get surfaces with minimum priority."""
+        """Get surfaces with minimum priority, highest priority first."""
+        end = bisect.bisect_left(self._by_priority, (-min_priority + 1,))
         return [
-            surface
-            for surface in self._surfaces.values()
-            if surface.priority >= min_priority
+            self._surfaces[surface_id] for _, _, surface_id in self._by_priority[:end]
         ]
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every change, for validating cached lookups."""
+        return self._generation
+
+    def subscribe(self, callback: RegistrySubscriber) -> None:
+        """Call ``callback`` with a ``RegistryChange`` after every change."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: RegistrySubscriber) -> bool:
+        """Stop notifying ``callback``; returns False if it was not subscribed."""
+        try:
+            self._subscribers.remove(callback)
+        except ValueError:
+            return False
+        return True
+
+    def reindex_surface(self, surface_id: str) -> bool:
+        """Re-read a surface's status, priority and capabilities into the indexes."""
+        surface = self._surfaces.get(surface_id)
+        if not surface:
+            self._logger.warning(
+                "surface_registry.surface_not_found",
+                surface_id=surface_id,
+            )
+            return False
+
+        old_status = self._index_keys[surface_id][0]
+        self._unindex_surface(surface)
+        self._index_surface(surface)
+        self._update_availability_stats()
+        self._notify(RegistryChangeType.REINDEXED, surface_id, surface, old_status)
+        return True
+
     def update_surface_status(self, surface_id: str, status: SurfaceStatus) -> bool:
         """Update surface status."""
         surface = self._surfaces.get(surface_id)
@@ -196,10 +302,13 @@ class SurfaceRegistry:
 
         try:
             old_status = surface.status
-            surface.status = status
+            self._move_status(surface, status)
 
             # Update availability stats
             self._update_availability_stats()
+            self._notify(
+                RegistryChangeType.STATUS_CHANGED, surface_id, surface, old_status
+            )
 
             self._logger.debug(
                 "surface_registry.status_updated",
@@ -366,7 +475,14 @@ class SurfaceRegistry:
         """Clear all registered surfaces and adapters."""
         self._surfaces.clear()
         self._adapters.clear()
+        self._by_type.clear()
+        self._by_status.clear()
+        self._by_capability.clear()
+        self._healthy.clear()
+        self._by_priority.clear()
+        self._index_keys.clear()
         self._stats = RegistryStats()
+        self._notify(RegistryChangeType.CLEARED)
 
         self._logger.info("surface_registry.registry_cleared")
 
@@ -415,36 +531,87 @@ class SurfaceRegistry:
             self._logger.error("surface_registry.config_import_failed", error=str(e))
             return False
 
-    def _update_availability_stats(self) -> None:
-        """Update availability statistics."""
-        self._stats.available_surfaces = len(
-            [
-                surface
-                for surface in self._surfaces.values()
-                if surface.status == SurfaceStatus.AVAILABLE
-            ]
-        )
-
-        self._stats.busy_surfaces = len(
-            [
-                surface
-                for surface in self._surfaces.values()
-                if surface.status == SurfaceStatus.BUSY
-            ]
-        )
-
-        self._stats.unavailable_surfaces = len(
-            [
-                surface
-                for surface in self._surfaces.values()
-                if surface.status == SurfaceStatus.UNAVAILABLE
-            ]
+    def _index_surface(self, surface: SurfaceConfig) -> None:
+        """Add a surface to every secondary index."""
+        surface_id = surface.surface_id
+        self._by_type.setdefault(surface.surface_type, {})[surface_id] = surface
+        self._by_status.setdefault(surface.status, {})[surface_id] = surface
+        if surface.status not in _UNHEALTHY_STATUSES:
+            self._healthy[surface_id] = surface
+        for feature in CAPABILITY_FEATURES:
+            if surface.supports_feature(feature):
+                self._by_capability.setdefault(feature, {})[surface_id] = surface
+
+        self._sequence += 1
+        priority_key = (-surface.priority, self._sequence, surface_id)
+        bisect.insort(self._by_priority, priority_key)
+        self._index_keys[surface_id] = (surface.status, priority_key)
+
+    def _unindex_surface(self, surface: SurfaceConfig) -> None:
+        """Remove a surface from every secondary index."""
+        surface_id = surface.surface_id
+        status, priority_key = self._index_keys.pop(surface_id)
+        self._by_type.get(surface.surface_type, {}).pop(surface_id, None)
+        self._by_status[status].pop(surface_id, None)
+        self._healthy.pop(surface_id, None)
+        for members in self._by_capability.values():
+            members.pop(surface_id, None)
+
+        index = bisect.bisect_left(self._by_priority, priority_key)
+        del self._by_priority[index]
+
+    def _move_status(self, surface: SurfaceConfig, status: SurfaceStatus) -> None:
+        """Set a surface's status and move it between status indexes."""
+        surface_id = surface.surface_id
+        old_status, priority_key = self._index_keys[surface_id]
+        surface.status = status
+        if status == old_status:
+            return
+
+        self._by_status[old_status].pop(surface_id, None)
+        self._by_status.setdefault(status, {})[surface_id] = surface
+        if status in _UNHEALTHY_STATUSES:
+            self._healthy.pop(surface_id, None)
+        elif surface_id not in self._healthy:
+            self._healthy[surface_id] = surface
+        self._index_keys[surface_id] = (status, priority_key)
+
+    def _notify(
+        self,
+        change_type: RegistryChangeType,
+        surface_id: str | None = None,
+        surface: SurfaceConfig | None = None,
+        old_status: SurfaceStatus | None = None,
+    ) -> None:
+        """Bump the generation and tell subscribers about a change."""
+        self._generation += 1
+        if not self._subscribers:
+            return
+
+        change = RegistryChange(
+            change_type=change_type,
+            generation=self._generation,
+            surface_id=surface_id,
+            surface=surface,
+            old_status=old_status,
         )
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                self._logger.error(
+                    "surface_registry.subscriber_failed",
+                    change_type=change_type.value,
+                    surface_id=surface_id,
+                    error=str(e),
+                )
 
-        self._stats.error_surfaces = len(
-            [
-                surface
-                for surface in self._surfaces.values()
-                if surface.status == SurfaceStatus.ERROR
-            ]
-        )
+    def _update_availability_stats(self) -> None:
+        """Update availability statistics from the status index."""
+        for status, attribute in (
+            (SurfaceStatus.AVAILABLE, "available_surfaces"),
+            (SurfaceStatus.BUSY, "busy_surfaces"),
+            (SurfaceStatus.UNAVAILABLE, "unavailable_surfaces"),
+            (SurfaceStatus.ERROR, "error_surfaces"),
+        ):
+            setattr(self._stats, attribute, len(self._by_status.get(status, ())))
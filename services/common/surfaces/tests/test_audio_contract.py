@@ -5,6 +5,7 @@ This module validates that the canonical audio contract is properly
 enforced and that media gateway conversions work correctly.
 """
 
+import numpy as np
 import pytest
 
 from services.common.surfaces.audio_contract import AudioContract, AudioContractSpec
@@ -180,14 +181,14 @@ class TestJitterBuffer:
 
     def test_jitter_buffer_get_ready_frames(self):
         """Test getting ready frames from jitter buffer."""
-        buffer = JitterBuffer()
+        buffer = JitterBuffer(adaptive=False)
         current_time = 1234567890.0
 
-        # Add frame that's ready
-        buffer.add_frame(b"\x00\x01", current_time - 0.2)  # 200ms old
+        # Add frame that's ready (plays 100ms after arriving)
+        buffer.add_frame(b"\x00\x01", current_time - 0.11)
 
-        # Add frame that's not ready
-        buffer.add_frame(b"\x02\x03", current_time - 0.05)  # 50ms old
+        # Add frame that's not ready (due one 20ms frame later)
+        buffer.add_frame(b"\x02\x03", current_time - 0.09)
 
         ready_frames = buffer.get_ready_frames(current_time)
 
@@ -205,6 +206,97 @@ class TestJitterBuffer:
         buffer.add_frame(b"\x00\x01", 1234567890.0)
         assert buffer.is_empty() is False
 
+    def test_jitter_buffer_reorders_by_sequence(self):
+        """Frames play in sequence order regardless of arrival order."""
+        buffer = JitterBuffer(adaptive=False)
+
+        buffer.add_frame(b"\x00\x00", 10.000, sequence=0)
+        buffer.add_frame(b"\x02\x00", 10.021, sequence=2)
+        buffer.add_frame(b"\x01\x00", 10.025, sequence=1)
+
+        assert buffer.get_ready_frames(10.2) == [b"\x00\x00", b"\x01\x00", b"\x02\x00"]
+        assert buffer.is_empty() is True
+
+    def test_jitter_buffer_drops_late_and_duplicate_frames(self):
+        """A frame arriving after its turn, or twice, is dropped and counted."""
+        buffer = JitterBuffer(adaptive=False)
+        buffer.add_frame(b"\x00\x00", 10.00, sequence=5)
+        buffer.add_frame(b"\x01\x00", 10.02, sequence=6)
+        buffer.get_ready_frames(10.11)
+
+        assert buffer.add_frame(b"\x00\x00", 10.12, sequence=5) is False
+        assert buffer.add_frame(b"\x01\x00", 10.12, sequence=6) is False
+
+        stats = buffer.stats()
+        assert stats["late_drops"] == 1
+        assert stats["duplicate_drops"] == 1
+        assert stats["occupancy_frames"] == 1
+
+    def test_jitter_buffer_handles_sequence_rollover(self):
+        """RTP sequences wrapping from 65535 to 0 keep playing in order."""
+        buffer = JitterBuffer(adaptive=False)
+        sequences = [*range(65530, 65536), *range(6)]
+        released = []
+
+        for index, sequence in enumerate(sequences):
+            arrival = 10.0 + index * 0.02
+            buffer.add_frame(bytes([index, 0]), arrival, sequence=sequence)
+            released.extend(buffer.get_ready_frames(arrival))
+        released.extend(buffer.get_ready_frames(11.0))
+
+        assert released == [bytes([index, 0]) for index in range(12)]
+        stats = buffer.stats()
+        assert stats["late_drops"] == 0
+        assert stats["concealed_frames"] == 0
+
+        # After an underrun across the wrap, the stream re-anchors
+        assert buffer.add_frame(b"\x0c\x00", 12.0, sequence=6) is True
+        assert buffer.get_ready_frames(12.2) == [b"\x0c\x00"]
+
+    def test_jitter_buffer_conceals_lost_frame(self):
+        """A gap is filled by repeating the previous frame at decaying gain."""
+        buffer = JitterBuffer(adaptive=False)
+        frame = (np.full(4, 1000, dtype="<i2")).tobytes()
+        buffer.add_frame(frame, 10.00, sequence=0)
+        buffer.add_frame(frame, 10.06, sequence=3)
+
+        ready = buffer.get_ready_frames(10.2)
+
+        assert len(ready) == 4
+        assert ready[1] == frame
+        assert np.frombuffer(ready[2], dtype="<i2").tolist() == [500] * 4
+        assert buffer.stats()["concealed_frames"] == 2
+
+    def test_jitter_buffer_ring_overflow_drops_oldest(self):
+        """A frame beyond the ring's reach pushes out the oldest frames."""
+        buffer = JitterBuffer(max_size=4, adaptive=False)
+        for sequence in range(4):
+            buffer.add_frame(bytes([sequence, 0]), 10.0, sequence=sequence)
+
+        buffer.add_frame(b"\x05\x00", 10.0, sequence=5)
+
+        assert buffer.stats()["overflow_drops"] == 2
+        assert buffer.current_frames[0] == (b"\x02\x00", 10.0)
+
+    def test_jitter_buffer_adapts_target_to_jitter(self):
+        """Target latency follows measured jitter, within its bounds."""
+        steady = JitterBuffer(target_latency_ms=60.0)
+        jittery = JitterBuffer(target_latency_ms=60.0)
+        offsets = [0.0, 0.03, -0.01, 0.025, 0.0, 0.035, -0.005, 0.02]
+
+        for sequence in range(400):
+            arrival = 10.0 + sequence * 0.02
+            steady.add_frame(b"\x00\x00", arrival, sequence=sequence)
+            jittery.add_frame(
+                b"\x00\x00", arrival + offsets[sequence % 8], sequence=sequence
+            )
+            steady.get_ready_frames(arrival)
+            jittery.get_ready_frames(arrival)
+
+        assert steady.target_latency_ms == pytest.approx(20.0)
+        assert jittery.jitter_ms > 10.0
+        assert 50.0 < jittery.target_latency_ms <= 180.0
+
 
 class TestMediaGateway:
     """Test MediaGateway functionality."""
@@ -113,6 +113,32 @@ class TestPCMFrame:
 
         assert frame.frame_size_ms == 20.0  # 0.02 * 1000
 
+    @pytest.mark.unit
+    def test_pcm_frame_samples_view(self):
+        """Test PCMFrame exposes its PCM as a read-only view, not a copy."""
+        pcm = b"\x01\x00\xff\xff\x00\x80\xff\x7f"
+        frame = PCMFrame(
+            pcm=pcm,
+            timestamp=0.0,
+            rms=0.0,
+            duration=0.0,
+            sequence=0,
+            sample_rate=16000,
+        )
+
+        samples = frame.samples
+        assert samples.tolist() == [1, -1, -32768, 32767]
+        assert not samples.flags.writeable
+        assert samples.base is not None
+        assert frame.sample_count == 4
+
+    @pytest.mark.unit
+    def test_discord_uses_shared_pcm_frame(self):
+        """Test the Discord receive path shares the common PCMFrame type."""
+        from services.discord.audio import PCMFrame as DiscordPCMFrame
+
+        assert DiscordPCMFrame is PCMFrame
+
 
 class TestAudioSegment:
     """Test AudioSegment data structure."""
@@ -5,6 +5,7 @@ This module validates that the surface registry correctly manages
 surface configurations and adapters.
 """
 
+import random
 from unittest.mock import Mock
 
 from services.common.surfaces.config import (
@@ -14,7 +15,11 @@ from services.common.surfaces.config import (
     SurfaceType,
 )
 from services.common.surfaces.interfaces import SurfaceAdapter
-from services.common.surfaces.registry import RegistryStats, SurfaceRegistry
+from services.common.surfaces.registry import (
+    RegistryChangeType,
+    RegistryStats,
+    SurfaceRegistry,
+)
 
 
 class TestRegistryStats:
@@ -665,3 +670,130 @@ class TestSurfaceRegistry:
         assert imported_surface.display_name == "Imported Surface"
         assert imported_surface.priority == 5
         assert imported_surface.config["timeout_ms"] == 5000.0
+
+
+def _scan(registry: SurfaceRegistry, predicate) -> set[str]:
+    return {s.surface_id for s in registry.get_all_surfaces() if predicate(s)}
+
+
+class TestRegistryIndexes:
+    """Test indexed lookups and change notifications."""
+
+    def test_indexes_match_full_scan_after_random_changes(self):
+        """Every indexed lookup agrees with a scan after mixed operations."""
+        rng = random.Random(0)
+        registry = SurfaceRegistry()
+        statuses = list(SurfaceStatus)
+
+        for index in range(200):
+            registry.register_surface(
+                SurfaceConfig(
+                    surface_id=f"surface{index}",
+                    surface_type=rng.choice(list(SurfaceType)),
+                    display_name=f"Surface {index}",
+                    status=rng.choice(statuses),
+                    priority=rng.randint(0, 10),
+                    capabilities=SurfaceCapabilities(
+                        supports_stereo=rng.random() < 0.5,
+                        supports_webrtc=rng.random() < 0.5,
+                    ),
+                )
+            )
+        for _ in range(300):
+            surface_id = f"surface{rng.randrange(200)}"
+            if rng.random() < 0.2:
+                registry.unregister_surface(surface_id)
+            else:
+                registry.update_surface_status(surface_id, rng.choice(statuses))
+
+        for surface_type in SurfaceType:
+            assert {
+                s.surface_id for s in registry.get_surfaces_by_type(surface_type)
+            } == _scan(registry, lambda s, t=surface_type: s.surface_type == t)
+        assert {s.surface_id for s in registry.get_available_surfaces()} == _scan(
+            registry, SurfaceConfig.is_available
+        )
+        assert {s.surface_id for s in registry.get_healthy_surfaces()} == _scan(
+            registry, SurfaceConfig.is_healthy
+        )
+        for feature in ("stereo", "webrtc", "audio_input"):
+            assert {
+                s.surface_id for s in registry.get_surfaces_by_capability(feature)
+            } == _scan(registry, lambda s, f=feature: s.supports_feature(f))
+        by_priority = registry.get_surfaces_by_priority(5)
+        assert {s.surface_id for s in by_priority} == _scan(
+            registry, lambda s: s.priority >= 5
+        )
+        assert [s.priority for s in by_priority] == sorted(
+            (s.priority for s in by_priority), reverse=True
+        )
+        stats = registry.get_registry_stats()
+        assert stats.busy_surfaces == len(
+            _scan(registry, lambda s: s.status == SurfaceStatus.BUSY)
+        )
+
+    def test_priority_ties_keep_registration_order(self):
+        """Surfaces of equal priority are returned in registration order."""
+        registry = SurfaceRegistry()
+        for surface_id, priority in (("a", 1), ("b", 5), ("c", 1), ("d", 5)):
+            registry.register_surface(
+                SurfaceConfig(
+                    surface_id=surface_id,
+                    surface_type=SurfaceType.WEB,
+                    display_name=surface_id,
+                    priority=priority,
+                )
+            )
+
+        assert [s.surface_id for s in registry.get_surfaces_by_priority()] == [
+            "b",
+            "d",
+            "a",
+            "c",
+        ]
+
+    def test_subscribers_are_notified_of_changes(self):
+        """Subscribers see each change; a failing subscriber does not stop others."""
+        registry = SurfaceRegistry()
+        changes = []
+        registry.subscribe(Mock(side_effect=RuntimeError("router down")))
+        registry.subscribe(changes.append)
+        surface = SurfaceConfig(
+            surface_id="web1", surface_type=SurfaceType.WEB, display_name="Web 1"
+        )
+
+        registry.register_surface(surface)
+        registry.update_surface_status("web1", SurfaceStatus.BUSY)
+        registry.unregister_surface("web1")
+        assert registry.unsubscribe(changes.append) is True
+        registry.clear_registry()
+
+        assert [change.change_type for change in changes] == [
+            RegistryChangeType.REGISTERED,
+            RegistryChangeType.STATUS_CHANGED,
+            RegistryChangeType.UNREGISTERED,
+        ]
+        assert changes[1].old_status == SurfaceStatus.AVAILABLE
+        assert changes[1].surface is surface
+        assert [change.generation for change in changes] == [1, 2, 3]
+        assert registry.generation == 4
+
+    def test_reindex_surface_after_direct_mutation(self):
+        """Configs changed in place are picked up by reindex_surface."""
+        registry = SurfaceRegistry()
+        surface = SurfaceConfig(
+            surface_id="discord1",
+            surface_type=SurfaceType.DISCORD,
+            display_name="Discord 1",
+        )
+        registry.register_surface(surface)
+
+        surface.status = SurfaceStatus.ERROR
+        surface.priority = 7
+        assert registry.reindex_surface("discord1") is True
+
+        assert registry.get_available_surfaces() == []
+        assert registry.get_healthy_surfaces() == []
+        assert registry.get_surfaces_by_status(SurfaceStatus.ERROR) == [surface]
+        assert registry.get_surfaces_by_priority(7) == [surface]
+        assert registry.get_registry_stats().error_surfaces == 1
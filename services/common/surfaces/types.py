@@ -12,6 +12,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
+from services.common.audio_kernels import pcm_samples
+
 
 class AudioFormat(Enum):
     """Supported audio formats."""
@@ -49,7 +53,12 @@ class SessionAction(Enum):
 
 @dataclass(slots=True)
 class PCMFrame:
-    """Represents a single PCM audio frame with metadata."""
+    """Represents a single PCM audio frame with metadata.
+
+    This is the one frame type shared by every layer, from the Discord receiver
+    through the accumulator, VAD and wake gating to segment encoding. Build it
+    once per frame and pass it on; ``samples`` reads the PCM without copying.
+    """
 
     pcm: bytes
     timestamp: float
@@ -65,6 +74,16 @@ class PCMFrame:
         """Frame duration in milliseconds."""
         return self.duration * 1000.0
 
+    @property
+    def samples(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Read-only NumPy view of the interleaved samples (no copy)."""
+        return pcm_samples(self.pcm, self.sample_width)
+
+    @property
+    def sample_count(self) -> int:
+        """Samples per channel."""
+        return len(self.pcm) // (self.sample_width * self.channels)
+
 
 @dataclass(slots=True)
 class AudioMetadata:
@@ -0,0 +1,115 @@
+"""Tests for the columnar per-frame feature store."""
+
+import numpy as np
+import pytest
+
+from services.common.audio_features import FrameFeatureStore
+from services.common.audio_quality import AudioQualityMetrics
+from services.common.surfaces.types import PCMFrame
+
+
+def _frames(count: int, size: int = 960, seed: int = 0) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    t = np.arange(count * size) / 48000
+    audio = 6000 * np.sin(2 * np.pi * 440 * t) + rng.normal(150, 500, len(t))
+    return list(audio.astype(np.int16).reshape(count, size))
+
+
+class TestFrameFeatureStore:
+    """Per-frame columns and their aggregates."""
+
+    def test_aggregates_match_concatenated_samples(self):
+        """RMS, mean and zero-crossing rate combine across rows exactly."""
+        frames = _frames(40)
+        store = FrameFeatureStore(capacity=4)
+
+        for frame in frames:
+            store.append(frame, 48000)
+
+        joined = np.concatenate(frames).astype(np.float64)
+        crossings = sum(
+            np.count_nonzero(np.diff(np.signbit(frame))) for frame in frames
+        )
+        assert len(store) == 40
+        assert store.rms() == pytest.approx(np.sqrt(np.mean(joined**2)))
+        assert store.mean() == pytest.approx(joined.mean())
+        assert store.zcr() == pytest.approx(crossings / (40 * 959))
+        assert store.rms(10, 20) == pytest.approx(
+            np.sqrt(np.mean(np.concatenate(frames[10:20]).astype(np.float64) ** 2))
+        )
+
+    def test_given_rms_is_used_instead_of_recomputed(self):
+        """A caller-provided RMS sets the row's RMS and energy."""
+        store = FrameFeatureStore()
+
+        store.append(np.ones(100, dtype=np.int16), 16000, rms=3.0)
+
+        assert store.column("rms")[0] == 3.0
+        assert store.column("energy")[0] == pytest.approx(900.0)
+
+    def test_spectral_features_are_opt_in(self):
+        """Without spectral=True there are no spectral columns (and no FFT)."""
+        store = FrameFeatureStore()
+        store.append(_frames(1)[0], 48000)
+
+        with pytest.raises(KeyError, match="spectral=True"):
+            store.column("centroid_hz")
+
+    def test_spectral_features(self):
+        """Band energies add up to the frame energy; a tone peaks at its pitch."""
+        t = np.arange(320) / 16000
+        tone = (8000 * np.sin(2 * np.pi * 500 * t)).astype(np.int16)
+        store = FrameFeatureStore(spectral=True, band_edges_hz=(0, 300, 1000, 8000))
+
+        store.append(tone, 16000)
+        store.append(np.zeros(320, dtype=np.int16), 16000)
+
+        bands = store.column("band_energy")
+        assert bands[0].sum() == pytest.approx(store.column("energy")[0])
+        assert np.argmax(bands[0]) == 1
+        assert store.column("peak_hz")[0] == 500.0
+        assert 400 < store.column("centroid_hz")[0] < 700
+        assert bands[1].sum() == 0.0
+
+    def test_columns_are_read_only_views(self):
+        """Consumers cannot modify the stored features."""
+        store = FrameFeatureStore()
+        store.append(_frames(1)[0], 48000)
+
+        with pytest.raises(ValueError):
+            store.column("rms")[0] = 0.0
+
+    def test_clear_keeps_capacity(self):
+        """Clearing drops the rows so the store can be refilled."""
+        store = FrameFeatureStore(capacity=2)
+        for frame in _frames(5):
+            store.append(frame, 48000)
+
+        store.clear()
+        store.append(np.zeros(10, dtype=np.int16), 48000)
+
+        assert len(store) == 1
+        assert store.rms() == 0.0
+
+
+class TestQualityMetricsFromFeatures:
+    """Quality metrics computed from the store."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_from_features_match_calculate_metrics(self):
+        """Metrics from per-frame features equal those of the joined PCM."""
+        frames = _frames(25)
+        store = FrameFeatureStore()
+        for frame in frames:
+            store.append(frame, 48000)
+        pcm = np.concatenate(frames).tobytes()
+        joined = PCMFrame(
+            pcm=pcm, timestamp=0.0, rms=0.0, duration=0.5, sequence=0, sample_rate=48000
+        )
+
+        expected = await AudioQualityMetrics.calculate_metrics(joined)
+        metrics = AudioQualityMetrics.metrics_from_features(store, 48000)
+
+        assert "dominant_frequency_hz" not in metrics
+        for key in ("rms", "rms_int16", "snr_db", "clarity_score", "duration_ms"):
+            assert metrics[key] == pytest.approx(expected[key])
@@ -0,0 +1,275 @@
+"""Tests for the NumPy PCM kernels and their use in the audio contract."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from services.common.audio_kernels import (
+    Resampler,
+    TimeStretcher,
+    convert_width,
+    expand_channels,
+    mix_to_mono,
+    pcm_bytes,
+    pcm_samples,
+    resample,
+    rms,
+)
+from services.common.surfaces.audio_contract import AudioContract
+from services.common.surfaces.media_gateway import MediaGateway
+
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+needs_audioop = pytest.mark.skipif(audioop is None, reason="audioop not available")
+
+
+def _noise(count: int, dtype=np.int16, seed: int = 0) -> np.ndarray:
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(seed)
+    return rng.integers(info.min, info.max, count, endpoint=True).astype(dtype)
+
+
+def _tone(rate: int, seconds: float, channels: int = 1) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (0.5 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    return np.repeat(tone, channels)
+
+
+class TestSampleConversion:
+    """Width conversion and channel mixing."""
+
+    @needs_audioop
+    @pytest.mark.parametrize(
+        ("from_width", "to_width"), [(2, 1), (1, 2), (2, 4), (4, 2), (2, 3), (3, 2)]
+    )
+    def test_convert_width_matches_lin2lin(self, from_width, to_width):
+        """Width conversion is bit-exact with audioop.lin2lin."""
+        data = audioop.lin2lin(_noise(4000).tobytes(), 2, from_width)
+
+        converted = convert_width(pcm_samples(data, from_width), from_width, to_width)
+
+        assert pcm_bytes(converted, to_width) == audioop.lin2lin(
+            data, from_width, to_width
+        )
+
+    @needs_audioop
+    @pytest.mark.parametrize("width", [2, 4])
+    def test_stereo_downmix_matches_tomono(self, width):
+        """Averaging two channels is bit-exact with audioop.tomono(0.5, 0.5)."""
+        data = audioop.lin2lin(_noise(4000).tobytes(), 2, width)
+
+        mono = mix_to_mono(pcm_samples(data, width), 2)
+
+        assert pcm_bytes(mono, width) == audioop.tomono(data, width, 0.5, 0.5)
+
+    def test_multichannel_downmix_averages_every_channel(self):
+        """Channels beyond two are averaged per frame, not read as stereo pairs."""
+        frames = np.array([[300, 0, -300, 600], [-8, -8, -8, -7]], dtype=np.int16)
+
+        mono = mix_to_mono(frames.reshape(-1), 4)
+
+        np.testing.assert_array_equal(mono, [150, -8])
+
+    def test_kernels_write_into_output_buffers(self):
+        """Passing ``out`` reuses the caller's buffer instead of allocating."""
+        stereo = _noise(640)
+        mono_out = np.empty(320, dtype=np.int16)
+        width_out = np.empty(320, dtype=np.int8)
+
+        mono = mix_to_mono(stereo, 2, out=mono_out)
+        narrow = convert_width(mono, 2, 1, out=width_out)
+
+        assert mono is mono_out
+        assert narrow is width_out
+        np.testing.assert_array_equal(expand_channels(mono, 2)[::2], mono)
+
+    def test_24_bit_round_trip(self):
+        """24-bit PCM unpacks with its sign and packs back unchanged."""
+        values = np.array([-(1 << 23), -1, 0, 1, (1 << 23) - 1], dtype=np.int32)
+        data = pcm_bytes(values, 3)
+
+        assert len(data) == 15
+        np.testing.assert_array_equal(pcm_samples(data, 3), values)
+
+    def test_rms_matches_definition(self):
+        """RMS is computed in the samples' own scale."""
+        samples = _noise(960)
+
+        expected = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+
+        assert rms(samples) == pytest.approx(expected)
+        assert rms(samples[:0]) == 0.0
+
+    def test_invalid_pcm_is_rejected(self):
+        """Odd-length buffers and unknown widths raise ValueError."""
+        with pytest.raises(ValueError):
+            pcm_samples(b"\x00\x01\x02", 2)
+        with pytest.raises(ValueError):
+            pcm_samples(b"\x00" * 10, 5)
+
+
+class TestResampler:
+    """Stateful linear-interpolation resampling."""
+
+    @pytest.mark.parametrize(
+        ("from_rate", "to_rate", "channels"),
+        [(48000, 16000, 1), (44100, 16000, 1), (8000, 16000, 1), (22050, 16000, 2)],
+    )
+    def test_frame_by_frame_matches_whole_buffer(self, from_rate, to_rate, channels):
+        """Resampling 20 ms frames through one resampler equals one-shot output."""
+        samples = _noise(from_rate * channels // 2)
+        frame = from_rate // 50 * channels
+        resampler = Resampler(from_rate, to_rate, channels)
+
+        streamed = np.concatenate(
+            [
+                resampler.process(samples[start : start + frame])
+                for start in range(0, len(samples), frame)
+            ]
+        )
+
+        np.testing.assert_array_equal(
+            streamed, resample(samples, from_rate, to_rate, channels)
+        )
+        assert abs(len(streamed) // channels - to_rate // 2) <= 1
+
+    def test_resampled_tone_stays_a_tone(self):
+        """A 440 Hz tone at 44.1 kHz lands on the same tone at 16 kHz."""
+        resampled = resample(_tone(44100, 0.5), 44100, 16000)
+
+        expected = _tone(16000, 0.5)[: len(resampled)]
+        error = resampled[: len(expected)].astype(np.float64) - expected
+
+        assert np.sqrt(np.mean(error**2)) < 0.01 * 32767
+
+    def test_output_buffer_is_reused(self):
+        """``out`` sized by max_output_frames receives every call's output."""
+        resampler = Resampler(44100, 16000)
+        out = np.empty(resampler.max_output_frames(882), dtype=np.int16)
+
+        total = sum(
+            len(resampler.process(np.zeros(882, dtype=np.int16), out=out))
+            for _ in range(50)
+        )
+
+        assert total == 16000
+
+
+def _voiced(rate: int, seconds: float) -> np.ndarray:
+    """200 Hz fundamental plus its second harmonic."""
+    t = np.arange(int(rate * seconds)) / rate
+    voiced = 8000 * np.sin(2 * np.pi * 200 * t) + 3000 * np.sin(2 * np.pi * 400 * t)
+    return voiced.astype(np.int16)
+
+
+def _stretch_frames(stretcher: TimeStretcher, samples: np.ndarray, speed: float):
+    return np.concatenate(
+        [
+            stretcher.process(samples[start : start + 320], speed)
+            for start in range(0, len(samples), 320)
+        ]
+    )
+
+
+class TestTimeStretcher:
+    """Pitch-preserving duration changes."""
+
+    @pytest.mark.parametrize("speed", [1 / 0.95, 1.01, 1 / 1.05])
+    def test_duration_changes_and_pitch_is_kept(self, speed):
+        """Output length follows the speed within one period; pitch does not move."""
+        samples = _voiced(16000, 2.0)
+
+        stretched = _stretch_frames(TimeStretcher(16000), samples, speed)
+
+        assert abs(len(stretched) - len(samples) / speed) <= 80
+        spectrum = np.abs(np.fft.rfft(stretched * np.hanning(len(stretched))))
+        peak_hz = np.fft.rfftfreq(len(stretched), 1 / 16000)[np.argmax(spectrum)]
+        assert peak_hz == pytest.approx(200.0, abs=1.0)
+
+    def test_stretching_adds_no_discontinuities(self):
+        """Crossfades keep sample-to-sample steps within the source's own range."""
+        samples = _voiced(16000, 1.0)
+        steepest = np.max(np.abs(np.diff(samples.astype(np.int32))))
+
+        for speed in (1 / 0.9, 1 / 1.1):
+            stretched = _stretch_frames(TimeStretcher(16000), samples, speed)
+            assert (
+                np.max(np.abs(np.diff(stretched.astype(np.int32)))) <= steepest * 1.05
+            )
+
+    def test_small_corrections_accumulate_across_frames(self):
+        """A correction smaller than a period is carried until it can be applied."""
+        stretcher = TimeStretcher(16000)
+        frame = _voiced(16000, 0.02)
+
+        first = stretcher.process(frame, 1.01)
+
+        assert len(first) == len(frame)
+        assert stretcher.pending == pytest.approx(320 * (1 - 1 / 1.01))
+
+
+class TestContractNormalization:
+    """AudioContract and MediaGateway on top of the kernels."""
+
+    def test_stereo_48k_normalizes_to_mono_16k(self):
+        """Channels are downmixed before resampling, keeping the tone intact."""
+        contract = AudioContract()
+        stereo = _tone(48000, 0.5, channels=2)
+
+        data, metadata = contract.normalize_audio(
+            stereo.tobytes(), {"sample_rate": 48000, "channels": 2, "sample_width": 2}
+        )
+
+        mono = pcm_samples(data, 2)
+        assert metadata["sample_rate"] == 16000
+        assert metadata["channels"] == 1
+        assert len(mono) == 8000
+        np.testing.assert_array_equal(mono, _tone(48000, 0.5)[::3])
+
+    async def test_gateway_keeps_resampler_per_stream(self):
+        """Frames of one stream normalize exactly like the whole stream."""
+        gateway = MediaGateway(enable_jitter_buffer=False)
+        metadata = {"sample_rate": 44100, "channels": 1, "sample_width": 2}
+        audio = _tone(44100, 0.5).tobytes()
+        frame = 882 * 2
+
+        streamed = b"".join(
+            [
+                (
+                    await gateway.normalize_audio(
+                        audio[start : start + frame], metadata, stream_id="user-1"
+                    )
+                )[0]
+                for start in range(0, len(audio), frame)
+            ]
+        )
+        whole, _ = await gateway.normalize_audio(audio, metadata)
+
+        assert streamed == whole
+        gateway.end_stream("user-1")
+        assert "user-1" not in gateway._resamplers
+
+    async def test_gateway_drift_correction_time_stretches_per_stream(self):
+        """Late audio is shortened by whole samples, carrying state per stream."""
+        gateway = MediaGateway(enable_jitter_buffer=False)
+        samples = _voiced(16000, 1.0)
+
+        corrected = [
+            await gateway.handle_drift_correction(
+                samples[start : start + 320].tobytes(), 0.0, 0.08, stream_id="user-1"
+            )
+            for start in range(0, len(samples), 320)
+        ]
+
+        total = sum(len(frame) for frame in corrected)
+        assert all(len(frame) % 2 == 0 for frame in corrected)
+        assert total == pytest.approx(len(samples) * 2 * 0.92, abs=2 * 80)
+        gateway.end_stream("user-1")
+        assert "user-1" not in gateway._stretchers
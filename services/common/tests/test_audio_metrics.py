@@ -243,3 +243,33 @@ def test_metric_kind_enum_values():
     assert MetricKind.HTTP.value == "http"
     assert MetricKind.SYSTEM.value == "system"
     assert MetricKind.GUARDRAILS.value == "guardrails"
+
+
+@pytest.mark.unit
+def test_jitter_buffer_metrics_observe_buffer_stats(mock_observability_manager):
+    """Jitter buffer instruments read occupancy and drops from the buffer."""
+    from services.common.audio_metrics import create_jitter_buffer_metrics
+    from services.common.surfaces.media_gateway import JitterBuffer
+
+    buffer = JitterBuffer(adaptive=False)
+    buffer.add_frame(b"\x00\x00", 10.0, sequence=3)
+    buffer.add_frame(b"\x00\x00", 10.0, sequence=3)
+    meter = mock_observability_manager.get_meter()
+
+    create_jitter_buffer_metrics(
+        mock_observability_manager, lambda: {"discord:1:2": buffer.stats()}
+    )
+
+    callbacks = {
+        call.args[0]: call.kwargs["callbacks"][0]
+        for call in meter.create_observable_gauge.call_args_list
+        + meter.create_observable_counter.call_args_list
+    }
+    [occupancy] = callbacks["jitter_buffer_occupancy_frames"](None)
+    drops = {
+        obs.attributes["reason"]: obs.value
+        for obs in callbacks["jitter_buffer_dropped_frames_total"](None)
+    }
+    assert occupancy.value == 1
+    assert occupancy.attributes["surface"] == "discord:1:2"
+    assert drops == {"late": 0, "duplicate": 1, "overflow": 0}
@@ -0,0 +1,234 @@
+"""Tests for the asynchronous log pipeline and logging cost accounting."""
+
+import json
+import logging
+import time
+from collections.abc import Generator
+from io import StringIO
+
+import pytest
+import structlog
+
+from services.common import structured_logging as clog
+from services.common.structured_logging import (
+    configure_logging,
+    flush_logs,
+    get_log_pipeline_stats,
+    get_logger,
+    log_enabled,
+    track_logging_time,
+)
+
+
+@pytest.fixture
+def isolated_logging() -> Generator[None, None, None]:
+    """Restore structlog, root handlers and pipeline state after each test."""
+    original_config = structlog.get_config()
+    root = logging.getLogger()
+    original_handlers = root.handlers[:]
+    original_level = root.level
+    original_configured_level = clog._configured_level
+    yield
+    clog._stop_listener()
+    clog._stats.events.clear()
+    clog._stats.dropped.clear()
+    structlog.configure(**original_config)
+    root.handlers = original_handlers
+    root.setLevel(original_level)
+    clog._configured_level = original_configured_level
+
+
+class _SlowStream(StringIO):
+    """Stream that blocks writes until released, to fill the queue."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delay = 0.05
+
+    def write(self, s: str) -> int:
+        time.sleep(self.delay)
+        return super().write(s)
+
+
+@pytest.mark.unit
+def test_async_pipeline_writes_after_flush(isolated_logging):
+    """Async events are rendered on the background thread and appear after flush."""
+    output = StringIO()
+    configure_logging(level="INFO", stream=output, async_logs=True)
+
+    get_logger("pipeline").info("pipeline.event", value=1)
+    flush_logs()
+
+    log_data = json.loads(output.getvalue().strip())
+    assert log_data["event"] == "pipeline.event"
+    assert log_data["value"] == 1
+    assert get_log_pipeline_stats()["async"] is True
+
+
+@pytest.mark.unit
+def test_explicit_stream_defaults_to_synchronous(isolated_logging, monkeypatch):
+    """Captured streams are written synchronously unless LOG_ASYNC says otherwise."""
+    monkeypatch.delenv("LOG_ASYNC", raising=False)
+    output = StringIO()
+    configure_logging(level="INFO", stream=output)
+
+    get_logger("pipeline").info("pipeline.sync_event")
+
+    assert "pipeline.sync_event" in output.getvalue()
+    assert get_log_pipeline_stats()["async"] is False
+
+
+@pytest.mark.unit
+def test_full_queue_drops_and_counts(isolated_logging):
+    """Events beyond the queue bound are dropped and counted by level."""
+    configure_logging(level="INFO", stream=_SlowStream(), async_logs=True, queue_size=2)
+    logger = get_logger("pipeline")
+
+    for i in range(50):
+        logger.warning("pipeline.burst", i=i)
+
+    assert get_log_pipeline_stats()["dropped"].get("warning", 0) > 0
+    flush_logs()
+
+
+@pytest.mark.unit
+def test_async_stdlib_records_keep_caller_contextvars(isolated_logging):
+    """stdlib records carry the caller's contextvars to the render thread."""
+    output = StringIO()
+    configure_logging(level="INFO", stream=output, async_logs=True)
+
+    with structlog.contextvars.bound_contextvars(correlation_id="abc-123"):
+        logging.getLogger("pipeline.stdlib").info("stdlib %s", "event")
+    flush_logs()
+
+    log_data = json.loads(output.getvalue().strip())
+    assert log_data["event"] == "stdlib event"
+    assert log_data["correlation_id"] == "abc-123"
+
+
+@pytest.mark.unit
+def test_queue_handler_snapshots_event_dict(isolated_logging):
+    """The queued record owns a copy of the event dict; the caller's is untouched."""
+    configure_logging(level="INFO", stream=StringIO(), async_logs=True)
+    handler = logging.getLogger().handlers[0]
+    event_dict = {"event": "pipeline.snapshot", "value": 1}
+    record = logging.LogRecord("pipeline", logging.INFO, "", 0, event_dict, (), None)
+
+    prepared = handler.prepare(record)
+    event_dict["value"] = 2
+
+    assert prepared is not record
+    assert prepared.msg == {"event": "pipeline.snapshot", "value": 1}
+    assert record.msg is event_dict
+
+
+@pytest.mark.unit
+def test_configure_leaves_shared_loggers_alone(isolated_logging):
+    """Skipping the caller walk touches neither the logger class nor shared loggers."""
+    logger_class = logging.getLoggerClass()
+    output = StringIO()
+    configure_logging(level="INFO", stream=output)
+    shared = logging.getLogger("pipeline.callsite")
+
+    private = clog._CallsiteFreeLoggerFactory()("pipeline.callsite")
+    get_logger("pipeline.callsite").info("pipeline.callsite")
+
+    assert logging.getLoggerClass() is logger_class
+    assert "findCaller" not in vars(shared)
+    assert shared.findCaller()[0] == __file__
+    assert private is not shared
+    assert private.parent is shared
+    assert private.findCaller() == ("(unknown file)", 0, "(unknown function)", None)
+    assert "pipeline.callsite" in output.getvalue()
+
+    shared.setLevel(logging.ERROR)
+    assert not private.isEnabledFor(logging.INFO)
+    shared.setLevel(logging.NOTSET)
+
+
+@pytest.mark.unit
+def test_events_counted_by_name_and_level(isolated_logging):
+    """Written events are counted per event name and level."""
+    configure_logging(level="INFO", stream=StringIO(), async_logs=False)
+    logger = get_logger("pipeline")
+
+    logger.info("pipeline.counted")
+    logger.info("pipeline.counted")
+    logger.debug("pipeline.filtered")
+
+    events = get_log_pipeline_stats()["events"]
+    assert events[("pipeline.counted", "info")] == 2
+    assert ("pipeline.filtered", "debug") not in events
+
+
+@pytest.mark.unit
+def test_log_enabled_follows_configured_level(isolated_logging):
+    """log_enabled reflects the level passed to configure_logging."""
+    configure_logging(level="WARNING", stream=StringIO())
+
+    assert log_enabled(logging.ERROR)
+    assert log_enabled(logging.WARNING)
+    assert not log_enabled(logging.INFO)
+    assert not log_enabled(logging.DEBUG)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("async_logs", [True, False])
+def test_track_logging_time_accumulates(isolated_logging, async_logs):
+    """Caller-side logging time is charged to the active timer only."""
+    configure_logging(level="INFO", stream=StringIO(), async_logs=async_logs)
+    logger = get_logger("pipeline")
+
+    with track_logging_time() as timer:
+        for _ in range(10):
+            logger.info("pipeline.timed")
+    elapsed = timer.elapsed_ns
+    logger.info("pipeline.untimed")
+    flush_logs()
+
+    assert elapsed > 0
+    assert timer.elapsed_ns == elapsed
+    assert timer.seconds == elapsed / 1e9
+
+
+def _process_frames(logger, frames: int) -> float:
+    """Simulate a per-frame hot path logging a debug event per frame."""
+    pcm = bytes(1920)
+    start = time.perf_counter()
+    for i in range(frames):
+        rms = sum(pcm[::64]) / 30
+        if log_enabled(logging.DEBUG):
+            logger.debug(
+                "voice.process_packet_entry",
+                packet_number=i,
+                user_id=12345,
+                pcm_length=len(pcm),
+                rms=rms,
+            )
+    return frames / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+def test_frame_throughput_logging_on_vs_off(isolated_logging):
+    """Benchmark per-frame throughput with debug logging on and off."""
+    frames = 5000
+    results = {}
+    for label, level, async_logs in (
+        ("off", "INFO", False),
+        ("on_sync", "DEBUG", False),
+        ("on_async", "DEBUG", True),
+    ):
+        configure_logging(
+            level=level,
+            stream=StringIO(),
+            async_logs=async_logs,
+            queue_size=frames,
+        )
+        results[label] = _process_frames(get_logger("bench"), frames)
+        flush_logs()
+
+    for label, fps in results.items():
+        print(f"logging {label}: {fps:,.0f} frames/s")
+
+    assert results["off"] > results["on_sync"]
+    assert results["off"] > results["on_async"]
@@ -0,0 +1,255 @@
+"""Tests for the ASGI observability middleware."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import FastAPI, WebSocket
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+import numpy as np
+import pytest
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanContext, TraceFlags
+
+from services.common.correlation import get_correlation_id
+from services.common.middleware import (
+    ROUTE_FALLBACK,
+    HttpRouteMetrics,
+    ObservabilityMiddleware,
+)
+
+
+class _Instrument:
+    def __init__(self) -> None:
+        self.calls: list[tuple[float, dict[str, Any]]] = []
+        self.span_contexts: list[SpanContext] = []
+
+    def add(self, amount: float, attributes: dict[str, Any]) -> None:
+        self.calls.append((amount, attributes))
+        self.span_contexts.append(trace.get_current_span().get_span_context())
+
+    record = add
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.state.service_name = "test"
+    app.state.http_metrics = {
+        "http_requests": _Instrument(),
+        "http_request_duration": _Instrument(),
+        "http_request_logging_duration": _Instrument(),
+    }
+
+    @app.get("/correlation")
+    async def correlation() -> dict[str, str | None]:
+        return {"correlation_id": get_correlation_id()}
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for index in range(3):
+                yield f"chunk-{index};".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/health/live")
+    async def live() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.websocket("/ws")
+    async def echo(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text(await websocket.receive_text())
+        await websocket.close()
+
+    app.add_middleware(ObservabilityMiddleware)
+    return app
+
+
+def test_correlation_id_reaches_endpoint_and_response():
+    """The request's correlation ID is visible to the endpoint and echoed back."""
+    client = TestClient(_app())
+
+    from_header = client.get("/correlation", headers={"X-Correlation-ID": "abc-123"})
+    from_query = client.get("/correlation", params={"correlation_id": "q-456"})
+    generated = client.get("/correlation")
+
+    assert from_header.json() == {"correlation_id": "abc-123"}
+    assert from_header.headers["X-Correlation-ID"] == "abc-123"
+    assert from_query.headers["X-Correlation-ID"] == "q-456"
+    assert generated.headers["X-Correlation-ID"] == generated.json()["correlation_id"]
+
+
+async def test_streaming_chunks_are_forwarded_as_sent():
+    """Each body chunk reaches the server as its own message, in order."""
+    app = _app()
+    messages: list[dict[str, Any]] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> dict[str, Any]:
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response completes
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-correlation-id", b"stream-1")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+    start, *body = messages
+    assert (b"x-correlation-id", b"stream-1") in start["headers"]
+    assert [message["body"] for message in body if message["body"]] == [
+        b"chunk-0;",
+        b"chunk-1;",
+        b"chunk-2;",
+    ]
+
+
+def test_websocket_passes_through():
+    """WebSocket scopes are handed to the app untouched."""
+    client = TestClient(_app())
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text("hello")
+        assert websocket.receive_text() == "hello"
+
+
+def test_metrics_reuse_attribute_dicts_per_route():
+    """Repeated requests to a route record with the same attribute objects."""
+    app = _app()
+    client = TestClient(app)
+
+    client.get("/correlation")
+    client.get("/correlation")
+    client.get("/health/live")
+
+    requests = app.state.http_metrics["http_requests"].calls
+    durations = app.state.http_metrics["http_request_duration"].calls
+    assert len(requests) == 2
+    assert requests[0][1] == {
+        "route": "/correlation",
+        "method": "GET",
+        "status": "success",
+        "service": "test",
+    }
+    assert requests[0][1] is requests[1][1]
+    assert durations[0][1] == {
+        "route": "/correlation",
+        "method": "GET",
+        "service": "test",
+    }
+    assert len(app.state.http_metrics["http_request_logging_duration"].calls) == 2
+
+
+def test_endpoint_errors_are_recorded_and_raised():
+    """An unhandled exception is counted as an error and still propagates."""
+    app = _app()
+    client = TestClient(app)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        client.get("/boom")
+
+    ((_, attributes),) = app.state.http_metrics["http_requests"].calls
+    assert attributes["status"] == "error"
+    assert attributes["route"] == "/boom"
+
+
+def test_metrics_are_labelled_by_route_template():
+    """Path parameters do not reach the route label."""
+    app = _app()
+    client = TestClient(app)
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    requests = app.state.http_metrics["http_requests"].calls
+    assert [attributes["route"] for _, attributes in requests] == [
+        "/items/{item_id}",
+        "/items/{item_id}",
+    ]
+    assert requests[0][1] is requests[1][1]
+
+
+def test_random_paths_keep_series_count_bounded():
+    """Unmatched paths and methods share one fallback bucket."""
+    app = _app()
+    client = TestClient(app)
+    rng = np.random.default_rng(0)
+
+    for _ in range(200):
+        client.get(f"/{rng.integers(1 << 30)}/{rng.integers(1 << 30)}")
+    client.get("/items/not-a-number")
+    client.request("BREW", "/items/3")
+    client.post("/correlation")
+
+    series = {
+        tuple(sorted(attributes.items()))
+        for _, attributes in app.state.http_metrics["http_requests"].calls
+    }
+    routes = {dict(attributes)["route"] for attributes in series}
+    assert routes == {ROUTE_FALLBACK, "/items/{item_id}"}
+    assert len(series) <= 4
+
+
+def test_route_table_is_capped():
+    """Routes beyond the cap are recorded under the fallback bucket."""
+    requests = _Instrument()
+    metrics = HttpRouteMetrics(
+        {"http_requests": requests},
+        "test",
+        [(f"/route/{index}", {"GET"}) for index in range(10)],
+        max_routes=3,
+    )
+
+    metrics.record_request("/route/2", "GET", "success", 0.01)
+    metrics.record_request("/route/3", "GET", "success", 0.01)
+
+    assert [attributes["route"] for _, attributes in requests.calls] == [
+        "/route/2",
+        ROUTE_FALLBACK,
+    ]
+
+
+def test_duration_is_recorded_under_the_request_span():
+    """The request's span context is current when latency is recorded."""
+    duration = _Instrument()
+    metrics = HttpRouteMetrics(
+        {"http_request_duration": duration}, "test", [("/ping", {"GET"})]
+    )
+    span_context = SpanContext(
+        trace_id=0x1234,
+        span_id=0x5678,
+        is_remote=False,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+    )
+
+    metrics.record_request("/ping", "GET", "success", 0.01, span_context)
+
+    assert duration.span_contexts == [span_context]
+    assert not trace.get_current_span().get_span_context().is_valid
@@ -0,0 +1,133 @@
+"""Tests for end-to-end voice-to-voice latency tracing."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from services.common.tracing import create_in_memory_tracer
+from services.common.voice_latency import (
+    OTHER_STAGE,
+    VoiceLatencyTracker,
+    record_stage_span,
+    stage_breakdown_from_spans,
+)
+
+
+def _run_utterance(tracker: VoiceLatencyTracker, correlation_id: str) -> None:
+    """Drive one utterance through every stage with fixed timestamps."""
+    base = 1_700_000_000.0
+    tracker.begin(
+        correlation_id,
+        capture_start=base,
+        speech_end=base + 1.0,
+        enqueued_at=base + 1.2,
+    )
+    tracker.record_dequeued(correlation_id, base + 1.3)
+    tracker.record_stage(correlation_id, "stt_inference", base + 1.3, base + 1.8)
+    tracker.add_orchestrator_timings(
+        correlation_id,
+        {
+            "input_validation_ms": 10.0,
+            "langchain_processing_ms": 400.0,
+            "output_validation_ms": 5.0,
+            "tts_synthesis_ms": 200.0,
+        },
+    )
+    tracker.record_stage(correlation_id, "playback_start", base + 2.5, base + 2.55)
+
+
+@pytest.mark.unit
+def test_breakdown_covers_total_latency():
+    """Stage durations plus the unattributed remainder add up to the total."""
+    tracker = VoiceLatencyTracker()
+    _run_utterance(tracker, "cid-1")
+
+    breakdown = tracker.finish("cid-1", 1_700_000_002.55)
+
+    assert breakdown is not None
+    assert breakdown["total"] == pytest.approx(2.55)
+    assert breakdown["capture"] == pytest.approx(1.0)
+    assert breakdown["vad_end"] == pytest.approx(0.2)
+    assert breakdown["stt_queue"] == pytest.approx(0.1)
+    assert breakdown["stt_inference"] == pytest.approx(0.5)
+    assert breakdown["guardrails"] == pytest.approx(0.015)
+    assert breakdown["llm"] == pytest.approx(0.4)
+    assert breakdown["tts"] == pytest.approx(0.2)
+    stages = sum(v for k, v in breakdown.items() if k != "total")
+    assert stages == pytest.approx(breakdown["total"])
+    assert breakdown[OTHER_STAGE] >= 0.0
+    assert tracker.pending == 0
+
+
+@pytest.mark.unit
+def test_stage_spans_share_one_trace_per_utterance():
+    """Spans for one correlation ID land in the same trace; others do not."""
+    tracer, exporter = create_in_memory_tracer("test-voice")
+    tracker = VoiceLatencyTracker(tracer=tracer)
+    _run_utterance(tracker, "cid-a")
+    _run_utterance(tracker, "cid-b")
+    # The orchestrator records its stages independently with the same ID
+    record_stage_span(tracer, "llm", "cid-a", 1_700_000_001.9, 1_700_000_002.3)
+    tracker.finish("cid-a", 1_700_000_002.55)
+    tracker.finish("cid-b", 1_700_000_002.55)
+
+    spans = exporter.get_finished_spans()
+    trace_ids: dict[str, set[int]] = {}
+    for span in spans:
+        cid = span.attributes["correlation_id"]
+        trace_ids.setdefault(cid, set()).add(span.context.trace_id)
+
+    assert len(trace_ids["cid-a"]) == 1
+    assert len(trace_ids["cid-b"]) == 1
+    assert trace_ids["cid-a"] != trace_ids["cid-b"]
+    assert any(s.name == "voice.utterance" for s in spans)
+
+    breakdown = stage_breakdown_from_spans(spans, "cid-a")
+    assert breakdown["stt_inference"] == pytest.approx(0.5)
+    assert breakdown["llm"] == pytest.approx(0.4)
+
+
+@pytest.mark.unit
+def test_finish_records_metrics():
+    """Completion records the voice-to-voice histogram and per-stage durations."""
+    metrics = {"end_to_end_latency": Mock(), "voice_stage_duration": Mock()}
+    tracker = VoiceLatencyTracker(metrics=metrics)
+    _run_utterance(tracker, "cid-1")
+
+    tracker.finish("cid-1", 1_700_000_002.55)
+
+    metrics["end_to_end_latency"].record.assert_called_once()
+    args, kwargs = metrics["end_to_end_latency"].record.call_args
+    assert args[0] == pytest.approx(2.55)
+    assert kwargs["attributes"] == {"path": "voice_to_voice"}
+    recorded = {
+        call.kwargs["attributes"]["stage"]
+        for call in metrics["voice_stage_duration"].record.call_args_list
+    }
+    assert {"capture", "stt_inference", "llm", "tts", OTHER_STAGE} <= recorded
+
+
+@pytest.mark.unit
+def test_discarded_and_unknown_utterances_are_not_recorded():
+    """Utterances that never reach playback do not produce a latency sample."""
+    metrics = {"end_to_end_latency": Mock()}
+    tracker = VoiceLatencyTracker(metrics=metrics)
+    _run_utterance(tracker, "cid-1")
+
+    tracker.discard("cid-1")
+
+    assert tracker.finish("cid-1", 1_700_000_003.0) is None
+    assert tracker.finish("never-seen", 1_700_000_003.0) is None
+    metrics["end_to_end_latency"].record.assert_not_called()
+
+
+@pytest.mark.unit
+def test_pending_utterances_are_bounded():
+    """The oldest in-flight utterances are dropped beyond max_pending."""
+    tracker = VoiceLatencyTracker(max_pending=2)
+    for i in range(5):
+        tracker.begin(f"cid-{i}", 1.0, 2.0, 3.0)
+
+    assert tracker.pending == 2
+    assert tracker.finish("cid-0", 4.0) is None
+    assert tracker.finish("cid-4", 4.0) is not None
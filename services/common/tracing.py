@@ -2,6 +2,10 @@
 
 This module provides standardized tracing setup and utilities across all services
 in the audio orchestrator platform.
+
+Exporters and instrumentors are imported where they are used: together they
+pull in protobuf, FastAPI and the HTTP client stacks, which processes that only
+need the tracer API should not pay for at import time.
 """
 
 import inspect
@@ -10,22 +14,31 @@ import uuid
 from typing import Any
 
 from opentelemetry import trace, metrics
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 
+from .correlation import get_correlation_id
 from .structured_logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _tag_correlation_id(span: Any, _scope: dict[str, Any]) -> None:
+    """Server request hook: put the request's correlation ID on its span.
+
+    ObservabilityMiddleware sets the correlation ID before the instrumented app
+    starts the span, so exemplars on HTTP latency lead back to it via the trace.
+    """
+    correlation_id = get_correlation_id()
+    if correlation_id and span is not None and span.is_recording():
+        span.set_attribute("correlation_id", correlation_id)
+
+
 class TracingManager:
     """Manages OpenTelemetry tracing configuration and instrumentation."""
 
@@ -126,6 +139,10 @@ class TracingManager:
                 base_endpoint = base_endpoint.rstrip("/")
                 traces_endpoint = f"{base_endpoint}/v1/traces"
 
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
             otlp_exporter = OTLPSpanExporter(endpoint=traces_endpoint)
             otlp_processor = BatchSpanProcessor(otlp_exporter)
 
@@ -163,7 +180,11 @@ class TracingManager:
             return
 
         try:
-            FastAPIInstrumentor.instrument_app(app)
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+            FastAPIInstrumentor.instrument_app(
+                app, server_request_hook=_tag_correlation_id
+            )
             self._fastapi_instrumented = True
             logger.info("tracing.fastapi_instrumented", service=self.service_name)
         except Exception as exc:
@@ -179,6 +200,9 @@ class TracingManager:
             return
 
         try:
+            from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
             HTTPXClientInstrumentor().instrument()
             RequestsInstrumentor().instrument()
             self._http_clients_instrumented = True
@@ -318,6 +342,35 @@ def trace_service_call(service_name: str, operation: str) -> Any:
     return decorator
 
 
+def create_in_memory_tracer(
+    service_name: str,
+) -> tuple[trace.Tracer, InMemorySpanExporter]:
+    """Create a tracer whose spans are kept in memory instead of exported.
+
+    Spans are exported synchronously as they end, so they can be inspected
+    with ``exporter.get_finished_spans()`` in tests or local debugging without
+    an OTLP collector. The provider is private to the returned tracer and does
+    not replace the global one.
+
+    Args:
+        service_name: Service name recorded on the tracer resource
+
+    Returns:
+        Tuple of (tracer, exporter)
+    """
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(
+        resource=Resource.create(
+            {
+                "service.name": service_name,
+                "service.namespace": "audio-orchestrator",
+            }
+        )
+    )
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(service_name), exporter
+
+
 # Global tracing manager instances
 _tracing_managers: dict[str, TracingManager] = {}
 
@@ -449,6 +502,13 @@ class ObservabilityManager(TracingManager):
                     endpoint=metrics_endpoint,
                     protocol="http",
                 )
+                from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+                    OTLPMetricExporter,
+                )
+                from opentelemetry.sdk.metrics.export import (
+                    PeriodicExportingMetricReader,
+                )
+
                 metric_reader = PeriodicExportingMetricReader(
                     OTLPMetricExporter(endpoint=metrics_endpoint),
                     export_interval_millis=15000,
@@ -0,0 +1,307 @@
+"""
+End-to-end voice-to-voice latency tracing.
+
+One utterance is followed from its first captured packet to the first frame of
+the spoken response. Every service records its stages as spans in a trace
+whose ID is derived from the utterance's correlation ID, so spans from the
+Discord and orchestrator services join into one trace per utterance without
+extra propagation headers (the correlation ID already travels on every hop).
+The Discord service sees both ends of the path, so it aggregates the per-stage
+breakdown and records the voice-to-voice histogram.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import hashlib
+from typing import Any
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+from .structured_logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Stages of the voice-to-voice path, in pipeline order
+VOICE_STAGES = (
+    "capture",
+    "vad_end",
+    "stt_queue",
+    "stt_inference",
+    "guardrails",
+    "llm",
+    "tts",
+    "playback_start",
+)
+# Time not covered by any stage (wake detection, HTTP overhead, ...)
+OTHER_STAGE = "other"
+
+# Orchestrator stage_timings keys (milliseconds) that make up each voice stage
+ORCHESTRATOR_STAGE_KEYS: dict[str, tuple[str, ...]] = {
+    "guardrails": ("input_validation_ms", "output_validation_ms"),
+    "llm": ("langchain_processing_ms",),
+    "tts": ("tts_synthesis_ms",),
+}
+
+_SPAN_PREFIX = "voice."
+_STAGE_ATTRIBUTE = "voice.stage"
+
+
+def voice_trace_context(correlation_id: str) -> Context:
+    """Build the parent context shared by every span of one utterance.
+
+    The trace and parent span IDs are derived from the correlation ID, so any
+    service holding the correlation ID lands its spans in the same trace.
+
+    Args:
+        correlation_id: Utterance correlation ID
+
+    Returns:
+        Context to pass as ``context=`` when starting stage spans
+    """
+    digest = hashlib.blake2b(correlation_id.encode(), digest_size=24).digest()
+    parent = SpanContext(
+        trace_id=int.from_bytes(digest[:16], "big") or 1,
+        span_id=int.from_bytes(digest[16:], "big") or 1,
+        is_remote=True,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(parent))
+
+
+def record_stage_span(
+    tracer: trace.Tracer | None,
+    stage: str,
+    correlation_id: str,
+    start: float,
+    end: float,
+    **attributes: Any,
+) -> None:
+    """Record a finished stage span in the utterance's trace.
+
+    Args:
+        tracer: Tracer to record with; None disables recording
+        stage: Stage name (see ``VOICE_STAGES``)
+        correlation_id: Utterance correlation ID
+        start: Stage start as epoch seconds
+        end: Stage end as epoch seconds
+        **attributes: Extra span attributes; None values are skipped
+    """
+    if tracer is None:
+        return
+    span_attributes = {k: v for k, v in attributes.items() if v is not None}
+    span_attributes[_STAGE_ATTRIBUTE] = stage
+    span_attributes["correlation_id"] = correlation_id
+    span = tracer.start_span(
+        f"{_SPAN_PREFIX}{stage}",
+        context=voice_trace_context(correlation_id),
+        start_time=int(start * 1e9),
+        attributes=span_attributes,
+    )
+    span.end(end_time=int(max(start, end) * 1e9))
+
+
+def stage_breakdown_from_spans(
+    spans: Iterable[ReadableSpan], correlation_id: str
+) -> dict[str, float]:
+    """Sum stage span durations for one utterance.
+
+    Args:
+        spans: Finished spans, e.g. from an ``InMemorySpanExporter``
+        correlation_id: Utterance correlation ID
+
+    Returns:
+        Seconds spent per stage
+    """
+    breakdown: dict[str, float] = {}
+    for span in spans:
+        attributes = span.attributes or {}
+        stage = attributes.get(_STAGE_ATTRIBUTE)
+        if (
+            stage is None
+            or attributes.get("correlation_id") != correlation_id
+            or span.start_time is None
+            or span.end_time is None
+        ):
+            continue
+        duration = (span.end_time - span.start_time) / 1e9
+        breakdown[str(stage)] = breakdown.get(str(stage), 0.0) + duration
+    return breakdown
+
+
+@dataclass
+class _Utterance:
+    """Stage timings collected so far for one utterance."""
+
+    capture_start: float
+    enqueued_at: float
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+class VoiceLatencyTracker:
+    """Collect the stage breakdown of in-flight utterances and record latency."""
+
+    def __init__(
+        self,
+        tracer: trace.Tracer | None = None,
+        metrics: dict[str, Any] | None = None,
+        max_pending: int = 256,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            tracer: Tracer for stage spans; None records metrics only
+            metrics: Audio metrics dict (``end_to_end_latency`` and
+                ``voice_stage_duration`` are used when present)
+            max_pending: Maximum in-flight utterances; the oldest are dropped
+                when utterances never reach playback
+        """
+        self._tracer = tracer
+        self._metrics = metrics or {}
+        self.max_pending = max_pending
+        self._pending: OrderedDict[str, _Utterance] = OrderedDict()
+
+    @property
+    def pending(self) -> int:
+        """Number of utterances still waiting for playback."""
+        return len(self._pending)
+
+    def begin(
+        self,
+        correlation_id: str,
+        capture_start: float,
+        speech_end: float,
+        enqueued_at: float,
+    ) -> None:
+        """Start tracking an utterance once its segment is queued for STT.
+
+        Args:
+            correlation_id: Segment correlation ID
+            capture_start: Timestamp of the first captured frame
+            speech_end: Timestamp of the end of the last speech frame
+            enqueued_at: When VAD closed the segment and queued it
+        """
+        self._pending[correlation_id] = _Utterance(
+            capture_start=capture_start, enqueued_at=enqueued_at
+        )
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+        self.record_stage(correlation_id, "capture", capture_start, speech_end)
+        self.record_stage(correlation_id, "vad_end", speech_end, enqueued_at)
+
+    def record_dequeued(self, correlation_id: str, dequeued_at: float) -> None:
+        """Record the STT queue wait when the consumer picks up the segment."""
+        utterance = self._pending.get(correlation_id)
+        if utterance is not None:
+            self.record_stage(
+                correlation_id, "stt_queue", utterance.enqueued_at, dequeued_at
+            )
+
+    def record_stage(
+        self,
+        correlation_id: str,
+        stage: str,
+        start: float,
+        end: float,
+        **attributes: Any,
+    ) -> None:
+        """Record a stage measured by this service as a span and in the breakdown."""
+        utterance = self._pending.get(correlation_id)
+        if utterance is None:
+            return
+        utterance.stages[stage] = utterance.stages.get(stage, 0.0) + max(
+            0.0, end - start
+        )
+        record_stage_span(self._tracer, stage, correlation_id, start, end, **attributes)
+
+    def add_orchestrator_timings(
+        self, correlation_id: str, stage_timings: dict[str, float] | None
+    ) -> None:
+        """Fold the orchestrator's reported stage timings into the breakdown.
+
+        The orchestrator records its own spans for these stages, so only the
+        durations are added here.
+        """
+        utterance = self._pending.get(correlation_id)
+        if utterance is None or not stage_timings:
+            return
+        for stage, keys in ORCHESTRATOR_STAGE_KEYS.items():
+            total_ms = sum(stage_timings.get(key, 0.0) for key in keys)
+            if total_ms:
+                utterance.stages[stage] = (
+                    utterance.stages.get(stage, 0.0) + total_ms / 1000
+                )
+
+    def finish(
+        self, correlation_id: str, playback_started_at: float
+    ) -> dict[str, float] | None:
+        """Complete an utterance when its response starts playing.
+
+        Args:
+            correlation_id: Utterance correlation ID
+            playback_started_at: When the first response frame was handed to
+                the voice client
+
+        Returns:
+            Seconds per stage (including ``other`` and ``total``), or None if
+            the utterance was not being tracked
+        """
+        utterance = self._pending.pop(correlation_id, None)
+        if utterance is None:
+            return None
+
+        total = max(0.0, playback_started_at - utterance.capture_start)
+        breakdown = dict(utterance.stages)
+        breakdown[OTHER_STAGE] = max(0.0, total - sum(breakdown.values()))
+
+        end_to_end = self._metrics.get("end_to_end_latency")
+        if end_to_end is not None:
+            end_to_end.record(total, attributes={"path": "voice_to_voice"})
+        stage_duration = self._metrics.get("voice_stage_duration")
+        if stage_duration is not None:
+            for stage, seconds in breakdown.items():
+                stage_duration.record(seconds, attributes={"stage": stage})
+
+        if self._tracer is not None:
+            span = self._tracer.start_span(
+                f"{_SPAN_PREFIX}utterance",
+                context=voice_trace_context(correlation_id),
+                start_time=int(utterance.capture_start * 1e9),
+                attributes={
+                    "correlation_id": correlation_id,
+                    "voice.total_ms": round(total * 1000, 2),
+                },
+            )
+            span.end(
+                end_time=int(max(utterance.capture_start, playback_started_at) * 1e9)
+            )
+
+        logger.info(
+            "voice.latency_breakdown",
+            correlation_id=correlation_id,
+            total_ms=round(total * 1000, 2),
+            stages_ms={k: round(v * 1000, 2) for k, v in breakdown.items()},
+        )
+        breakdown["total"] = total
+        return breakdown
+
+    def discard(self, correlation_id: str) -> None:
+        """Stop tracking an utterance that will not produce playback."""
+        self._pending.pop(correlation_id, None)
+
+
+__all__ = [
+    "ORCHESTRATOR_STAGE_KEYS",
+    "OTHER_STAGE",
+    "VOICE_STAGES",
+    "VoiceLatencyTracker",
+    "record_stage_span",
+    "stage_breakdown_from_spans",
+    "voice_trace_context",
+]
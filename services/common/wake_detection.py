@@ -9,7 +9,6 @@ or will gracefully degrade to transcript-based detection only.
 
 from __future__ import annotations
 
-import audioop
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +16,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
+from services.common.audio_kernels import pcm_bytes, pcm_samples, resample
 from services.common.structured_logging import get_logger
 
 
@@ -396,9 +396,9 @@ class WakeDetector:
         return None
 
     def _resample(self, pcm: bytes, sample_rate: int) -> bytes:
-        """Resample audio to target sample rate using audioop.ratecv().
+        """Resample audio to target sample rate by linear interpolation.
 
-        Uses audioop.ratecv() (fast, lower quality) instead of librosa.resample()
+        Uses the NumPy resampling kernel (fast, lower quality) instead of librosa.resample()
         because wake detection is performance-critical and runs on every audio frame.
         For quality-critical paths (e.g., STT preprocessing), use librosa.resample()
         instead (see services/common/audio.py:resample_audio()).
@@ -406,10 +406,10 @@ class WakeDetector:
         if sample_rate == self._target_sample_rate:
             return pcm
         try:
-            converted, _ = audioop.ratecv(
-                pcm, 2, 1, sample_rate, self._target_sample_rate, None
+            converted = resample(
+                pcm_samples(pcm, 2), sample_rate, self._target_sample_rate
             )
-            return converted
+            return pcm_bytes(converted, 2)
         except Exception as exc:
             self._logger.warning(
                 "wake.resample_failed",
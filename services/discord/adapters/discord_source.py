@@ -11,15 +11,39 @@ import asyncio
 from collections.abc import Callable
 import time
 from typing import Any
+import weakref
 
+from services.common.audio_metrics import create_jitter_buffer_metrics
 from services.common.structured_logging import get_logger
-from services.common.surfaces.media_gateway import MediaGateway
+from services.common.surfaces.media_gateway import JitterBuffer, MediaGateway
 from services.common.surfaces.protocols import AudioCaptureProtocol
 from services.common.surfaces.types import AudioFormat, AudioMetadata, PCMFrame
+from services.common.tracing import get_observability_manager
 
 
 logger = get_logger(__name__)
 
+# Jitter buffers of live sources by surface ID, exported as metrics
+_jitter_buffers: weakref.WeakValueDictionary[str, JitterBuffer] = (
+    weakref.WeakValueDictionary()
+)
+_jitter_metrics_registered = False
+
+
+def _track_jitter_buffer(surface_id: str, buffer: JitterBuffer) -> None:
+    """Report ``buffer`` in the process-wide jitter buffer metrics."""
+    global _jitter_metrics_registered
+    _jitter_buffers[surface_id] = buffer
+    if not _jitter_metrics_registered:
+        _jitter_metrics_registered = True
+        create_jitter_buffer_metrics(
+            get_observability_manager("discord"),
+            lambda: {
+                surface: tracked.stats()
+                for surface, tracked in list(_jitter_buffers.items())
+            },
+        )
+
 
 class DiscordAudioSource(AudioCaptureProtocol):
     """Discord audio source adapter implementing AudioCaptureProtocol."""
@@ -35,6 +59,10 @@ class DiscordAudioSource(AudioCaptureProtocol):
         self.channel_id = channel_id
         self.user_id = user_id
         self.media_gateway: MediaGateway = media_gateway or MediaGateway()
+        if self.media_gateway.jitter_buffer is not None:
+            _track_jitter_buffer(
+                self.get_surface_id(), self.media_gateway.jitter_buffer
+            )
 
         # Audio capture state
         self._is_capturing = False
@@ -331,6 +331,9 @@ async def _start_discord_bot(
             metrics=audio_metrics,
             stt_health_check=_check_stt_health,
             orchestrator_health_check=_check_orchestrator_health,
+            tracer=(
+                observability_manager.get_tracer() if observability_manager else None
+            ),
         )
 
         # Share the observability manager with the bot's health manager
@@ -344,17 +347,14 @@ async def _start_discord_bot(
 
         # Mark bot health manager startup as complete (bot is initialized)
         bot._health_manager.mark_startup_complete()
+        bot._health_manager.start_background_probing()
 
         # Wait for dependencies to be ready before connecting to Discord
         logger.info("discord.waiting_for_dependencies")
         timeout = 300.0  # 5 minutes - same as _segment_consumer
-        start_time = asyncio.get_event_loop().time()
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if await bot._health_manager.check_ready():
-                logger.info("discord.dependencies_ready")
-                break
-            await asyncio.sleep(2.0)  # Same polling interval as _segment_consumer
+        if await bot._health_manager.wait_until_ready(timeout):
+            logger.info("discord.dependencies_ready")
         else:
             logger.error(
                 "discord.dependency_timeout",
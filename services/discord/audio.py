@@ -11,19 +11,10 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Literal
 
-from .config import AudioConfig
-
-
-@dataclass(slots=True)
-class PCMFrame:
-    """Represents a single PCM audio frame."""
+from services.common.audio_features import FrameFeatureStore
+from services.common.surfaces.types import PCMFrame
 
-    pcm: bytes
-    timestamp: float
-    rms: float
-    duration: float
-    sequence: int
-    sample_rate: int
+from .config import AudioConfig
 
 
 @dataclass(slots=True)
@@ -55,7 +46,12 @@ class FlushDecision:
 
 @dataclass(slots=True)
 class Accumulator:
-    """Collects PCM frames for a specific speaker."""
+    """Collects PCM frames for a specific speaker.
+
+    ``features`` holds one row per frame in ``frames``; it is filled from each
+    frame's samples and ``rms`` as the frame arrives, so segment checks and wake
+    gating read frame features instead of rescanning the accumulated PCM.
+    """
 
     user_id: int
     config: AudioConfig
@@ -65,9 +61,11 @@ class Accumulator:
     sequence: int = 0
     silence_started_at: float | None = None
     sample_rate: int = 0
+    features: FrameFeatureStore = field(default_factory=FrameFeatureStore)
 
     def append(self, frame: PCMFrame) -> None:
         self.frames.append(frame)
+        self.features.append(frame.samples, frame.sample_rate, rms=frame.rms)
         self.last_activity = frame.timestamp
         self.active = True
         self.silence_started_at = None
@@ -106,32 +104,32 @@ class Accumulator:
     def pop_segment(self, correlation_id: str) -> AudioSegment | None:
         if not self.frames:
             return None
+
+        # Validate PCM has audio content (not all zeros) before joining it
+        accumulated_rms = self.features.rms()
+        min_segment_rms = getattr(
+            self.config, "min_segment_rms_threshold", 5.0
+        )  # AudioConfig is passed directly
+
+        if accumulated_rms < min_segment_rms:
+            # All silence - don't create segment
+            self._clear_frames()
+            return None
+
         start = self.frames[0].timestamp
         end = self.frames[-1].timestamp + self.frames[-1].duration
         pcm = b"".join(frame.pcm for frame in self.frames)
 
         # Validate accumulated PCM before creating segment
         if not pcm or len(pcm) == 0:
-            self.frames.clear()
+            self._clear_frames()
             return None
 
         # Check minimum size (at least 1 frame: channels * sample_width)
         # Assuming 16-bit mono (1 channel * 2 bytes)
         min_size = 1 * 2
         if len(pcm) < min_size:
-            self.frames.clear()
-            return None
-
-        # Validate PCM has audio content (not all zeros)
-        # NOTE: rms_from_pcm is defined in this file (line 127), no import needed
-        accumulated_rms = rms_from_pcm(pcm)
-        min_segment_rms = getattr(
-            self.config, "min_segment_rms_threshold", 5.0
-        )  # AudioConfig is passed directly
-
-        if accumulated_rms < min_segment_rms:
-            # All silence - don't create segment
-            self.frames.clear()
+            self._clear_frames()
             return None
 
         segment = AudioSegment(
@@ -143,11 +141,15 @@ class Accumulator:
             frame_count=len(self.frames),
             sample_rate=self.sample_rate or self.config.input_sample_rate_hz,
         )
-        self.frames.clear()
+        self._clear_frames()
         self.active = False
         self.silence_started_at = None
         return segment
 
+    def _clear_frames(self) -> None:
+        self.frames.clear()
+        self.features.clear()
+
 
 def rms_from_pcm(pcm: bytes) -> float:
     """Compute RMS value for PCM audio in int16 domain (0-32767).
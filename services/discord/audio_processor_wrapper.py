@@ -7,17 +7,22 @@ audio processing library directly (no HTTP calls).
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from typing import Any
 
 from services.common.audio_processing_core import AudioProcessingCore
 from services.common.audio_vad import VADProcessor
 from services.common.correlation import CorrelationIDGenerator
-from services.common.structured_logging import get_logger, should_sample
-from services.common.surfaces.types import PCMFrame as CommonPCMFrame
+from services.common.structured_logging import (
+    get_logger,
+    log_enabled,
+    should_sample,
+)
+from services.common.surfaces.types import PCMFrame
 from services.common.wake_detection import WakeDetector
 
-from .audio import Accumulator, AudioSegment, PCMFrame as DiscordPCMFrame, rms_from_pcm
+from .audio import Accumulator, AudioSegment
 
 logger = get_logger(__name__)
 
@@ -129,33 +134,21 @@ class AudioProcessorWrapper:
                 accumulator = Accumulator(user_id=user_id, config=self._config)
                 self._accumulators[user_id] = accumulator
 
-            # Create common PCMFrame for processing
-            current_time = time.time()
-            common_frame = CommonPCMFrame(
+            # One frame object serves VAD and the accumulator; the PCM is not copied
+            frame = PCMFrame(
                 pcm=pcm,
-                timestamp=current_time,
+                timestamp=time.time(),
                 rms=rms,
                 duration=duration,
                 sequence=accumulator.sequence,
                 sample_rate=sample_rate,
-                channels=1,  # Default for Discord mono audio
+                channels=1,  # Discord mono audio
                 sample_width=2,  # 16-bit
             )
+            accumulator.sequence += 1
 
             # Detect speech using VAD on original audio (before processing)
-            is_speech = await self._vad_processor.detect_speech(common_frame)
-
-            # Store original PCM in accumulator (skip normalization for wake detection)
-            # Normalization can be applied later when creating segments for STT if needed
-            discord_frame = DiscordPCMFrame(
-                pcm=pcm,  # Use original PCM, not normalized
-                timestamp=current_time,
-                rms=rms,
-                duration=duration,
-                sequence=accumulator.sequence,
-                sample_rate=sample_rate,
-            )
-            accumulator.sequence += 1
+            is_speech = await self._vad_processor.detect_speech(frame)
 
             # Enhanced logging for VAD decisions (rate-limited for first 20 frames, then sampled)
             frame_count = len(accumulator.frames)
@@ -174,7 +167,7 @@ class AudioProcessorWrapper:
                     is_speech=is_speech,
                     accumulator_frames=frame_count,
                 )
-            if should_log_frame:
+            if should_log_frame and log_enabled(logging.DEBUG):
                 self._logger.debug(
                     "audio_processor_wrapper.vad_decision",
                     user_id=user_id,
@@ -188,14 +181,14 @@ class AudioProcessorWrapper:
 
             # Update accumulator based on speech detection
             if is_speech:
-                accumulator.append(discord_frame)
+                accumulator.append(frame)
 
                 # Log when accumulator starts for a user
                 if len(accumulator.frames) == 1:
                     self._logger.debug(
                         "audio_processor_wrapper.accumulator_started",
                         user_id=user_id,
-                        sample_rate=discord_frame.sample_rate,
+                        sample_rate=frame.sample_rate,
                         frame_duration=duration,
                     )
 
@@ -229,8 +222,10 @@ class AudioProcessorWrapper:
                 )
 
                 # Log why wake check is being skipped (sampled to avoid spam)
-                if not should_check_wake and should_sample(
-                    "wake_check_skip", every_n=25
+                if (
+                    not should_check_wake
+                    and log_enabled(logging.DEBUG)
+                    and should_sample("wake_check_skip", every_n=25)
                 ):
                     skip_reasons = []
                     if not self._wake_detector:
@@ -260,23 +255,12 @@ class AudioProcessorWrapper:
                     # Concatenate accumulated PCM frames before try block for logging
                     accumulated_pcm = b"".join(f.pcm for f in accumulator.frames)
 
-                    # Calculate quality metrics before wake detection
-                    accumulated_rms = rms_from_pcm(accumulated_pcm)
-                    temp_pcm_frame = CommonPCMFrame(
-                        pcm=accumulated_pcm,
-                        sample_rate=accumulator.sample_rate,
-                        timestamp=accumulator.frames[0].timestamp
-                        if accumulator.frames
-                        else time.time(),
-                        duration=current_duration,
-                        rms=accumulated_rms,
-                        sequence=frame_count,
-                        channels=1,
-                        sample_width=2,
-                    )
+                    # Quality metrics from the accumulated frames' features
+                    # (no pass over the PCM, and no FFT: spectral features are off)
+                    accumulated_rms = accumulator.features.rms()
                     quality_metrics = (
-                        await self._audio_processor_core.calculate_quality_metrics(
-                            temp_pcm_frame
+                        self._audio_processor_core.calculate_feature_metrics(
+                            accumulator.features, accumulator.sample_rate
                         )
                     )
 
@@ -319,8 +303,10 @@ class AudioProcessorWrapper:
                         wake_result = None
 
                     # Log when detection runs but finds nothing (sampled)
-                    if wake_result is None and should_sample(
-                        "wake_detection_no_result", every_n=15
+                    if (
+                        wake_result is None
+                        and log_enabled(logging.DEBUG)
+                        and should_sample("wake_detection_no_result", every_n=15)
                     ):
                         self._logger.debug(
                             "audio_processor_wrapper.wake_detection_no_result",
@@ -359,17 +345,17 @@ class AudioProcessorWrapper:
                                 segment  # Return immediately, bypassing silence timeout
                             )
             else:
-                new_silence = accumulator.mark_silence(discord_frame.timestamp)
+                new_silence = accumulator.mark_silence(frame.timestamp)
                 if new_silence and should_log_frame:
                     self._logger.debug(
                         "audio_processor_wrapper.silence_started",
                         user_id=user_id,
-                        timestamp=discord_frame.timestamp,
+                        timestamp=frame.timestamp,
                         accumulator_frames=len(accumulator.frames),
                     )
 
             # Check if accumulator should flush
-            flush_decision = accumulator.should_flush(discord_frame.timestamp)
+            flush_decision = accumulator.should_flush(frame.timestamp)
             if flush_decision:
                 # Always log flush decisions
                 self._logger.info(
@@ -416,7 +402,7 @@ class AudioProcessorWrapper:
                     - accumulator.frames[0].timestamp
                 )
                 silence_age = (
-                    discord_frame.timestamp - accumulator.last_activity
+                    frame.timestamp - accumulator.last_activity
                     if accumulator.last_activity
                     else 0.0
                 )
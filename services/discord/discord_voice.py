@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from dataclasses import dataclass
@@ -15,7 +16,8 @@ import discord
 import httpx
 
 from services.common.health import HealthManager
-from services.common.structured_logging import get_logger
+from services.common.structured_logging import get_logger, log_enabled
+from services.common.voice_latency import VoiceLatencyTracker
 
 from .audio import AudioSegment, rms_from_pcm
 from .audio_processor_wrapper import AudioProcessorWrapper
@@ -86,6 +88,7 @@ class VoiceBot(discord.Client):
         metrics: dict[str, Any] | None = None,
         stt_health_check: Callable[[], Awaitable[bool]] | None = None,
         orchestrator_health_check: Callable[[], Awaitable[bool]] | None = None,
+        tracer: Any | None = None,
     ) -> None:
         intents = self._build_intents(config.discord)
         super().__init__(intents=intents)
@@ -95,6 +98,7 @@ class VoiceBot(discord.Client):
         self._publish_transcript = transcript_publisher
         self._logger = get_logger(__name__, service_name="discord")
         self._metrics = metrics or {}
+        self._voice_latency = VoiceLatencyTracker(tracer=tracer, metrics=self._metrics)
         self._segment_queue: asyncio.Queue[SegmentContext] = asyncio.Queue()
         self._segment_task: asyncio.Task[None] | None = None
         self._idle_flush_task: asyncio.Task[None] | None = None
@@ -165,6 +169,7 @@ class VoiceBot(discord.Client):
 
             # Fire and forget; do not block setup
             asyncio.create_task(_do_warmup())
+        self._health_manager.start_background_probing()
         self._segment_task = asyncio.create_task(self._segment_consumer())
         self._idle_flush_task = asyncio.create_task(self._idle_flush_loop())
         # Start health monitoring task
@@ -191,6 +196,7 @@ class VoiceBot(discord.Client):
             self._health_monitor_task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._health_monitor_task
+        await self._health_manager.stop_background_probing()
         disconnect_coros: list[Awaitable[None]] = []
         for voice_client in list(self.voice_clients):
             guild_id = voice_client.guild.id if voice_client.guild else None
@@ -708,12 +714,7 @@ class VoiceBot(discord.Client):
 
         # Use int16-domain RMS to align with normalization target units
         frame_start_time = time.perf_counter()
-        try:
-            import audioop
-
-            rms = float(audioop.rms(pcm, 2))
-        except Exception:
-            rms = rms_from_pcm(pcm)
+        rms = rms_from_pcm(pcm)
 
         # Early PCM validation: Skip silent/zero-amplitude frames
         min_rms_threshold = getattr(self.config.audio, "min_audio_rms_threshold", 10.0)
@@ -804,6 +805,12 @@ class VoiceBot(discord.Client):
 
         # Save debug audio segment
 
+        self._voice_latency.begin(
+            segment.correlation_id,
+            capture_start=segment.start_timestamp,
+            speech_end=segment.end_timestamp,
+            enqueued_at=time.time(),
+        )
         await self._segment_queue.put(segment_context)
 
     async def _resolve_voice_state(self, user_id: int) -> discord.VoiceState | None:
@@ -874,15 +881,11 @@ class VoiceBot(discord.Client):
             message="Segment consumer task starting",
         )
         # Wait for dependencies to be ready (aligned with HealthManager pattern)
-        # HealthManager uses ResilientHTTPClient with exponential backoff and caching
+        # The background prober wakes this as soon as every dependency is up
         timeout = 300.0
-        start = asyncio.get_event_loop().time()
 
-        while asyncio.get_event_loop().time() - start < timeout:
-            if await self._health_manager.check_ready():
-                self._logger.info("service.dependencies_ready")
-                break
-            await asyncio.sleep(2.0)
+        if await self._health_manager.wait_until_ready(timeout):
+            self._logger.info("service.dependencies_ready")
         else:
             self._logger.error(
                 "service.dependency_timeout",
@@ -909,19 +912,24 @@ class VoiceBot(discord.Client):
                 heartbeat_interval = 60.0  # Log heartbeat every 60 seconds
 
                 while not self._shutdown.is_set():
-                    queue_depth = self._segment_queue.qsize()
-                    self._logger.debug(
-                        "voice.segment_consumer_waiting_for_segment",
-                        queue_depth=queue_depth,
-                        message="Waiting for segment from queue",
-                    )
+                    debug_enabled = log_enabled(logging.DEBUG)
+                    if debug_enabled:
+                        self._logger.debug(
+                            "voice.segment_consumer_waiting_for_segment",
+                            queue_depth=self._segment_queue.qsize(),
+                            message="Waiting for segment from queue",
+                        )
                     context = await self._segment_queue.get()
-                    self._logger.debug(
-                        "voice.segment_consumer_segment_received",
-                        correlation_id=context.segment.correlation_id,
-                        queue_depth_remaining=self._segment_queue.qsize(),
-                        message="Segment received from queue",
+                    self._voice_latency.record_dequeued(
+                        context.segment.correlation_id, time.time()
                     )
+                    if debug_enabled:
+                        self._logger.debug(
+                            "voice.segment_consumer_segment_received",
+                            correlation_id=context.segment.correlation_id,
+                            queue_depth_remaining=self._segment_queue.qsize(),
+                            message="Segment received from queue",
+                        )
 
                     # Periodic heartbeat logging
                     current_time = asyncio.get_event_loop().time()
@@ -940,26 +948,31 @@ class VoiceBot(discord.Client):
                     )
 
                     try:
-                        # Get circuit breaker stats for logging
-                        circuit_stats = stt_client.get_circuit_stats()
-                        segment_logger.debug(
-                            "voice.segment_processing_start",
-                            guild_id=context.guild_id,
-                            channel_id=context.channel_id,
-                            frames=context.segment.frame_count,
-                            stt_circuit_state=circuit_stats.get("state", "unknown"),
-                            stt_circuit_available=circuit_stats.get("available", True),
-                            stt_circuit_failure_count=circuit_stats.get(
-                                "failure_count", 0
-                            ),
-                            stt_circuit_success_count=circuit_stats.get(
-                                "success_count", 0
-                            ),
-                            queue_depth_at_start=self._segment_queue.qsize(),
-                        )
+                        if debug_enabled:
+                            # Circuit breaker stats are only gathered for logging
+                            circuit_stats = stt_client.get_circuit_stats()
+                            segment_logger.debug(
+                                "voice.segment_processing_start",
+                                guild_id=context.guild_id,
+                                channel_id=context.channel_id,
+                                frames=context.segment.frame_count,
+                                stt_circuit_state=circuit_stats.get("state", "unknown"),
+                                stt_circuit_available=circuit_stats.get(
+                                    "available", True
+                                ),
+                                stt_circuit_failure_count=circuit_stats.get(
+                                    "failure_count", 0
+                                ),
+                                stt_circuit_success_count=circuit_stats.get(
+                                    "success_count", 0
+                                ),
+                                queue_depth_at_start=self._segment_queue.qsize(),
+                            )
+                        stt_start = time.time()
                         transcript = await stt_client.transcribe(context.segment)
 
                         if transcript is None:
+                            self._voice_latency.discard(context.segment.correlation_id)
                             # STT unavailable - drop segment
                             segment_logger.info(
                                 "voice.segment_dropped_stt_unavailable",
@@ -971,6 +984,13 @@ class VoiceBot(discord.Client):
                             # await self._send_fallback_response(context, "Voice processing unavailable")
                             continue
 
+                        self._voice_latency.record_stage(
+                            context.segment.correlation_id,
+                            "stt_inference",
+                            stt_start,
+                            time.time(),
+                            stt_latency_ms=transcript.stt_latency_ms,
+                        )
                         # Process transcript normally
                         segment_logger.info(
                             "voice.segment_processing_complete",
@@ -989,6 +1009,7 @@ class VoiceBot(discord.Client):
                         )
                         raise
                     except Exception as exc:
+                        self._voice_latency.discard(context.segment.correlation_id)
                         segment_logger.exception(
                             "voice.segment_processing_failed",
                             guild_id=context.guild_id,
@@ -1047,6 +1068,7 @@ class VoiceBot(discord.Client):
         )
 
         if not detection:
+            self._voice_latency.discard(transcript.correlation_id)
             transcript_logger.debug(
                 "voice.segment_ignored",
                 reason="wake_not_detected",
@@ -1094,6 +1116,12 @@ class VoiceBot(discord.Client):
                 correlation_id=transcript.correlation_id,
             )
             orchestrator_latency = time.perf_counter() - orchestrator_start
+            orchestrator_done = time.time()
+            if isinstance(orchestrator_result, dict):
+                self._voice_latency.add_orchestrator_timings(
+                    transcript.correlation_id,
+                    orchestrator_result.get("stage_timings"),
+                )
 
             transcript_logger.info(
                 "voice.transcript_sent_to_orchestrator",
@@ -1136,6 +1164,16 @@ class VoiceBot(discord.Client):
                                 audio_bytes,
                                 correlation_id=transcript.correlation_id,
                             )
+                            playback_started = time.time()
+                            self._voice_latency.record_stage(
+                                transcript.correlation_id,
+                                "playback_start",
+                                orchestrator_done,
+                                playback_started,
+                            )
+                            self._voice_latency.finish(
+                                transcript.correlation_id, playback_started
+                            )
                         else:
                             transcript_logger.warning(
                                 "voice.audio_playback_skipped",
@@ -1178,6 +1216,9 @@ class VoiceBot(discord.Client):
                 error=str(exc),
             )
 
+        # Utterances that did not reach audio playback have no voice-to-voice latency
+        self._voice_latency.discard(transcript.correlation_id)
+
         # Also publish to the original transcript publisher for compatibility
         await self._publish_transcript(payload)
         transcript_logger.info(
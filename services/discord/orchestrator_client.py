@@ -69,11 +69,14 @@ class OrchestratorClient:
             if correlation_id:
                 headers["X-Correlation-ID"] = correlation_id
 
+            # Conversation memory lives in each orchestrator replica, so keep
+            # a user's turns on the same one
             response = await client.post_with_retry(
                 "/api/v1/transcripts",
                 json=payload,
                 headers=headers,
                 timeout=30.0,
+                affinity_key=user_id,
             )
             response.raise_for_status()
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import logging
 import os
 import time
 from collections import deque
@@ -17,6 +18,7 @@ from discord.opus import OpusError
 
 from services.common.structured_logging import (
     get_logger,
+    log_enabled,
     should_rate_limit,
     should_sample,
 )
@@ -300,7 +302,7 @@ class BufferedVoiceSink:
                 pcm_len=len(pcm_val) if isinstance(pcm_val, bytes) else None,
                 pcm_related_attrs=pcm_attrs[:10],
             )
-        else:
+        elif log_enabled(logging.DEBUG):
             # After first 5, use DEBUG for ongoing diagnostic details
             self._logger.debug(
                 "voice.process_packet_entry",
@@ -360,7 +362,7 @@ class BufferedVoiceSink:
                 frame_count=frame_count,
                 about_to_call_callback=True,
             )
-        else:
+        elif log_enabled(logging.DEBUG):
             self._logger.debug(
                 "voice.process_packet_success",
                 packet_number=process_count + 1,
@@ -382,24 +384,13 @@ class BufferedVoiceSink:
                 packet_number=process_count + 1,
                 user_id=user_id,
             )
-        else:
+        elif log_enabled(logging.DEBUG):
             self._logger.debug(
                 "voice.process_packet_callback_scheduled",
                 packet_number=process_count + 1,
                 user_id=user_id,
             )
 
-    def _calculate_rms(self, pcm: bytes) -> float:
-        """Calculate RMS for PCM data."""
-        if not pcm:
-            return 0.0
-        try:
-            import audioop
-
-            return float(audioop.rms(pcm, 2))
-        except Exception:
-            return 0.0
-
 
 def build_sink(loop: asyncio.AbstractEventLoop, callback: FrameCallback) -> Any:
     """Return a BasicSink that forwards decoded PCM frames to the pipeline."""
@@ -7,6 +7,7 @@ the AudioSource interface and handles audio capture properly.
 
 import time
 from unittest.mock import Mock, patch
+import weakref
 
 import pytest
 
@@ -468,3 +469,24 @@ class TestDiscordAudioSource:
         assert stats["total_audio_duration"] == 0.2
         assert stats["sequence_counter"] == 10
         assert stats["last_frame_time"] > 0
+
+    @pytest.mark.component
+    def test_jitter_buffer_metrics_registered_once_per_process(self):
+        """Every source's jitter buffer is exported through one registration."""
+        module = "services.discord.adapters.discord_source"
+        with (
+            patch(f"{module}._jitter_metrics_registered", False),
+            patch(f"{module}._jitter_buffers", weakref.WeakValueDictionary()),
+            patch(f"{module}.get_observability_manager") as get_manager,
+            patch(f"{module}.create_jitter_buffer_metrics") as create_metrics,
+        ):
+            first = DiscordAudioSource(1, 2)
+            second = DiscordAudioSource(1, 3)
+
+            create_metrics.assert_called_once()
+            manager, get_stats = create_metrics.call_args.args
+            assert manager is get_manager.return_value
+            stats = get_stats()
+            assert set(stats) == {"discord:1:2", "discord:1:3"}
+            assert stats["discord:1:2"] == first.media_gateway.jitter_buffer.stats()
+            assert stats["discord:1:3"] == second.media_gateway.jitter_buffer.stats()
@@ -199,22 +199,8 @@ class TranscriptionClient:
             pool=None,
         )
         try:
-            # Check if STT is healthy before attempting
-            if not await self._http_client.check_health():
-                circuit_state = "unknown"
-                if (
-                    hasattr(self._http_client, "_circuit_breaker")
-                    and self._http_client._circuit_breaker
-                ):
-                    circuit_state = self._http_client._circuit_breaker.get_state().value
-                logger.warning(
-                    "stt.service_not_ready",
-                    correlation_id=segment.correlation_id,
-                    circuit_state=circuit_state,
-                    action="dropping_segment",
-                )
-                return None
-
+            # No pre-flight health check: the resilient client learns STT health
+            # from request outcomes and refuses requests while its circuit is open
             # Pass correlation ID in headers
             headers = {"X-Correlation-ID": segment.correlation_id}
 
@@ -242,6 +228,9 @@ class TranscriptionClient:
                 max_retries=self._config.max_retries,
                 log_fields={"correlation_id": segment.correlation_id},
                 logger=logger,
+                # Retries share the segment's processing budget instead of
+                # each getting a fresh timeout
+                deadline=time.monotonic() + processing_timeout,
             )
         except ServiceUnavailableError:
             logger.warning(
@@ -5,8 +5,6 @@ import time
 from typing import Any
 
 from fastapi import HTTPException
-import torch
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
 from services.common.app_factory import create_service_app
 from services.common.config import (
@@ -20,7 +18,13 @@ from services.common.gpu_utils import (
 )
 from services.common.health import HealthManager
 from services.common.health_endpoints import HealthEndpoints
-from services.common.model_loader import BackgroundModelLoader
+from services.common.lazy_imports import lazy_import
+from services.common.model_loader import BackgroundModelLoader, load_phase
+from services.common.model_snapshot import (
+    ModelSnapshot,
+    SnapshotContents,
+    build_module,
+)
 from services.common.model_utils import force_download_transformers
 from services.common.structured_logging import configure_logging, get_logger
 from services.common.tracing import get_observability_manager
@@ -38,6 +42,12 @@ configure_logging(
 )
 logger = get_logger(__name__, service_name="flan")
 
+# torch and transformers load with the model (in the loader thread), so the
+# service answers /health/live without waiting for them
+_ML_HINT = "FLAN service requires torch and transformers. Use python-ml base image."
+torch = lazy_import("torch", _ML_HINT)
+transformers = lazy_import("transformers", _ML_HINT)
+
 
 class ModelSize(Enum):
     BASE = "google/flan-t5-base"  # 1GB RAM
@@ -91,18 +101,20 @@ def _load_from_cache() -> tuple[Any, Any] | None:
     try:
         model_start = time.time()
         logger.debug("flan.loading_model_from_cache", phase="model_cache_load")
-        cached_model = AutoModelForSeq2SeqLM.from_pretrained(
-            MODEL_NAME,
-            cache_dir=CACHE_DIR,
-            local_files_only=True,  # Only use local files
-        )
+        with load_phase("deserialize"):
+            cached_model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
+                MODEL_NAME,
+                cache_dir=CACHE_DIR,
+                local_files_only=True,  # Only use local files
+            )
         model_duration = time.time() - model_start
 
         tokenizer_start = time.time()
         logger.debug("flan.loading_tokenizer_from_cache", phase="tokenizer_cache_load")
-        cached_tokenizer = AutoTokenizer.from_pretrained(
-            MODEL_NAME, cache_dir=CACHE_DIR, local_files_only=True
-        )
+        with load_phase("tokenizer"):
+            cached_tokenizer = transformers.AutoTokenizer.from_pretrained(
+                MODEL_NAME, cache_dir=CACHE_DIR, local_files_only=True
+            )
         tokenizer_duration = time.time() - tokenizer_start
         total_duration = time.time() - cache_start
 
@@ -110,13 +122,17 @@ def _load_from_cache() -> tuple[Any, Any] | None:
         device = "cuda" if torch.cuda.is_available() else "cpu"
         if device == "cuda":
             logger.info("flan.moving_model_to_gpu", phase="gpu_migration")
-            cached_model = cached_model.to(device)
-            cached_model = cached_model.half()  # Use float16 on GPU
+            with load_phase("gpu_migration"):
+                cached_model = cached_model.to(device)
+                cached_model = cached_model.half()  # Use float16 on GPU
 
         # Apply torch.compile() if enabled
         from services.common.torch_compile import compile_model_if_enabled
 
-        cached_model = compile_model_if_enabled(cached_model, "flan", "flan_t5", logger)
+        with load_phase("compile"):
+            cached_model = compile_model_if_enabled(
+                cached_model, "flan", "flan_t5", logger
+            )
 
         # Get actual device information from the loaded model
         device_info = get_full_device_info(model=cached_model, intended_device=device)
@@ -216,7 +232,7 @@ def _load_with_download() -> tuple[Any, Any]:
             model_name=MODEL_NAME,
             cache_dir=CACHE_DIR,
             force=True,
-            model_class=AutoModelForSeq2SeqLM,
+            model_class=transformers.AutoModelForSeq2SeqLM,
         )
         model_duration = time.time() - model_start
 
@@ -225,7 +241,7 @@ def _load_with_download() -> tuple[Any, Any]:
             model_name=MODEL_NAME,
             cache_dir=CACHE_DIR,
             force=True,
-            model_class=AutoTokenizer,
+            model_class=transformers.AutoTokenizer,
         )
         tokenizer_duration = time.time() - tokenizer_start
 
@@ -233,19 +249,20 @@ def _load_with_download() -> tuple[Any, Any]:
         device = "cuda" if torch.cuda.is_available() else "cpu"
         if device == "cuda":
             logger.info("flan.moving_model_to_gpu", phase="gpu_migration")
-            downloaded_model = downloaded_model.to(device)
-            downloaded_model = downloaded_model.half()  # Use float16 on GPU
+            with load_phase("gpu_migration"):
+                downloaded_model = downloaded_model.to(device)
+                downloaded_model = downloaded_model.half()  # Use float16 on GPU
     else:
         model_start = time.time()
         logger.debug("flan.downloading_model", phase="model_download")
-        downloaded_model = AutoModelForSeq2SeqLM.from_pretrained(
+        downloaded_model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
             MODEL_NAME, cache_dir=CACHE_DIR
         )
         model_duration = time.time() - model_start
 
         tokenizer_start = time.time()
         logger.debug("flan.downloading_tokenizer", phase="tokenizer_download")
-        downloaded_tokenizer = AutoTokenizer.from_pretrained(
+        downloaded_tokenizer = transformers.AutoTokenizer.from_pretrained(
             MODEL_NAME, cache_dir=CACHE_DIR
         )
         tokenizer_duration = time.time() - tokenizer_start
@@ -254,15 +271,17 @@ def _load_with_download() -> tuple[Any, Any]:
         device = "cuda" if torch.cuda.is_available() else "cpu"
         if device == "cuda":
             logger.info("flan.moving_model_to_gpu", phase="gpu_migration")
-            downloaded_model = downloaded_model.to(device)
-            downloaded_model = downloaded_model.half()  # Use float16 on GPU
+            with load_phase("gpu_migration"):
+                downloaded_model = downloaded_model.to(device)
+                downloaded_model = downloaded_model.half()  # Use float16 on GPU
 
     # Apply torch.compile() if enabled
     from services.common.torch_compile import compile_model_if_enabled
 
-    downloaded_model = compile_model_if_enabled(
-        downloaded_model, "flan", "flan_t5", logger
-    )
+    with load_phase("compile"):
+        downloaded_model = compile_model_if_enabled(
+            downloaded_model, "flan", "flan_t5", logger
+        )
 
     total_duration = time.time() - download_start
 
@@ -291,6 +310,67 @@ def _load_with_download() -> tuple[Any, Any]:
     return (downloaded_model, downloaded_tokenizer)
 
 
+def _export_snapshot(loaded: tuple[Any, Any]) -> SnapshotContents:
+    """Snapshot the post-processed (device, dtype) model weights."""
+    loaded_model, _ = loaded
+    # Compiled models wrap the original module; snapshot the weights only
+    base_model = getattr(loaded_model, "_orig_mod", loaded_model)
+    return SnapshotContents(components={"model": base_model.state_dict()})
+
+
+def _restore_snapshot(contents: SnapshotContents) -> tuple[Any, Any]:
+    """Rebuild model and tokenizer from a snapshot and the cached config."""
+    from services.common.torch_compile import compile_model_if_enabled
+
+    with load_phase("deserialize"):
+        config = transformers.AutoConfig.from_pretrained(
+            MODEL_NAME, cache_dir=CACHE_DIR, local_files_only=True
+        )
+        restored_model = build_module(
+            lambda: transformers.AutoModelForSeq2SeqLM.from_config(config),
+            contents.components["model"],
+        )
+    with load_phase("tokenizer"):
+        restored_tokenizer = transformers.AutoTokenizer.from_pretrained(
+            MODEL_NAME, cache_dir=CACHE_DIR, local_files_only=True
+        )
+    with load_phase("compile"):
+        restored_model = compile_model_if_enabled(
+            restored_model, "flan", "flan_t5", logger
+        )
+    return (restored_model, restored_tokenizer)
+
+
+def _snapshot_device() -> str:
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _create_snapshot() -> ModelSnapshot:
+    return ModelSnapshot(
+        "flan_t5",
+        export=_export_snapshot,
+        restore=_restore_snapshot,
+        fingerprint=lambda: {
+            "model": MODEL_NAME,
+            "device": _snapshot_device(),
+            "torch": torch.__version__,
+            "transformers": transformers.__version__,
+        },
+        device=_snapshot_device,
+    )
+
+
+def _create_model_loader() -> BackgroundModelLoader:
+    """Model loader trying snapshot, then cache, then download."""
+    return BackgroundModelLoader(
+        cache_loader_func=_load_from_cache,
+        download_loader_func=_load_with_download,
+        logger=logger,
+        loader_name="flan_t5",
+        snapshot=_create_snapshot(),
+    )
+
+
 async def _startup() -> None:
     """Load the FLAN-T5 model and tokenizer on startup."""
     global _model_loader, _observability_manager, _llm_metrics
@@ -325,13 +405,8 @@ async def _startup() -> None:
             "Loading FLAN-T5 model", extra={"model": MODEL_NAME, "cache_dir": CACHE_DIR}
         )
 
-        # Initialize model loader with cache-first + download fallback
-        _model_loader = BackgroundModelLoader(
-            cache_loader_func=_load_from_cache,
-            download_loader_func=_load_with_download,
-            logger=logger,
-            loader_name="flan_t5",
-        )
+        # Initialize model loader with snapshot/cache-first + download fallback
+        _model_loader = _create_model_loader()
 
         # Start background loading (non-blocking)
         await _model_loader.initialize()
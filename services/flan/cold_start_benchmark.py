@@ -0,0 +1,13 @@
+"""Cold-start benchmark for the FLAN-T5 model.
+
+Run with ``python -m services.flan.cold_start_benchmark [--runs N] [--no-snapshot]``.
+"""
+
+import sys
+
+from services.common.cold_start import main
+from services.flan.app import _create_model_loader
+
+
+if __name__ == "__main__":
+    sys.exit(main("services.flan.cold_start_benchmark", _create_model_loader))
@@ -5,7 +5,6 @@ This service provides input/output validation, toxicity detection, PII detection
 and rate limiting for the audio orchestrator system.
 """
 
-import hashlib
 import re
 import time
 from typing import Any
@@ -15,10 +14,12 @@ from pydantic import BaseModel, Field
 
 from services.common.config import (
     LoggingConfig,
+    get_env_with_default,
     get_service_preset,
 )
 from services.common.health import HealthManager
 from services.common.health_endpoints import HealthEndpoints
+from services.common.lazy_imports import lazy_import
 from services.common.model_loader import BackgroundModelLoader
 from services.common.app_factory import create_service_app
 from services.common.structured_logging import configure_logging, get_logger
@@ -28,16 +29,17 @@ from services.common.permissions import (
     ensure_model_directory,
 )
 
+from .scanner import get_injection_scanner, get_pii_redactor
+from .toxicity import ToxicityBatcher, ToxicityScorer
 
-# ML imports for toxicity detection with strict fail-fast
-try:
-    from transformers import pipeline
-except ImportError as exc:
-    raise ImportError(
-        f"Required ML library not available: {exc}. "
-        "Guardrails service requires transformers for toxicity detection. "
-        "Use python-ml base image or explicitly install transformers."
-    ) from exc
+
+# ML imports for toxicity detection: checked now, imported with the model (in the
+# loader thread) so the service answers /health/live without waiting for them
+transformers = lazy_import(
+    "transformers",
+    "Guardrails service requires transformers for toxicity detection. "
+    "Use python-ml base image or explicitly install transformers.",
+)
 
 # Rate limiting imports with strict fail-fast
 try:
@@ -67,31 +69,6 @@ _health_manager = HealthManager("guardrails")
 # Note: Other stateful components (_toxicity_detector, _limiter, _model_loader, etc.)
 # are now stored in app.state during startup and accessed via app.state or request.app.state
 
-# Toxicity cache size constant
-_TOXICITY_CACHE_MAX_SIZE = 100  # Limit cache size to prevent memory issues
-
-# PII patterns
-PII_PATTERNS = {
-    "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-    "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
-    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
-    "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
-}
-
-# Dangerous prompt patterns
-DANGEROUS_PATTERNS = [
-    "ignore previous",
-    "system:",
-    "assistant:",
-    "[INST]",
-    "forget everything",
-    "new instructions",
-    "override",
-    "jailbreak",
-    "roleplay",
-    "pretend to be",
-]
-
 
 class ValidationRequest(BaseModel):
     text: str = Field(..., description="Text to validate")
@@ -190,7 +167,7 @@ def _load_toxicity_model(
                 cache_dir=cache_dir,
                 phase="force_download",
             )
-            detector = pipeline(
+            detector = transformers.pipeline(
                 "text-classification",
                 model=model_name,
                 model_kwargs={"force_download": True, "cache_dir": cache_dir},
@@ -214,7 +191,7 @@ def _load_toxicity_model(
                 cache_dir=cache_dir,
                 phase="normal_load",
             )
-            detector = pipeline(
+            detector = transformers.pipeline(
                 "text-classification",
                 model=model_name,
                 model_kwargs={"cache_dir": cache_dir},
@@ -288,8 +265,8 @@ async def _startup() -> None:
         app.state.system_metrics = system_metrics
         app.state.observability_manager = observability_manager
 
-        # Initialize toxicity cache in app.state
-        app.state.toxicity_cache = {}
+        # Toxicity scorer is created on first use, once the model is loaded
+        app.state.toxicity_scorer = None
 
         # Set observability manager in health manager
         _health_manager.set_observability_manager(observability_manager)
@@ -346,9 +323,41 @@ async def _startup() -> None:
 
 async def _shutdown() -> None:
     """Cleanup on shutdown."""
+    toxicity_scorer = getattr(app.state, "toxicity_scorer", None)
+    if toxicity_scorer is not None:
+        await toxicity_scorer.batcher.close()
+        app.state.toxicity_scorer = None
     logger.info("guardrails.shutdown")
 
 
+def _get_toxicity_scorer(detector: Any) -> ToxicityScorer:
+    """Get the shared toxicity scorer, creating it on first use."""
+    scorer: ToxicityScorer | None = getattr(app.state, "toxicity_scorer", None)
+    if scorer is None:
+        guardrails_metrics = getattr(app.state, "guardrails_metrics", None)
+        batcher = ToxicityBatcher(
+            detector,
+            max_batch_size=get_env_with_default(
+                "GUARDRAILS_TOXICITY_BATCH_SIZE", 8, int
+            ),
+            max_wait_ms=get_env_with_default(
+                "GUARDRAILS_TOXICITY_BATCH_WAIT_MS", 5.0, float
+            ),
+            metrics=guardrails_metrics,
+        )
+        scorer = ToxicityScorer(
+            batcher,
+            cache_size=get_env_with_default(
+                "GUARDRAILS_TOXICITY_CACHE_SIZE", 1000, int
+            ),
+            metrics=guardrails_metrics,
+        )
+        app.state.toxicity_scorer = scorer
+    # The model loader may hand out a new detector after a reload
+    scorer.batcher.detector = detector
+    return scorer
+
+
 # Create app using factory pattern
 app = create_service_app(
     "guardrails",
@@ -427,32 +436,30 @@ async def validate_input(
                 safe=False, reason="too_long", sanitized=text[:1000] + "..."
             )
 
-        # Prompt injection detection
-        text_lower = text.lower()
-        for pattern in DANGEROUS_PATTERNS:
-            if pattern in text_lower:
-                # Record metrics
-                processing_time = time.time() - start_time
-                guardrails_metrics = getattr(app.state, "guardrails_metrics", None)
-                if guardrails_metrics:
-                    if "validation_requests" in guardrails_metrics:
-                        guardrails_metrics["validation_requests"].add(
-                            1,
-                            attributes={
-                                "type": "input",
-                                "status": "blocked",
-                                "reason": "prompt_injection",
-                            },
-                        )
-                    if "validation_duration" in guardrails_metrics:
-                        guardrails_metrics["validation_duration"].record(
-                            processing_time,
-                            attributes={"type": "input", "status": "blocked"},
-                        )
-
-                return ValidationResponse(
-                    safe=False, reason="prompt_injection", sanitized=text
-                )
+        # Prompt injection detection (single pass over all dangerous phrases)
+        if get_injection_scanner().find(text) is not None:
+            # Record metrics
+            processing_time = time.time() - start_time
+            guardrails_metrics = getattr(app.state, "guardrails_metrics", None)
+            if guardrails_metrics:
+                if "validation_requests" in guardrails_metrics:
+                    guardrails_metrics["validation_requests"].add(
+                        1,
+                        attributes={
+                            "type": "input",
+                            "status": "blocked",
+                            "reason": "prompt_injection",
+                        },
+                    )
+                if "validation_duration" in guardrails_metrics:
+                    guardrails_metrics["validation_duration"].record(
+                        processing_time,
+                        attributes={"type": "input", "status": "blocked"},
+                    )
+
+            return ValidationResponse(
+                safe=False, reason="prompt_injection", sanitized=text
+            )
 
         # Basic content filtering
         sanitized = _sanitize_text(text)
@@ -518,6 +525,7 @@ async def validate_output(
         correlation_id = http_request.headers.get("X-Correlation-ID")
 
     start_time = time.time()
+    guardrails_metrics = getattr(app.state, "guardrails_metrics", None)
 
     try:
         text = request.text
@@ -558,56 +566,21 @@ async def validate_output(
             correlation_id=correlation_id,
         )
 
-        # Toxicity check with caching
+        # Toxicity check: sentence-level, cached, batched off the event loop
         if detector is not None:
             try:
-                # Create cache key from text hash
-                text_hash = hashlib.sha256(text.encode()).hexdigest()
-                cache_key = f"toxicity:{text_hash}"
-
-                # Get toxicity cache from app.state
-                toxicity_cache = getattr(app.state, "toxicity_cache", {})
-
-                # Check cache first
-                cached_result = toxicity_cache.get(cache_key)
-                if cached_result is not None:
-                    logger.info(
-                        "guardrails.toxicity_cache_hit",
-                        duration_ms=0.0,  # Cache hit is instantaneous
-                        label=cached_result["label"],
-                        score=cached_result["score"],
-                        correlation_id=correlation_id,
-                        cache_size=len(toxicity_cache),
-                    )
-                    result = cached_result
-                else:
-                    # Cache miss - run inference
-                    toxicity_check_start = time.time()
-                    result = detector(text)[0]
-                    toxicity_check_time = (time.time() - toxicity_check_start) * 1000
-
-                    # Cache result (with size limit)
-                    if len(toxicity_cache) >= _TOXICITY_CACHE_MAX_SIZE:
-                        # Remove oldest entry (simple FIFO eviction)
-                        oldest_key = next(iter(toxicity_cache))
-                        del toxicity_cache[oldest_key]
-                        logger.debug(
-                            "guardrails.toxicity_cache_evicted",
-                            evicted_key=oldest_key,
-                            cache_size=len(toxicity_cache),
-                        )
-                    toxicity_cache[cache_key] = result
-                    app.state.toxicity_cache = toxicity_cache
-
-                    logger.info(
-                        "guardrails.toxicity_inference_completed",
-                        duration_ms=round(toxicity_check_time, 2),
-                        label=result["label"],
-                        score=result["score"],
-                        correlation_id=correlation_id,
-                        cache_hit=False,
-                        cache_size=len(toxicity_cache),
-                    )
+                toxicity_check_start = time.time()
+                scorer = _get_toxicity_scorer(detector)
+                result = await scorer.score_text(text)
+                toxicity_check_time = (time.time() - toxicity_check_start) * 1000
+                logger.info(
+                    "guardrails.toxicity_check_completed",
+                    duration_ms=round(toxicity_check_time, 2),
+                    label=result["label"],
+                    score=result["score"],
+                    correlation_id=correlation_id,
+                    cache_size=scorer.get_stats()["size"],
+                )
 
                 # Record toxicity check metric
                 guardrails_metrics = getattr(app.state, "guardrails_metrics", None)
@@ -652,30 +625,23 @@ async def validate_output(
                     correlation_id=correlation_id,
                 )
 
-        # PII detection and redaction
+        # PII detection and redaction (single pass over all PII types)
         pii_redaction_start = time.time()
-        filtered_text = _redact_pii(text)
+        filtered_text, pii_counts = get_pii_redactor().redact(text)
         pii_redaction_time = (time.time() - pii_redaction_start) * 1000
         logger.info(
             "guardrails.pii_redaction_completed",
             duration_ms=round(pii_redaction_time, 2),
-            text_changed=filtered_text != text,
+            text_changed=bool(pii_counts),
             correlation_id=correlation_id,
         )
 
-        # Record PII detection metrics
-        original_text = text
-        if filtered_text != original_text:
-            # PII was detected and redacted
-            for pii_type in PII_PATTERNS:
-                if (
-                    f"[{pii_type.upper()}_REDACTED]" in filtered_text
-                    and guardrails_metrics
-                    and "pii_detections" in guardrails_metrics
-                ):
-                    guardrails_metrics["pii_detections"].add(
-                        1, attributes={"type": pii_type}
-                    )
+        # Record PII detection metrics (one per detected type)
+        if guardrails_metrics and "pii_detections" in guardrails_metrics:
+            for pii_type in pii_counts:
+                guardrails_metrics["pii_detections"].add(
+                    1, attributes={"type": pii_type}
+                )
 
         # Record success metrics
         processing_time = time.time() - start_time
@@ -755,17 +721,3 @@ def _sanitize_text(text: str) -> str:
     text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", text)
 
     return text
-
-
-def _redact_pii(text: str) -> str:
-    """Detect and redact PII from text."""
-    filtered_text = text
-
-    for pii_type, pattern in PII_PATTERNS.items():
-        if re.search(pattern, filtered_text):
-            # Redact PII
-            filtered_text = re.sub(
-                pattern, f"[{pii_type.upper()}_REDACTED]", filtered_text
-            )
-
-    return filtered_text
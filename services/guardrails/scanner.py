@@ -0,0 +1,129 @@
+"""
+Compiled single-pass scanners for guardrails validation.
+
+PII redaction compiles every pattern into one alternation with a named group
+per PII type and redacts in a single ``sub`` pass. Prompt-injection detection
+matches all dangerous phrases with one case-insensitive alternation.
+"""
+
+from __future__ import annotations
+
+import re
+
+
+# PII patterns (order is match priority when patterns start at the same position)
+PII_PATTERNS = {
+    # Possessive local part: '@' is not in the class, so backtracking can never help
+    "email": r"\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+    "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
+    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+    "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+}
+
+# Dangerous prompt patterns (matched case-insensitively)
+DANGEROUS_PATTERNS = [
+    "ignore previous",
+    "system:",
+    "assistant:",
+    "[INST]",
+    "forget everything",
+    "new instructions",
+    "override",
+    "jailbreak",
+    "roleplay",
+    "pretend to be",
+]
+
+
+_WORD_BOUNDARY = r"\b"
+
+
+class PIIRedactor:
+    """Redact all PII types in one pass over the text."""
+
+    def __init__(self, patterns: dict[str, str] | None = None) -> None:
+        """Compile PII patterns into a single alternation.
+
+        Args:
+            patterns: PII type to regex mapping; defaults to ``PII_PATTERNS``.
+                Types must be valid regex group names.
+        """
+        patterns = patterns if patterns is not None else PII_PATTERNS
+        self.pii_types = tuple(patterns)
+        self._replacements = {
+            pii_type: f"[{pii_type.upper()}_REDACTED]" for pii_type in patterns
+        }
+        # Hoist a word boundary shared by every pattern out of the alternation
+        # so it is checked once per position instead of once per branch
+        prefix = ""
+        if patterns and all(p.startswith(_WORD_BOUNDARY) for p in patterns.values()):
+            prefix = _WORD_BOUNDARY
+            patterns = {
+                name: pattern[len(prefix) :] for name, pattern in patterns.items()
+            }
+        alternation = "|".join(
+            f"(?P<{name}>{pattern})" for name, pattern in patterns.items()
+        )
+        self._pattern = re.compile(f"{prefix}(?:{alternation})")
+
+    def redact(self, text: str) -> tuple[str, dict[str, int]]:
+        """Redact PII from text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Tuple of (redacted text, count of redactions per PII type). The
+            counts dict only contains types that were found.
+        """
+        counts: dict[str, int] = {}
+        replacements = self._replacements
+
+        def _replace(match: re.Match[str]) -> str:
+            pii_type = match.lastgroup or ""
+            counts[pii_type] = counts.get(pii_type, 0) + 1
+            return replacements[pii_type]
+
+        return self._pattern.sub(_replace, text), counts
+
+
+class InjectionScanner:
+    """Detect prompt-injection phrases in one case-insensitive pass."""
+
+    def __init__(self, phrases: list[str] | None = None) -> None:
+        """Compile dangerous phrases into a single alternation.
+
+        Args:
+            phrases: Literal phrases to detect; defaults to ``DANGEROUS_PATTERNS``
+        """
+        phrases = phrases if phrases is not None else DANGEROUS_PATTERNS
+        # Lowercased literals matched against lowercased text; this is much
+        # cheaper than re.IGNORECASE, which folds case at every position.
+        # Longest first so overlapping phrases report the most specific match.
+        ordered = sorted({p.lower() for p in phrases}, key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(p) for p in ordered))
+
+    def find(self, text: str) -> str | None:
+        """Return the first dangerous phrase (lowercased) found in text, or None."""
+        match = self._pattern.search(text.lower())
+        return match.group(0) if match else None
+
+
+_default_redactor: PIIRedactor | None = None
+_default_injection_scanner: InjectionScanner | None = None
+
+
+def get_pii_redactor() -> PIIRedactor:
+    """Get the shared redactor for the default PII patterns."""
+    global _default_redactor
+    if _default_redactor is None:
+        _default_redactor = PIIRedactor()
+    return _default_redactor
+
+
+def get_injection_scanner() -> InjectionScanner:
+    """Get the shared scanner for the default dangerous phrases."""
+    global _default_injection_scanner
+    if _default_injection_scanner is None:
+        _default_injection_scanner = InjectionScanner()
+    return _default_injection_scanner
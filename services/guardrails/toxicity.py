@@ -0,0 +1,205 @@
+"""
+Batched, off-loop toxicity scoring for guardrails.
+
+Inference runs on a single dedicated worker thread so the event loop is never
+blocked. Concurrent validations are micro-batched into one pipeline call, and
+outputs are scored per sentence with an LRU cache so a sentence repeated in a
+new response is not scored again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import re
+import time
+from typing import Any
+
+from services.common.result_cache import ResultCache, generate_cache_key
+from services.common.structured_logging import get_logger
+
+
+logger = get_logger(__name__, service_name="guardrails")
+
+# Split after sentence-ending punctuation followed by whitespace
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into non-empty, stripped sentences."""
+    return [s for s in (p.strip() for p in _SENTENCE_BOUNDARY.split(text)) if s]
+
+
+def most_toxic(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Pick the result that should decide the verdict for a whole text.
+
+    Toxic-labelled results rank above any other label, then by score.
+    """
+    return max(results, key=lambda r: (r["label"] == "toxic", r["score"]))
+
+
+class ToxicityBatcher:
+    """Micro-batch concurrent toxicity requests into single pipeline calls."""
+
+    def __init__(
+        self,
+        detector: Any,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            detector: Callable text-classification pipeline taking a list of
+                texts and returning one result dict per text
+            max_batch_size: Maximum texts per forward pass
+            max_wait_ms: How long to wait for more texts after the first arrives
+            metrics: Optional guardrails metrics dict
+        """
+        self.detector = detector
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self._metrics = metrics or {}
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[dict[str, Any]]]] = (
+            asyncio.Queue()
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="toxicity"
+        )
+        self._worker: asyncio.Task[None] | None = None
+
+    async def score(self, texts: list[str]) -> list[dict[str, Any]]:
+        """Score texts, sharing forward passes with concurrent callers."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future: asyncio.Future[dict[str, Any]] = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _run(self) -> None:
+        """Collect queued texts into batches and run them on the worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.detector, texts
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            duration = time.perf_counter() - start
+            if "toxicity_batch_size" in self._metrics:
+                self._metrics["toxicity_batch_size"].record(len(batch))
+            logger.debug(
+                "guardrails.toxicity_batch_completed",
+                batch_size=len(batch),
+                duration_ms=round(duration * 1000, 2),
+            )
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the batching task and the worker thread."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+
+class ToxicityScorer:
+    """Sentence-level toxicity scoring with an LRU cache in front of a batcher."""
+
+    def __init__(
+        self,
+        batcher: ToxicityBatcher,
+        cache_size: int = 1000,
+        metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the scorer.
+
+        Args:
+            batcher: Batcher used for sentences that miss the cache
+            cache_size: Maximum cached sentence results
+            metrics: Optional guardrails metrics dict
+        """
+        self.batcher = batcher
+        self._cache: ResultCache[dict[str, Any]] = ResultCache(
+            max_entries=cache_size, max_size_mb=16, service_name="guardrails"
+        )
+        self._metrics = metrics or {}
+
+    async def score_text(self, text: str) -> dict[str, Any]:
+        """Score a text by its most toxic sentence.
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Result dict with ``label``, ``score`` and the deciding ``sentence``
+        """
+        sentences = split_sentences(text) or [text]
+        keys = [generate_cache_key("toxicity", s) for s in sentences]
+
+        results: dict[str, dict[str, Any]] = {}
+        misses: dict[str, str] = {}
+        for key, sentence in zip(keys, sentences, strict=True):
+            if key in results or key in misses:
+                continue
+            cached = self._cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                misses[key] = sentence
+        self._record_lookups(hits=len(results), misses=len(misses))
+
+        if misses:
+            scored = await self.batcher.score(list(misses.values()))
+            for key, result in zip(misses, scored, strict=True):
+                self._cache.put(key, result)
+                results[key] = result
+
+        scored_sentences = [
+            {**results[key], "sentence": sentence}
+            for key, sentence in zip(keys, sentences, strict=True)
+        ]
+        return most_toxic(scored_sentences)
+
+    def _record_lookups(self, hits: int, misses: int) -> None:
+        lookups = self._metrics.get("toxicity_cache_lookups")
+        if lookups is None:
+            return
+        if hits:
+            lookups.add(hits, attributes={"result": "hit"})
+        if misses:
+            lookups.add(misses, attributes={"result": "miss"})
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sentence cache statistics."""
+        return self._cache.get_stats()
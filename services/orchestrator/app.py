@@ -22,9 +22,13 @@ from services.common.http_client_factory import (
 from services.common.resilient_http import ServiceUnavailableError
 from services.common.structured_logging import get_logger
 from services.common.tracing import get_observability_manager
+from services.common.voice_latency import record_stage_span
 
 # LangChain imports
+from .conversation_memory import build_session_id
 from .langchain_integration import (
+    create_conversation_memory,
+    create_intent_router,
     create_langchain_executor,
     process_with_langchain,
 )
@@ -105,11 +109,15 @@ async def _startup() -> None:
         # Initialize LangChain executor (strict requirement - fail fast if unavailable)
         langchain_executor = create_langchain_executor()
         app.state.langchain_executor = langchain_executor
+        app.state.conversation_memory = create_conversation_memory()
+        app.state.intent_router = create_intent_router()
 
         # Initialize TTS client (optional - graceful degradation)
         try:
             tts_url = get_env_with_default("TTS_BASE_URL", "http://bark:7100", str)
-            tts_client = TTSClient(base_url=tts_url)
+            tts_client = TTSClient(
+                base_url=tts_url, metrics=getattr(app.state, "http_metrics", None)
+            )
             app.state.tts_client = tts_client
             logger.info("orchestrator.tts_client_initialized", tts_url=tts_url)
         except Exception as exc:
@@ -245,6 +253,17 @@ health_endpoints = HealthEndpoints(
 app.include_router(health_endpoints.get_router())
 
 
+def _record_voice_stage(
+    stage: str, correlation_id: str | None, start: float, **attributes: Any
+) -> None:
+    """Record an orchestrator stage (ending now) in the utterance's latency trace."""
+    if not correlation_id:
+        return
+    observability_manager = getattr(app.state, "observability_manager", None)
+    tracer = observability_manager.get_tracer() if observability_manager else None
+    record_stage_span(tracer, stage, correlation_id, start, time.time(), **attributes)
+
+
 @app.post("/api/v1/transcripts", response_model=TranscriptProcessResponse)  # type: ignore[misc]
 async def process_transcript(
     request: TranscriptProcessRequest,
@@ -331,6 +350,12 @@ async def process_transcript(
                 await guardrails_client.close()
                 guardrails_time = (time.time() - guardrails_start) * 1000
                 stage_timings["input_validation_ms"] = guardrails_time
+                _record_voice_stage(
+                    "guardrails",
+                    request.correlation_id,
+                    guardrails_start,
+                    phase="input",
+                )
                 logger.info(
                     "orchestrator.input_validation_completed",
                     duration_ms=guardrails_time,
@@ -368,10 +393,16 @@ async def process_transcript(
             )
             langchain_executor = getattr(app.state, "langchain_executor", None)
             response = await process_with_langchain(
-                sanitized_transcript, request.user_id, langchain_executor
+                sanitized_transcript,
+                build_session_id(request.user_id, request.channel_id),
+                langchain_executor,
+                memory=getattr(app.state, "conversation_memory", None),
+                llm_metrics=getattr(app.state, "llm_metrics", None),
+                router=getattr(app.state, "intent_router", None),
             )
             langchain_time = (time.time() - langchain_start) * 1000
             stage_timings["langchain_processing_ms"] = langchain_time
+            _record_voice_stage("llm", request.correlation_id, langchain_start)
             # Validate response is not empty or error message
             if not response or response.strip() == "":
                 logger.warning(
@@ -390,6 +421,9 @@ async def process_transcript(
         except Exception as langchain_exc:
             langchain_time = (time.time() - langchain_start) * 1000
             stage_timings["langchain_processing_ms"] = langchain_time
+            _record_voice_stage(
+                "llm", request.correlation_id, langchain_start, status="error"
+            )
             logger.error(
                 "orchestrator.langchain_failed",
                 error=str(langchain_exc),
@@ -433,6 +467,12 @@ async def process_transcript(
                 await guardrails_client.close()
                 output_validation_time = (time.time() - output_validation_start) * 1000
                 stage_timings["output_validation_ms"] = output_validation_time
+                _record_voice_stage(
+                    "guardrails",
+                    request.correlation_id,
+                    output_validation_start,
+                    phase="output",
+                )
                 logger.info(
                     "orchestrator.output_validation_completed",
                     duration_ms=output_validation_time,
@@ -491,6 +531,12 @@ async def process_transcript(
                     tts_time = (time.time() - tts_start) * 1000
                     stage_timings["tts_synthesis_ms"] = tts_time
                     stage_timings["base64_encode_ms"] = base64_time
+                    _record_voice_stage(
+                        "tts",
+                        request.correlation_id,
+                        tts_start,
+                        audio_size=len(audio_bytes),
+                    )
                     logger.info(
                         "orchestrator.tts_synthesis_completed",
                         total_duration_ms=tts_time,
@@ -556,6 +602,7 @@ async def process_transcript(
             tool_calls=None,
             correlation_id=request.correlation_id,
             error=None,
+            stage_timings=stage_timings,
         )
 
     except Exception as e:
@@ -0,0 +1,197 @@
+"""
+Bounded per-session conversation memory for the LangChain orchestrator.
+
+Each session (keyed by channel and user) keeps its own sliding window of turns,
+trimmed to a token budget so the prompt sent to the LLM stays flat over the life
+of the process. Idle sessions are evicted by TTL and the number of sessions is
+capped with LRU eviction.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from services.common.structured_logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Roles understood by LangChain's MessagesPlaceholder when given (role, content) tuples
+HUMAN_ROLE = "human"
+AI_ROLE = "ai"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a string.
+
+    Uses the common ~4 characters per token heuristic; it only needs to be
+    consistent for budgeting, not exact.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (at least 1 for non-empty text)
+    """
+    if not text:
+        return 0
+    return max(1, (len(text) + 3) // 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text so that ``estimate_tokens`` of the result is at most ``max_tokens``."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    return text[: max(0, max_tokens) * 4]
+
+
+def build_session_id(user_id: str, channel_id: str | None = None) -> str:
+    """Build a memory session key from user and channel identifiers."""
+    if channel_id:
+        return f"{channel_id}:{user_id}"
+    return user_id
+
+
+@dataclass
+class _Session:
+    """Conversation history for a single session."""
+
+    messages: deque[tuple[str, str, int]] = field(default_factory=deque)
+    token_count: int = 0
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class ConversationMemoryStore:
+    """Per-session conversation memory with token budget and LRU eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        max_history_tokens: int = 1024,
+        idle_ttl_seconds: float = 1800.0,
+    ) -> None:
+        """Initialize the memory store.
+
+        Args:
+            max_sessions: Maximum number of sessions kept in memory
+            max_history_tokens: Token budget for each session's history window
+            idle_ttl_seconds: Sessions idle longer than this are evicted
+                (0 disables TTL eviction)
+        """
+        self.max_sessions = max_sessions
+        self.max_history_tokens = max_history_tokens
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self.evictions = 0
+
+    def get_history(self, session_id: str) -> list[tuple[str, str]]:
+        """Get the history window for a session as (role, content) tuples.
+
+        Args:
+            session_id: Session key (see ``build_session_id``)
+
+        Returns:
+            Messages in chronological order, suitable for a ``chat_history``
+            MessagesPlaceholder
+        """
+        self._evict_idle()
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        session.last_access = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return [(role, content) for role, content, _ in session.messages]
+
+    def get_history_tokens(self, session_id: str) -> int:
+        """Get the estimated token count of a session's history window."""
+        session = self._sessions.get(session_id)
+        return session.token_count if session else 0
+
+    def add_turn(self, session_id: str, user_input: str, response: str) -> None:
+        """Append a user/assistant turn and trim the window to the token budget.
+
+        A turn larger than the whole budget is truncated to fit it: the user
+        input keeps up to half the budget and the response the rest.
+
+        Args:
+            session_id: Session key
+            user_input: User message for this turn
+            response: Assistant response for this turn
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _Session()
+            self._sessions[session_id] = session
+        else:
+            self._sessions.move_to_end(session_id)
+        session.last_access = time.monotonic()
+
+        user_tokens = estimate_tokens(user_input)
+        response_tokens = estimate_tokens(response)
+        if user_tokens + response_tokens > self.max_history_tokens:
+            budget = max(0, self.max_history_tokens)
+            response_share = min(
+                response_tokens, budget - min(user_tokens, budget // 2)
+            )
+            user_input = truncate_to_tokens(user_input, budget - response_share)
+            response = truncate_to_tokens(response, response_share)
+            logger.debug(
+                "conversation_memory.turn_truncated",
+                session_id=session_id,
+                turn_tokens=user_tokens + response_tokens,
+                max_history_tokens=self.max_history_tokens,
+            )
+
+        for role, content in ((HUMAN_ROLE, user_input), (AI_ROLE, response)):
+            tokens = estimate_tokens(content)
+            session.messages.append((role, content, tokens))
+            session.token_count += tokens
+
+        # Drop whole turns from the front until the window fits the budget;
+        # the most recent turn fits on its own
+        while (
+            session.token_count > self.max_history_tokens and len(session.messages) > 2
+        ):
+            for _ in range(2):
+                _, _, tokens = session.messages.popleft()
+                session.token_count -= tokens
+
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self.evictions += 1
+            logger.debug("conversation_memory.session_evicted", session_id=evicted_id)
+
+    def clear_session(self, session_id: str) -> None:
+        """Forget a session's history."""
+        self._sessions.pop(session_id, None)
+
+    def _evict_idle(self) -> None:
+        """Evict sessions that have been idle longer than the TTL."""
+        if self.idle_ttl_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        # Sessions are kept in access order, so idle ones are at the front
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_access >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+            logger.debug("conversation_memory.session_expired", session_id=session_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get memory statistics.
+
+        Returns:
+            Dictionary with session count, total history tokens and evictions
+        """
+        return {
+            "sessions": len(self._sessions),
+            "total_tokens": sum(s.token_count for s in self._sessions.values()),
+            "max_sessions": self.max_sessions,
+            "max_history_tokens": self.max_history_tokens,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,173 @@
+"""
+Fast-path intent router for the LangChain orchestrator.
+
+Trivial requests ("what time is it", greetings, thanks) do not need an
+OpenAI-functions agent loop with several LLM round-trips. The router matches
+the whole normalized transcript against one precompiled alternation of
+anchored intent patterns and answers high-confidence matches directly or with
+a single tool call. Anything else falls through to the agent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import datetime
+import re
+import time
+
+# Filler that may surround a simple request without changing its intent
+_PREFIX = r"(?:(?:hey|hi|ok|okay)\s+atlas\s+)?(?:(?:please|atlas|so)\s+)*"
+_SUFFIX = r"(?:\s+(?:please|atlas|now|right now|today))*"
+
+
+def _answer_time() -> str:
+    now = datetime.datetime.now()
+    return f"Current time is {now.strftime('%Y-%m-%d %H:%M:%S')}"
+
+
+def _answer_date() -> str:
+    today = datetime.datetime.now()
+    return f"Today is {today.strftime('%A, %B %d, %Y')}."
+
+
+def _answer_greeting() -> str:
+    return "Hello! How can I help you?"
+
+
+def _answer_thanks() -> str:
+    return "You're welcome!"
+
+
+@dataclass(frozen=True)
+class IntentRoute:
+    """A fast-path intent: an anchored pattern and the handler that answers it."""
+
+    name: str
+    pattern: str
+    handler: Callable[[], str]
+
+
+@dataclass(frozen=True)
+class RouteResult:
+    """Result of a fast-path match."""
+
+    intent: str
+    response: str
+    duration_ms: float
+
+
+DEFAULT_ROUTES: tuple[IntentRoute, ...] = (
+    IntentRoute(
+        "current_time",
+        r"what(?:\s+is|'s|s)?\s+the\s+(?:current\s+)?time"
+        r"|what\s+time\s+is\s+it"
+        r"|(?:tell|give)\s+me\s+the\s+(?:current\s+)?time"
+        r"|(?:current\s+)?time\s+check",
+        _answer_time,
+    ),
+    IntentRoute(
+        "current_date",
+        r"what(?:\s+is|'s|s)?\s+(?:the\s+)?(?:date|day)(?:\s+is\s+it)?"
+        r"|what\s+day\s+is\s+it"
+        r"|(?:tell|give)\s+me\s+the\s+date",
+        _answer_date,
+    ),
+    IntentRoute(
+        "greeting",
+        r"(?:hello|hi|hey|good\s+(?:morning|afternoon|evening))(?:\s+there)?",
+        _answer_greeting,
+    ),
+    IntentRoute(
+        "thanks",
+        r"(?:thanks|thank\s+you)(?:\s+(?:so\s+much|very\s+much|a\s+lot))?",
+        _answer_thanks,
+    ),
+)
+
+_NON_WORD = re.compile(r"[^\w'\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_transcript(transcript: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    text = _NON_WORD.sub(" ", transcript.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class IntentRouter:
+    """Route trivial transcripts around the agent using precompiled patterns."""
+
+    def __init__(
+        self,
+        routes: tuple[IntentRoute, ...] = DEFAULT_ROUTES,
+        handlers: dict[str, Callable[[], str]] | None = None,
+        max_transcript_chars: int = 80,
+        latency_ewma_alpha: float = 0.2,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            routes: Intent routes to match, in priority order
+            handlers: Optional handler overrides by intent name, e.g. to answer
+                with the agent's own tool function
+            max_transcript_chars: Longer transcripts always fall through; simple
+                requests are short, and this bounds regex work per call
+            latency_ewma_alpha: Smoothing factor for the agent latency estimate
+        """
+        self._handlers = {route.name: route.handler for route in routes}
+        self._handlers.update(handlers or {})
+        alternation = "|".join(f"(?P<{route.name}>{route.pattern})" for route in routes)
+        self._pattern = re.compile(rf"{_PREFIX}(?:{alternation}){_SUFFIX}")
+        self.max_transcript_chars = max_transcript_chars
+        self._alpha = latency_ewma_alpha
+        self.agent_latency_estimate_s: float | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def route(self, transcript: str) -> RouteResult | None:
+        """Answer a transcript on the fast path if it matches a simple intent.
+
+        Args:
+            transcript: Raw transcript text
+
+        Returns:
+            RouteResult on a match, None if the transcript should go to the agent
+        """
+        start = time.perf_counter()
+        match = None
+        if len(transcript) <= self.max_transcript_chars:
+            match = self._pattern.fullmatch(normalize_transcript(transcript))
+        if match is None or match.lastgroup is None:
+            self.misses += 1
+            return None
+
+        intent = match.lastgroup
+        response = self._handlers[intent]()
+        self.hits += 1
+        return RouteResult(
+            intent=intent,
+            response=response,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    def record_agent_latency(self, seconds: float) -> None:
+        """Update the EWMA of agent processing time used to estimate savings."""
+        if self.agent_latency_estimate_s is None:
+            self.agent_latency_estimate_s = seconds
+        else:
+            self.agent_latency_estimate_s += self._alpha * (
+                seconds - self.agent_latency_estimate_s
+            )
+
+    def estimate_latency_saved(self, result: RouteResult) -> float | None:
+        """Estimate seconds saved by answering ``result`` on the fast path."""
+        if self.agent_latency_estimate_s is None:
+            return None
+        return max(0.0, self.agent_latency_estimate_s - result.duration_ms / 1000)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of routed transcripts answered on the fast path."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
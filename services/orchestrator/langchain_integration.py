@@ -4,15 +4,20 @@ LangChain Integration Module
 This module provides LangChain-based orchestration capabilities for the enhanced orchestrator.
 """
 
+import time
+from typing import Any
+
 from services.common.config.loader import get_env_with_default
 from services.common.structured_logging import get_logger
 
+from .conversation_memory import ConversationMemoryStore, estimate_tokens
+from .intent_router import IntentRouter
+
 logger = get_logger(__name__)
 
 # LangChain imports with strict fail-fast
 try:
     from langchain.agents import AgentExecutor, create_openai_functions_agent
-    from langchain.memory import ConversationBufferMemory
     from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
     from langchain.tools import Tool
     from langchain_openai import ChatOpenAI
@@ -35,10 +40,16 @@ When responding:
 - Be concise but informative
 - Ask clarifying questions when needed
 - Provide helpful context when appropriate"""
+_SYSTEM_PROMPT_TOKENS = estimate_tokens(SYSTEM_PROMPT)
 
 
 def create_langchain_executor() -> AgentExecutor:
-    """Create the LangChain agent executor."""
+    """Create the LangChain agent executor.
+
+    The executor is shared across sessions and holds no memory of its own;
+    per-session history is supplied as ``chat_history`` on each call from a
+    ``ConversationMemoryStore``.
+    """
     try:
         # Get LLM URLs from environment (agnostic service name)
         llm_primary_url = get_env_with_default("LLM_BASE_URL", "http://flan:8100", str)
@@ -83,17 +94,11 @@ def create_langchain_executor() -> AgentExecutor:
             ),
         ]
 
-        # Create memory
-        memory = ConversationBufferMemory(
-            memory_key="chat_history", return_messages=True
-        )
-
         # Create agent
         agent = create_openai_functions_agent(llm, tools, prompt)
         executor = AgentExecutor(
             agent=agent,
             tools=tools,
-            memory=memory,
             verbose=True,
             return_intermediate_steps=True,
         )
@@ -128,16 +133,113 @@ def get_current_time() -> str:
     return f"Current time is {now.strftime('%Y-%m-%d %H:%M:%S')}"
 
 
+def create_conversation_memory() -> ConversationMemoryStore:
+    """Create the per-session conversation memory store from environment."""
+    memory = ConversationMemoryStore(
+        max_sessions=get_env_with_default("ORCHESTRATOR_MEMORY_MAX_SESSIONS", 256, int),
+        max_history_tokens=get_env_with_default(
+            "ORCHESTRATOR_MEMORY_MAX_TOKENS", 1024, int
+        ),
+        idle_ttl_seconds=get_env_with_default(
+            "ORCHESTRATOR_MEMORY_IDLE_TTL_SECONDS", 1800.0, float
+        ),
+    )
+    logger.info(
+        "langchain.memory_created",
+        max_sessions=memory.max_sessions,
+        max_history_tokens=memory.max_history_tokens,
+        idle_ttl_seconds=memory.idle_ttl_seconds,
+    )
+    return memory
+
+
+def create_intent_router() -> IntentRouter | None:
+    """Create the fast-path intent router, or None if disabled by environment."""
+    if not get_env_with_default("ORCHESTRATOR_FAST_PATH_ENABLED", True, bool):
+        logger.info("langchain.fast_path_disabled")
+        return None
+    # Answer time requests with the agent's own tool so both paths agree
+    return IntentRouter(handlers={"current_time": get_current_time})
+
+
 async def process_with_langchain(
-    transcript: str, session_id: str, executor: AgentExecutor
+    transcript: str,
+    session_id: str,
+    executor: AgentExecutor,
+    memory: ConversationMemoryStore | None = None,
+    llm_metrics: dict[str, Any] | None = None,
+    router: IntentRouter | None = None,
 ) -> str:
-    """Process transcript using LangChain orchestration."""
+    """Process transcript using LangChain orchestration.
+
+    Args:
+        transcript: User transcript to process
+        session_id: Conversation session key (see ``build_session_id``)
+        executor: Shared agent executor
+        memory: Optional per-session memory; when omitted the call is stateless
+        llm_metrics: Optional LLM metrics dict for prompt-token and fast-path
+            accounting
+        router: Optional fast-path router consulted before the agent
+    """
+    if router is not None:
+        routed = router.route(transcript)
+        if routed is not None:
+            if memory:
+                memory.add_turn(session_id, transcript, routed.response)
+            latency_saved = router.estimate_latency_saved(routed)
+            if llm_metrics:
+                if "llm_fast_path_requests" in llm_metrics:
+                    llm_metrics["llm_fast_path_requests"].add(
+                        1, attributes={"result": "hit", "intent": routed.intent}
+                    )
+                if latency_saved is not None and "llm_fast_path_saved" in llm_metrics:
+                    llm_metrics["llm_fast_path_saved"].record(
+                        latency_saved, attributes={"intent": routed.intent}
+                    )
+            logger.info(
+                "langchain.fast_path_hit",
+                intent=routed.intent,
+                duration_ms=routed.duration_ms,
+                estimated_saved_ms=(
+                    latency_saved * 1000 if latency_saved is not None else None
+                ),
+                session_id=session_id,
+            )
+            return routed.response
+        if llm_metrics and "llm_fast_path_requests" in llm_metrics:
+            llm_metrics["llm_fast_path_requests"].add(
+                1, attributes={"result": "miss", "intent": "none"}
+            )
+
+    agent_start = time.perf_counter()
     try:
-        result = await executor.ainvoke({"input": transcript, "session_id": session_id})
+        chat_history = memory.get_history(session_id) if memory else []
+        history_tokens = memory.get_history_tokens(session_id) if memory else 0
+        prompt_tokens = (
+            _SYSTEM_PROMPT_TOKENS + history_tokens + estimate_tokens(transcript)
+        )
+        if llm_metrics and "llm_prompt_tokens" in llm_metrics:
+            llm_metrics["llm_prompt_tokens"].record(
+                prompt_tokens, attributes={"model": "orchestrator"}
+            )
+        logger.debug(
+            "langchain.prompt_prepared",
+            session_id=session_id,
+            history_messages=len(chat_history),
+            prompt_tokens=prompt_tokens,
+        )
+
+        result = await executor.ainvoke(
+            {"input": transcript, "chat_history": chat_history}
+        )
+        if router is not None:
+            router.record_agent_latency(time.perf_counter() - agent_start)
 
         # Handle different response formats from LangChain
         output = result.get("output")
         if output:
+            if memory:
+                memory.add_turn(session_id, transcript, str(output))
             return str(output)
 
         # Check intermediate steps for tool usage results
@@ -148,6 +250,8 @@ async def process_with_langchain(
             if isinstance(last_step, tuple) and len(last_step) >= 2:
                 tool_result = last_step[1]
                 if tool_result:
+                    if memory:
+                        memory.add_turn(session_id, transcript, str(tool_result))
                     return str(tool_result)
 
         # Fallback response if no output found
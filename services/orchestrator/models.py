@@ -35,6 +35,9 @@ class TranscriptProcessResponse(BaseModel):
     )
     correlation_id: str | None = Field(None, description="Correlation ID for tracing")
     error: str | None = Field(None, description="Error message if processing failed")
+    stage_timings: dict[str, float] | None = Field(
+        None, description="Per-stage processing durations in milliseconds"
+    )
 
 
 class CapabilityInfo(BaseModel):
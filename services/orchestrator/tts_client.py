@@ -6,6 +6,7 @@ This module provides a client for the orchestrator service to communicate with t
 from __future__ import annotations
 
 import time
+from typing import Any
 
 from services.common.config.loader import get_env_with_default
 from services.common.http_client_factory import create_resilient_client
@@ -22,6 +23,7 @@ class TTSClient:
         self,
         base_url: str | None = None,
         timeout: float | None = None,
+        metrics: dict[str, Any] | None = None,
     ) -> None:
         """Initialize TTS client.
 
@@ -29,7 +31,9 @@ class TTSClient:
             base_url: Base URL for the TTS service. If not provided, will use
                      environment variable or default to http://bark:7100
             timeout: Request timeout in seconds. If not provided, will use
-                    environment variable ORCHESTRATOR_TTS_TIMEOUT or default to 90.0
+                    environment variable ORCHESTRATOR_TTS_TIMEOUT or default to 90.0.
+                    This bounds the whole call, including retries.
+            metrics: Optional HTTP metrics dict for retry-budget and hedging counters
         """
         # Default to TTS service URL if not provided (agnostic service name)
         if base_url is None:
@@ -49,6 +53,7 @@ class TTSClient:
             service_name="bark",
             base_url=base_url,
             env_prefix="ORCHESTRATOR_TTS",
+            metrics=metrics,
         )
 
         self._logger.info(
@@ -113,6 +118,7 @@ class TTSClient:
                 json=payload,
                 headers=headers,
                 timeout=self.timeout,
+                deadline=time.monotonic() + self.timeout,
             )
             http_time = (time.time() - http_start) * 1000
 
@@ -23,7 +23,7 @@ from services.common.gpu_utils import (
 )
 from services.common.health import HealthManager
 from services.common.health_endpoints import HealthEndpoints
-from services.common.model_loader import BackgroundModelLoader
+from services.common.model_loader import BackgroundModelLoader, load_phase
 from services.common.model_utils import force_download_faster_whisper
 from services.common.structured_logging import configure_logging, get_logger
 from services.common.tracing import get_observability_manager
@@ -688,7 +688,8 @@ def _load_from_cache() -> Any | None:
     load_start = time.time()
     try:
         # Initialize model with CUDA fallback using shared utility
-        model = _initialize_whisper_model(local_model_path, device, compute_type)
+        with load_phase("deserialize"):
+            model = _initialize_whisper_model(local_model_path, device, compute_type)
 
         load_duration = time.time() - load_start
         total_duration = time.time() - cache_start
@@ -736,6 +737,20 @@ def _load_from_cache() -> Any | None:
         return None
 
 
+def _create_model_loader() -> BackgroundModelLoader:
+    """Model loader trying cache, then download.
+
+    No snapshot: CTranslate2 models are already a converted, memory-mapped
+    format quantized at load time, so there is no post-processing to skip.
+    """
+    return BackgroundModelLoader(
+        cache_loader_func=_load_from_cache,
+        download_loader_func=lambda: _load_with_fallback(MODEL_NAME),
+        logger=logger,
+        loader_name="whisper_model",
+    )
+
+
 def _load_with_fallback(model_name: str = MODEL_NAME) -> Any:
     """Load model with fallback logic (try primary, then tiny.en)."""
     import time
@@ -787,7 +802,8 @@ def _load_with_fallback(model_name: str = MODEL_NAME) -> Any:
         )
 
         # Initialize model with CUDA fallback using shared utility
-        model = _initialize_whisper_model(model_path_or_name, device, compute_type)
+        with load_phase("deserialize"):
+            model = _initialize_whisper_model(model_path_or_name, device, compute_type)
 
         model_init_duration = time.time() - model_init_start
         total_duration = time.time() - download_start
@@ -884,12 +900,7 @@ async def _startup() -> None:
 
         # Initialize model loader with cache-first + download fallback (critical component)
         try:
-            model_loader = BackgroundModelLoader(
-                cache_loader_func=_load_from_cache,
-                download_loader_func=lambda: _load_with_fallback(MODEL_NAME),
-                logger=logger,
-                loader_name="whisper_model",
-            )
+            model_loader = _create_model_loader()
 
             # Start background loading (non-blocking)
             await model_loader.initialize()
@@ -926,9 +937,14 @@ async def _startup() -> None:
                 "yes",
             )
 
+            # 0 enhances each segment in a single pass
+            chunk_seconds = float(os.getenv("STT_ENHANCEMENT_CHUNK_SECONDS", "0"))
             audio_enhancer = AudioEnhancer(
                 enable_metricgan=enable_enhancement,
                 device=os.getenv("STT_ENHANCEMENT_DEVICE", "cpu"),
+                batch_size=int(os.getenv("STT_ENHANCEMENT_BATCH_SIZE", "4")),
+                batch_wait_ms=float(os.getenv("STT_ENHANCEMENT_BATCH_WAIT_MS", "10")),
+                chunk_seconds=chunk_seconds or None,
             )
             logger.info(
                 "stt.audio_enhancer_initialized",
@@ -1001,6 +1017,13 @@ async def _startup() -> None:
             samples = int(16000 * 0.3)
             pcm = (np.zeros(samples, dtype=np.int16)).tobytes()
 
+            # Filtering loads scipy.signal lazily; do it here, not on a request
+            audio_enhancer = getattr(app.state, "audio_enhancer", None)
+            if audio_enhancer is not None:
+                audio_enhancer.apply_high_pass_filter(
+                    np.zeros(samples, dtype=np.float32)
+                )
+
             # Encode to WAV using AudioProcessor to match runtime path
             processor = AudioProcessor("stt")
             wav_data = processor.pcm_to_wav(pcm, 16000, 1, 2)
@@ -1029,12 +1052,20 @@ async def _startup() -> None:
         raise
 
 
+async def _shutdown() -> None:
+    """Stop the audio enhancement batching worker."""
+    audio_enhancer = getattr(app.state, "audio_enhancer", None)
+    if audio_enhancer is not None:
+        await audio_enhancer.close()
+
+
 # Create app using factory pattern
 app = create_service_app(
     "stt",
     "1.0.0",
     title="audio-orchestrator STT (faster-whisper)",
     startup_callback=_startup,
+    shutdown_callback=_shutdown,
     health_manager=_health_manager,
 )
 
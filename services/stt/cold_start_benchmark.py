@@ -0,0 +1,13 @@
+"""Cold-start benchmark for the Whisper model.
+
+Run with ``python -m services.stt.cold_start_benchmark [--runs N] [--no-snapshot]``.
+"""
+
+import sys
+
+from services.common.cold_start import main
+from services.stt.app import _create_model_loader
+
+
+if __name__ == "__main__":
+    sys.exit(main("services.stt.cold_start_benchmark", _create_model_loader))
@@ -5,13 +5,18 @@ separating concerns for better testability and maintainability.
 """
 
 import hashlib
+import logging
 import time
 from collections.abc import Iterable
 from typing import Any, cast
 
 from fastapi import HTTPException, Request
 
-from services.common.structured_logging import correlation_context, get_logger
+from services.common.structured_logging import (
+    correlation_context,
+    get_logger,
+    log_enabled,
+)
 
 logger = get_logger(__name__, service_name="stt")
 
@@ -348,18 +353,19 @@ async def execute_inference(
         decision="starting_transcription_inference",
     )
 
-    # Log device info
-    request_logger.info(
-        "stt.processing_started.device_info",
-        correlation_id=correlation_id,
-        intended_device=device_info.get("intended_device"),
-        actual_device=device_info.get("actual_device", "unknown"),
-        device_verified=device_info.get("device_verified", False),
-        model_on_device=device_info.get("model_on_device"),
-        pytorch_cuda_available=device_info.get("pytorch_cuda_available", False),
-        pytorch_cuda_device_name=device_info.get("pytorch_cuda_device_name"),
-        phase="inference_start",
-    )
+    # Per-request device details are diagnostics; the device is logged at load time
+    if log_enabled(logging.DEBUG):
+        request_logger.debug(
+            "stt.processing_started.device_info",
+            correlation_id=correlation_id,
+            intended_device=device_info.get("intended_device"),
+            actual_device=device_info.get("actual_device", "unknown"),
+            device_verified=device_info.get("device_verified", False),
+            model_on_device=device_info.get("model_on_device"),
+            pytorch_cuda_available=device_info.get("pytorch_cuda_available", False),
+            pytorch_cuda_device_name=device_info.get("pytorch_cuda_device_name"),
+            phase="inference_start",
+        )
 
     # Build transcribe kwargs
     transcribe_kwargs: dict[str, object] = {"beam_size": params["beam_size"]}
@@ -400,15 +406,15 @@ async def execute_inference(
             decision="inference_success",
         )
 
-        # Log device info
-        request_logger.info(
-            "stt.inference_completed.device_info",
-            correlation_id=correlation_id,
-            intended_device=device_info.get("intended_device"),
-            actual_device=device_info.get("actual_device", "unknown"),
-            model_on_device=device_info.get("model_on_device"),
-            phase="inference_complete",
-        )
+        if log_enabled(logging.DEBUG):
+            request_logger.debug(
+                "stt.inference_completed.device_info",
+                correlation_id=correlation_id,
+                intended_device=device_info.get("intended_device"),
+                actual_device=device_info.get("actual_device", "unknown"),
+                model_on_device=device_info.get("model_on_device"),
+                phase="inference_complete",
+            )
     except (RuntimeError, OSError) as e:
         inference_duration = time.time() - inference_start
         error_str = str(e).lower()
@@ -28,6 +28,7 @@ from services.common.config.presets import WakeConfig
 from services.common.health import HealthManager
 from services.common.health_endpoints import HealthEndpoints
 from services.common.audio_enhancement import AudioEnhancer
+from services.common.audio_kernels import pcm_bytes, pcm_samples, resample
 from services.common.structured_logging import configure_logging, get_logger
 from services.common.surfaces.types import AudioSegment
 from services.common.tracing import get_observability_manager
@@ -85,9 +86,12 @@ async def _startup() -> None:
                 "1",
                 "yes",
             )
+            # Uploads can be far longer than live segments; 0 disables chunking
+            chunk_seconds = float(os.getenv("TESTING_ENHANCEMENT_CHUNK_SECONDS", "4"))
             audio_enhancer = AudioEnhancer(
                 enable_metricgan=enable_enhancement,
                 device=os.getenv("TESTING_ENHANCEMENT_DEVICE", "cpu"),
+                chunk_seconds=chunk_seconds or None,
             )
             app.state.audio_enhancer = audio_enhancer
             logger.info(
@@ -109,6 +113,9 @@ async def _shutdown() -> None:
     """Service shutdown event handler."""
     logger.info("Testing UI service shutting down")
     await client.aclose()
+    audio_enhancer = getattr(app.state, "audio_enhancer", None)
+    if audio_enhancer is not None:
+        await audio_enhancer.close()
     # Health manager will handle shutdown automatically
 
 
@@ -412,8 +419,6 @@ def _get_wake_scores_for_debugging(
     Returns:
         Scores dict with phrase -> score mapping, or None if processing fails
     """
-    import audioop
-
     if not pcm or wake_detector._model is None:
         return None
 
@@ -421,7 +426,9 @@ def _get_wake_scores_for_debugging(
     target_rate = wake_detector._target_sample_rate
     if sample_rate != target_rate:
         try:
-            converted, _ = audioop.ratecv(pcm, 2, 1, sample_rate, target_rate, None)
+            converted = pcm_bytes(
+                resample(pcm_samples(pcm, 2), sample_rate, target_rate), 2
+            )
         except Exception:
             return None
     else:
@@ -0,0 +1,133 @@
+"""Tests for the HealthManager background dependency prober."""
+
+import asyncio
+import time
+
+import pytest
+
+from services.common.health import HealthManager, HealthStatus
+
+
+@pytest.mark.asyncio
+async def test_readiness_reads_snapshot_without_checking():
+    """Readiness calls are served from the snapshot, not by running checks."""
+    hm = HealthManager("test-service")
+    calls = {"count": 0}
+
+    async def dep_check() -> bool:
+        calls["count"] += 1
+        await asyncio.sleep(0.05)
+        return True
+
+    hm.register_dependency("dep", dep_check)
+    hm.mark_startup_complete()
+    hm.start_background_probing(interval_seconds=60.0)
+    try:
+        assert await hm.wait_until_ready(timeout=1.0)
+        probes = calls["count"]
+
+        start = time.perf_counter()
+        for _ in range(100):
+            assert await hm.check_ready() is True
+            status = await hm.get_health_status()
+        elapsed = time.perf_counter() - start
+
+        assert calls["count"] == probes
+        assert status.status == HealthStatus.HEALTHY
+        assert status.details["dependencies"]["dep"]["cached"] is True
+        assert elapsed < 0.5
+    finally:
+        await hm.stop_background_probing()
+
+
+@pytest.mark.asyncio
+async def test_prober_refreshes_dependencies_concurrently():
+    """Every dependency is re-probed on its interval, checks running together."""
+    hm = HealthManager("test-service")
+    starts: dict[str, list[float]] = {"a": [], "b": []}
+
+    def make_check(name: str):
+        async def check() -> bool:
+            starts[name].append(time.monotonic())
+            await asyncio.sleep(0.05)
+            return True
+
+        return check
+
+    hm.register_dependency("a", make_check("a"))
+    hm.register_dependency("b", make_check("b"))
+    hm.start_background_probing(interval_seconds=0.1, jitter=0.0)
+    try:
+        await asyncio.sleep(0.45)
+    finally:
+        await hm.stop_background_probing()
+
+    assert len(starts["a"]) >= 2
+    assert len(starts["b"]) >= 2
+    assert abs(starts["a"][0] - starts["b"][0]) < 0.03
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_wakes_on_probe():
+    """Waiters wake when a probe reports the dependency available."""
+    hm = HealthManager("test-service")
+    state = {"ready": False}
+    hm.register_dependency("model", lambda: state["ready"])
+    hm.mark_startup_complete()
+    hm.start_background_probing(interval_seconds=0.05, jitter=0.0)
+    try:
+        assert await hm.check_ready() is False
+        asyncio.get_running_loop().call_later(0.1, state.update, {"ready": True})
+
+        start = time.monotonic()
+        assert await hm.wait_until_ready(timeout=2.0, poll_interval=5.0)
+        assert time.monotonic() - start < 1.0
+    finally:
+        await hm.stop_background_probing()
+
+
+@pytest.mark.asyncio
+async def test_failing_dependency_backs_off():
+    """Errors back off exponentially; not-ready results keep the interval."""
+    hm = HealthManager("test-service")
+    calls = {"error": 0, "not_ready": 0}
+
+    def erroring() -> bool:
+        calls["error"] += 1
+        raise ConnectionError("refused")
+
+    def not_ready() -> bool:
+        calls["not_ready"] += 1
+        return False
+
+    hm.register_dependency("error", erroring)
+    hm.register_dependency("not_ready", not_ready)
+    hm.start_background_probing(interval_seconds=0.05, jitter=0.0)
+    try:
+        await asyncio.sleep(0.6)
+    finally:
+        await hm.stop_background_probing()
+
+    assert calls["not_ready"] >= 8
+    assert calls["error"] <= 4
+    snapshot = hm.get_dependency_snapshot()
+    assert snapshot["error"]["error_type"] == "ConnectionError"
+    assert snapshot["not_ready"]["available"] is False
+
+
+@pytest.mark.asyncio
+async def test_unprobed_dependency_checked_inline():
+    """Dependencies registered after the prober's last pass are checked once inline."""
+    hm = HealthManager("test-service")
+    hm.mark_startup_complete()
+    hm.start_background_probing(interval_seconds=60.0)
+    try:
+        await asyncio.sleep(0)
+        hm.register_dependency("late", lambda: True)
+
+        status = await hm.get_health_status()
+
+        assert status.details["dependencies"]["late"]["available"] is True
+        assert "late" in hm.get_dependency_snapshot()
+    finally:
+        await hm.stop_background_probing()
@@ -0,0 +1,78 @@
+"""Tests for deferred heavy imports and the import-time budget harness."""
+
+import sys
+
+import pytest
+
+from services.common.lazy_imports import LazyModule, lazy_import
+from services.tests.measure_import_time import (
+    EntryPoint,
+    ImportProfile,
+    check_entry_point,
+    parse_importtime,
+    profile_import,
+)
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       900 |       1020 |   json
+import time:        50 |         50 |   wave
+import time:      2000 |       3070 | services.example
+"""
+
+
+def test_lazy_import_defers_until_attribute_access(monkeypatch):
+    """The real module loads on first attribute access, not at lazy_import."""
+    monkeypatch.delitem(sys.modules, "wave", raising=False)
+
+    wave = lazy_import("wave")
+
+    assert isinstance(wave, LazyModule)
+    assert "wave" not in sys.modules
+    assert wave.Error is sys.modules["wave"].Error
+
+
+def test_lazy_import_fails_fast_when_missing():
+    """A missing package still raises at import time, with the hint."""
+    with pytest.raises(ImportError, match="install the thing"):
+        lazy_import("definitely_not_installed_pkg", "install the thing")
+
+
+def test_parse_importtime():
+    """Importtime lines become records with nesting depth."""
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("_json", 2),
+        ("json", 1),
+        ("wave", 1),
+        ("services.example", 0),
+    ]
+    profile = ImportProfile("services.example", 3.07, records)
+    assert [r.module for r in profile.top()] == ["json", "wave"]
+
+
+def test_budget_and_deferred_violations():
+    """Slow imports and eagerly imported deferred modules are both reported."""
+    profile = ImportProfile(
+        "services.example", 3.07, parse_importtime(IMPORTTIME_OUTPUT)
+    )
+
+    assert check_entry_point(EntryPoint("services.example", 10.0), profile) == []
+    violations = check_entry_point(
+        EntryPoint("services.example", 1.0, deferred=("json",)), profile
+    )
+    assert len(violations) == 2
+    assert "budget 1ms" in violations[0]
+    assert "imports json eagerly" in violations[1]
+
+
+@pytest.mark.parametrize("module", ["services.common.config", "services.common.audio"])
+def test_shared_modules_keep_heavy_imports_deferred(module):
+    """Logging/config and audio helpers import neither FastAPI nor librosa."""
+    profile = profile_import(module, runs=1)
+
+    assert profile.error is None
+    assert not {"fastapi", "librosa", "soundfile", "scipy.signal"} & profile.modules
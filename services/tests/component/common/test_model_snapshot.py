@@ -0,0 +1,176 @@
+"""Tests for snapshot restores and load-time breakdowns in the model loader."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from services.common.model_loader import BackgroundModelLoader, load_phase
+from services.common.model_snapshot import SNAPSHOT_FORMAT, ModelSnapshot
+from services.common.structured_logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class FakeSnapshot:
+    """Snapshot stand-in recording saves and serving a fixed restore."""
+
+    def __init__(self, restored: Any = None):
+        self.path = Path("/snapshots/fake")
+        self.restored = restored
+        self.saved: list[Any] = []
+
+    def load(self) -> Any:
+        return self.restored
+
+    def save(self, model: Any) -> Path:
+        time.sleep(0.01)
+        self.saved.append(model)
+        return self.path
+
+
+def _loader(snapshot: FakeSnapshot, cache_loader=None) -> BackgroundModelLoader:
+    return BackgroundModelLoader(
+        cache_loader_func=cache_loader or (lambda: "cached-model"),
+        download_loader_func=lambda: "downloaded-model",
+        logger=logger,
+        loader_name="test_model",
+        snapshot=snapshot,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_hit_skips_cache_load():
+    """A usable snapshot is the model; the cache loader never runs."""
+    calls = {"cache": 0}
+
+    def cache_loader() -> str:
+        calls["cache"] += 1
+        return "cached-model"
+
+    snapshot = FakeSnapshot(restored="restored-model")
+    loader = _loader(snapshot, cache_loader)
+
+    assert await loader.ensure_loaded()
+
+    assert loader.get_model() == "restored-model"
+    assert calls["cache"] == 0
+    status = loader.get_status()
+    assert status["method"] == "snapshot"
+    assert status["snapshot"] == "restored"
+    assert "snapshot_load" in status["breakdown_ms"]
+    assert snapshot.saved == []
+    await loader.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_cache_load_writes_snapshot():
+    """After a snapshot miss the loaded model is snapshotted in the background."""
+    snapshot = FakeSnapshot()
+    loader = _loader(snapshot)
+
+    assert await loader.ensure_loaded()
+    assert loader.get_status()["method"] == "cache"
+
+    await loader.wait_for_snapshot()
+    assert snapshot.saved == ["cached-model"]
+    status = loader.get_status()
+    assert status["snapshot"] == "saved"
+    assert {"snapshot_load", "cache_load", "snapshot_save"} <= set(
+        status["breakdown_ms"]
+    )
+    await loader.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_save_failure_keeps_model(monkeypatch):
+    """A failed snapshot write is reported but does not unload the model."""
+    snapshot = FakeSnapshot()
+
+    def failing_save(model: Any) -> Path:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(snapshot, "save", failing_save)
+    loader = _loader(snapshot)
+
+    assert await loader.ensure_loaded()
+    await loader.wait_for_snapshot()
+
+    assert loader.is_loaded()
+    assert loader.get_status()["snapshot"] == "failed"
+    await loader.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_disabled_by_env(monkeypatch):
+    """MODEL_SNAPSHOT_ENABLED=false ignores the snapshot entirely."""
+    monkeypatch.setenv("MODEL_SNAPSHOT_ENABLED", "false")
+    snapshot = FakeSnapshot(restored="restored-model")
+    loader = _loader(snapshot)
+
+    assert await loader.ensure_loaded()
+
+    assert loader.get_model() == "cached-model"
+    assert "snapshot" not in loader.get_status()
+    await loader.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_load_phase_records_breakdown_from_loader_thread():
+    """Phases timed inside a threaded loader function land in the status."""
+
+    def cache_loader() -> str:
+        with load_phase("deserialize"):
+            time.sleep(0.02)
+        with load_phase("compile"):
+            pass
+        return "cached-model"
+
+    loader = BackgroundModelLoader(
+        cache_loader_func=cache_loader,
+        download_loader_func=lambda: "downloaded-model",
+        logger=logger,
+        loader_name="test_model",
+    )
+
+    assert await loader.ensure_loaded()
+
+    breakdown = loader.get_status()["breakdown_ms"]
+    assert breakdown["deserialize"] >= 15
+    assert "compile" in breakdown
+    assert breakdown["cache_load"] >= breakdown["deserialize"]
+    await loader.cleanup()
+
+
+def test_load_phase_outside_load_is_noop():
+    """Timing a phase with no load running does nothing."""
+    with load_phase("deserialize"):
+        pass
+
+
+def test_stale_snapshot_is_ignored(tmp_path):
+    """A snapshot whose fingerprint no longer matches is not used."""
+    snapshot = ModelSnapshot(
+        "model",
+        export=lambda model: model,
+        restore=lambda contents: contents,
+        fingerprint={"model": "flan-t5-large", "torch": "2.5.0"},
+        root=tmp_path,
+    )
+    snapshot.path.mkdir()
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "fingerprint": {"model": "flan-t5-large", "torch": "2.4.0"},
+        "components": {},
+    }
+    (snapshot.path / "manifest.json").write_text(json.dumps(manifest))
+
+    assert not snapshot.exists()
+    assert snapshot.load() is None
+
+    manifest["fingerprint"]["torch"] = "2.5.0"
+    (snapshot.path / "manifest.json").write_text(json.dumps(manifest))
+    assert snapshot.exists()
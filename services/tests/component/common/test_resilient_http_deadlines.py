@@ -0,0 +1,227 @@
+"""Tests for deadlines, retry budgets and hedged requests in the HTTP clients."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from services.common.http_client import (
+    DeadlineExceededError,
+    RetryBudget,
+    post_with_retries,
+    timeout_within_deadline,
+)
+from services.common.resilient_http import ResilientHTTPClient
+
+
+def _resilient_client(handler, **kwargs) -> ResilientHTTPClient:
+    return ResilientHTTPClient(
+        service_name="upstream",
+        base_url="http://upstream:8000",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def test_timeout_within_deadline_caps_timeouts():
+    """Timeouts shrink to the time left before the deadline."""
+    deadline = time.monotonic() + 1.0
+
+    assert timeout_within_deadline(5.0, None) == 5.0
+    assert timeout_within_deadline(0.5, deadline) == 0.5
+    assert timeout_within_deadline(5.0, deadline) <= 1.0
+    assert timeout_within_deadline(None, deadline) <= 1.0
+
+    capped = timeout_within_deadline(httpx.Timeout(10.0, connect=0.2), deadline)
+    assert capped.connect == 0.2
+    assert capped.read <= 1.0
+
+    with pytest.raises(DeadlineExceededError):
+        timeout_within_deadline(5.0, time.monotonic() - 0.1)
+
+
+def test_retry_budget_limits_retries_to_ratio():
+    """Retries are capped at the configured fraction of recent requests."""
+    on_exhausted = Mock()
+    budget = RetryBudget(
+        ratio=0.2, min_retries_per_second=0.0, on_exhausted=on_exhausted
+    )
+    for _ in range(10):
+        budget.record_request()
+
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    assert budget.exhausted == 1
+    on_exhausted.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_post_stops_retrying_at_deadline():
+    """No retry starts that could not finish before the deadline."""
+    attempts = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["count"] += 1
+        return httpx.Response(503)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        start = time.monotonic()
+        with pytest.raises(httpx.HTTPStatusError):
+            await post_with_retries(
+                client,
+                "http://upstream/work",
+                json={},
+                max_retries=5,
+                deadline=time.monotonic() + 0.3,
+            )
+        elapsed = time.monotonic() - start
+
+    # The first backoff (0.5s) already overruns the 0.3s deadline
+    assert attempts["count"] == 1
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_post_stops_retrying_when_budget_exhausted():
+    """An exhausted retry budget turns the first failure into the final one."""
+    attempts = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["count"] += 1
+        return httpx.Response(503)
+
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await post_with_retries(
+                client,
+                "http://upstream/work",
+                json={},
+                max_retries=3,
+                retry_budget=budget,
+            )
+
+    assert attempts["count"] == 1
+    assert budget.exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary():
+    """A hedge is sent after the observed p95 and the faster copy wins."""
+    calls = {"count": 0}
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200, json={"copy": "primary"})
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    metrics = {"http_client_hedged_requests": Mock()}
+    client = _resilient_client(handler, hedge_min_samples=5, metrics=metrics)
+    for _ in range(5):
+        client._record_outcome(client._replicas[0], 0.05, 200)
+
+    start = time.monotonic()
+    response = await client.get("/lookup", hedge=True)
+    elapsed = time.monotonic() - start
+
+    assert response.json() == {"copy": "hedge"}
+    assert elapsed < 0.5
+    await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+    metrics["http_client_hedged_requests"].add.assert_called_once_with(
+        1, attributes={"service": "upstream", "winner": "hedge"}
+    )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """Requests that finish within the p95 never send a second copy."""
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(200)
+
+    client = _resilient_client(handler, hedge_min_samples=5, hedge_idempotent=True)
+    for _ in range(5):
+        client._record_outcome(client._replicas[0], 0.5, 200)
+
+    await client.get("/lookup")
+
+    assert calls["count"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedging_waits_for_latency_samples():
+    """Without enough observed latencies there is no p95 to hedge on."""
+    client = _resilient_client(
+        lambda _request: httpx.Response(200), hedge_min_samples=5
+    )
+
+    assert client.latency_p95 is None
+    await client.get("/lookup", hedge=True)
+    assert client.latency_p95 is None
+    await client.close()
+
+
+def test_retry_budget_prunes_requests_without_retries():
+    """Recording requests alone keeps only the current window."""
+    budget = RetryBudget(window_seconds=0.0)
+
+    for _ in range(10_000):
+        budget.record_request()
+
+    assert len(budget._requests) < 10_000
+
+
+@pytest.mark.asyncio
+async def test_each_call_records_one_request_in_budget():
+    """GETs count toward the budget, and a hedged POST counts once."""
+    calls = {"count": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 4:
+            await asyncio.sleep(0.5)
+        return httpx.Response(200)
+
+    client = _resilient_client(handler, hedge_min_samples=5)
+    for _ in range(5):
+        client._record_outcome(client._replicas[0], 0.05, 200)
+
+    await client.get("/lookup")
+    await client.put("/item", json={})
+    await client.delete("/item")
+    assert len(client._retry_budget._requests) == 3
+
+    await client.post_with_retry("/work", json={}, hedge=True)
+
+    assert calls["count"] == 5  # The slow POST and its hedge
+    assert len(client._retry_budget._requests) == 4
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_does_not_count_against_replica():
+    """A caller whose deadline already passed cannot trip the circuit."""
+    client = _resilient_client(lambda _request: httpx.Response(200))
+
+    for _ in range(10):
+        with pytest.raises(DeadlineExceededError):
+            await client.post_with_retry(
+                "/work", json={}, deadline=time.monotonic() - 1.0
+            )
+
+    assert client._replicas[0].circuit.get_state().value == "closed"
+    await client.close()
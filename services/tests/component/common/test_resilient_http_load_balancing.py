@@ -0,0 +1,270 @@
+"""Tests for client-side load balancing across upstream replicas."""
+
+import asyncio
+from collections import Counter
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from services.common.circuit_breaker import CircuitBreakerConfig, CircuitState
+from services.common.resilient_http import (
+    ResilientHTTPClient,
+    ServiceUnavailableError,
+    split_base_urls,
+)
+from services.tests.measure_load_balancing import compare_load_balancing
+
+
+URLS = ["http://replica-a", "http://replica-b", "http://replica-c"]
+
+
+def _client(handler, urls=URLS, **kwargs) -> ResilientHTTPClient:
+    return ResilientHTTPClient(
+        service_name="upstream",
+        base_url=urls,
+        transport=httpx.MockTransport(handler),
+        circuit_config=CircuitBreakerConfig(
+            failure_threshold=2, timeout_seconds=60.0, max_timeout_seconds=60.0
+        ),
+        **kwargs,
+    )
+
+
+def _hosts(handler_hits: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler_hits.append(request.url.host)
+        return httpx.Response(200)
+
+    return handler
+
+
+def test_split_base_urls():
+    """A comma-separated setting becomes one URL per replica."""
+    assert split_base_urls("http://a:9000/, http://b:9000") == [
+        "http://a:9000",
+        "http://b:9000",
+    ]
+    assert split_base_urls(["http://a"]) == ["http://a"]
+    with pytest.raises(ValueError):
+        split_base_urls(" , ")
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_avoids_slow_replica():
+    """Pick-two routing sends traffic to the replica with the lower load."""
+    hits: list[str] = []
+    client = _client(_hosts(hits), urls=URLS[:2])
+    slow, fast = client._replicas
+    slow.latency_ewma = 1.0
+    fast.latency_ewma = 0.01
+
+    for _ in range(20):
+        await client.get("/work")
+
+    assert Counter(hits) == {"replica-b": 20}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_affinity_key_pins_replica_until_ejected():
+    """Keys stay on one replica; only the ejected replica's keys move."""
+    hits: list[str] = []
+    client = _client(_hosts(hits))
+    keys = [f"user-{i}" for i in range(30)]
+
+    def placement() -> dict[str, str]:
+        placed = {}
+        for key in keys:
+            replica, _ = client._select_replica(key)
+            assert replica is not None
+            placed[key] = replica.base_url
+        return placed
+
+    before = placement()
+    assert placement() == before
+    assert len(set(before.values())) == 3
+
+    ejected = client._replicas[0]
+    for _ in range(2):
+        client._record_outcome(ejected, 0.01, 503)
+    after = placement()
+
+    for key, url in before.items():
+        if url == ejected.base_url:
+            assert after[key] != ejected.base_url
+        else:
+            assert after[key] == url
+
+    await client.post_with_retry("/work", json={}, affinity_key="user-0")
+    assert hits == [after["user-0"].removeprefix("http://")]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pin_by_correlation_id():
+    """With pinning enabled, the correlation ID header is the affinity key."""
+    hits: list[str] = []
+    client = _client(_hosts(hits), pin_by_correlation_id=True)
+
+    for _ in range(10):
+        await client.get("/work", headers={"X-Correlation-ID": "abc"})
+
+    assert len(set(hits)) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_replica_is_ejected():
+    """A replica whose circuit opens stops receiving traffic."""
+    hits: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.host)
+        return httpx.Response(503 if request.url.host == "replica-a" else 200)
+
+    metrics = {"http_client_replica_ejections": Mock()}
+    client = _client(handler, urls=URLS[:2], metrics=metrics)
+    for _ in range(30):
+        await client.get("/work")
+
+    assert hits.count("replica-a") == 2
+    assert client._replicas[0].circuit.get_state() == CircuitState.OPEN
+    metrics["http_client_replica_ejections"].add.assert_called_once_with(
+        1, attributes={"service": "upstream", "replica": "http://replica-a"}
+    )
+    stats = client.get_upstream_stats()
+    assert stats["circuit_state"] == "closed"
+    assert [r["circuit_state"] for r in stats["replicas"]] == ["open", "closed"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_all_replicas_ejected_raises():
+    """With every circuit open the upstream is unavailable."""
+    client = _client(lambda _request: httpx.Response(503), urls=URLS[:2])
+    for replica in client._replicas:
+        for _ in range(2):
+            client._record_outcome(replica, 0.01, 503)
+
+    with pytest.raises(ServiceUnavailableError):
+        await client.get("/work")
+    assert client.get_circuit_stats()["state"] == "open"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_recovering_replica_gets_one_trial_at_a_time():
+    """Selection leaves circuits alone; a recovering replica takes one trial."""
+    hits: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.host)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200)
+
+    client = _client(handler, urls=URLS[:2])
+    recovering, healthy = client._replicas
+    for _ in range(2):
+        client._record_outcome(recovering, 0.01, 503)
+    # Past the open timeout, so the next request may be a trial
+    recovering.circuit._last_failure_time = time.time() - 600
+
+    assert recovering.admits_request()
+    assert client._select_replica(exclude=(recovering,)) == (healthy, False)
+    assert recovering.circuit.get_state() == CircuitState.OPEN
+
+    await asyncio.gather(*(client.get("/work") for _ in range(20)))
+
+    assert hits.count("replica-a") == 1
+    assert hits.count("replica-b") == 19
+    assert recovering.circuit.get_state() == CircuitState.HALF_OPEN
+    assert not recovering.trial_in_flight
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_finishing_call_keeps_another_calls_trial():
+    """Only the call that took a half-open trial frees it."""
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200)
+
+    client = _client(slow, urls=URLS[:1])
+    [replica] = client._replicas
+    closed_call = asyncio.ensure_future(client.get("/work"))
+    await asyncio.sleep(0.01)
+    replica.circuit._transition_to_open()
+    replica.circuit._last_failure_time = time.time() - 600
+    trial_call = asyncio.ensure_future(client.get("/work"))
+    await asyncio.sleep(0.01)
+    assert replica.trial_in_flight
+
+    await closed_call
+    assert replica.trial_in_flight
+
+    await trial_call
+    assert not replica.trial_in_flight
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_retry_moves_to_another_replica(monkeypatch):
+    """A failed attempt is retried on another replica, not the one that failed."""
+    hits: list[str] = []
+    monkeypatch.setattr("services.common.http_client.DEFAULT_BACKOFF_SECONDS", 0.01)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.host)
+        return httpx.Response(503 if request.url.host == "replica-a" else 200)
+
+    client = _client(handler, urls=URLS[:2])
+    key = next(
+        f"user-{i}"
+        for i in range(100)
+        if client._select_replica(f"user-{i}")[0] is client._replicas[0]
+    )
+
+    response = await client.post_with_retry(
+        "/work", json={}, max_retries=2, affinity_key=key
+    )
+
+    assert response.status_code == 200
+    assert hits == ["replica-a", "replica-b"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_goes_to_another_replica():
+    """The hedged copy is sent to a different replica than the primary."""
+    hits: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.host)
+        if len(hits) == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"replica": request.url.host})
+
+    client = _client(handler, urls=URLS[:2], hedge_min_samples=5)
+    for _ in range(5):
+        client._record_outcome(client._replicas[0], 0.05, 200)
+
+    response = await client.get("/work", hedge=True)
+
+    assert len(hits) == 2
+    assert hits[0] != hits[1]
+    assert response.json()["replica"] == hits[1]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_improves_tail_latency():
+    """Against stubs with one slow replica, pick-two beats round-robin at p95."""
+    results = await compare_load_balancing(requests=150, concurrency=8)
+
+    round_robin = results["round_robin"]
+    least_loaded = results["least_loaded"]
+    assert least_loaded["p95"] < round_robin["p95"]
+    assert least_loaded["served"]["replica-slow"] < 50
@@ -0,0 +1,181 @@
+"""Tests for passive health tracking in ResilientHTTPClient."""
+
+import time
+
+import httpx
+import pytest
+
+from services.common.circuit_breaker import CircuitBreakerConfig, CircuitState
+from services.common.resilient_http import ResilientHTTPClient, ServiceUnavailableError
+
+
+def _client_with_transport(
+    handler, *, failure_threshold: int = 2, **kwargs
+) -> ResilientHTTPClient:
+    client = ResilientHTTPClient(
+        service_name="upstream",
+        base_url="http://upstream:8000",
+        circuit_config=CircuitBreakerConfig(
+            failure_threshold=failure_threshold,
+            success_threshold=1,
+            timeout_seconds=0.05,
+            max_timeout_seconds=0.05,
+        ),
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+    # Leave the startup grace period so health checks would really be sent
+    client._service_start_time = time.time() - 600.0
+    client._last_health_check = 0.0
+    return client
+
+
+@pytest.mark.asyncio
+async def test_steady_state_requests_make_no_health_calls():
+    """With a closed circuit, requests go straight to the upstream."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client_with_transport(handler)
+    for _ in range(5):
+        await client.post_with_retry("/work", json={}, max_retries=1)
+        await client.get("/status")
+
+    assert "/health/ready" not in paths
+    assert len(paths) == 10
+    assert client.get_upstream_stats()["healthy"] is True
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_and_timeouts_open_circuit():
+    """5xx responses and timeouts count as failures and open the circuit."""
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(503)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = _client_with_transport(handler, failure_threshold=2)
+    response = await client.get("/status")
+    assert response.status_code == 503
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get("/status")
+
+    assert client._replicas[0].circuit.get_state() == CircuitState.OPEN
+    with pytest.raises(ServiceUnavailableError):
+        await client.get("/status")
+    assert calls["count"] == 2
+    assert client.get_upstream_stats()["healthy"] is False
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_each_retry_attempt_is_recorded_separately(monkeypatch):
+    """Retried 5xx reach the circuit; backoff sleeps stay out of the latency."""
+    statuses = iter([503, 503, 200])
+    monkeypatch.setattr("services.common.http_client.DEFAULT_BACKOFF_SECONDS", 0.1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses))
+
+    client = _client_with_transport(handler, failure_threshold=5)
+    outcomes: list[tuple[float, int | None]] = []
+    record_outcome = client._record_outcome
+
+    def spy(replica, elapsed, status_code):
+        outcomes.append((elapsed, status_code))
+        record_outcome(replica, elapsed, status_code)
+
+    monkeypatch.setattr(client, "_record_outcome", spy)
+
+    response = await client.post_with_retry("/work", json={}, max_retries=3)
+
+    assert response.status_code == 200
+    assert [status for _, status in outcomes] == [503, 503, 200]
+    assert all(elapsed < 0.1 for elapsed, _ in outcomes)
+    assert client.latency_ewma < 0.1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_mark_upstream_unhealthy():
+    """A 4xx means the upstream is serving; it is not a circuit failure."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(422)
+
+    client = _client_with_transport(handler, failure_threshold=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.post_with_retry("/work", json={}, max_retries=1)
+
+    assert client._replicas[0].circuit.get_state() == CircuitState.CLOSED
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_probes_before_request():
+    """Only a recovering circuit triggers an active /health/ready probe."""
+    paths: list[str] = []
+    state = {"fail": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/health/ready":
+            return httpx.Response(200)
+        return httpx.Response(500 if state["fail"] else 200)
+
+    client = _client_with_transport(handler, failure_threshold=1)
+    await client.get("/work")
+    assert client._replicas[0].circuit.get_state() == CircuitState.OPEN
+
+    state["fail"] = False
+    time.sleep(0.2)  # Let the open circuit time out into half-open
+    await client.post_with_retry("/work", json={}, max_retries=1)
+
+    assert paths == ["/work", "/health/ready", "/work"]
+    assert client._replicas[0].circuit.get_state() == CircuitState.CLOSED
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_latency_ewma_tracks_responses():
+    """Response latency feeds an EWMA estimate per upstream."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    client = _client_with_transport(handler, latency_ewma_alpha=0.5)
+    assert client.latency_ewma is None
+    assert client.get_upstream_stats()["latency_ewma_ms"] is None
+
+    client._record_outcome(client._replicas[0], 0.1, 200)
+    client._record_outcome(client._replicas[0], 0.3, 200)
+    assert client.latency_ewma == pytest.approx(0.2)
+
+    await client.get("/status")
+    assert client.latency_ewma is not None
+    assert client.latency_ewma < 0.2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_responses_count_as_failures():
+    """Responses slower than slow_request_seconds feed the circuit as failures."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    client = _client_with_transport(
+        handler, failure_threshold=2, slow_request_seconds=1.0
+    )
+    client._record_outcome(client._replicas[0], 2.0, 200)
+    client._record_outcome(client._replicas[0], 2.5, 200)
+
+    assert client._replicas[0].circuit.get_state() == CircuitState.OPEN
+    await client.close()
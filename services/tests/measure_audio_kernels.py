@@ -0,0 +1,194 @@
+"""Microbenchmark of the NumPy PCM kernels against ``audioop``.
+
+Times each conversion on a 20 ms frame (the per-frame hot path) and on a
+10 s buffer (whole segments), from 48 kHz stereo 16-bit PCM, plus the full
+``AudioContract.normalize_audio`` path with a stream resampler and the
+drift-correction time stretch (5% speed-up on canonical 16 kHz audio)::
+
+    python -m services.tests.measure_audio_kernels --repeat 200
+
+``audioop`` columns are empty on Python 3.13+, where the module was removed,
+and for the time stretch, which has no ``audioop`` counterpart.
+"""
+
+import argparse
+from collections.abc import Callable
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+import warnings
+
+import numpy as np
+
+from services.common.audio_kernels import (
+    Resampler,
+    TimeStretcher,
+    convert_width,
+    mix_to_mono,
+    pcm_bytes,
+    pcm_samples,
+    resample,
+    rms,
+)
+from services.common.structured_logging import configure_logging
+from services.common.surfaces.audio_contract import AudioContract
+
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:  # Python 3.13+
+    audioop = None
+
+
+SOURCE_RATE = 48000
+TARGET_RATE = 16000
+DURATIONS_S = {"20ms": 0.02, "10s": 10.0}
+
+
+def make_stereo_pcm(seconds: float, seed: int = 0) -> bytes:
+    """48 kHz stereo 16-bit PCM: a tone per channel plus noise."""
+    rng = np.random.default_rng(seed)
+    frames = int(seconds * SOURCE_RATE)
+    t = np.arange(frames) / SOURCE_RATE
+    left = 0.3 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 0.02, frames)
+    right = 0.3 * np.sin(2 * np.pi * 330 * t) + rng.normal(0, 0.02, frames)
+    stereo = np.column_stack((left, right)).reshape(-1)
+    return (stereo * 32767).astype("<i2").tobytes()
+
+
+def operations(
+    stereo: bytes,
+) -> dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]]:
+    """(kernel, audioop) callables per operation on one buffer."""
+    mono = pcm_bytes(mix_to_mono(pcm_samples(stereo, 2), 2), 2)
+    mono_samples = pcm_samples(mono, 2)
+    mono_out = np.empty(len(mono_samples), dtype=np.int16)
+    width_out = np.empty(len(mono_samples), dtype=np.int8)
+    resampler = Resampler(SOURCE_RATE, TARGET_RATE)
+    resample_out = np.empty(
+        resampler.max_output_frames(len(mono_samples)), dtype=np.int16
+    )
+    contract = AudioContract()
+    contract_resampler = contract.create_resampler(SOURCE_RATE)
+    metadata = {"sample_rate": SOURCE_RATE, "channels": 2, "sample_width": 2}
+    canonical = resample(mono_samples, SOURCE_RATE, TARGET_RATE)
+    stretcher = TimeStretcher(TARGET_RATE)
+
+    ops: dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]] = {
+        "to_mono": (
+            lambda: mix_to_mono(pcm_samples(stereo, 2), 2, out=mono_out),
+            None,
+        ),
+        "width_16_to_8": (
+            lambda: convert_width(mono_samples, 2, 1, out=width_out),
+            None,
+        ),
+        "resample_48k_16k": (
+            lambda: resampler.process(mono_samples, out=resample_out),
+            None,
+        ),
+        "rms": (lambda: rms(mono_samples), None),
+        "normalize": (
+            lambda: contract.normalize_audio(
+                stereo, metadata, resampler=contract_resampler
+            ),
+            None,
+        ),
+        "time_stretch": (lambda: stretcher.process(canonical, 1.05), None),
+    }
+    if audioop is not None:
+        state = [None]
+
+        def ratecv() -> bytes:
+            converted, state[0] = audioop.ratecv(
+                mono, 2, 1, SOURCE_RATE, TARGET_RATE, state[0]
+            )
+            return converted
+
+        def normalize() -> bytes:
+            mixed = audioop.tomono(stereo, 2, 0.5, 0.5)
+            converted, state[0] = audioop.ratecv(
+                mixed, 2, 1, SOURCE_RATE, TARGET_RATE, state[0]
+            )
+            return converted
+
+        ops["to_mono"] = (
+            ops["to_mono"][0],
+            lambda: audioop.tomono(stereo, 2, 0.5, 0.5),
+        )
+        ops["width_16_to_8"] = (
+            ops["width_16_to_8"][0],
+            lambda: audioop.lin2lin(mono, 2, 1),
+        )
+        ops["resample_48k_16k"] = (ops["resample_48k_16k"][0], ratecv)
+        ops["rms"] = (ops["rms"][0], lambda: audioop.rms(mono, 2))
+        ops["normalize"] = (ops["normalize"][0], normalize)
+    return ops
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-5 microseconds per call."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=repeat)) / repeat * 1e6
+
+
+def run_benchmark(repeat: int = 200) -> list[dict[str, Any]]:
+    """Time every operation at every buffer duration."""
+    results = []
+    for label, seconds in DURATIONS_S.items():
+        stereo = make_stereo_pcm(seconds)
+        # Long buffers are slow per call; keep total time per cell similar
+        calls = max(1, int(repeat * min(1.0, 0.02 / seconds) * 10))
+        for name, (kernel, reference) in operations(stereo).items():
+            kernel_us = time_call(kernel, calls)
+            audioop_us = time_call(reference, calls) if reference else None
+            results.append(
+                {
+                    "buffer": label,
+                    "operation": name,
+                    "kernel_us": round(kernel_us, 2),
+                    "audioop_us": round(audioop_us, 2) if audioop_us else None,
+                }
+            )
+    return results
+
+
+def format_report(results: list[dict[str, Any]]) -> str:
+    """Human-readable table of the results."""
+    lines = [
+        f"{'buffer':>6}  {'operation':<17}  {'kernel us':>11}  "
+        f"{'audioop us':>11}  {'speedup':>7}"
+    ]
+    for result in results:
+        audioop_us = result["audioop_us"]
+        speedup = f"{audioop_us / result['kernel_us']:6.2f}x" if audioop_us else "-"
+        lines.append(
+            f"{result['buffer']:>6}  {result['operation']:<17}  "
+            f"{result['kernel_us']:11.2f}  "
+            f"{audioop_us if audioop_us is not None else '-':>11}  {speedup:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    # Per-frame debug logs would dominate the 20 ms timings
+    configure_logging("WARNING", json_logs=False)
+    results = run_benchmark(args.repeat)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
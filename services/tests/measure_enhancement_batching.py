@@ -0,0 +1,159 @@
+"""MetricGAN+ enhancement throughput at different micro-batch sizes.
+
+Sends a burst of concurrent segments through ``AudioEnhancer.enhance_audio_bytes``
+(the path the STT service uses) once per batch size and reports segments/s
+and per-segment latency. Segments are synthetic speech-band signals of mixed
+length, so padding to the longest segment in a batch is included in the cost::
+
+    python -m services.tests.measure_enhancement_batching --batch-sizes 1 4 8
+
+MetricGAN+ is loaded (or downloaded) into ``--model-savedir`` first; with
+``--filters-only`` only decoding, high-pass filtering and encoding are timed.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+from services.common.audio_enhancement import AudioEnhancer, encode_audio_bytes
+from services.tests.utils.performance import LatencyStats
+
+
+SAMPLE_RATE = 16000
+
+
+def make_segments(
+    count: int, min_seconds: float = 1.0, max_seconds: float = 4.0, seed: int = 0
+) -> list[bytes]:
+    """WAV segments of random length: harmonic tones plus white noise."""
+    rng = np.random.default_rng(seed)
+    segments = []
+    for _ in range(count):
+        samples = int(rng.uniform(min_seconds, max_seconds) * SAMPLE_RATE)
+        t = np.arange(samples, dtype=np.float32) / SAMPLE_RATE
+        f0 = rng.uniform(100.0, 250.0)
+        audio = sum(
+            np.sin(2 * np.pi * f0 * harmonic * t) / harmonic for harmonic in (1, 2, 3)
+        )
+        audio = 0.2 * audio + rng.normal(0.0, 0.02, samples)
+        segments.append(encode_audio_bytes(audio.astype(np.float32), SAMPLE_RATE, True))
+    return segments
+
+
+async def run_batch_size(
+    batch_size: int,
+    segments: list[bytes],
+    enable_metricgan: bool,
+    model_savedir: str,
+    batch_wait_ms: float,
+) -> dict[str, Any]:
+    """Enhance every segment concurrently with one enhancer of ``batch_size``."""
+    enhancer = AudioEnhancer(
+        enable_metricgan=enable_metricgan,
+        device="cpu",
+        model_savedir=model_savedir,
+        batch_size=batch_size,
+        batch_wait_ms=batch_wait_ms,
+    )
+    try:
+        if enable_metricgan and not await enhancer.ensure_loaded():
+            raise RuntimeError("MetricGAN+ could not be loaded")
+        # Warm up the filter design cache and the model's first forward pass
+        await enhancer.enhance_audio_bytes(segments[0])
+
+        latency = LatencyStats(operation_name=f"batch_{batch_size}")
+
+        async def enhance(segment: bytes) -> None:
+            start = time.perf_counter()
+            await enhancer.enhance_audio_bytes(segment)
+            latency.add_measurement((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(enhance(segment) for segment in segments))
+        elapsed = time.perf_counter() - start
+    finally:
+        await enhancer.close()
+
+    stats = latency.get_stats()
+    audio_seconds = sum((len(segment) - 44) / 2 / SAMPLE_RATE for segment in segments)
+    return {
+        "batch_size": batch_size,
+        "segments": len(segments),
+        "elapsed_s": round(elapsed, 3),
+        "segments_per_s": round(len(segments) / elapsed, 2),
+        "rtf": round(elapsed / audio_seconds, 4),
+        "latency_ms": {key: round(stats[key], 1) for key in ("p50", "p95", "max")},
+    }
+
+
+async def run_benchmark(
+    batch_sizes: list[int],
+    segments: list[bytes],
+    enable_metricgan: bool = True,
+    model_savedir: str = "pretrained_models/metricgan-plus",
+    batch_wait_ms: float = 10.0,
+) -> list[dict[str, Any]]:
+    """Run every batch size over the same segments."""
+    return [
+        await run_batch_size(
+            batch_size, segments, enable_metricgan, model_savedir, batch_wait_ms
+        )
+        for batch_size in batch_sizes
+    ]
+
+
+def format_report(results: list[dict[str, Any]]) -> str:
+    """Human-readable table of the results."""
+    lines = [
+        f"{'batch':>5}  {'segments/s':>10}  {'RTF':>7}  "
+        f"{'p50 ms':>8}  {'p95 ms':>8}  {'speedup':>7}"
+    ]
+    baseline = results[0]["segments_per_s"] if results else 0.0
+    for result in results:
+        lines.append(
+            f"{result['batch_size']:>5}  {result['segments_per_s']:10.2f}  "
+            f"{result['rtf']:7.4f}  {result['latency_ms']['p50']:8.1f}  "
+            f"{result['latency_ms']['p95']:8.1f}  "
+            f"{result['segments_per_s'] / baseline:6.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--segments", type=int, default=32)
+    parser.add_argument("--batch-wait-ms", type=float, default=10.0)
+    parser.add_argument("--model-savedir", default="pretrained_models/metricgan-plus")
+    parser.add_argument(
+        "--filters-only",
+        action="store_true",
+        help="time the pipeline without MetricGAN+",
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run_benchmark(
+            args.batch_sizes,
+            make_segments(args.segments),
+            enable_metricgan=not args.filters_only,
+            model_savedir=args.model_savedir,
+            batch_wait_ms=args.batch_wait_ms,
+        )
+    )
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
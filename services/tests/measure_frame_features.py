@@ -0,0 +1,141 @@
+"""Cost of quality metrics on accumulated speech, from PCM vs from frame features.
+
+At every wake check the Discord wrapper reports RMS, SNR and clarity for all
+frames accumulated so far. This compares computing them from the joined PCM
+(``rms_from_pcm`` plus ``AudioQualityMetrics.calculate_metrics``, which also
+runs an FFT over the whole buffer) with reading the per-frame columns of a
+``FrameFeatureStore``, and reports what filling the store costs per frame::
+
+    python -m services.tests.measure_frame_features --seconds 1 5 15
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+import numpy as np
+
+from services.common.audio_features import FrameFeatureStore
+from services.common.audio_quality import AudioQualityMetrics
+from services.common.structured_logging import configure_logging
+from services.common.surfaces.types import PCMFrame
+from services.discord.audio import rms_from_pcm
+
+
+SAMPLE_RATE = 48000
+FRAME_SAMPLES = 960  # 20 ms
+
+
+def make_frames(seconds: float, seed: int = 0) -> list[bytes]:
+    """20 ms PCM frames of a 150 Hz harmonic signal with noise."""
+    rng = np.random.default_rng(seed)
+    count = int(seconds * SAMPLE_RATE) // FRAME_SAMPLES
+    t = np.arange(count * FRAME_SAMPLES) / SAMPLE_RATE
+    audio = 6000 * np.sin(2 * np.pi * 150 * t) + rng.normal(0, 300, len(t))
+    pcm = audio.astype("<i2").tobytes()
+    step = FRAME_SAMPLES * 2
+    return [pcm[start : start + step] for start in range(0, len(pcm), step)]
+
+
+def fill_store(frames: list[bytes]) -> FrameFeatureStore:
+    """Feature store filled the way the accumulator fills it."""
+    store = FrameFeatureStore()
+    for pcm in frames:
+        frame = PCMFrame(
+            pcm=pcm,
+            timestamp=0.0,
+            rms=rms_from_pcm(pcm),
+            duration=0.02,
+            sequence=0,
+            sample_rate=SAMPLE_RATE,
+        )
+        store.append(frame.samples, SAMPLE_RATE, rms=frame.rms)
+    return store
+
+
+def from_pcm(frames: list[bytes]) -> dict[str, Any]:
+    """Metrics the way the wake check computed them before the feature store."""
+    pcm = b"".join(frames)
+    rms_from_pcm(pcm)
+    frame = PCMFrame(
+        pcm=pcm,
+        timestamp=0.0,
+        rms=0.0,
+        duration=0.0,
+        sequence=0,
+        sample_rate=SAMPLE_RATE,
+    )
+    return asyncio.run(AudioQualityMetrics.calculate_metrics(frame))
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-5 microseconds per call."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=repeat)) / repeat * 1e6
+
+
+def run_benchmark(durations: list[float], repeat: int = 20) -> list[dict[str, Any]]:
+    """Time both metric paths for each accumulated duration."""
+    results = []
+    for seconds in durations:
+        frames = make_frames(seconds)
+        store = fill_store(frames)
+        pcm_us = time_call(lambda frames=frames: from_pcm(frames), repeat)
+        features_us = time_call(
+            lambda store=store: AudioQualityMetrics.metrics_from_features(
+                store, SAMPLE_RATE
+            ),
+            repeat,
+        )
+        append_us = time_call(lambda frames=frames: fill_store(frames), 1) / len(frames)
+        results.append(
+            {
+                "seconds": seconds,
+                "frames": len(frames),
+                "from_pcm_us": round(pcm_us, 1),
+                "from_features_us": round(features_us, 1),
+                "append_us_per_frame": round(append_us, 2),
+            }
+        )
+    return results
+
+
+def format_report(results: list[dict[str, Any]]) -> str:
+    """Human-readable table of the results."""
+    lines = [
+        f"{'seconds':>7}  {'frames':>6}  {'from pcm us':>12}  "
+        f"{'from features us':>16}  {'append us/frame':>15}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['seconds']:7.1f}  {result['frames']:6d}  "
+            f"{result['from_pcm_us']:12.1f}  {result['from_features_us']:16.1f}  "
+            f"{result['append_us_per_frame']:15.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 5.0, 15.0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    # Leave log I/O out of the numbers
+    configure_logging("WARNING", json_logs=False)
+    results = run_benchmark(args.seconds, args.repeat)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Per-frame cost of the Discord receive path: accumulator, VAD and wake gating.
+
+Feeds 20 ms frames of 48 kHz mono 16-bit PCM (a voiced signal, so VAD
+accumulates) through ``AudioProcessorWrapper.register_frame_async`` exactly as
+``DiscordVoice.ingest_voice_packet`` does, and reports time per frame and the
+memory allocated transiently while processing one frame (``tracemalloc`` peak
+above the frame's starting usage)::
+
+    python -m services.tests.measure_frame_path --frames 2000
+
+Wake detection is disabled by default so the numbers cover the per-frame path
+only; ``--wake-checks`` adds a stub detector that never fires, so the wake
+gating (quality metrics on the accumulated audio every fifth frame) is timed
+without the model. Frame timestamps come from a simulated clock that advances
+20 ms per frame, so segments reach the wake-check and maximum durations as
+they would with live audio.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+
+from services.common.structured_logging import configure_logging
+from services.discord import audio_processor_wrapper
+from services.discord.audio import rms_from_pcm
+from services.discord.audio_processor_wrapper import AudioProcessorWrapper
+
+
+SAMPLE_RATE = 48000
+FRAME_SECONDS = 0.02
+
+
+def make_frames(count: int, seed: int = 0) -> list[bytes]:
+    """20 ms PCM frames of a 150 Hz harmonic signal with noise."""
+    rng = np.random.default_rng(seed)
+    samples = int(SAMPLE_RATE * FRAME_SECONDS)
+    t = np.arange(samples * count) / SAMPLE_RATE
+    voiced = sum(
+        np.sin(2 * np.pi * 150 * harmonic * t) / harmonic for harmonic in (1, 2, 3)
+    )
+    audio = 6000 * voiced + rng.normal(0, 300, len(t))
+    pcm = audio.astype("<i2").tobytes()
+    step = samples * 2
+    return [pcm[start : start + step] for start in range(0, len(pcm), step)]
+
+
+class _FrameClock:
+    """``time`` stand-in whose wall clock advances one frame per reading."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        self.now += FRAME_SECONDS
+        return self.now
+
+
+class _NeverWakes:
+    """Wake detector stand-in: a loaded "model" that never detects a phrase."""
+
+    _model = object()
+
+    def detect_audio(self, pcm: bytes, sample_rate: int) -> None:
+        return None
+
+
+def make_wrapper(wake_checks: bool = False) -> AudioProcessorWrapper:
+    """Wrapper configured like the Discord service."""
+    audio_config = SimpleNamespace(
+        enable_vad=True,
+        vad_aggressiveness=1,
+        silence_timeout_seconds=0.75,
+        max_segment_duration_seconds=15.0,
+        min_segment_duration_seconds=0.3,
+        input_sample_rate_hz=SAMPLE_RATE,
+        min_segment_rms_threshold=5.0,
+    )
+    wake_detector: Any = _NeverWakes() if wake_checks else None
+    return AudioProcessorWrapper(
+        audio_config, SimpleNamespace(), wake_detector=wake_detector
+    )
+
+
+async def _process(wrapper: AudioProcessorWrapper, frames: list[bytes]) -> None:
+    for pcm in frames:
+        await wrapper.register_frame_async(
+            1, pcm, rms_from_pcm(pcm), FRAME_SECONDS, SAMPLE_RATE
+        )
+
+
+async def _transient_bytes(
+    wrapper: AudioProcessorWrapper, frames: list[bytes]
+) -> list[int]:
+    transient = []
+    tracemalloc.start()
+    try:
+        for pcm in frames:
+            rms = rms_from_pcm(pcm)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await wrapper.register_frame_async(1, pcm, rms, FRAME_SECONDS, SAMPLE_RATE)
+            transient.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return transient
+
+
+def run_benchmark(frame_count: int = 2000, wake_checks: bool = False) -> dict[str, Any]:
+    """Time and allocation figures for ``frame_count`` frames."""
+    frames = make_frames(frame_count)
+
+    with patch.object(audio_processor_wrapper, "time", _FrameClock()):
+        wrapper = make_wrapper(wake_checks)
+        asyncio.run(_process(wrapper, frames[:100]))
+        start = time.perf_counter()
+        asyncio.run(_process(wrapper, frames))
+        elapsed = time.perf_counter() - start
+
+        transient = np.array(
+            asyncio.run(_transient_bytes(make_wrapper(wake_checks), frames))
+        )
+    return {
+        "frames": frame_count,
+        "wake_checks": wake_checks,
+        "frame_bytes": len(frames[0]),
+        "us_per_frame": round(elapsed / frame_count * 1e6, 2),
+        "transient_bytes_median": int(np.median(transient)),
+        "transient_bytes_p95": int(np.percentile(transient, 95)),
+    }
+
+
+def format_report(result: dict[str, Any]) -> str:
+    """Human-readable summary of the results."""
+    return "\n".join(
+        [
+            f"frames:                  {result['frames']} x {result['frame_bytes']} bytes",
+            f"time per frame:          {result['us_per_frame']:.2f} us",
+            f"transient bytes (p50):   {result['transient_bytes_median']}",
+            f"transient bytes (p95):   {result['transient_bytes_p95']}",
+        ]
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument(
+        "--wake-checks", action="store_true", help="include wake gating"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    # Per-frame debug logs would dominate the timings
+    configure_logging("WARNING", json_logs=False)
+    result = run_benchmark(args.frames, args.wake_checks)
+    print(format_report(result))
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""Import-time budgets and time-to-live measurements for service entry points.
+
+Each entry point is imported in a fresh interpreter under ``python -X importtime``.
+The run fails when an entry point exceeds its import-time budget or eagerly
+imports a module that must stay deferred until first use (torch, transformers,
+librosa, scipy.signal, the OTLP exporters). ``--live`` additionally starts each
+service with uvicorn and reports the time from process start to the first
+successful ``/health/live``.
+
+Run with ``python -m services.tests.measure_import_time [--live] [--json]``.
+"""
+
+import argparse
+from dataclasses import dataclass, field
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any
+
+import httpx
+
+
+# Modules that must only load on first use (model load or first request)
+DEFERRED_MODULES = (
+    "torch",
+    "transformers",
+    "bark",
+    "librosa",
+    "soundfile",
+    "scipy.signal",
+    "opentelemetry.exporter.otlp.proto.http.trace_exporter",
+    "opentelemetry.exporter.otlp.proto.http.metric_exporter",
+)
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    """A module whose import time is budgeted."""
+
+    module: str
+    budget_ms: float
+    deferred: tuple[str, ...] = DEFERRED_MODULES
+    # Served app for the time-to-live measurement (``module:attr``)
+    app: str | None = None
+
+
+ENTRY_POINTS = (
+    EntryPoint("services.stt.app", 2000, app="services.stt.app:app"),
+    EntryPoint("services.flan.app", 1500, app="services.flan.app:app"),
+    EntryPoint("services.bark.app", 1500, app="services.bark.app:app"),
+    EntryPoint("services.guardrails.app", 1500, app="services.guardrails.app:app"),
+    EntryPoint(
+        "services.orchestrator.app",
+        2500,
+        deferred=("torch", "librosa", "soundfile", "scipy.signal"),
+        app="services.orchestrator.app:app",
+    ),
+    EntryPoint(
+        "services.discord.app",
+        3000,
+        deferred=("torch", "transformers", "librosa", "soundfile", "scipy.signal"),
+        app="services.discord.app:app",
+    ),
+    # Shared modules every service (and the Discord bot) imports
+    EntryPoint("services.common.config", 400),
+    EntryPoint("services.common.audio", 300),
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Import profile of one entry point."""
+
+    module: str
+    total_ms: float
+    records: list[ImportRecord] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def modules(self) -> set[str]:
+        return {record.module for record in self.records}
+
+    def top(self, count: int = 5) -> list[ImportRecord]:
+        """Direct imports of the entry point, most expensive first."""
+        index = next(
+            (i for i, r in enumerate(self.records) if r.module == self.module), None
+        )
+        if index is None:
+            return []
+        # importtime prints a module after everything it imported
+        depth = self.records[index].depth
+        children = []
+        for record in reversed(self.records[:index]):
+            if record.depth <= depth:
+                break
+            if record.depth == depth + 1:
+                children.append(record)
+        return sorted(children, key=lambda r: r.cumulative_us, reverse=True)[:count]
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse ``python -X importtime`` stderr into records."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(stripped)) // 2,
+            )
+        )
+    return records
+
+
+def profile_import(module: str, runs: int = 3) -> ImportProfile:
+    """Import ``module`` in fresh interpreters and keep the fastest run.
+
+    The minimum filters out noise from disk cache and CPU contention.
+    """
+    best: ImportProfile | None = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        records = parse_importtime(completed.stderr)
+        entry = next((r for r in records if r.module == module), None)
+        if completed.returncode != 0 or entry is None:
+            lines = completed.stderr.strip().splitlines()
+            return ImportProfile(
+                module, 0.0, records, error=lines[-1] if lines else "import failed"
+            )
+        profile = ImportProfile(module, entry.cumulative_us / 1000, records)
+        if best is None or profile.total_ms < best.total_ms:
+            best = profile
+    assert best is not None
+    return best
+
+
+def check_entry_point(entry: EntryPoint, profile: ImportProfile) -> list[str]:
+    """Budget and deferred-import violations of one profile."""
+    if profile.error:
+        return []
+    violations = []
+    if profile.total_ms > entry.budget_ms:
+        violations.append(
+            f"{entry.module}: import took {profile.total_ms:.0f}ms "
+            f"(budget {entry.budget_ms:.0f}ms)"
+        )
+    eager = sorted(set(entry.deferred) & profile.modules)
+    if eager:
+        violations.append(f"{entry.module}: imports {', '.join(eager)} eagerly")
+    return violations
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def measure_time_to_live(app: str, timeout: float = 120.0) -> float | None:
+    """Milliseconds from process start until ``/health/live`` answers 200.
+
+    Returns:
+        The time to live, or None if the service exited or timed out
+    """
+    port = _free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=dict(os.environ, PYTHONUNBUFFERED="1"),
+    )
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - start < timeout:
+                if process.poll() is not None:
+                    return None
+                try:
+                    response = client.get(f"http://127.0.0.1:{port}/health/live")
+                    if response.status_code == 200:
+                        return (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.05)
+        return None
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print import profiles; exit 1 on a budget violation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="imports per entry point")
+    parser.add_argument(
+        "--live", action="store_true", help="also measure time to /health/live"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    parser.add_argument("modules", nargs="*", help="limit to these entry points")
+    args = parser.parse_args(argv)
+
+    entries = [e for e in ENTRY_POINTS if not args.modules or e.module in args.modules]
+    results: list[dict[str, Any]] = []
+    violations: list[str] = []
+    for entry in entries:
+        profile = profile_import(entry.module, runs=args.runs)
+        entry_violations = check_entry_point(entry, profile)
+        violations.extend(entry_violations)
+        result: dict[str, Any] = {
+            "module": entry.module,
+            "import_ms": round(profile.total_ms, 1),
+            "budget_ms": entry.budget_ms,
+            "error": profile.error,
+            "top": {r.module: round(r.cumulative_us / 1000, 1) for r in profile.top()},
+        }
+        if args.live and entry.app and not profile.error:
+            live_ms = measure_time_to_live(entry.app)
+            result["time_to_live_ms"] = round(live_ms, 1) if live_ms else None
+        results.append(result)
+
+    if args.json:
+        print(json.dumps({"results": results, "violations": violations}, indent=2))
+    else:
+        print("\n=== Import Time ===")
+        for result in results:
+            if result["error"]:
+                print(f"{result['module']:>26}: skipped ({result['error']})")
+                continue
+            line = (
+                f"{result['module']:>26}: {result['import_ms']:7.0f}ms "
+                f"/ {result['budget_ms']:.0f}ms"
+            )
+            if "time_to_live_ms" in result:
+                live = result["time_to_live_ms"]
+                line += f"  live {live:.0f}ms" if live else "  live: failed"
+            top = ", ".join(f"{name} {ms:.0f}ms" for name, ms in result["top"].items())
+            print(f"{line}  [{top}]")
+        for violation in violations:
+            print(f"BUDGET EXCEEDED {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
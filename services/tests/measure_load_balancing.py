@@ -0,0 +1,145 @@
+"""Stub-upstream harness comparing client-side load balancing strategies.
+
+Each stub replica serves a limited number of requests at once with its own
+service time, so a slow replica builds a queue when it receives an equal share
+of traffic. The harness drives the same closed-loop load through
+``ResilientHTTPClient`` with round-robin and least-loaded (pick-two) routing
+and reports the latency distribution of each.
+
+Run with ``python -m services.tests.measure_load_balancing``.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+import random
+import sys
+import time
+from typing import Any
+
+import httpx
+
+from services.common.resilient_http import LoadBalancing, ResilientHTTPClient
+from services.tests.utils.performance import LatencyStats
+
+
+@dataclass
+class StubReplica:
+    """A stub upstream replica with fixed capacity and service time."""
+
+    host: str
+    service_time: float
+    concurrency: int = 2
+    jitter: float = 0.2
+    served: int = 0
+    _slots: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+    async def serve(self) -> httpx.Response:
+        """Serve one request, queueing while every slot is busy."""
+        async with self._slots:
+            self.served += 1
+            spread = random.uniform(1 - self.jitter, 1 + self.jitter)
+            await asyncio.sleep(self.service_time * spread)
+        return httpx.Response(200, json={"replica": self.host})
+
+
+class StubUpstreams:
+    """In-process transport routing requests to stub replicas by host."""
+
+    def __init__(self, replicas: list[StubReplica]):
+        self.replicas = {replica.host: replica for replica in replicas}
+        self.transport = httpx.MockTransport(self._handle)
+
+    @property
+    def base_urls(self) -> list[str]:
+        return [f"http://{host}" for host in self.replicas]
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        return await self.replicas[request.url.host].serve()
+
+
+def default_replicas() -> list[StubReplica]:
+    """Two healthy replicas and one running four times slower."""
+    return [
+        StubReplica("replica-a", service_time=0.02),
+        StubReplica("replica-b", service_time=0.02),
+        StubReplica("replica-slow", service_time=0.08),
+    ]
+
+
+async def measure_strategy(
+    load_balancing: LoadBalancing,
+    replicas: list[StubReplica],
+    requests: int = 300,
+    concurrency: int = 8,
+) -> dict[str, Any]:
+    """Drive closed-loop load through one routing strategy.
+
+    Args:
+        load_balancing: Routing strategy to measure
+        replicas: Fresh stub replicas for this run
+        requests: Total requests to send
+        concurrency: Requests kept in flight
+
+    Returns:
+        Latency summary in milliseconds and requests served per replica
+    """
+    upstreams = StubUpstreams(replicas)
+    client = ResilientHTTPClient(
+        service_name="stub",
+        base_url=upstreams.base_urls,
+        transport=upstreams.transport,
+        load_balancing=load_balancing,
+        max_connections=concurrency,
+    )
+    stats = LatencyStats(operation_name=load_balancing)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one_request() -> None:
+        async with slots:
+            start = time.perf_counter()
+            await client.get("/work")
+            stats.add_measurement((time.perf_counter() - start) * 1000)
+
+    try:
+        await asyncio.gather(*(one_request() for _ in range(requests)))
+    finally:
+        await client.close()
+
+    return {
+        **stats.get_stats(),
+        "served": {host: r.served for host, r in upstreams.replicas.items()},
+    }
+
+
+async def compare_load_balancing(
+    requests: int = 300, concurrency: int = 8
+) -> dict[str, dict[str, Any]]:
+    """Measure round-robin and least-loaded routing against the same stubs."""
+    results: dict[str, dict[str, Any]] = {}
+    strategies: tuple[LoadBalancing, ...] = ("round_robin", "least_loaded")
+    for strategy in strategies:
+        results[strategy] = await measure_strategy(
+            strategy, default_replicas(), requests=requests, concurrency=concurrency
+        )
+    return results
+
+
+async def main() -> int:
+    """Print the latency comparison."""
+    results = await compare_load_balancing()
+
+    print("\n=== Load Balancing Comparison ===")
+    for strategy, stats in results.items():
+        print(
+            f"{strategy:>13}: p50 {stats['p50']:.1f}ms  p95 {stats['p95']:.1f}ms  "
+            f"p99 {stats['p99']:.1f}ms  served {stats['served']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
@@ -0,0 +1,161 @@
+"""Per-request overhead of ``ObservabilityMiddleware`` on a trivial endpoint.
+
+Drives a FastAPI app directly through its ASGI interface (no sockets, no HTTP
+client) so that the only difference between runs is the middleware stack.
+Reports requests/s for the bare app and for the app with the middleware, on a
+plain JSON endpoint and on a chunked ``StreamingResponse``::
+
+    python -m services.tests.measure_middleware_overhead --requests 5000
+
+Metrics instruments are no-op stand-ins, so the numbers cover the
+middleware's own work rather than an OpenTelemetry SDK export pipeline.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from services.common.middleware import ObservabilityMiddleware
+from services.common.structured_logging import configure_logging
+
+
+class _NoopInstrument:
+    def add(self, amount: float, attributes: dict[str, Any] | None = None) -> None:
+        pass
+
+    def record(self, amount: float, attributes: dict[str, Any] | None = None) -> None:
+        pass
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    """Trivial service app, optionally wrapped in the observability middleware."""
+    app = FastAPI()
+    app.state.service_name = "bench"
+    app.state.http_metrics = {
+        "http_requests": _NoopInstrument(),
+        "http_request_duration": _NoopInstrument(),
+        "http_request_logging_duration": _NoopInstrument(),
+    }
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(4):
+                yield b"x" * 640
+
+        return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+    if with_middleware:
+        app.add_middleware(ObservabilityMiddleware)
+    return app
+
+
+async def _request(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    received = False
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            await asyncio.sleep(3600)
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _run(app: FastAPI, path: str, requests: int) -> float:
+    # Warm up routing and the middleware stack, which Starlette builds lazily
+    for _ in range(50):
+        await _request(app, path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await _request(app, path)
+    return requests / (time.perf_counter() - start)
+
+
+def run_benchmark(requests: int = 5000, rounds: int = 3) -> list[dict[str, Any]]:
+    """Best-of-``rounds`` requests/s for each endpoint with and without middleware."""
+    results = []
+    for path in ("/ping", "/stream"):
+        bare = max(
+            asyncio.run(_run(build_app(False), path, requests)) for _ in range(rounds)
+        )
+        wrapped = max(
+            asyncio.run(_run(build_app(True), path, requests)) for _ in range(rounds)
+        )
+        results.append(
+            {
+                "endpoint": path,
+                "bare_rps": round(bare, 1),
+                "middleware_rps": round(wrapped, 1),
+                "overhead_us": round((1 / wrapped - 1 / bare) * 1e6, 1),
+            }
+        )
+    return results
+
+
+def format_report(results: list[dict[str, Any]]) -> str:
+    """Human-readable table of the results."""
+    lines = [
+        f"{'endpoint':<9}  {'bare rps':>10}  {'middleware rps':>14}  {'+us/req':>8}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['endpoint']:<9}  {result['bare_rps']:10.1f}  "
+            f"{result['middleware_rps']:14.1f}  {result['overhead_us']:8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    # Leave log I/O out of the numbers; the middleware's own work stays in
+    configure_logging("WARNING", json_logs=False)
+    results = run_benchmark(args.requests, args.rounds)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Lookup and update cost of ``SurfaceRegistry`` with thousands of surfaces.
+
+Registers surfaces of mixed type, status, priority and capabilities, then
+times each lookup through the registry's indexes against the full scan it
+replaces, plus ``update_surface_status`` (which maintains the indexes)::
+
+    python -m services.tests.measure_surface_registry --surfaces 1000 5000
+
+The scan column filters ``get_all_surfaces()`` with the predicate the lookup
+answers, which is what every lookup cost before the indexes.
+"""
+
+import argparse
+from collections.abc import Callable
+import json
+from pathlib import Path
+import random
+import sys
+import timeit
+from typing import Any
+
+from services.common.structured_logging import configure_logging
+from services.common.surfaces.config import (
+    SurfaceCapabilities,
+    SurfaceConfig,
+    SurfaceStatus,
+    SurfaceType,
+)
+from services.common.surfaces.registry import SurfaceRegistry
+
+
+def build_registry(count: int, seed: int = 0) -> SurfaceRegistry:
+    """Registry of ``count`` surfaces with random attributes."""
+    rng = random.Random(seed)
+    registry = SurfaceRegistry()
+    for index in range(count):
+        registry.register_surface(
+            SurfaceConfig(
+                surface_id=f"surface-{index}",
+                surface_type=rng.choice(list(SurfaceType)),
+                display_name=f"Surface {index}",
+                status=rng.choice(list(SurfaceStatus)),
+                priority=rng.randint(0, 10),
+                capabilities=SurfaceCapabilities(
+                    supports_stereo=rng.random() < 0.3,
+                    supports_webrtc=rng.random() < 0.1,
+                ),
+            )
+        )
+    return registry
+
+
+def operations(
+    registry: SurfaceRegistry,
+) -> dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]]:
+    """(indexed, scan) callables per operation."""
+    surfaces = registry.get_all_surfaces
+    statuses = [SurfaceStatus.AVAILABLE, SurfaceStatus.BUSY]
+    flip = [0]
+
+    def update_status() -> None:
+        flip[0] ^= 1
+        registry.update_surface_status("surface-0", statuses[flip[0]])
+
+    return {
+        "by_type": (
+            lambda: registry.get_surfaces_by_type(SurfaceType.WEBRTC),
+            lambda: [s for s in surfaces() if s.surface_type == SurfaceType.WEBRTC],
+        ),
+        "available": (
+            registry.get_available_surfaces,
+            lambda: [s for s in surfaces() if s.is_available()],
+        ),
+        "healthy": (
+            registry.get_healthy_surfaces,
+            lambda: [s for s in surfaces() if s.is_healthy()],
+        ),
+        "by_capability": (
+            lambda: registry.get_surfaces_by_capability("webrtc"),
+            lambda: [s for s in surfaces() if s.supports_feature("webrtc")],
+        ),
+        "by_priority": (
+            lambda: registry.get_surfaces_by_priority(9),
+            lambda: [s for s in surfaces() if s.priority >= 9],
+        ),
+        "update_status": (update_status, None),
+    }
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-5 microseconds per call."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=repeat)) / repeat * 1e6
+
+
+def run_benchmark(counts: list[int], repeat: int = 200) -> list[dict[str, Any]]:
+    """Time every operation at every registry size."""
+    results = []
+    for count in counts:
+        registry = build_registry(count)
+        for name, (indexed, scan) in operations(registry).items():
+            indexed_us = time_call(indexed, repeat)
+            scan_us = time_call(scan, repeat) if scan else None
+            results.append(
+                {
+                    "surfaces": count,
+                    "operation": name,
+                    "indexed_us": round(indexed_us, 2),
+                    "scan_us": round(scan_us, 2) if scan_us else None,
+                }
+            )
+    return results
+
+
+def format_report(results: list[dict[str, Any]]) -> str:
+    """Human-readable table of the results."""
+    lines = [
+        f"{'surfaces':>8}  {'operation':<14}  {'indexed us':>11}  "
+        f"{'scan us':>10}  {'speedup':>8}"
+    ]
+    for result in results:
+        scan_us = result["scan_us"]
+        speedup = f"{scan_us / result['indexed_us']:7.1f}x" if scan_us else "-"
+        lines.append(
+            f"{result['surfaces']:>8}  {result['operation']:<14}  "
+            f"{result['indexed_us']:11.2f}  "
+            f"{scan_us if scan_us is not None else '-':>10}  {speedup:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--surfaces", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    # Registration and status-change logs would dominate the update timings
+    configure_logging("WARNING", json_logs=False)
+    results = run_benchmark(args.surfaces, args.repeat)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""Corpus-level transcription quality benchmark: WER, CER, latency and RTF.
+
+Replays the labelled fixture corpus (``fixtures/stt/quality_corpus.json``) plus
+white-noise copies at the manifest's SNRs through the STT pipeline once per
+configuration - as recorded, and after ``AudioEnhancer`` - and reports corpus
+WER/CER, latency percentiles and real-time factor side by side in one report.
+
+Point it at an STT service started with ``STT_ENABLE_AUDIO_ENHANCEMENT=false``
+so that the configurations differ only in the enhancement applied here::
+
+    python -m services.tests.measure_transcription_quality --stt-url http://localhost:9000
+
+``--whisper-model base`` transcribes in-process with faster-whisper instead.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import io
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+import wave
+
+import httpx
+import numpy as np
+
+from services.tests.quality.wer_calculator import CorpusResult, WERCalculator
+from services.tests.utils.performance import LatencyStats
+
+
+CORPUS_MANIFEST = Path(__file__).parent / "fixtures" / "stt" / "quality_corpus.json"
+
+# WAV bytes in, transcript out
+Transcriber = Callable[[bytes], Awaitable[str]]
+# (float32 mono audio, sample rate) in, enhanced audio out
+Enhancer = Callable[[np.ndarray, int], np.ndarray]
+
+
+@dataclass(frozen=True)
+class Utterance:
+    """One labelled recording of the corpus."""
+
+    name: str
+    reference: str
+    audio: np.ndarray
+    sample_rate: int
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self.audio) / self.sample_rate
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV as float32 mono in [-1, 1]."""
+    with wave.open(str(path), "rb") as wav_file:
+        sample_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        frames = wav_file.readframes(wav_file.getnframes())
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio, sample_rate
+
+
+def to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+    """Encode float audio as 16-bit mono WAV."""
+    pcm = np.clip(audio * 32768.0, -32768.0, 32767.0).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def load_corpus(
+    manifest: Path = CORPUS_MANIFEST, noise: bool = True, seed: int = 0
+) -> list[Utterance]:
+    """Load the labelled corpus and its noisy variants.
+
+    Noise is drawn from a seeded generator, so every configuration and every
+    run scores the same audio.
+    """
+    spec = json.loads(manifest.read_text())
+    rng = np.random.default_rng(seed)
+    corpus: list[Utterance] = []
+    for entry in spec["utterances"]:
+        audio, sample_rate = read_wav(manifest.parent / entry["audio"])
+        corpus.append(Utterance(entry["name"], entry["reference"], audio, sample_rate))
+        if not noise:
+            continue
+        signal_power = float(np.mean(audio**2))
+        for snr_db in spec.get("noise_snr_db", []):
+            noise_power = signal_power / (10 ** (snr_db / 10))
+            noisy = audio + rng.normal(0.0, np.sqrt(noise_power), len(audio))
+            corpus.append(
+                Utterance(
+                    f"{entry['name']}@{snr_db}dB",
+                    entry["reference"],
+                    noisy.astype(np.float32),
+                    sample_rate,
+                )
+            )
+    return corpus
+
+
+def http_transcriber(client: httpx.AsyncClient, stt_url: str) -> Transcriber:
+    """Transcribe through a running STT service's ``/transcribe`` endpoint."""
+
+    async def transcribe(wav_bytes: bytes) -> str:
+        response = await client.post(
+            f"{stt_url}/transcribe",
+            files={"audio": ("test.wav", wav_bytes, "audio/wav")},
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return str(response.json().get("transcript", ""))
+
+    return transcribe
+
+
+def whisper_transcriber(model_name: str, device: str = "cpu") -> Transcriber:
+    """Transcribe in-process with faster-whisper."""
+    from faster_whisper import WhisperModel
+
+    model = WhisperModel(model_name, device=device)
+
+    def _transcribe(wav_bytes: bytes) -> str:
+        segments, _ = model.transcribe(io.BytesIO(wav_bytes), beam_size=5)
+        return " ".join(segment.text.strip() for segment in segments)
+
+    async def transcribe(wav_bytes: bytes) -> str:
+        return await asyncio.to_thread(_transcribe, wav_bytes)
+
+    return transcribe
+
+
+def audio_enhancer(enable_metricgan: bool = True, device: str = "cpu") -> Enhancer:
+    """The STT service's enhancement pipeline as an Enhancer."""
+    from services.common.audio_enhancement import AudioEnhancer
+
+    enhancer = AudioEnhancer(enable_metricgan=enable_metricgan, device=device)
+
+    def enhance(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        return enhancer.enhance_audio_pipeline(audio, sample_rate=sample_rate)
+
+    return enhance
+
+
+@dataclass
+class ConfigurationResult:
+    """Quality and speed of one configuration over the corpus."""
+
+    name: str
+    quality: CorpusResult
+    latency: LatencyStats
+    audio_seconds: float
+    processing_seconds: float
+    hypotheses: list[str] = field(default_factory=list)
+    failures: int = 0
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor: processing time per second of audio."""
+        return (
+            self.processing_seconds / self.audio_seconds if self.audio_seconds else 0.0
+        )
+
+    def summary(self) -> dict[str, Any]:
+        latency = self.latency.get_stats()
+        return {
+            "wer": round(self.quality.wer, 2),
+            "cer": round(self.quality.cer, 2),
+            "substitutions": self.quality.substitutions,
+            "insertions": self.quality.insertions,
+            "deletions": self.quality.deletions,
+            "failures": self.failures,
+            "latency_ms": {
+                key: round(latency[key], 1) for key in ("mean", "p50", "p95", "max")
+            },
+            "rtf": round(self.rtf, 3),
+        }
+
+
+async def run_configuration(
+    name: str,
+    corpus: list[Utterance],
+    transcribe: Transcriber,
+    enhancer: Enhancer | None = None,
+) -> ConfigurationResult:
+    """Transcribe the corpus once; latency covers enhancement plus transcription.
+
+    A failed request is scored as an empty transcript and counted.
+    """
+    latency = LatencyStats(operation_name=name)
+    hypotheses: list[str] = []
+    failures = 0
+    for utterance in corpus:
+        start = time.perf_counter()
+        audio = utterance.audio
+        if enhancer is not None:
+            audio = await asyncio.to_thread(enhancer, audio, utterance.sample_rate)
+        try:
+            hypothesis = await transcribe(to_wav_bytes(audio, utterance.sample_rate))
+        except Exception:
+            hypothesis = ""
+            failures += 1
+        latency.add_measurement((time.perf_counter() - start) * 1000)
+        hypotheses.append(hypothesis)
+
+    quality = WERCalculator().calculate_corpus(
+        [utterance.reference for utterance in corpus], hypotheses
+    )
+    return ConfigurationResult(
+        name=name,
+        quality=quality,
+        latency=latency,
+        audio_seconds=sum(utterance.duration_seconds for utterance in corpus),
+        processing_seconds=sum(latency.measurements) / 1000,
+        hypotheses=hypotheses,
+        failures=failures,
+    )
+
+
+async def run_benchmark(
+    corpus: list[Utterance],
+    transcribe: Transcriber,
+    configurations: dict[str, Enhancer | None],
+) -> dict[str, Any]:
+    """Run every configuration and compare each against the first.
+
+    Returns:
+        Report with per-configuration summaries, WER deltas (percentage points
+        and relative improvement vs the first configuration) and per-utterance
+        WERs
+    """
+    calculator = WERCalculator()
+    results = [
+        await run_configuration(name, corpus, transcribe, enhancer)
+        for name, enhancer in configurations.items()
+    ]
+    baseline = results[0]
+    report: dict[str, Any] = {
+        "utterances": len(corpus),
+        "audio_seconds": round(baseline.audio_seconds, 2),
+        "baseline": baseline.name,
+        "configurations": {},
+    }
+    for result in results:
+        summary = result.summary()
+        summary["wer_delta"] = round(result.quality.wer - baseline.quality.wer, 2)
+        summary["wer_improvement_pct"] = round(
+            calculator.calculate_improvement(baseline.quality.wer, result.quality.wer),
+            1,
+        )
+        summary["per_utterance"] = [
+            {"name": utterance.name, "wer": round(wer.wer, 2), "hypothesis": text}
+            for utterance, wer, text in zip(
+                corpus, result.quality.utterances, result.hypotheses, strict=True
+            )
+        ]
+        report["configurations"][result.name] = summary
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Human-readable table of a benchmark report."""
+    lines = [
+        "\n=== Transcription Quality "
+        f"({report['utterances']} utterances, {report['audio_seconds']:.1f}s audio) ===",
+        f"{'configuration':>14}  {'WER':>6}  {'CER':>6}  {'dWER':>6}  "
+        f"{'p50 ms':>7}  {'p95 ms':>7}  {'RTF':>6}  failed",
+    ]
+    for name, summary in report["configurations"].items():
+        lines.append(
+            f"{name:>14}  {summary['wer']:6.2f}  {summary['cer']:6.2f}  "
+            f"{summary['wer_delta']:+6.2f}  {summary['latency_ms']['p50']:7.1f}  "
+            f"{summary['latency_ms']['p95']:7.1f}  {summary['rtf']:6.3f}  "
+            f"{summary['failures']}"
+        )
+    return "\n".join(lines)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    corpus = load_corpus(args.manifest, noise=not args.no_noise)
+    configurations: dict[str, Enhancer | None] = {
+        "baseline": None,
+        "enhanced": audio_enhancer(
+            enable_metricgan=not args.no_metricgan, device=args.device
+        ),
+    }
+    if args.whisper_model:
+        transcribe = whisper_transcriber(args.whisper_model, device=args.device)
+        return await run_benchmark(corpus, transcribe, configurations)
+    async with httpx.AsyncClient() as client:
+        transcribe = http_transcriber(client, args.stt_url)
+        return await run_benchmark(corpus, transcribe, configurations)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print (and optionally save) the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stt-url", default="http://localhost:9000")
+    parser.add_argument(
+        "--whisper-model", help="transcribe in-process with this faster-whisper model"
+    )
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--manifest", type=Path, default=CORPUS_MANIFEST)
+    parser.add_argument("--no-noise", action="store_true", help="skip noisy copies")
+    parser.add_argument(
+        "--no-metricgan", action="store_true", help="enhance with filters only"
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_run(args))
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
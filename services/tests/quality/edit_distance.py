@@ -0,0 +1,223 @@
+"""Batched, NumPy-vectorized Levenshtein alignment for WER/CER scoring.
+
+The classic DP fills an (m+1) x (n+1) table cell by cell in Python. Here a
+whole batch of sequence pairs advances one reference row at a time: the
+substitution/deletion candidates of a row are elementwise over every pair and
+column, and the left-to-right insertion chain is resolved with a running
+minimum (``row[j] = min_k(row[k] + j - k)``). Pairs are bucketed by length so
+padding stays small, and the backtrace keeps the tie order of the original
+``WERCalculator`` so counts are unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+# Upper bound on DP cells (int32) held per batch, ~16 MB
+DEFAULT_MAX_BATCH_CELLS = 4_000_000
+
+
+@dataclass(frozen=True)
+class AlignmentOp:
+    """One step of an alignment: ``equal``, ``substitute``, ``delete`` or ``insert``."""
+
+    op: str
+    reference: Hashable | None
+    hypothesis: Hashable | None
+
+
+@dataclass
+class EditOperations:
+    """Edit operations aligning one hypothesis to its reference."""
+
+    substitutions: int
+    insertions: int
+    deletions: int
+    hits: int
+    alignment: list[AlignmentOp] | None = field(default=None, repr=False)
+
+    @property
+    def errors(self) -> int:
+        return self.substitutions + self.insertions + self.deletions
+
+
+def _encode(
+    references: Sequence[Sequence[Hashable]],
+    hypotheses: Sequence[Sequence[Hashable]],
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Map tokens to shared integer ids so comparisons are vectorized."""
+    vocabulary: dict[Hashable, int] = {}
+
+    def encode(tokens: Sequence[Hashable]) -> np.ndarray:
+        return np.fromiter(
+            (vocabulary.setdefault(token, len(vocabulary)) for token in tokens),
+            dtype=np.int32,
+            count=len(tokens),
+        )
+
+    return [encode(tokens) for tokens in references], [
+        encode(tokens) for tokens in hypotheses
+    ]
+
+
+def distance_tables(
+    references: Sequence[np.ndarray], hypotheses: Sequence[np.ndarray]
+) -> np.ndarray:
+    """Full DP tables of a batch of encoded pairs.
+
+    Returns:
+        int32 array of shape (batch, max_m + 1, max_n + 1); the distance of
+        pair ``b`` is ``tables[b, len(ref_b), len(hyp_b)]``. Cells beyond a
+        pair's own lengths hold padding results and must not be read.
+    """
+    batch = len(references)
+    max_m = max((len(ref) for ref in references), default=0)
+    max_n = max((len(hyp) for hyp in hypotheses), default=0)
+    # Distinct negative pads never match a real token or each other
+    refs = np.full((batch, max_m), -1, dtype=np.int32)
+    hyps = np.full((batch, max_n), -2, dtype=np.int32)
+    for index, (ref, hyp) in enumerate(zip(references, hypotheses, strict=True)):
+        refs[index, : len(ref)] = ref
+        hyps[index, : len(hyp)] = hyp
+
+    columns = np.arange(max_n + 1, dtype=np.int32)
+    tables = np.empty((batch, max_m + 1, max_n + 1), dtype=np.int32)
+    tables[:, 0, :] = columns
+    for i in range(1, max_m + 1):
+        previous = tables[:, i - 1, :]
+        row = tables[:, i, :]
+        row[:, 0] = i
+        cost = (refs[:, i - 1, None] != hyps).astype(np.int32)
+        np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost, out=row[:, 1:])
+        # Insertions: row[j] = min over k <= j of row[k] + (j - k)
+        row[:] = np.minimum.accumulate(row - columns, axis=1) + columns
+    return tables
+
+
+def _backtrace(
+    table: np.ndarray, ref: np.ndarray, hyp: np.ndarray, alignment: bool
+) -> tuple[int, int, int, int, list[tuple[str, int, int]] | None]:
+    substitutions = insertions = deletions = hits = 0
+    steps: list[tuple[str, int, int]] | None = [] if alignment else None
+    i, j = len(ref), len(hyp)
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and ref[i - 1] == hyp[j - 1]:
+            hits += 1
+            op = "equal"
+            i -= 1
+            j -= 1
+        elif i > 0 and j > 0 and table[i, j] == table[i - 1, j - 1] + 1:
+            substitutions += 1
+            op = "substitute"
+            i -= 1
+            j -= 1
+        elif i > 0 and table[i, j] == table[i - 1, j] + 1:
+            deletions += 1
+            op = "delete"
+            i -= 1
+        else:
+            insertions += 1
+            op = "insert"
+            j -= 1
+        if steps is not None:
+            steps.append((op, i, j))
+    if steps is not None:
+        steps.reverse()
+    return substitutions, insertions, deletions, hits, steps
+
+
+def _buckets(
+    order: list[int], m_lengths: list[int], n_lengths: list[int], max_cells: int
+) -> list[list[int]]:
+    """Split length-sorted indices into batches that fit ``max_cells``."""
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    max_m = max_n = 0
+    for index in order:
+        m = max(max_m, m_lengths[index])
+        n = max(max_n, n_lengths[index])
+        if current and (len(current) + 1) * (m + 1) * (n + 1) > max_cells:
+            buckets.append(current)
+            current, m, n = [], m_lengths[index], n_lengths[index]
+        current.append(index)
+        max_m, max_n = m, n
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def batch_edit_operations(
+    references: Sequence[Sequence[Hashable]],
+    hypotheses: Sequence[Sequence[Hashable]],
+    *,
+    alignments: bool = False,
+    max_batch_cells: int = DEFAULT_MAX_BATCH_CELLS,
+) -> list[EditOperations]:
+    """Align every hypothesis to its reference.
+
+    Args:
+        references: Token sequences (words, characters, ...) per utterance
+        hypotheses: Token sequences to score, same length as ``references``
+        alignments: Also return the per-token alignment of each pair
+        max_batch_cells: Memory bound for the DP tables of one batch
+
+    Returns:
+        One EditOperations per pair, in input order
+    """
+    if len(references) != len(hypotheses):
+        raise ValueError(
+            f"{len(references)} references but {len(hypotheses)} hypotheses"
+        )
+    encoded_refs, encoded_hyps = _encode(references, hypotheses)
+    m_lengths = [len(ref) for ref in encoded_refs]
+    n_lengths = [len(hyp) for hyp in encoded_hyps]
+    order = sorted(range(len(references)), key=lambda k: (m_lengths[k], n_lengths[k]))
+
+    results: list[EditOperations | None] = [None] * len(references)
+    for bucket in _buckets(order, m_lengths, n_lengths, max_batch_cells):
+        tables = distance_tables(
+            [encoded_refs[k] for k in bucket], [encoded_hyps[k] for k in bucket]
+        )
+        for table, index in zip(tables, bucket, strict=True):
+            ref, hyp = encoded_refs[index], encoded_hyps[index]
+            substitutions, insertions, deletions, hits, steps = _backtrace(
+                table, ref, hyp, alignments
+            )
+            alignment = None
+            if steps is not None:
+                ref_tokens, hyp_tokens = references[index], hypotheses[index]
+                alignment = [
+                    AlignmentOp(
+                        op,
+                        None if op == "insert" else ref_tokens[i],
+                        None if op == "delete" else hyp_tokens[j],
+                    )
+                    for op, i, j in steps
+                ]
+            results[index] = EditOperations(
+                substitutions, insertions, deletions, hits, alignment
+            )
+    return [result for result in results if result is not None]
+
+
+def edit_operations(
+    reference: Sequence[Hashable],
+    hypothesis: Sequence[Hashable],
+    *,
+    alignment: bool = False,
+) -> EditOperations:
+    """Align a single pair (see ``batch_edit_operations``)."""
+    return batch_edit_operations([reference], [hypothesis], alignments=alignment)[0]
+
+
+__all__ = [
+    "AlignmentOp",
+    "EditOperations",
+    "batch_edit_operations",
+    "distance_tables",
+    "edit_operations",
+]
@@ -0,0 +1,116 @@
+"""Quality parity of chunked (overlap-add) enhancement with whole-segment enhancement."""
+
+from itertools import pairwise
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from services.common.audio_enhancement import AudioEnhancer, chunk_spans, overlap_add
+from services.common.audio_quality import AudioQualityMetrics
+from services.tests.measure_transcription_quality import Utterance, load_corpus
+
+
+pytestmark = pytest.mark.quality
+
+CHUNK_SECONDS = 1.0
+OVERLAP_SECONDS = 0.1
+
+
+def _fir_enhance_batch(self, audios):
+    """Stateless stand-in for MetricGAN+: a short smoothing filter per item.
+
+    Each item is filtered on its own, so window edges see zero padding just
+    as a real model sees the edges of its input.
+    """
+    taps = np.hanning(33).astype(np.float32)
+    taps /= taps.sum()
+    return [
+        np.convolve(audio, taps, mode="same").astype(np.float32) for audio in audios
+    ]
+
+
+def _enhancer(**kwargs):
+    loader = Mock()
+    loader.is_loaded.return_value = True
+    loader.is_loading.return_value = False
+    loader.get_model.return_value = object()
+    with patch(
+        "services.common.audio_enhancement.BackgroundModelLoader", return_value=loader
+    ):
+        return AudioEnhancer(enable_metricgan=True, **kwargs)
+
+
+def _parity(
+    full: AudioEnhancer, chunked: AudioEnhancer, corpus: list[Utterance]
+) -> list[dict[str, float]]:
+    """Compare chunked with whole-segment output, and both with the clean audio."""
+    clean = {u.name: u.audio for u in corpus if "@" not in u.name}
+    results = []
+    for utterance in corpus:
+        whole = full.enhance_audio(utterance.audio, utterance.sample_rate)
+        windowed = chunked.enhance_audio(utterance.audio, utterance.sample_rate)
+        reference = clean[utterance.name.split("@")[0]]
+        results.append(
+            {
+                "segmental_snr_vs_full": AudioQualityMetrics.calculate_segmental_snr(
+                    whole, windowed, utterance.sample_rate
+                ),
+                "snr_full": AudioQualityMetrics.calculate_reference_snr(
+                    reference, whole
+                ),
+                "snr_chunked": AudioQualityMetrics.calculate_reference_snr(
+                    reference, windowed
+                ),
+                "max_abs_diff": float(np.max(np.abs(whole - windowed))),
+            }
+        )
+    return results
+
+
+def test_windows_have_fixed_size_and_crossfade_is_transparent():
+    """Windows cover the signal at one size; identical windows recombine exactly."""
+    spans = chunk_spans(10_000, 3_000, 500)
+    assert spans[0] == (0, 3_000) and spans[-1] == (7_000, 10_000)
+    assert {end - start for start, end in spans} == {3_000}
+    assert all(b[0] < a[1] - 499 for a, b in pairwise(spans))
+
+    signal = np.random.default_rng(0).normal(size=10_000).astype(np.float32)
+    recombined = overlap_add([signal[s:e] for s, e in spans], spans, 10_000, 500)
+    np.testing.assert_allclose(recombined, signal, rtol=1e-5, atol=1e-6)
+
+
+def test_chunked_matches_full_segment_on_fixture_corpus():
+    """Chunked output stays within parity of whole-segment output on the corpus."""
+    corpus = load_corpus()
+    with patch.object(AudioEnhancer, "_enhance_batch", _fir_enhance_batch):
+        full = _enhancer()
+        chunked = _enhancer(
+            chunk_seconds=CHUNK_SECONDS, chunk_overlap_seconds=OVERLAP_SECONDS
+        )
+        assert len(chunked._chunk_spans(len(corpus[0].audio), 16000)[0]) > 1
+        results = _parity(full, chunked, corpus)
+
+    for result in results:
+        assert result["segmental_snr_vs_full"] > 30.0
+        # Window edges fall inside crossfades wider than the filter
+        assert result["max_abs_diff"] < 1e-4
+        assert result["snr_chunked"] == pytest.approx(result["snr_full"], abs=0.1)
+
+
+async def test_metricgan_chunked_parity_on_fixture_corpus():
+    """With the real MetricGAN+, chunking costs at most 1 dB against clean audio."""
+    pytest.importorskip("torch")
+    pytest.importorskip("speechbrain")
+    full = AudioEnhancer(enable_metricgan=True)
+    chunked = AudioEnhancer(
+        enable_metricgan=True,
+        chunk_seconds=CHUNK_SECONDS,
+        chunk_overlap_seconds=OVERLAP_SECONDS,
+    )
+    if not (await full.ensure_loaded() and await chunked.ensure_loaded()):
+        pytest.skip("MetricGAN+ model not available")
+
+    for result in _parity(full, chunked, load_corpus()):
+        assert result["segmental_snr_vs_full"] > 10.0
+        assert result["snr_chunked"] >= result["snr_full"] - 1.0
@@ -0,0 +1,115 @@
+"""Tests for vectorized WER/CER scoring and the transcription quality benchmark."""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from services.tests.measure_transcription_quality import (
+    load_corpus,
+    run_benchmark,
+    to_wav_bytes,
+)
+from services.tests.quality.edit_distance import batch_edit_operations
+from services.tests.quality.wer_calculator import WERCalculator
+
+
+def _reference_edit_distance(ref: list[str], hyp: list[str]) -> tuple[int, int, int]:
+    """Cell-by-cell DP with the same backtrace order as the engine."""
+    m, n = len(ref), len(hyp)
+    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        dp[i][0] = i
+    for j in range(n + 1):
+        dp[0][j] = j
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if ref[i - 1] == hyp[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1]
+            else:
+                dp[i][j] = 1 + min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1])
+    sub = ins = dele = 0
+    i, j = m, n
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and ref[i - 1] == hyp[j - 1]:
+            i, j = i - 1, j - 1
+        elif i > 0 and j > 0 and dp[i][j] == dp[i - 1][j - 1] + 1:
+            sub, i, j = sub + 1, i - 1, j - 1
+        elif i > 0 and dp[i][j] == dp[i - 1][j] + 1:
+            dele, i = dele + 1, i - 1
+        else:
+            ins, j = ins + 1, j - 1
+    return sub, ins, dele
+
+
+def test_batch_matches_reference_dp():
+    """Batched counts equal the cell-by-cell DP, across small batch limits."""
+    rng = random.Random(7)
+    refs = [[rng.choice("abcd") for _ in range(rng.randint(0, 25))] for _ in range(300)]
+    hyps = [[rng.choice("abcd") for _ in range(rng.randint(0, 25))] for _ in range(300)]
+
+    for max_cells in (1, 500, 4_000_000):
+        results = batch_edit_operations(refs, hyps, max_batch_cells=max_cells)
+        assert [(r.substitutions, r.insertions, r.deletions) for r in results] == [
+            _reference_edit_distance(ref, hyp)
+            for ref, hyp in zip(refs, hyps, strict=True)
+        ]
+
+
+def test_alignment_and_wer():
+    """Alignments list each operation; WER keeps its per-utterance semantics."""
+    calculator = WERCalculator()
+
+    result = calculator.calculate_wer(
+        "Hello world this is a test", "hello world this is test"
+    )
+    assert (result.wer, result.deletions) == (pytest.approx(100 / 6), 1)
+
+    corpus = calculator.calculate_corpus(
+        ["the cat sat", "a b"], ["the bat sat down", ""], alignments=True
+    )
+    assert [(op.op, op.reference, op.hypothesis) for op in corpus.alignments[0]] == [
+        ("equal", "the", "the"),
+        ("substitute", "cat", "bat"),
+        ("equal", "sat", "sat"),
+        ("insert", None, "down"),
+    ]
+    # 2 errors + 2 deletions over 5 reference words
+    assert corpus.wer == pytest.approx(80.0)
+    assert corpus.utterances[1].deletions == 2
+    assert calculator.calculate_cer("the cat", "the bat") == pytest.approx(100 / 7)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_each_configuration():
+    """Every configuration gets WER, latency and RTF, compared to the first."""
+    corpus = load_corpus()
+    assert len(corpus) == 4  # clean + three SNRs
+    assert not np.array_equal(corpus[0].audio, corpus[1].audio)
+    enhanced_inputs = []
+
+    async def transcribe(wav_bytes: bytes) -> str:
+        await asyncio.sleep(0.01)
+        if wav_bytes in enhanced_inputs:
+            return "hello this is a test of the speech transcription system"
+        return "hello this is the test of speech transcription"
+
+    def enhance(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        enhanced = audio * 0.5
+        enhanced_inputs.append(to_wav_bytes(enhanced, sample_rate))
+        return enhanced
+
+    report = await run_benchmark(
+        corpus, transcribe, {"baseline": None, "enhanced": enhance}
+    )
+
+    baseline = report["configurations"]["baseline"]
+    enhanced = report["configurations"]["enhanced"]
+    assert baseline["wer"] == pytest.approx(30.0)  # 1 sub + 2 del of 10 words
+    assert enhanced["wer"] == 0.0
+    assert enhanced["wer_delta"] == pytest.approx(-30.0)
+    assert enhanced["wer_improvement_pct"] == 100.0
+    assert baseline["rtf"] > 0
+    assert baseline["latency_ms"]["p95"] >= baseline["latency_ms"]["p50"]
+    assert len(enhanced["per_utterance"]) == 4
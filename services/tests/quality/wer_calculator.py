@@ -1,9 +1,17 @@
 """Word Error Rate (WER) calculation utilities for audio quality validation."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 import re
 from typing import Any
 
+from services.tests.quality.edit_distance import (
+    AlignmentOp,
+    EditOperations,
+    batch_edit_operations,
+    edit_operations,
+)
+
 
 @dataclass
 class WERResult:
@@ -18,6 +26,22 @@ class WERResult:
     hypothesis_words: int
 
 
+@dataclass
+class CorpusResult:
+    """Corpus-level WER/CER with per-utterance detail."""
+
+    wer: float
+    cer: float
+    substitutions: int
+    insertions: int
+    deletions: int
+    reference_words: int
+    reference_chars: int
+    char_errors: int
+    utterances: list[WERResult]
+    alignments: list[list[AlignmentOp]] | None = None
+
+
 class WERCalculator:
     """Calculate Word Error Rate between reference and hypothesis."""
 
@@ -76,6 +100,77 @@ class WERCalculator:
             hypothesis_words=len(hyp_tokens),
         )
 
+    def calculate_cer(self, reference: str, hypothesis: str) -> float:
+        """Calculate Character Error Rate (percentage) on normalized text."""
+        ref_chars = list(self.normalize_text(reference))
+        operations = edit_operations(ref_chars, list(self.normalize_text(hypothesis)))
+        return (operations.errors / len(ref_chars) * 100) if ref_chars else 0.0
+
+    def calculate_corpus(
+        self,
+        references: Sequence[str],
+        hypotheses: Sequence[str],
+        alignments: bool = False,
+    ) -> CorpusResult:
+        """Score a whole corpus in vectorized batches.
+
+        Corpus WER/CER are total errors over total reference words/characters,
+        so long utterances weigh more than in a mean of per-utterance WERs.
+
+        Args:
+            references: Ground truth texts
+            hypotheses: Predicted texts, one per reference
+            alignments: Also return the word alignment of each utterance
+
+        Returns:
+            CorpusResult with corpus rates and per-utterance WERResults
+        """
+        ref_tokens = [self.tokenize(text) for text in references]
+        hyp_tokens = [self.tokenize(text) for text in hypotheses]
+        word_ops = batch_edit_operations(ref_tokens, hyp_tokens, alignments=alignments)
+        ref_chars = [list(self.normalize_text(text)) for text in references]
+        char_ops = batch_edit_operations(
+            ref_chars, [list(self.normalize_text(text)) for text in hypotheses]
+        )
+
+        utterances = [
+            self._wer_result(ops, len(ref), len(hyp))
+            for ops, ref, hyp in zip(word_ops, ref_tokens, hyp_tokens, strict=True)
+        ]
+        reference_words = sum(len(tokens) for tokens in ref_tokens)
+        reference_chars = sum(len(chars) for chars in ref_chars)
+        word_errors = sum(ops.errors for ops in word_ops)
+        char_errors = sum(ops.errors for ops in char_ops)
+        return CorpusResult(
+            wer=(word_errors / reference_words * 100) if reference_words else 0.0,
+            cer=(char_errors / reference_chars * 100) if reference_chars else 0.0,
+            substitutions=sum(ops.substitutions for ops in word_ops),
+            insertions=sum(ops.insertions for ops in word_ops),
+            deletions=sum(ops.deletions for ops in word_ops),
+            reference_words=reference_words,
+            reference_chars=reference_chars,
+            char_errors=char_errors,
+            utterances=utterances,
+            alignments=[ops.alignment or [] for ops in word_ops]
+            if alignments
+            else None,
+        )
+
+    @staticmethod
+    def _wer_result(
+        operations: EditOperations, reference_words: int, hypothesis_words: int
+    ) -> WERResult:
+        wer = (operations.errors / reference_words * 100) if reference_words else 0.0
+        return WERResult(
+            wer=wer,
+            substitutions=operations.substitutions,
+            insertions=operations.insertions,
+            deletions=operations.deletions,
+            total_words=reference_words,
+            reference_words=reference_words,
+            hypothesis_words=hypothesis_words,
+        )
+
     def _calculate_edit_distance(
         self, ref_tokens: list[str], hyp_tokens: list[str]
     ) -> tuple[int, int, int]:
@@ -84,49 +179,8 @@ class WERCalculator:
         Returns:
             Tuple of (substitutions, insertions, deletions)
         """
-        m, n = len(ref_tokens), len(hyp_tokens)
-
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i  # deletions
-        for j in range(n + 1):
-            dp[0][j] = j  # insertions
-
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if ref_tokens[i - 1] == hyp_tokens[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i - 1][j],  # deletion
-                        dp[i][j - 1],  # insertion
-                        dp[i - 1][j - 1],  # substitution
-                    )
-
-        # Backtrack to count operations
-        substitutions = insertions = deletions = 0
-        i, j = m, n
-
-        while i > 0 or j > 0:
-            if i > 0 and j > 0 and ref_tokens[i - 1] == hyp_tokens[j - 1]:
-                i -= 1
-                j -= 1
-            elif i > 0 and j > 0 and dp[i][j] == dp[i - 1][j - 1] + 1:
-                substitutions += 1
-                i -= 1
-                j -= 1
-            elif i > 0 and dp[i][j] == dp[i - 1][j] + 1:
-                deletions += 1
-                i -= 1
-            else:
-                insertions += 1
-                j -= 1
-
-        return substitutions, insertions, deletions
+        operations = edit_operations(ref_tokens, hyp_tokens)
+        return operations.substitutions, operations.insertions, operations.deletions
 
     def calculate_improvement(self, baseline_wer: float, enhanced_wer: float) -> float:
         """Calculate relative improvement percentage.
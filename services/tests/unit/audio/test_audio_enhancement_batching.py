@@ -0,0 +1,171 @@
+"""Unit tests for cached filter design and batched MetricGAN+ enhancement."""
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from services.common.audio_enhancement import (
+    AudioEnhancer,
+    EnhancementBatcher,
+    decode_audio_bytes,
+    encode_audio_bytes,
+    high_pass_sos,
+)
+
+
+class FakeMetricGAN:
+    """enhance_batch stand-in that halves the signal and records each call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def enhance_batch(self, noisy, lengths):
+        self.calls.append((tuple(noisy.shape), lengths.tolist()))
+        return noisy * 0.5
+
+
+def _loaded_enhancer(model, **kwargs):
+    loader = Mock()
+    loader.is_loaded.return_value = True
+    loader.is_loading.return_value = False
+    loader.get_model.return_value = model
+    with patch(
+        "services.common.audio_enhancement.BackgroundModelLoader", return_value=loader
+    ):
+        return AudioEnhancer(enable_metricgan=True, **kwargs)
+
+
+@pytest.mark.unit
+def test_high_pass_design_is_cached_per_rate():
+    """The filter is designed once per rate and matches the transfer-function form."""
+    from scipy import signal
+
+    high_pass_sos.cache_clear()
+    enhancer = AudioEnhancer(enable_metricgan=False)
+    audio = np.random.default_rng(0).normal(size=16000).astype(np.float32)
+
+    filtered = enhancer.apply_high_pass_filter(audio, sample_rate=16000)
+    enhancer.apply_high_pass_filter(audio, sample_rate=16000)
+    enhancer.apply_high_pass_filter(audio, sample_rate=48000)
+
+    assert high_pass_sos.cache_info().misses == 2
+    assert high_pass_sos.cache_info().hits == 1
+    b, a = signal.butter(4, 80.0 / 8000, btype="high")
+    reference = signal.filtfilt(b, a, audio)
+    assert filtered.dtype == np.float32
+    assert np.max(np.abs(filtered[200:-200] - reference[200:-200])) < 1e-4
+
+
+@pytest.mark.unit
+def test_enhance_batch_pads_with_relative_lengths():
+    """A batch is zero-padded to its longest signal and trimmed back per item."""
+    pytest.importorskip("torch")
+    model = FakeMetricGAN()
+    enhancer = _loaded_enhancer(model)
+    enhancer._get_metricgan_model()
+    audios = [np.ones(n, dtype=np.float32) for n in (400, 1000, 250)]
+
+    enhanced = enhancer._enhance_batch(audios)
+
+    assert model.calls == [((3, 1000), pytest.approx([0.4, 1.0, 0.25]))]
+    assert [len(audio) for audio in enhanced] == [400, 1000, 250]
+    assert all(np.allclose(audio, 0.5) for audio in enhanced)
+
+
+@pytest.mark.unit
+async def test_concurrent_segments_share_one_forward_pass():
+    """Concurrent segments are micro-batched off the event loop thread."""
+    calls = []
+    threads = set()
+
+    def enhance_batch(audios):
+        calls.append(len(audios))
+        threads.add(threading.current_thread().name)
+        return [audio * 0.5 for audio in audios]
+
+    batcher = EnhancementBatcher(enhance_batch, max_batch_size=4, max_wait_ms=20)
+    try:
+        audios = [np.full(n, 1.0, dtype=np.float32) for n in (100, 200, 300)]
+        results = await asyncio.gather(*(batcher.enhance(audio) for audio in audios))
+    finally:
+        await batcher.close()
+
+    assert calls == [3]
+    assert threading.main_thread().name not in threads
+    assert [len(result) for result in results] == [100, 200, 300]
+    assert all(np.allclose(result, 0.5) for result in results)
+
+
+@pytest.mark.unit
+async def test_batch_failure_propagates_to_every_caller():
+    """A failed forward pass fails each waiting segment, not the worker."""
+
+    def enhance_batch(audios):
+        raise RuntimeError("out of memory")
+
+    batcher = EnhancementBatcher(enhance_batch, max_batch_size=4, max_wait_ms=5)
+    try:
+        with pytest.raises(RuntimeError):
+            await batcher.enhance(np.zeros(10, dtype=np.float32))
+    finally:
+        await batcher.close()
+
+
+@pytest.mark.unit
+async def test_enhance_audio_bytes_keeps_wav_format():
+    """WAV input comes back as WAV at its own sample rate; PCM stays PCM."""
+    batches = []
+
+    def enhance_batch(self, audios):
+        batches.append(len(audios))
+        return [audio * 0.5 for audio in audios]
+
+    rng = np.random.default_rng(0)
+    audio = (0.3 * rng.uniform(-1, 1, 8000)).astype(np.float32)
+    wav = encode_audio_bytes(audio, 8000, as_wav=True)
+    pcm = encode_audio_bytes(audio, 16000, as_wav=False)
+
+    with patch.object(AudioEnhancer, "_enhance_batch", enhance_batch):
+        enhancer = _loaded_enhancer(object(), batch_wait_ms=20)
+        try:
+            enhanced_wav, enhanced_pcm = await asyncio.gather(
+                enhancer.enhance_audio_bytes(wav),
+                enhancer.enhance_audio_bytes(pcm),
+            )
+        finally:
+            await enhancer.close()
+
+    assert batches == [2]
+    decoded, sample_rate, is_wav = decode_audio_bytes(enhanced_wav)
+    assert (sample_rate, is_wav, len(decoded)) == (8000, True, 8000)
+    assert len(enhanced_pcm) == len(pcm)
+    assert np.std(decoded) < np.std(audio)
+
+
+@pytest.mark.unit
+async def test_long_segment_windows_share_forward_passes():
+    """A chunked segment's fixed-size windows are batched, not the whole segment."""
+    batches = []
+
+    def enhance_batch(self, audios):
+        batches.append([len(audio) for audio in audios])
+        return list(audios)
+
+    audio = (0.3 * np.random.default_rng(0).uniform(-1, 1, 40_000)).astype(np.float32)
+    pcm = encode_audio_bytes(audio, 16000, as_wav=False)
+
+    with patch.object(AudioEnhancer, "_enhance_batch", enhance_batch):
+        enhancer = _loaded_enhancer(
+            object(), batch_size=4, chunk_seconds=1.0, chunk_overlap_seconds=0.1
+        )
+        try:
+            enhanced = await enhancer.enhance_audio_bytes(pcm)
+        finally:
+            await enhancer.close()
+
+    # 2.5 s in 1 s windows with a 0.1 s overlap: 3 windows, one forward pass
+    assert batches == [[16000, 16000, 16000]]
+    assert len(enhanced) == len(pcm)
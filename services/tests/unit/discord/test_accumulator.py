@@ -0,0 +1,53 @@
+"""Tests for the Discord speaker accumulator."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.common.surfaces.types import PCMFrame
+from services.discord.audio import Accumulator
+
+
+def _accumulate(amplitude: float, frames: int = 5) -> Accumulator:
+    config = SimpleNamespace(min_segment_rms_threshold=5.0, input_sample_rate_hz=48000)
+    accumulator = Accumulator(user_id=1, config=config)
+    rng = np.random.default_rng(0)
+    for index in range(frames):
+        samples = (amplitude * rng.standard_normal(960)).astype(np.int16)
+        accumulator.append(
+            PCMFrame(
+                pcm=samples.tobytes(),
+                timestamp=index * 0.02,
+                rms=float(np.sqrt(np.mean(samples.astype(np.float64) ** 2))),
+                duration=0.02,
+                sequence=index,
+                sample_rate=48000,
+            )
+        )
+    return accumulator
+
+
+@pytest.mark.unit
+def test_pop_segment_joins_frames_and_clears_features():
+    """Each appended frame adds a feature row; popping a segment empties both."""
+    accumulator = _accumulate(1000.0)
+    assert len(accumulator.features) == 5
+
+    segment = accumulator.pop_segment("corr-1")
+
+    assert segment is not None
+    assert segment.frame_count == 5
+    assert len(segment.pcm) == 5 * 960 * 2
+    assert not accumulator.frames
+    assert len(accumulator.features) == 0
+
+
+@pytest.mark.unit
+def test_pop_segment_drops_silence_using_frame_features():
+    """Segments below the RMS threshold are discarded without a PCM pass."""
+    accumulator = _accumulate(1.0)
+
+    assert accumulator.pop_segment("corr-2") is None
+    assert not accumulator.frames
+    assert len(accumulator.features) == 0
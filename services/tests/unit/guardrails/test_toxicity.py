@@ -0,0 +1,131 @@
+"""Unit tests for batched, sentence-level toxicity scoring."""
+
+import asyncio
+import threading
+
+import pytest
+
+from services.guardrails.toxicity import (
+    ToxicityBatcher,
+    ToxicityScorer,
+    most_toxic,
+    split_sentences,
+)
+
+
+class FakeDetector:
+    """Text-classification stand-in that records each forward pass."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        return [
+            {"label": "toxic", "score": 0.95}
+            if "awful" in text
+            else {"label": "neutral", "score": 0.9}
+            for text in texts
+        ]
+
+
+@pytest.mark.unit
+def test_split_sentences():
+    """Text is split after sentence punctuation and blanks are dropped."""
+    assert split_sentences("Hi there. How are you?  Fine!") == [
+        "Hi there.",
+        "How are you?",
+        "Fine!",
+    ]
+    assert split_sentences("   ") == []
+
+
+@pytest.mark.unit
+def test_most_toxic_prefers_toxic_label():
+    """A toxic label outranks a higher-scoring non-toxic label."""
+    results = [
+        {"label": "neutral", "score": 0.99},
+        {"label": "toxic", "score": 0.4},
+    ]
+    assert most_toxic(results)["label"] == "toxic"
+
+
+@pytest.mark.unit
+async def test_concurrent_requests_share_one_forward_pass():
+    """Concurrent scoring calls are micro-batched off the event loop thread."""
+    detector = FakeDetector()
+    batcher = ToxicityBatcher(detector, max_batch_size=8, max_wait_ms=20)
+    try:
+        results = await asyncio.gather(
+            batcher.score(["one"]), batcher.score(["two"]), batcher.score(["three"])
+        )
+    finally:
+        await batcher.close()
+
+    assert [r[0]["label"] for r in results] == ["neutral"] * 3
+    assert detector.calls == [["one", "two", "three"]]
+    assert threading.current_thread().name not in detector.threads
+
+
+@pytest.mark.unit
+async def test_batches_respect_max_size():
+    """Queued texts are split into batches of at most max_batch_size."""
+    detector = FakeDetector()
+    batcher = ToxicityBatcher(detector, max_batch_size=2, max_wait_ms=20)
+    try:
+        await batcher.score(["a", "b", "c", "d", "e"])
+    finally:
+        await batcher.close()
+
+    assert [len(call) for call in detector.calls] == [2, 2, 1]
+
+
+@pytest.mark.unit
+async def test_detector_errors_propagate_to_callers():
+    """A failing forward pass fails its callers without killing the worker."""
+
+    def broken(texts):
+        raise RuntimeError("model exploded")
+
+    batcher = ToxicityBatcher(broken, max_wait_ms=1)
+    try:
+        with pytest.raises(RuntimeError):
+            await batcher.score(["x"])
+        batcher.detector = FakeDetector()
+        assert (await batcher.score(["y"]))[0]["label"] == "neutral"
+    finally:
+        await batcher.close()
+
+
+@pytest.mark.unit
+async def test_scorer_caches_per_sentence():
+    """Sentences already scored are not sent to the model again."""
+    detector = FakeDetector()
+    scorer = ToxicityScorer(ToxicityBatcher(detector, max_wait_ms=1))
+    try:
+        first = await scorer.score_text("Hello there. You are awful.")
+        second = await scorer.score_text("You are awful. Something new!")
+    finally:
+        await scorer.batcher.close()
+
+    assert first["label"] == "toxic"
+    assert first["sentence"] == "You are awful."
+    assert second["label"] == "toxic"
+    assert detector.calls == [["Hello there.", "You are awful."], ["Something new!"]]
+    assert scorer.get_stats()["hits"] == 1
+
+
+@pytest.mark.unit
+async def test_scorer_deduplicates_repeated_sentences():
+    """A sentence repeated within one text is scored once."""
+    detector = FakeDetector()
+    scorer = ToxicityScorer(ToxicityBatcher(detector, max_wait_ms=1))
+    try:
+        result = await scorer.score_text("Okay. Okay. Okay.")
+    finally:
+        await scorer.batcher.close()
+
+    assert result["label"] == "neutral"
+    assert detector.calls == [["Okay."]]
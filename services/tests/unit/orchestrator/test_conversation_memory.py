@@ -0,0 +1,101 @@
+"""Unit tests for orchestrator per-session conversation memory."""
+
+from unittest.mock import patch
+
+import pytest
+
+from services.orchestrator.conversation_memory import (
+    AI_ROLE,
+    HUMAN_ROLE,
+    ConversationMemoryStore,
+    build_session_id,
+    estimate_tokens,
+)
+
+
+@pytest.mark.unit
+def test_estimate_tokens():
+    """Token estimate is zero for empty text and roughly chars / 4 otherwise."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hi") == 1
+    assert estimate_tokens("x" * 400) == 100
+
+
+@pytest.mark.unit
+def test_build_session_id_scopes_by_channel():
+    """Session IDs separate the same user across channels."""
+    assert build_session_id("user", "chan") == "chan:user"
+    assert build_session_id("user", "other") != build_session_id("user", "chan")
+    assert build_session_id("user") == "user"
+
+
+@pytest.mark.unit
+def test_sessions_are_isolated():
+    """Turns recorded for one session are not visible to another."""
+    memory = ConversationMemoryStore()
+    memory.add_turn("a", "hello", "hi there")
+
+    assert memory.get_history("a") == [(HUMAN_ROLE, "hello"), (AI_ROLE, "hi there")]
+    assert memory.get_history("b") == []
+
+
+@pytest.mark.unit
+def test_history_stays_within_token_budget():
+    """Old turns are dropped so the window never exceeds the budget."""
+    memory = ConversationMemoryStore(max_history_tokens=50)
+    for i in range(100):
+        memory.add_turn("s", f"question {i} " + "x" * 40, f"answer {i} " + "y" * 40)
+        assert memory.get_history_tokens("s") <= 50
+
+    history = memory.get_history("s")
+    # Most recent turn is always kept
+    assert history[-2][1].startswith("question 99")
+    assert history[-1][1].startswith("answer 99")
+
+
+@pytest.mark.unit
+def test_oversized_turn_is_truncated_to_budget():
+    """A single turn larger than the budget is cut to fit instead of stored whole."""
+    memory = ConversationMemoryStore(max_history_tokens=10)
+    memory.add_turn("s", "short", "reply")
+    memory.add_turn("s", "x" * 200, "y" * 200)
+
+    history = memory.get_history("s")
+    assert memory.get_history_tokens("s") <= 10
+    assert [role for role, _ in history] == [HUMAN_ROLE, AI_ROLE]
+    assert history[0][1] == "x" * 20
+    assert history[1][1] == "y" * 20
+
+    # A short question leaves the rest of the budget to the response
+    memory.add_turn("t", "why?", "z" * 200)
+    assert memory.get_history("t") == [(HUMAN_ROLE, "why?"), (AI_ROLE, "z" * 36)]
+
+
+@pytest.mark.unit
+def test_lru_eviction_caps_sessions():
+    """Least recently used sessions are evicted beyond max_sessions."""
+    memory = ConversationMemoryStore(max_sessions=2)
+    memory.add_turn("a", "1", "1")
+    memory.add_turn("b", "2", "2")
+    memory.get_history("a")  # touch "a" so "b" is least recently used
+    memory.add_turn("c", "3", "3")
+
+    assert memory.get_history("b") == []
+    assert memory.get_history("a") != []
+    assert memory.get_stats()["sessions"] == 2
+    assert memory.get_stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_idle_sessions_expire():
+    """Sessions idle longer than the TTL are dropped on next access."""
+    memory = ConversationMemoryStore(idle_ttl_seconds=60.0)
+    with patch(
+        "services.orchestrator.conversation_memory.time.monotonic", return_value=0.0
+    ):
+        memory.add_turn("a", "hello", "hi")
+    with patch(
+        "services.orchestrator.conversation_memory.time.monotonic", return_value=120.0
+    ):
+        assert memory.get_history("a") == []
+    assert memory.get_stats()["sessions"] == 0
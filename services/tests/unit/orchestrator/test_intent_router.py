@@ -0,0 +1,94 @@
+"""Unit tests and benchmark for the orchestrator fast-path intent router."""
+
+import json
+from pathlib import Path
+import time
+
+import pytest
+
+from services.orchestrator.intent_router import IntentRouter, normalize_transcript
+
+
+CORPUS_PATH = (
+    Path(__file__).parents[2] / "fixtures" / "orchestrator" / "sample_transcripts.json"
+)
+
+
+@pytest.fixture
+def corpus() -> list[dict]:
+    """Sample transcripts with expected fast-path intents."""
+    with CORPUS_PATH.open(encoding="utf-8") as f:
+        return json.load(f)["transcripts"]
+
+
+@pytest.mark.unit
+def test_normalize_transcript():
+    """Punctuation is stripped and whitespace collapsed, apostrophes kept."""
+    assert normalize_transcript("  What's   the TIME?! ") == "what's the time"
+
+
+@pytest.mark.unit
+def test_corpus_routing_matches_expected_intents(corpus):
+    """Every corpus transcript is routed to its expected intent or falls through."""
+    router = IntentRouter()
+    for sample in corpus:
+        result = router.route(sample["text"])
+        actual = result.intent if result else None
+        assert actual == sample["intent"], sample["text"]
+
+
+@pytest.mark.unit
+def test_handler_override_is_used():
+    """Handler overrides replace the built-in answer for an intent."""
+    router = IntentRouter(handlers={"current_time": lambda: "tool answer"})
+    result = router.route("what time is it")
+    assert result is not None
+    assert result.response == "tool answer"
+
+
+@pytest.mark.unit
+def test_long_transcripts_fall_through():
+    """Transcripts over the length limit always go to the agent."""
+    router = IntentRouter(max_transcript_chars=10)
+    assert router.route("what time is it") is None
+    assert router.misses == 1
+
+
+@pytest.mark.unit
+def test_latency_saved_uses_agent_ewma():
+    """Latency saved is unknown until the agent has been timed, then tracks the EWMA."""
+    router = IntentRouter(latency_ewma_alpha=0.5)
+    result = router.route("hello")
+    assert result is not None
+    assert router.estimate_latency_saved(result) is None
+
+    router.record_agent_latency(2.0)
+    router.record_agent_latency(4.0)
+    assert router.agent_latency_estimate_s == pytest.approx(3.0)
+    saved = router.estimate_latency_saved(result)
+    assert saved is not None
+    assert 2.9 < saved <= 3.0
+
+
+@pytest.mark.performance
+def test_router_benchmark_over_corpus(corpus):
+    """Benchmark routing cost and hit rate over the sample corpus."""
+    router = IntentRouter()
+    iterations = 500
+    texts = [sample["text"] for sample in corpus]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in texts:
+            router.route(text)
+    duration = time.perf_counter() - start
+
+    per_call_us = duration / (iterations * len(texts)) * 1e6
+    expected_hits = sum(1 for sample in corpus if sample["intent"])
+    assert router.hit_rate == pytest.approx(expected_hits / len(texts))
+    # Routing must be negligible next to a single LLM round-trip
+    assert per_call_us < 200
+    print(
+        f"Routed {iterations * len(texts)} transcripts: {per_call_us:.1f} us/call, "
+        f"hit rate {router.hit_rate:.0%}"
+    )
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Memory and throughput benchmark for validation window loading.
+
+Compares three ways of turning a validation feature file into shuffled
+(batch, window, features) batches, each in a fresh process:
+
+- openwakeword: list of window slices + np.array, as in openwakeword/train.py
+- wrapper: stride-tricks view copied with np.array(copy=True), the previous
+  train_wrapper_minimal.py behaviour
+- lazy: np.load(mmap_mode="r") + SlidingWindowFeatures, gathering one batch
+  at a time (feature_windows.py)
+
+Peak RSS of the lazy loader includes the file-backed pages of the memory map
+it has touched. The kernel can reclaim those pages, unlike the anonymous
+memory of a materialized copy.
+
+Usage:
+    python benchmark_feature_windows.py                     # synthetic, full-size
+    python benchmark_feature_windows.py --features validation_set_features.npy
+    python benchmark_feature_windows.py --samples 100000 --strategies wrapper lazy
+"""
+
+import argparse
+import json
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from feature_windows import SlidingWindowFeatures, window_batches
+
+
+STRATEGIES = ("openwakeword", "wrapper", "lazy")
+# Shape of the full false-positive validation set
+DEFAULT_SAMPLES = 481_345
+DEFAULT_FEATURES = 96
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_strategy(
+    strategy: str, path: Path, window_size: int, batch_size: int, max_batches: int
+) -> dict[str, Any]:
+    """Build the windows and iterate shuffled batches; runs in the child."""
+    baseline_mb = _peak_rss_mb()
+    start = time.perf_counter()
+    if strategy == "lazy":
+        windows = SlidingWindowFeatures(np.load(path, mmap_mode="r"), window_size)
+        count = len(windows)
+    else:
+        data = np.load(path)
+        count = data.shape[0] - window_size + 1
+        if strategy == "openwakeword":
+            materialized = np.array([data[i : i + window_size] for i in range(count)])
+        else:
+            view = as_strided(
+                data,
+                shape=(count, window_size, data.shape[1]),
+                strides=(data.strides[0], data.strides[0], data.strides[1]),
+                writeable=False,
+            )
+            materialized = np.array(view, copy=True, dtype=data.dtype)
+        del data
+    setup_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    seen = 0
+    checksum = 0.0
+    if strategy == "lazy":
+        batches = (batch for batch, _ in window_batches(windows, batch_size, seed=0))
+    else:
+        order = np.random.default_rng(0).permutation(count)
+        batches = (
+            materialized[order[i : i + batch_size]] for i in range(0, count, batch_size)
+        )
+    for batch_index, batch in enumerate(batches):
+        if max_batches and batch_index >= max_batches:
+            break
+        checksum += float(batch.sum())
+        seen += len(batch)
+    iterate_s = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "windows": count,
+        "setup_s": round(setup_s, 3),
+        "iterate_s": round(iterate_s, 3),
+        "windows_per_s": round(seen / iterate_s) if iterate_s else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "baseline_rss_mb": round(baseline_mb, 1),
+        "checksum": checksum,
+    }
+
+
+def run_benchmark(
+    path: Path,
+    strategies: list[str],
+    window_size: int = 16,
+    batch_size: int = 64,
+    max_batches: int = 0,
+) -> list[dict[str, Any]]:
+    """Run each strategy in its own process so peak RSS is not shared."""
+    results = []
+    for strategy in strategies:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                strategy,
+                "--features",
+                str(path),
+                "--window-size",
+                str(window_size),
+                "--batch-size",
+                str(batch_size),
+                "--max-batches",
+                str(max_batches),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            # A materializing strategy killed by the OOM killer lands here
+            results.append(
+                {
+                    "strategy": strategy,
+                    "error": (completed.stderr.strip().splitlines() or ["killed"])[-1],
+                    "returncode": completed.returncode,
+                }
+            )
+            continue
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark validation window loading (memory and throughput)"
+    )
+    parser.add_argument(
+        "--features", type=Path, help="Feature file (default: synthetic data)"
+    )
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--feature-dim", type=int, default=DEFAULT_FEATURES)
+    parser.add_argument("--window-size", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument(
+        "--max-batches", type=int, default=0, help="Stop after N batches (0 = all)"
+    )
+    parser.add_argument(
+        "--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES)
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    parser.add_argument("--child", choices=STRATEGIES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = _run_strategy(
+            args.child,
+            args.features,
+            args.window_size,
+            args.batch_size,
+            args.max_batches,
+        )
+        print(json.dumps(result))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.features
+        if path is None:
+            path = Path(tmp_dir) / "validation_set_features.npy"
+            rng = np.random.default_rng(0)
+            np.save(
+                path,
+                rng.random((args.samples, args.feature_dim), dtype=np.float32),
+            )
+        print(
+            f"Features: {path} ({path.stat().st_size / (1024**2):.0f} MB), "
+            f"window {args.window_size}, batch {args.batch_size}",
+            file=sys.stderr,
+        )
+        results = run_benchmark(
+            path,
+            args.strategies,
+            window_size=args.window_size,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"{'strategy':>13}  {'peak RSS MB':>11}  {'setup s':>8}  "
+        f"{'iterate s':>9}  {'windows/s':>10}"
+    )
+    for result in results:
+        if "error" in result:
+            print(f"{result['strategy']:>13}  failed: {result['error']}")
+            continue
+        print(
+            f"{result['strategy']:>13}  {result['peak_rss_mb']:11.0f}  "
+            f"{result['setup_s']:8.2f}  {result['iterate_s']:9.2f}  "
+            f"{result['windows_per_s']:10d}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Create a smaller subset of the validation features file for testing.
 
-This script creates a subset of the full validation dataset to avoid OOM errors
-while still providing some false-positive validation during training.
+This script creates a subset of the full validation dataset for quicker
+training runs. It is no longer needed to avoid OOM errors: train_wrapper_minimal.py
+streams the full validation set in batches (see feature_windows.py).
 """
 
 import argparse
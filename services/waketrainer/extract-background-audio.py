@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
-"""Extract background audio from HuggingFace dataset to WAV files for torch_audiomentations."""
+"""Extract background audio from HuggingFace dataset to WAV files for torch_audiomentations.
+
+Clips are decoded, resampled and written by a process pool while the main
+process only iterates the dataset (optionally in streaming mode, with audio
+decoding deferred to the workers). Each worker records the clips it finished
+in its own manifest shard, so an interrupted run resumes where it stopped.
+WAV files are written under a temporary name and renamed into place, so the
+output directory never holds partial clips.
+"""
 
 import argparse
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import io
+import json
 import os
 import sys
+import time
 from pathlib import Path
+from typing import Any
 
 try:
-    from datasets import load_dataset
+    from datasets import Audio, load_dataset
 except ImportError:
     print(
         "Error: datasets library not available. Install with: pip install datasets",
@@ -26,11 +40,239 @@ except ImportError:
     sys.exit(1)
 
 
+# Clips queued per worker; bounds memory when streaming large datasets
+IN_FLIGHT_PER_WORKER = 4
+PROGRESS_INTERVAL_S = 5.0
+
+
+def manifest_dir_for(output_path: Path) -> Path:
+    """Manifest/staging directory, kept outside the flat WAV directory.
+
+    openwakeword lists background directories non-recursively, so nothing but
+    finished WAV files may live in the output directory.
+    """
+    return output_path.parent / f".{output_path.name}-manifest"
+
+
+def read_manifest(manifest_dir: Path) -> dict[str, dict[str, Any]]:
+    """Merge all worker manifest shards into {filename: entry}."""
+    entries: dict[str, dict[str, Any]] = {}
+    for shard in sorted(manifest_dir.glob("worker-*.jsonl")):
+        for line in shard.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line of a killed worker
+            entries[entry["file"]] = entry
+    return entries
+
+
+def _output_filename(item: dict[str, Any], idx: int) -> str:
+    """Use the item ID or source file name if available, else the index."""
+    if "id" in item:
+        return f"{item['id']}.wav"
+    if "file" in item:
+        return f"{Path(item['file']).stem}.wav"
+    return f"audio_{idx:06d}.wav"
+
+
+def _clip_source(item: dict[str, Any]) -> dict[str, Any] | None:
+    """The picklable part of an item a worker needs to produce the clip."""
+    if "audio" in item:
+        audio_data = item["audio"]
+        if isinstance(audio_data, dict):
+            # Undecoded {"bytes", "path"} or decoded {"array", "sampling_rate"}
+            return dict(audio_data)
+        return {"array": audio_data}
+    if "array" in item:
+        return {"array": item["array"], "sampling_rate": item.get("sampling_rate")}
+    return None
+
+
+def _decode(source: dict[str, Any], default_rate: int) -> tuple[np.ndarray, int]:
+    if source.get("array") is not None:
+        audio_array = np.asarray(source["array"], dtype=np.float32)
+        return audio_array, source.get("sampling_rate") or default_rate
+    if source.get("bytes"):
+        audio_array, rate = sf.read(io.BytesIO(source["bytes"]), dtype="float32")
+    elif source.get("path"):
+        audio_array, rate = sf.read(source["path"], dtype="float32")
+    else:
+        raise ValueError("audio has neither array, bytes nor path")
+    if audio_array.ndim > 1:
+        audio_array = audio_array.mean(axis=1)
+    return audio_array, int(rate)
+
+
+def _resample(
+    audio_array: np.ndarray, source_rate: int, target_rate: int
+) -> np.ndarray:
+    """Resample with linear interpolation."""
+    if source_rate == target_rate:
+        return audio_array
+    new_length = int(len(audio_array) * target_rate / source_rate)
+    indices = np.linspace(0, len(audio_array) - 1, new_length)
+    return np.interp(indices, np.arange(len(audio_array)), audio_array)
+
+
+def extract_clip(
+    filename: str,
+    source: dict[str, Any],
+    output_path: Path,
+    manifest_dir: Path,
+    sample_rate: int,
+) -> dict[str, Any]:
+    """Decode, resample and write one clip; runs in a worker process.
+
+    Returns:
+        The manifest entry, or {"file", "error"} on failure
+    """
+    try:
+        audio_array, item_sample_rate = _decode(source, sample_rate)
+        audio_array = _resample(audio_array, item_sample_rate, sample_rate)
+
+        # Normalize audio to [-1.0, 1.0] range if needed
+        if audio_array.max() > 1.0 or audio_array.min() < -1.0:
+            audio_array = audio_array / np.max(np.abs(audio_array))
+
+        # Stage next to the manifest (same filesystem), then rename into place
+        staging_file = manifest_dir / f"{filename}.{os.getpid()}.partial"
+        sf.write(str(staging_file), audio_array, sample_rate, format="WAV")
+        output_file = output_path / filename
+        staging_file.replace(output_file)
+    except Exception as e:
+        return {"file": filename, "error": str(e)}
+
+    entry = {
+        "file": filename,
+        "bytes": output_file.stat().st_size,
+        "duration_s": round(len(audio_array) / sample_rate, 3),
+    }
+    # One manifest shard per worker process: appends never interleave
+    with (manifest_dir / f"worker-{os.getpid()}.jsonl").open("a") as shard:
+        shard.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def _load_dataset(
+    dataset_path: Path, repo_id: str, datasets_cache: Path, streaming: bool
+) -> Any:
+    """Load the dataset with audio decoding deferred to the workers."""
+    # Load dataset - try local directory first, then fall back to repo
+    # HuggingFace datasets can be in various formats (Parquet, Arrow, etc.)
+    if dataset_path.exists() and any(dataset_path.iterdir()):
+        print("Loading dataset from local directory...")
+        try:
+            # Try loading as Parquet dataset from local directory
+            dataset = load_dataset(
+                "parquet",
+                data_dir=str(dataset_path),
+                split="train",
+                cache_dir=str(datasets_cache),
+                streaming=streaming,
+                trust_remote_code=True,
+            )
+        except Exception as local_error:
+            print(
+                f"Could not load from local directory as Parquet: {local_error}",
+                file=sys.stderr,
+            )
+            print(f"Trying to load directly from {repo_id}...")
+            dataset = load_dataset(
+                repo_id,
+                split="train",
+                cache_dir=str(datasets_cache),
+                streaming=streaming,
+                trust_remote_code=True,
+            )
+    else:
+        print(f"Local directory not found or empty, loading from {repo_id}...")
+        dataset = load_dataset(
+            repo_id,
+            split="train",
+            cache_dir=str(datasets_cache),
+            streaming=streaming,
+            trust_remote_code=True,
+        )
+
+    if "audio" in (dataset.column_names or []):
+        # Hand workers the encoded bytes instead of decoding in this process
+        dataset = dataset.cast_column("audio", Audio(decode=False))
+    return dataset
+
+
+class _Progress:
+    """Clip counts and throughput, printed at most every PROGRESS_INTERVAL_S."""
+
+    def __init__(self, total: int | None, skipped: int) -> None:
+        self.total = total
+        self.skipped = skipped
+        self.success = 0
+        self.errors = 0
+        self.bytes_written = 0
+        self.start = time.perf_counter()
+        self._last_report = self.start
+
+    def record(self, result: dict[str, Any]) -> None:
+        if "error" in result:
+            self.errors += 1
+            print(
+                f"Error processing {result['file']}: {result['error']}",
+                file=sys.stderr,
+            )
+        else:
+            self.success += 1
+            self.bytes_written += result["bytes"]
+        if time.perf_counter() - self._last_report >= PROGRESS_INTERVAL_S:
+            self.report()
+
+    def report(self) -> None:
+        self._last_report = time.perf_counter()
+        elapsed = max(self._last_report - self.start, 1e-9)
+        done = self.success + self.errors + self.skipped
+        position = (
+            f"{done}/{self.total} ({100 * done / self.total:.1f}%)"
+            if self.total
+            else f"{done}"
+        )
+        print(
+            f"Progress: {position} - Success: {self.success}, Errors: {self.errors}, "
+            f"Skipped: {self.skipped} - {self.success / elapsed:.1f} clips/s, "
+            f"{self.bytes_written / (1024**2) / elapsed:.1f} MB/s"
+        )
+
+
+def _tasks(
+    dataset: Any,
+    done: dict[str, dict[str, Any]],
+    output_path: Path,
+    progress: _Progress,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """(filename, source) for every clip not already in the manifest."""
+    for idx, item in enumerate(dataset):
+        filename = _output_filename(item, idx)
+        if filename in done and (output_path / filename).exists():
+            progress.skipped += 1
+            continue
+        source = _clip_source(item)
+        if source is None:
+            print(
+                f"Warning: Item {idx} doesn't have expected audio format, skipping",
+                file=sys.stderr,
+            )
+            progress.errors += 1
+            continue
+        yield filename, source
+
+
 def extract_background_audio(
     dataset_dir: str | Path,
     output_dir: str | Path,
     repo_id: str = "Myrtle/CAIMAN-ASR-BackgroundNoise",
     sample_rate: int = 16000,
+    workers: int | None = None,
+    streaming: bool = False,
+    resume: bool = True,
 ) -> int:
     """Extract background audio from HuggingFace dataset to WAV files.
 
@@ -39,15 +281,24 @@ def extract_background_audio(
         output_dir: Directory to write WAV files
         repo_id: HuggingFace repository ID
         sample_rate: Target sample rate for WAV files (default: 16000)
+        workers: Decode/resample/write processes (default: CPU count;
+            1 extracts in this process)
+        streaming: Iterate the dataset without materializing it in the cache
+        resume: Skip clips recorded in the manifest by an earlier run
 
     Returns:
         0 on success, 1 on error
     """
     dataset_path = Path(dataset_dir)
     output_path = Path(output_dir)
+    manifest_dir = manifest_dir_for(output_path)
+    workers = workers or os.cpu_count() or 1
 
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    for stale in manifest_dir.glob("*.partial"):
+        stale.unlink()
 
     # Set cache directory to writable location in workspace
     # Override HF_HOME (set by base Dockerfile to /app/models which isn't writable)
@@ -64,130 +315,56 @@ def extract_background_audio(
     print(f"Output directory: {output_path}")
     print(f"Target sample rate: {sample_rate} Hz")
     print(f"Cache directory: {datasets_cache}")
+    print(f"Workers: {workers}{' (streaming)' if streaming else ''}")
 
-    try:
-        # Load dataset - try local directory first, then fall back to repo
-        # HuggingFace datasets can be in various formats (Parquet, Arrow, etc.)
-        if dataset_path.exists() and any(dataset_path.iterdir()):
-            print("Loading dataset from local directory...")
-            try:
-                # Try loading as Parquet dataset from local directory
-                dataset = load_dataset(
-                    "parquet",
-                    data_dir=str(dataset_path),
-                    split="train",
-                    cache_dir=str(datasets_cache),
-                    trust_remote_code=True,
-                )
-            except Exception as local_error:
-                print(
-                    f"Could not load from local directory as Parquet: {local_error}",
-                    file=sys.stderr,
-                )
-                print(f"Trying to load directly from {repo_id}...")
-                dataset = load_dataset(
-                    repo_id,
-                    split="train",
-                    cache_dir=str(datasets_cache),
-                    trust_remote_code=True,
-                )
-        else:
-            print(f"Local directory not found or empty, loading from {repo_id}...")
-            dataset = load_dataset(
-                repo_id,
-                split="train",
-                cache_dir=str(datasets_cache),
-                trust_remote_code=True,
-            )
+    done = read_manifest(manifest_dir) if resume else {}
+    if done:
+        print(f"Resuming: {len(done)} clips already extracted")
 
-        total_items = len(dataset)
-        print(f"\nFound {total_items} audio items in dataset")
+    try:
+        dataset = _load_dataset(dataset_path, repo_id, datasets_cache, streaming)
+        total_items = None if streaming else len(dataset)
+        print(f"\nFound {total_items or 'streaming'} audio items in dataset")
         print("Extracting audio to WAV files...")
 
-        success_count = 0
-        error_count = 0
-
-        for idx, item in enumerate(dataset):
-            try:
-                # Extract audio data from item
-                # Dataset items typically have an "audio" column
-                if "audio" in item:
-                    audio_data = item["audio"]
-                    if isinstance(audio_data, dict):
-                        # Audio dict with "array" and "sampling_rate"
-                        audio_array = np.array(audio_data["array"], dtype=np.float32)
-                        item_sample_rate = audio_data.get("sampling_rate", sample_rate)
-                    else:
-                        # Audio is already an array
-                        audio_array = np.array(audio_data, dtype=np.float32)
-                        item_sample_rate = sample_rate
-                elif "array" in item:
-                    # Direct array in item
-                    audio_array = np.array(item["array"], dtype=np.float32)
-                    item_sample_rate = item.get("sampling_rate", sample_rate)
-                else:
-                    # Try to find audio-like data in item
-                    print(
-                        f"Warning: Item {idx} doesn't have expected audio format, skipping",
-                        file=sys.stderr,
-                    )
-                    error_count += 1
-                    continue
-
-                # Resample if needed (simple linear interpolation for now)
-                if item_sample_rate != sample_rate:
-                    # Calculate resampling ratio
-                    ratio = sample_rate / item_sample_rate
-                    new_length = int(len(audio_array) * ratio)
-                    # Simple linear interpolation
-                    indices = np.linspace(0, len(audio_array) - 1, new_length)
-                    audio_array = np.interp(
-                        indices, np.arange(len(audio_array)), audio_array
-                    )
-
-                # Normalize audio to [-1.0, 1.0] range if needed
-                if audio_array.max() > 1.0 or audio_array.min() < -1.0:
-                    audio_array = audio_array / np.max(np.abs(audio_array))
-
-                # Generate filename (use index or item ID if available)
-                if "id" in item:
-                    filename = f"{item['id']}.wav"
-                elif "file" in item:
-                    # Extract filename from path if available
-                    filepath = Path(item["file"])
-                    filename = f"{filepath.stem}.wav"
-                else:
-                    filename = f"audio_{idx:06d}.wav"
-
-                output_file = output_path / filename
-
-                # Write WAV file
-                sf.write(str(output_file), audio_array, sample_rate)
-
-                success_count += 1
-
-                # Progress reporting every 100 items
-                if (idx + 1) % 100 == 0 or (idx + 1) == total_items:
-                    print(
-                        f"Progress: {idx + 1}/{total_items} ({100 * (idx + 1) / total_items:.1f}%) - "
-                        f"Success: {success_count}, Errors: {error_count}"
+        progress = _Progress(total_items, skipped=0)
+        tasks = _tasks(dataset, done, output_path, progress)
+        if workers == 1:
+            for filename, source in tasks:
+                progress.record(
+                    extract_clip(
+                        filename, source, output_path, manifest_dir, sample_rate
                     )
-
-            except Exception as e:
-                error_count += 1
-                print(
-                    f"Error processing item {idx}: {e}",
-                    file=sys.stderr,
                 )
-                # Continue processing other items
-                continue
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending: set[Future[dict[str, Any]]] = set()
+                for filename, source in tasks:
+                    if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            progress.record(future.result())
+                    pending.add(
+                        pool.submit(
+                            extract_clip,
+                            filename,
+                            source,
+                            output_path,
+                            manifest_dir,
+                            sample_rate,
+                        )
+                    )
+                for future in wait(pending).done:
+                    progress.record(future.result())
+        progress.report()
 
         print("\nExtraction complete!")
-        print(f"  Successfully extracted: {success_count} files")
-        print(f"  Errors: {error_count} files")
+        print(f"  Successfully extracted: {progress.success} files")
+        print(f"  Already extracted: {progress.skipped} files")
+        print(f"  Errors: {progress.errors} files")
         print(f"  Output directory: {output_path}")
 
-        if success_count == 0:
+        if progress.success + progress.skipped == 0:
             print(
                 "Warning: No files were successfully extracted!",
                 file=sys.stderr,
@@ -232,6 +409,22 @@ def main() -> int:
         default=16000,
         help="Target sample rate for WAV files (default: 16000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for decoding/resampling (default: CPU count)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream the dataset instead of materializing it in the HF cache",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Re-extract clips already recorded in the manifest",
+    )
 
     args = parser.parse_args()
 
@@ -240,6 +433,9 @@ def main() -> int:
         output_dir=args.output_dir,
         repo_id=args.repo_id,
         sample_rate=args.sample_rate,
+        workers=args.workers,
+        streaming=args.streaming,
+        resume=not args.no_resume,
     )
 
 
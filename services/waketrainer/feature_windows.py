@@ -0,0 +1,167 @@
+"""Lazy sliding-window batches over memory-mapped openWakeWord feature files.
+
+openWakeWord's false-positive validation turns an (n, features) feature array
+into every overlapping (window, features) slice up front. Materialized, that is
+``window`` times the file (481,345 x 16 x 96 float32 = 2.9 GB for the full
+validation set) before the model sees a single batch.
+
+Here the windows stay a strided view over the ``np.load(..., mmap_mode="r")``
+array and only the windows of the current batch are copied into memory, so
+peak RSS is bounded by the batch size rather than by the dataset:
+
+    data = np.load("validation_set_features.npy", mmap_mode="r")
+    windows = SlidingWindowFeatures(data, window_size=16)
+    for features, labels in window_batches(windows, batch_size=64, seed=0):
+        ...
+"""
+
+from collections.abc import Iterator
+import math
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+class SlidingWindowFeatures:
+    """Overlapping windows of a 2D feature array, gathered only on access.
+
+    Behaves like the (n_windows, window_size, features) array openWakeWord
+    builds with ``np.array([data[i:i + window] for i in ...])`` as far as
+    ``shape``, ``len`` and indexing go, but holds no window data itself.
+    """
+
+    def __init__(
+        self, data: np.ndarray, window_size: int, n_windows: int | None = None
+    ) -> None:
+        """Create the windowed view.
+
+        Args:
+            data: 2D array of shape (n, features), typically memory-mapped
+            window_size: Frames per window (the model's input_shape[0])
+            n_windows: Number of leading windows to expose (default: all
+                n - window_size + 1)
+        """
+        if data.ndim != 2:
+            raise ValueError(f"Expected 2D feature data, got shape {data.shape}")
+        n_samples, n_features = data.shape
+        max_windows = n_samples - window_size + 1
+        if max_windows <= 0:
+            raise ValueError(
+                f"Window size {window_size} is larger than data length {n_samples}"
+            )
+        if n_windows is None:
+            n_windows = max_windows
+        if not 0 < n_windows <= max_windows:
+            raise ValueError(f"n_windows must be in 1..{max_windows}, got {n_windows}")
+
+        self.data = data
+        self.window_size = window_size
+        self._view = as_strided(
+            data,
+            shape=(n_windows, window_size, n_features),
+            strides=(data.strides[0], data.strides[0], data.strides[1]),
+            writeable=False,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._view.shape  # type: ignore[return-value]
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self._view.dtype
+
+    @property
+    def ndim(self) -> int:
+        return 3
+
+    @property
+    def materialized_nbytes(self) -> int:
+        """Bytes a full copy of all windows would take."""
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, index: Any) -> np.ndarray:
+        """Copy of the selected window(s)."""
+        return np.array(self._view[index])
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        """Gather windows by index into a new (len(indices), window, features) array."""
+        return self._view[np.asarray(indices, dtype=np.intp)]
+
+
+def window_batches(
+    windows: SlidingWindowFeatures,
+    batch_size: int,
+    labels: np.ndarray | None = None,
+    shuffle: bool = True,
+    seed: int | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield (features, labels) batches, shuffling window indices, not data.
+
+    Each batch's indices are sorted before the gather so that the memory map
+    is read front to back; order within a batch does not matter for training.
+
+    Args:
+        windows: Windowed feature view
+        batch_size: Windows per batch; bounds the memory held at once
+        labels: Per-window labels (default: zeros, as for false-positive data)
+        shuffle: Visit windows in a random permutation
+        seed: Seed for the permutation
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    count = len(windows)
+    if shuffle:
+        order = np.random.default_rng(seed).permutation(count)
+    else:
+        order = np.arange(count)
+    for start in range(0, count, batch_size):
+        indices = np.sort(order[start : start + batch_size])
+        batch_labels = (
+            labels[indices]
+            if labels is not None
+            else np.zeros(len(indices), dtype=np.float32)
+        )
+        yield windows.take(indices), batch_labels
+
+
+class WindowBatchLoader:
+    """Re-iterable (features, labels) torch batches in place of a DataLoader.
+
+    Each iteration is one epoch; with ``shuffle`` every epoch draws a new
+    permutation from the loader's seeded generator.
+    """
+
+    def __init__(
+        self,
+        windows: SlidingWindowFeatures,
+        labels: np.ndarray | None = None,
+        batch_size: int = 64,
+        shuffle: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        self.windows = windows
+        self.labels = labels
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.windows) / self.batch_size)
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        import torch
+
+        epoch_seed = int(self._rng.integers(2**32)) if self.shuffle else None
+        for features, labels in window_batches(
+            self.windows,
+            self.batch_size,
+            labels=self.labels,
+            shuffle=self.shuffle,
+            seed=epoch_seed,
+        ):
+            yield torch.from_numpy(features), torch.from_numpy(labels)
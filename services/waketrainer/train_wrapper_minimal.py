@@ -2,285 +2,215 @@
 # type: ignore
 """Minimal wrapper to fix memory-intensive validation in openwakeword.
 
-This wrapper patches the auto_train method to:
-1. Replace memory-intensive list comprehension reshape with stride-tricks
-2. Fix DataLoader batch_size to use reasonable batches instead of loading everything
-3. Add GPU cache clearing before validation
-
-The problematic code in openwakeword/train.py:
-- Line 868: X_val_fp = np.array([X_val_fp[i:i+input_shape[0]] for i in range(...)])
-- Line 872: batch_size=len(X_val_fp_labels)  # Loads ALL validation data at once!
+openwakeword/train.py prepares false-positive validation data with:
+- X_val_fp = np.load(path)
+- X_val_fp = np.array([X_val_fp[i:i+input_shape[0]] for i in range(...)])
+- DataLoader(TensorDataset(...), batch_size=len(X_val_fp_labels))
+
+That materializes every sliding window (16x the feature file) and then moves
+all of them to the GPU as a single batch. Before train.py runs, this wrapper
+patches those calls so that:
+1. The validation features are loaded with mmap_mode="r"
+2. The window reshape returns a lazy SlidingWindowFeatures view
+3. The validation DataLoader becomes a WindowBatchLoader that gathers
+   VALIDATION_BATCH_SIZE windows at a time
+4. An empty validation path disables false-positive validation
 """
 
+from collections.abc import Callable
 import sys
 from pathlib import Path
 from typing import Any
 import numpy as np
-from numpy.lib.stride_tricks import as_strided
 
+from feature_windows import SlidingWindowFeatures, WindowBatchLoader
 
-def efficient_sliding_window_reshape(data: np.ndarray, window_size: int) -> np.ndarray:
-    """Create sliding windows efficiently using numpy stride tricks.
 
-    This avoids creating an intermediate Python list, which is the root cause
-    of the memory issue.
+# Windows per validation batch; each window is window_size x features float32
+VALIDATION_BATCH_SIZE = 64
+# Anything larger is the "all validation data in one batch" DataLoader
+MAX_DATALOADER_BATCH_SIZE = 1000
+
+
+def _is_validation_path(path: str) -> bool:
+    return (
+        "validation_set_features" in path or "false_positive_validation" in path.lower()
+    )
+
+
+def efficient_sliding_window_reshape(
+    data: np.ndarray, window_size: int, n_windows: int | None = None
+) -> SlidingWindowFeatures:
+    """Sliding windows over ``data`` without copying them.
 
     Args:
         data: 2D array of shape (n, features)
         window_size: Size of each sliding window (input_shape[0])
+        n_windows: Number of windows train.py asked for (default: all)
 
     Returns:
-        3D array of shape (n - window_size + 1, window_size, features)
+        Lazy (n_windows, window_size, features) view; windows are only copied
+        batch by batch when iterated
     """
-    n_samples, n_features = data.shape
-    n_windows = n_samples - window_size + 1
+    return SlidingWindowFeatures(data, window_size, n_windows=n_windows)
 
-    if n_windows <= 0:
-        raise ValueError(
-            f"Window size {window_size} is larger than data length {n_samples}"
-        )
 
-    # Create view with sliding windows using stride tricks (memory efficient)
-    shape = (n_windows, window_size, n_features)
-    strides = (data.strides[0], data.strides[0], data.strides[1])
+class _WindowedTensors:
+    """TensorDataset stand-in holding lazy windows and their labels."""
 
-    # Create view (no copy yet)
-    windows_view = as_strided(data, shape=shape, strides=strides, writeable=False)
+    def __init__(self, windows: SlidingWindowFeatures, labels: Any) -> None:
+        self.windows = windows
+        self.labels = labels
 
-    # Return a copy to ensure data integrity and proper memory layout
-    return np.array(windows_view, copy=True, dtype=data.dtype)
+    def __len__(self) -> int:
+        return len(self.windows)
 
 
-def patch_auto_train():
-    """Patch openwakeword.train.Model.auto_train to fix validation memory issues."""
-    try:
-        import openwakeword.train as oww_train
+def install_validation_patches() -> Callable[[], None]:
+    """Patch numpy/torch so train.py streams validation windows lazily.
 
-        if not hasattr(oww_train, "Model"):
-            print("Warning: openwakeword.train.Model not found", file=sys.stderr)
-            return False
-
-        original_auto_train = oww_train.Model.auto_train
-
-        def patched_auto_train(self: Any, *args: Any, **kwargs: Any) -> Any:
-            """Patched auto_train with efficient reshape and DataLoader batch size fix."""
-            # Track validation data and input_shape to intercept reshape
-            validation_context = {
-                "data": None,
-                "input_shape": None,
-                "loaded_path": None,
-            }
+    Returns:
+        Function restoring the original numpy and torch callables
+    """
+    tracked: dict[str, Any] = {"data": None}
 
-            original_np_load = np.load
-            original_np_array = np.array
+    original_np_load = np.load
+    original_np_array = np.array
 
-            # Patch torch.utils.data.DataLoader to fix batch_size
-            import torch.utils.data
+    def patched_np_load(*args: Any, **kwargs: Any) -> np.ndarray:
+        """Skip empty paths; memory-map and track validation features."""
+        if args and isinstance(args[0], str) and args[0].strip() == "":
+            # Return empty array for empty string paths (disables validation)
+            print(
+                "Skipping false-positive validation (empty path provided)",
+                file=sys.stderr,
+            )
+            return original_np_array([])
+        if args and _is_validation_path(str(args[0])):
+            kwargs.setdefault("mmap_mode", "r")
+            result = original_np_load(*args, **kwargs)
+            if getattr(result, "ndim", 0) == 2:
+                tracked["data"] = result
+                print(
+                    f"Memory-mapped validation data: shape {result.shape}, "
+                    f"{result.nbytes / (1024**2):.2f} MB on disk",
+                    file=sys.stderr,
+                )
+            return result
+        return original_np_load(*args, **kwargs)
 
-            original_data_loader = torch.utils.data.DataLoader
+    def patched_np_array(*args: Any, **kwargs: Any) -> Any:
+        """Return lazy windows for the list-of-slices validation reshape."""
+        data = tracked["data"]
+        if (
+            data is not None
+            and len(args) == 1
+            and isinstance(args[0], list)
+            and args[0]
+        ):
+            first = args[0][0]
+            if (
+                isinstance(first, np.ndarray)
+                and first.ndim == 2
+                and first.shape[1] == data.shape[1]
+                and np.may_share_memory(first, data)
+                and len(args[0]) <= data.shape[0] - first.shape[0] + 1
+            ):
+                windows = efficient_sliding_window_reshape(
+                    data, first.shape[0], n_windows=len(args[0])
+                )
+                print(
+                    f"Using lazy sliding windows: {len(windows)} windows of "
+                    f"{first.shape[0]} frames (materialized size "
+                    f"{windows.materialized_nbytes / (1024**3):.2f} GB avoided)",
+                    file=sys.stderr,
+                )
+                return windows
+        return original_np_array(*args, **kwargs)
 
-            def tracked_np_load(*args_load: Any, **kwargs_load: Any) -> np.ndarray:
-                """Track when validation data file is loaded."""
-                result = original_np_load(*args_load, **kwargs_load)
+    np.load = patched_np_load
+    np.array = patched_np_array
 
-                # Check if this is the validation data file
-                if len(args_load) > 0:
-                    path = (
-                        args_load[0]
-                        if isinstance(args_load[0], str)
-                        else str(args_load[0])
-                    )
-                    if (
-                        "validation_set_features" in path
-                        or "false_positive_validation" in path.lower()
-                    ):
-                        validation_context["data"] = result
-                        validation_context["loaded_path"] = path
-                        print(
-                            f"Tracked validation data: shape {result.shape}, size {result.nbytes / (1024**2):.2f} MB",
-                            file=sys.stderr,
-                        )
+    try:
+        import torch
+        import torch.utils.data
+    except ImportError:
 
-                return result
-
-            def optimized_np_array(*args_array: Any, **kwargs_array: Any) -> np.ndarray:
-                """Intercept np.array calls to optimize the reshape operation."""
-                # Check if this looks like the problematic reshape pattern
-                if (
-                    len(args_array) == 1
-                    and isinstance(args_array[0], list)
-                    and len(args_array[0]) > 10000
-                ):
-                    first_item = args_array[0][0]
-                    # Check if it's a list of 1D numpy arrays (sliding window pattern)
-                    if (
-                        isinstance(first_item, np.ndarray)
-                        and len(first_item.shape) == 1
-                        and all(
-                            isinstance(x, np.ndarray)
-                            and len(x.shape) == 1
-                            and len(x) == len(first_item)
-                            for x in args_array[0][:10]
-                            if isinstance(x, np.ndarray)
-                        )
-                    ):
-                        # This is the sliding window reshape
-                        window_size = len(first_item)
-                        num_windows = len(args_array[0])
-
-                        # Use the tracked validation data if available
-                        if validation_context["data"] is not None:
-                            original_data = validation_context["data"]
-                            if len(original_data.shape) == 2:
-                                print(
-                                    f"Using efficient stride-tricks reshape: {num_windows} windows of size {window_size} from 2D data shape {original_data.shape}",
-                                    file=sys.stderr,
-                                )
-                                return efficient_sliding_window_reshape(
-                                    original_data, window_size
-                                )
-
-                        # Fallback: use np.stack
-                        print(
-                            f"Warning: Using np.stack fallback for {num_windows} windows",
-                            file=sys.stderr,
-                        )
-                        return np.stack(args_array[0], axis=0)
-
-                # Not the pattern we're looking for - use original
-                return original_np_array(*args_array, **kwargs_array)
-
-            def patched_data_loader(
-                dataset: Any, batch_size: int = 1, **kwargs: Any
-            ) -> Any:
-                """Patch DataLoader to fix excessive batch sizes for validation."""
-                # Handle empty datasets (when false-positive validation is disabled)
-                if batch_size == 0:
-                    # Empty validation dataset - use a minimal batch size
-                    # The DataLoader will be empty anyway, but we need a valid batch_size
-                    print(
-                        "Patching DataLoader: batch_size=0 (empty validation dataset) -> 1",
-                        file=sys.stderr,
-                    )
-                    batch_size = 1
-                # Detect if this is the validation DataLoader (very large batch_size)
-                # The problematic code uses: batch_size=len(X_val_fp_labels)
-                # This could be 100,000+ samples, which causes OOM
-                elif batch_size > 1000:
-                    # This is likely the validation DataLoader - use reasonable batch size
-                    # Use 64 as a safe default (can be adjusted)
-                    reasonable_batch_size = 64
-                    print(
-                        f"Patching DataLoader batch_size: {batch_size} -> {reasonable_batch_size} (validation data)",
-                        file=sys.stderr,
-                    )
-                    batch_size = reasonable_batch_size
-
-                return original_data_loader(dataset, batch_size=batch_size, **kwargs)
-
-            # Temporarily replace functions
-            np.load = tracked_np_load
-            np.array = optimized_np_array
-            torch.utils.data.DataLoader = patched_data_loader
-
-            # Also patch train_model to clear GPU cache before validation
-            original_train_model = oww_train.Model.train_model
-
-            def patched_train_model(self: Any, *args: Any, **kwargs: Any) -> Any:
-                """Patched train_model that clears GPU cache before validation."""
-
-                # Get val_steps from kwargs or args
-                val_steps = kwargs.get("val_steps", [])
-                if not val_steps and args:
-                    # Try to extract from args (val_steps is usually a positional arg)
-                    try:
-                        # val_steps is typically passed as a keyword or in the config
-                        if hasattr(self, "val_steps"):
-                            val_steps = self.val_steps
-                    except Exception:  # noqa: S110
-                        # Ignore attribute access errors
-                        pass
-
-                # Call original train_model
-                result = original_train_model(self, *args, **kwargs)
-
-                return result
-
-            # Patch train_model to add validation memory management
-            # We'll intercept validation steps and clear cache
-            def enhanced_train_model(self: Any, *args: Any, **kwargs: Any) -> Any:
-                """Enhanced train_model with GPU cache clearing before validation."""
-
-                # Store original train_model behavior
-                # We need to wrap the validation loop
-                # The validation happens inside train_model, so we'll patch it at a different level
-                # Instead, let's add a hook to clear cache periodically
-
-                # Call original - the DataLoader patch will handle batch size
-                return original_train_model(self, *args, **kwargs)
-
-            # For now, use the original train_model - DataLoader patch should be sufficient
-            # oww_train.Model.train_model = enhanced_train_model
-
-            try:
-                result = original_auto_train(self, *args, **kwargs)
-            finally:
-                # Restore original functions
-                np.load = original_np_load
-                np.array = original_np_array
-                torch.utils.data.DataLoader = original_data_loader
-                # Clear tracking
-                validation_context["data"] = None
-                validation_context["input_shape"] = None
-                validation_context["loaded_path"] = None
+        def restore_numpy() -> None:
+            np.load = original_np_load
+            np.array = original_np_array
+
+        return restore_numpy
+
+    original_from_numpy = torch.from_numpy
+    original_tensor_dataset = torch.utils.data.TensorDataset
+    original_data_loader = torch.utils.data.DataLoader
+
+    def patched_from_numpy(array: Any) -> Any:
+        if isinstance(array, SlidingWindowFeatures):
+            return array
+        return original_from_numpy(array)
+
+    def patched_tensor_dataset(*tensors: Any) -> Any:
+        if tensors and isinstance(tensors[0], SlidingWindowFeatures):
+            labels = tensors[1] if len(tensors) > 1 else None
+            return _WindowedTensors(tensors[0], labels)
+        return original_tensor_dataset(*tensors)
+
+    def patched_data_loader(dataset: Any, batch_size: int = 1, **kwargs: Any) -> Any:
+        """Stream lazy windows; cap excessive validation batch sizes."""
+        if isinstance(dataset, _WindowedTensors):
+            labels = dataset.labels
+            if labels is not None and hasattr(labels, "numpy"):
+                labels = labels.numpy()
+            print(
+                f"Streaming validation windows: batch_size {batch_size} -> "
+                f"{VALIDATION_BATCH_SIZE}",
+                file=sys.stderr,
+            )
+            return WindowBatchLoader(
+                dataset.windows, labels, batch_size=VALIDATION_BATCH_SIZE
+            )
+        # Handle empty datasets (when false-positive validation is disabled)
+        if batch_size == 0:
+            print(
+                "Patching DataLoader: batch_size=0 (empty validation dataset) -> 1",
+                file=sys.stderr,
+            )
+            batch_size = 1
+        # The problematic code uses batch_size=len(X_val_fp_labels)
+        elif batch_size > MAX_DATALOADER_BATCH_SIZE:
+            print(
+                f"Patching DataLoader batch_size: {batch_size} -> "
+                f"{VALIDATION_BATCH_SIZE} (validation data)",
+                file=sys.stderr,
+            )
+            batch_size = VALIDATION_BATCH_SIZE
+        return original_data_loader(dataset, batch_size=batch_size, **kwargs)
 
-            return result
+    torch.from_numpy = patched_from_numpy
+    torch.utils.data.TensorDataset = patched_tensor_dataset
+    torch.utils.data.DataLoader = patched_data_loader
 
-        # Replace the method
-        oww_train.Model.auto_train = patched_auto_train
-        print(
-            "Applied efficient validation memory patches (reshape + DataLoader batch_size)",
-            file=sys.stderr,
-        )
-        return True
-
-    except ImportError as e:
-        print(f"Warning: Could not import openwakeword.train: {e}", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"Warning: Could not patch openwakeword: {e}", file=sys.stderr)
-        import traceback
+    def restore() -> None:
+        np.load = original_np_load
+        np.array = original_np_array
+        torch.from_numpy = original_from_numpy
+        torch.utils.data.TensorDataset = original_tensor_dataset
+        torch.utils.data.DataLoader = original_data_loader
 
-        traceback.print_exc()
-        return False
+    return restore
 
 
 def main() -> int:
     """Main entry point - patch then call original train.py."""
-    # Patch np.load at module level to handle empty strings BEFORE train.py runs
-    # This catches the module-level load at line 867 in train.py
-    original_np_load = np.load
-
-    def patched_np_load_module_level(*args: Any, **kwargs: Any) -> np.ndarray:
-        """Patch np.load to handle empty strings (module-level, before train.py runs)."""
-        if len(args) > 0 and isinstance(args[0], str) and args[0].strip() == "":
-            # Return empty array for empty string paths (disables validation)
-            print(
-                "Skipping false-positive validation (empty path provided)",
-                file=sys.stderr,
-            )
-            return np.array([])
-        return original_np_load(*args, **kwargs)
-
-    # Apply module-level np.load patch BEFORE importing train.py
-    np.load = patched_np_load_module_level
-
-    # Apply the auto_train patch (for validation reshape/DataLoader fixes)
-    if not patch_auto_train():
-        print(
-            "Warning: Could not apply validation memory patches. Continuing with original code.",
-            file=sys.stderr,
-        )
+    # Patch BEFORE train.py runs: the validation data is loaded and reshaped
+    # at module level, before auto_train is called
+    restore_patches = install_validation_patches()
+    print(
+        "Applied validation memory patches (mmap + lazy windows + batched loader)",
+        file=sys.stderr,
+    )
 
     # Import and execute train.py using runpy.run_path (runs as __main__ with patches)
     try:
@@ -392,8 +322,7 @@ def main() -> int:
         traceback.print_exc()
         return 1
     finally:
-        # Restore original np.load
-        np.load = original_np_load
+        restore_patches()
 
 
 if __name__ == "__main__":